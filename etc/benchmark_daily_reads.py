@@ -0,0 +1,59 @@
+"""
+Micro-benchmark of ``BcolzDailyBarReader.load_raw_arrays`` with a thread pool
+decompressing the columns, against the sequential reader.
+
+Usage: python etc/benchmark_daily_reads.py [num_threads ...]
+"""
+from multiprocessing.pool import ThreadPool
+import os
+import sys
+import timeit
+
+from zipline._testing.core import create_daily_bar_data, tmp_dir
+from zipline.data.bcolz_daily_bars import (
+    BcolzDailyBarReader,
+    BcolzDailyBarWriter,
+)
+from zipline.utils.calendar_utils import get_calendar
+
+COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+NUM_ASSETS = 5000
+
+
+def benchmark(thread_counts):
+    calendar = get_calendar('NYSE')
+    sessions = calendar.sessions_in_range('2010-01-04', '2019-12-31')
+    sids = list(range(1, NUM_ASSETS + 1))
+
+    with tmp_dir() as tempdir:
+        path = os.path.join(tempdir.path, 'daily.bcolz')
+        BcolzDailyBarWriter(path, calendar, sessions[0], sessions[-1]).write(
+            create_daily_bar_data(sessions, sids),
+        )
+        start, end = sessions[-252], sessions[-1]
+
+        for read_all, assets in (True, sids), (False, sids[:500]):
+            for num_threads in [1] + thread_counts:
+                pool = ThreadPool(num_threads) if num_threads > 1 else None
+                reader = BcolzDailyBarReader(
+                    path,
+                    read_all_threshold=0 if read_all else len(sids),
+                    read_pool=pool,
+                )
+                seconds = min(timeit.repeat(
+                    lambda: reader.load_raw_arrays(
+                        COLUMNS, start, end, assets,
+                    ),
+                    number=1,
+                    repeat=3,
+                ))
+                print('{:>5} assets, read_all={!s:<5}, {:>2} threads: '
+                      '{:8.1f} ms'.format(
+                          len(assets), read_all, num_threads, seconds * 1000,
+                      ))
+                if pool is not None:
+                    pool.terminate()
+
+
+if __name__ == '__main__':
+    benchmark([int(arg) for arg in sys.argv[1:]] or [2, 4, 8])
@@ -0,0 +1,116 @@
+"""
+Micro-benchmark of ``BcolzMinuteBarReader.load_raw_arrays`` with a sequential
+pool and with a thread pool, against the per-sid loop it replaced.
+
+Usage: python etc/benchmark_minute_reads.py [num_threads ...]
+"""
+from multiprocessing.pool import ThreadPool
+import sys
+import timeit
+
+import numpy as np
+
+from zipline._testing.core import (
+    create_minute_bar_data,
+    tmp_dir,
+    write_bcolz_minute_data,
+)
+from zipline.data.bar_reader import NoDataForSid
+from zipline.data.minute_bars import BcolzMinuteBarReader
+from zipline.utils.calendar_utils import get_calendar
+from zipline.utils.pool import SequentialPool
+
+COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+NUM_ASSETS = 500
+
+
+def per_sid_load_raw_arrays(reader, fields, start_dt, end_dt, sids):
+    """
+    ``load_raw_arrays`` as it was before reads were batched, decompressing,
+    excluding and scaling each sid's window on its own.
+    """
+    start_idx = reader._find_position_of_minute(start_dt)
+    end_idx = reader._find_position_of_minute(end_dt)
+
+    num_minutes = end_idx - start_idx + 1
+    indices_to_exclude = reader._exclusion_indices_for_range(
+        start_idx, end_idx,
+    )
+    if indices_to_exclude is not None:
+        for excl_start, excl_stop in indices_to_exclude:
+            num_minutes -= excl_stop - excl_start + 1
+    shape = num_minutes, len(sids)
+
+    results = []
+    for field in fields:
+        if field != 'volume':
+            out = np.full(shape, np.nan)
+        else:
+            out = np.zeros(shape, dtype=np.uint32)
+
+        for i, sid in enumerate(sids):
+            try:
+                carray = reader._open_minute_file(field, sid)
+            except NoDataForSid:
+                continue
+
+            values = carray[start_idx:end_idx + 1]
+            if indices_to_exclude is not None:
+                for excl_start, excl_stop in indices_to_exclude[::-1]:
+                    excl_slice = np.s_[
+                        excl_start - start_idx:excl_stop - start_idx + 1]
+                    values = np.delete(values, excl_slice)
+
+            where = values != 0
+            if field != 'volume':
+                out[:len(where), i][where] = (
+                    values[where] * reader._ohlc_ratio_inverse_for_sid(sid)
+                )
+            else:
+                out[:len(where), i][where] = values[where]
+
+        results.append(out)
+    return results
+
+
+def benchmark(thread_counts):
+    calendar = get_calendar('NYSE')
+    # This range includes the early close on 2015-11-27.
+    sessions = calendar.sessions_in_range('2015-11-02', '2015-12-31')
+    minutes = calendar.sessions_minutes(sessions[0], sessions[-1])
+    sids = list(range(1, NUM_ASSETS + 1))
+
+    with tmp_dir() as tempdir:
+        write_bcolz_minute_data(
+            calendar,
+            sessions,
+            tempdir.path,
+            create_minute_bar_data(minutes, sids),
+        )
+        start, end = minutes[-20 * 390], minutes[-1]
+
+        def run(name, load):
+            seconds = min(timeit.repeat(
+                lambda: load(COLUMNS, start, end, sids),
+                number=1,
+                repeat=3,
+            ))
+            print('{:>5} assets, {:<12}: {:8.1f} ms'.format(
+                len(sids), name, seconds * 1000,
+            ))
+
+        reader = BcolzMinuteBarReader(tempdir.path)
+        run('per sid', lambda *args: per_sid_load_raw_arrays(reader, *args))
+
+        reader = BcolzMinuteBarReader(tempdir.path, read_pool=SequentialPool())
+        run('sequential', reader.load_raw_arrays)
+
+        for num_threads in thread_counts:
+            pool = ThreadPool(num_threads)
+            reader = BcolzMinuteBarReader(tempdir.path, read_pool=pool)
+            run('{} threads'.format(num_threads), reader.load_raw_arrays)
+            pool.terminate()
+
+
+if __name__ == '__main__':
+    benchmark([int(arg) for arg in sys.argv[1:]] or [2, 4, 8])
@@ -0,0 +1,89 @@
+"""
+Micro-benchmark of ``SimplePipelineEngine`` computing independent windowed
+CustomFactors on a thread pool, against computing them one at a time.
+
+Usage: python etc/benchmark_pipeline_compute_pool.py [num_threads ...]
+"""
+from multiprocessing.pool import ThreadPool
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from zipline._testing.core import tmp_asset_finder
+from zipline.assets.synthetic import make_simple_equity_info
+from zipline.pipeline import CustomFactor, Pipeline
+from zipline.pipeline.data.testing import TestingDataSet
+from zipline.pipeline.domain import US_EQUITIES
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.loaders.synthetic import SeededRandomLoader
+
+NUM_ASSETS = 2000
+NUM_FACTORS = 8
+
+
+class WindowedVolatility(CustomFactor):
+    """
+    The standard deviation of the period returns of each asset over the
+    window. Each window length is a separate, independent term.
+    """
+    inputs = [TestingDataSet.float_col]
+
+    def compute(self, today, assets, out, values):
+        returns = np.diff(values, axis=0) / values[:-1]
+        out[:] = np.nanstd(returns, axis=0)
+
+
+def benchmark(thread_counts):
+    sessions = US_EQUITIES.sessions()
+    sessions = sessions[
+        (sessions >= '2014-01-02') & (sessions <= '2015-12-31')
+    ]
+    sids = list(range(1, NUM_ASSETS + 1))
+    equities = make_simple_equity_info(
+        sids,
+        sessions[0],
+        sessions[-1],
+        symbols=['A{}'.format(sid) for sid in sids],
+        exchange='NYSE',
+    )
+    exchanges = pd.DataFrame({'exchange': ['NYSE'], 'country_code': ['US']})
+    loader = SeededRandomLoader(
+        42, [TestingDataSet.float_col], sessions, sids,
+    )
+    pipe = Pipeline(
+        {
+            'vol_{}'.format(i): WindowedVolatility(window_length=20 + 10 * i)
+            for i in range(NUM_FACTORS)
+        },
+        domain=US_EQUITIES,
+    )
+    start, end = sessions[-126], sessions[-1]
+
+    with tmp_asset_finder(equities=equities, exchanges=exchanges) as finder:
+        def run(name, compute_pool):
+            engine = SimplePipelineEngine(
+                lambda column: loader,
+                finder,
+                default_domain=US_EQUITIES,
+                compute_pool=compute_pool,
+            )
+            seconds = min(timeit.repeat(
+                lambda: engine.run_pipeline(pipe, start, end),
+                number=1,
+                repeat=3,
+            ))
+            print('{} factors, {:>5} assets, {:<10}: {:8.1f} ms'.format(
+                NUM_FACTORS, NUM_ASSETS, name, seconds * 1000,
+            ))
+
+        run('sequential', None)
+        for num_threads in thread_counts:
+            pool = ThreadPool(num_threads)
+            run('{} threads'.format(num_threads), pool)
+            pool.terminate()
+
+
+if __name__ == '__main__':
+    benchmark([int(arg) for arg in sys.argv[1:]] or [2, 4, 8])
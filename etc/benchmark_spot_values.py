@@ -0,0 +1,75 @@
+"""
+Micro-benchmark of ``DataPortal.get_spot_value`` for many assets at once,
+against looking up each asset on its own.
+
+Usage: python etc/benchmark_spot_values.py [num_assets ...]
+"""
+import sys
+import timeit
+
+from zipline._testing.core import (
+    create_minute_bar_data,
+    tmp_asset_finder,
+    tmp_dir,
+    write_bcolz_minute_data,
+)
+from zipline.assets.synthetic import make_simple_equity_info
+from zipline.data.data_portal import DataPortal
+from zipline.data.minute_bars import BcolzMinuteBarReader
+from zipline.utils.calendar_utils import get_calendar
+
+FIELDS = ('price', 'close', 'volume')
+NUM_MINUTES = 20
+
+
+def benchmark(num_assets):
+    calendar = get_calendar('NYSE')
+    sessions = calendar.sessions_in_range('2016-08-01', '2016-08-02')
+    minutes = calendar.sessions_minutes(sessions[0], sessions[-1])
+    sids = list(range(1, num_assets + 1))
+    equities = make_simple_equity_info(
+        sids,
+        sessions[0],
+        sessions[-1],
+        symbols=['A{}'.format(sid) for sid in sids],
+        exchange='NYSE',
+    )
+
+    with tmp_dir() as tempdir, tmp_asset_finder(equities=equities) as finder:
+        write_bcolz_minute_data(
+            calendar,
+            sessions,
+            tempdir.path,
+            create_minute_bar_data(minutes, sids),
+        )
+        reader = BcolzMinuteBarReader(tempdir.path)
+        data_portal = DataPortal(
+            finder,
+            calendar,
+            first_trading_day=reader.first_trading_day,
+            equity_minute_reader=reader,
+        )
+        assets = finder.retrieve_all(sids)
+        dts = minutes[-NUM_MINUTES:]
+
+        def batched():
+            for dt in dts:
+                for field in FIELDS:
+                    data_portal.get_spot_value(assets, field, dt, 'minute')
+
+        def per_asset():
+            for dt in dts:
+                for field in FIELDS:
+                    for asset in assets:
+                        data_portal.get_spot_value(asset, field, dt, 'minute')
+
+        for name, func in ('batched', batched), ('per asset', per_asset):
+            seconds = min(timeit.repeat(func, number=1, repeat=3))
+            print('{:>6} assets, {:<9}: {:8.2f} ms per minute'.format(
+                num_assets, name, seconds / NUM_MINUTES * 1000,
+            ))
+
+
+if __name__ == '__main__':
+    for num_assets in [int(arg) for arg in sys.argv[1:]] or [500, 5000]:
+        benchmark(num_assets)
@@ -332,15 +332,17 @@ cdef class BarData:
                 # assume assets is iterable
                 # return a Series indexed by asset
                 if not self._adjust_minutes:
-                    return pd.Series(data={
-                        asset: self.data_portal.get_spot_value(
-                                    asset,
-                                    field,
-                                    self._get_current_minute(),
-                                    self.data_frequency
-                               )
-                        for asset in assets
-                        }, index=assets, name=fields)
+                    assets = list(assets)
+                    return pd.Series(
+                        self.data_portal.get_spot_value(
+                            assets,
+                            field,
+                            self._get_current_minute(),
+                            self.data_frequency
+                        ),
+                        index=assets,
+                        name=fields,
+                    )
                 else:
                     return pd.Series(data={
                         asset: self.data_portal.get_adjusted_value(
@@ -358,16 +360,18 @@ cdef class BarData:
                 data = {}
 
                 if not self._adjust_minutes:
+                    assets = list(assets)
                     for field in fields:
-                        series = pd.Series(data={
-                            asset: self.data_portal.get_spot_value(
-                                        asset,
-                                        field,
-                                        self._get_current_minute(),
-                                        self.data_frequency
-                                   )
-                            for asset in assets
-                            }, index=assets, name=field)
+                        series = pd.Series(
+                            self.data_portal.get_spot_value(
+                                assets,
+                                field,
+                                self._get_current_minute(),
+                                self.data_frequency
+                            ),
+                            index=assets,
+                            name=field,
+                        )
                         data[field] = series
                 else:
                     for field in fields:
@@ -688,65 +692,43 @@ cdef class BarData:
                 # columns are the assets, indexed by dt.
                 return df
         else:
-            if isinstance(assets, PricingDataAssociable):
-                # one asset, multiple fields. for now, just make multiple
-                # history calls, one per field, then stitch together the
-                # results. this can definitely be optimized!
-
-                df_dict = {
-                    field: self.data_portal.get_history_window(
-                        [assets],
-                        self._get_current_minute(),
-                        bar_count,
-                        frequency,
-                        field,
-                        self.data_frequency,
-                    )[assets] for field in fields
-                }
-
-                if self._adjust_minutes:
-                    adjs = {
-                        field: self.data_portal.get_adjustments(
-                            assets,
-                            field,
-                            self._get_current_minute(),
-                            self.simulation_dt_func()
-                        )[0] for field in fields
-                    }
+            single_asset = isinstance(assets, PricingDataAssociable)
 
-                    df_dict = {field: df * adjs[field]
-                               for field, df in iteritems(df_dict)}
+            if single_asset:
+                asset_list = [assets]
+            else:
+                asset_list = assets
 
-                # returned dataframe whose columns are the fields, indexed by
-                # dt.
-                return pd.DataFrame(df_dict)
+            # read all of the fields at once
+            df = self.data_portal.get_history_window_multi(
+                asset_list,
+                self._get_current_minute(),
+                bar_count,
+                frequency,
+                fields,
+                self.data_frequency,
+            )
 
-            else:
-                df_dict = {
-                    field: self.data_portal.get_history_window(
-                        assets,
-                        self._get_current_minute(),
-                        bar_count,
-                        frequency,
+            if self._adjust_minutes:
+                df = pd.concat({
+                    field: df[field] * self.data_portal.get_adjustments(
+                        asset_list,
                         field,
-                        self.data_frequency,
+                        self._get_current_minute(),
+                        self.simulation_dt_func()
                     ) for field in fields
-                }
-
-                if self._adjust_minutes:
-                    adjs = {
-                        field: self.data_portal.get_adjustments(
-                            assets,
-                            field,
-                            self._get_current_minute(),
-                            self.simulation_dt_func()
-                        ) for field in fields
-                    }
-
-                    df_dict = {field: df * adjs[field]
-                               for field, df in iteritems(df_dict)}
+                }, axis=1)
 
-                return pd.concat(df_dict, axis=1)
+            if single_asset:
+                # one asset, multiple fields. returned dataframe whose columns
+                # are the fields, indexed by dt.
+                return pd.DataFrame({
+                    field: df[field][assets] for field in fields
+                })
+            else:
+                # multiple assets, multiple fields. returned dataframe whose
+                # columns are the fields and assets, indexed by dt.
+                return df
 
     property current_dt:
         def __get__(self):
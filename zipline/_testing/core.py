@@ -702,6 +702,20 @@ class FakeDataPortal(DataPortal):
 
         return df
 
+    def get_history_window_multi(self, assets, end_dt, bar_count, frequency,
+                                 fields, data_frequency, ffill=True):
+        return pd.concat({
+            field: self.get_history_window(
+                assets,
+                end_dt,
+                bar_count,
+                frequency,
+                field,
+                data_frequency,
+                ffill,
+            ) for field in fields
+        }, axis=1)
+
 class tmp_assets_db(object):
     """Create a temporary assets sqlite database.
     This is meant to be used as a context manager.
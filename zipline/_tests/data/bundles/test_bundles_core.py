@@ -10,6 +10,14 @@ from zipline.utils.calendar_utils import get_calendar
 from zipline.assets.synthetic import make_simple_equity_info
 from zipline.data.bundles import UnknownBundle
 from zipline.data.bundles.core import _make_bundle_core
+from zipline.data.mmap_minute_bars import (
+    MmapMinuteBarReader,
+    MmapMinuteBarWriter,
+)
+from zipline.data.parquet_daily_bars import (
+    ParquetDailyBarReader,
+    ParquetDailyBarWriter,
+)
 from zipline.lib.adjustment import Float64Multiply
 from zipline.pipeline.loaders.synthetic import (
     make_bar_data,
@@ -247,6 +255,144 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             msg='volume',
         )
 
+    def test_ingest_mmap_minute_bars(self):
+        calendar = get_calendar('XNYS')
+        minutes = calendar.sessions_minutes(
+            self.START_DATE, self.END_DATE,
+        )
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+        minute_bar_data = make_bar_data(equities, minutes)
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+            minute_bar_format='mmap',
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          output_dir):
+            self.assertIsInstance(minute_bar_writer, MmapMinuteBarWriter)
+            asset_db_writer.write(equities=equities)
+            minute_bar_writer.write(minute_bar_data)
+
+        self.ingest('bundle', environ=self.environ)
+        bundle = self.load('bundle', environ=self.environ)
+        self.assertIsInstance(
+            bundle.equity_minute_bar_reader,
+            MmapMinuteBarReader,
+        )
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        actual = bundle.equity_minute_bar_reader.load_raw_arrays(
+            columns,
+            minutes[0],
+            minutes[-1],
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(minutes, sids, equities, colname),
+                msg=colname,
+            )
+
+    @parameterized.expand([('parquet',), ('arrow',)])
+    def test_ingest_parquet_daily_bars(self, daily_bar_format):
+        calendar = get_calendar('XNYS')
+        sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+        daily_bar_data = make_bar_data(equities, sessions)
+        dividends = pd.DataFrame({
+            'sid': [1],
+            'amount': [1.0],
+            'ex_date': [sessions[2]],
+            'declared_date': [sessions[0]],
+            'record_date': [sessions[3]],
+            'pay_date': [sessions[4]],
+        })
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+            daily_bar_format=daily_bar_format,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          output_dir):
+            self.assertIsInstance(daily_bar_writer, ParquetDailyBarWriter)
+            asset_db_writer.write(equities=equities)
+            daily_bar_writer.write(daily_bar_data)
+            adjustment_writer.write(dividends=dividends)
+
+        self.ingest('bundle', environ=self.environ)
+        bundle = self.load('bundle', environ=self.environ)
+        reader = bundle.equity_daily_bar_reader
+        self.assertIsInstance(reader, ParquetDailyBarReader)
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        actual = reader.load_raw_arrays(
+            columns,
+            self.START_DATE,
+            self.END_DATE,
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(sessions, sids, equities, colname),
+                msg=colname,
+            )
+
+        # The dividend ratio is computed from the close before the ex_date,
+        # read from the daily bars being ingested.
+        previous_close = reader.get_value(1, sessions[1], 'close')
+        assert_equal(
+            bundle.adjustment_reader.get_adjustments_for_sid('dividends', 1),
+            [[sessions[2], 1.0 - 1.0 / previous_close]],
+        )
+
+    def test_register_invalid_daily_bar_format(self):
+        with self.assertRaises(ValueError):
+            self.register('bundle', lambda *args: None,
+                          daily_bar_format='mmap')
+        self.assertNotIn('bundle', self.bundles)
+
+    def test_register_invalid_minute_bar_format(self):
+        with self.assertRaises(ValueError):
+            self.register('bundle', lambda *args: None,
+                          minute_bar_format='parquet')
+        self.assertNotIn('bundle', self.bundles)
+
     @parameterized.expand([('load',),])
     def test_bundle_doesnt_exist(self, fnname):
         with self.assertRaises(UnknownBundle) as e:
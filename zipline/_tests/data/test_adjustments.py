@@ -1,7 +1,10 @@
+from unittest import TestCase
+
 import numpy as np
 import pandas as pd
 import warnings
 from zipline.data.adjustments import (
+    AdjustmentIndex,
     SQLiteAdjustmentReader,
     SQLiteAdjustmentWriter,
 )
@@ -320,3 +323,67 @@ class TestSQLiteAdjustmentsWriter(WithExchangeCalendars,
         }).sort_index()
 
         assert_equal(result, expected)
+
+
+class AdjustmentIndexTestCase(TestCase):
+
+    def test_lookup(self):
+        rand = np.random.RandomState(5)
+        sids = rand.randint(0, 20, 200)
+        days = pd.Timestamp('2014-01-02').value // 10 ** 9 + (
+            86400 * rand.randint(0, 60, 200)
+        )
+        ratios = rand.uniform(0.5, 1.5, 200)
+        index = AdjustmentIndex({
+            'splits': (sids, days, ratios),
+            'mergers': ((), (), ()),
+        })
+
+        requested = [3, 25, 0, 7, 3, 19]
+        for start, end in [('2014-01-01', '2014-04-01'),
+                           ('2014-01-15', '2014-02-03'),
+                           ('2014-02-03', '2014-02-03'),
+                           ('2014-02-03 12:00', '2014-02-04 12:00'),
+                           ('2015-01-01', '2015-02-01')]:
+            start, end = pd.Timestamp(start), pd.Timestamp(end)
+            locs, dates, found = index.lookup('splits', requested, start, end)
+
+            expected_locs, expected_dates, expected = [], [], []
+            for i, sid in enumerate(requested):
+                rows = sorted(
+                    (d, j) for j, d in enumerate(days)
+                    if sids[j] == sid and
+                    start.value < d * 10 ** 9 <= end.value
+                )
+                for d, j in rows:
+                    expected_locs.append(i)
+                    expected_dates.append(d * 10 ** 9)
+                    expected.append(ratios[j])
+
+            assert_equal(locs.tolist(), expected_locs)
+            assert_equal(dates.tolist(), expected_dates)
+            assert_equal(found.tolist(), expected)
+
+        # A start for each sid.
+        starts = pd.DatetimeIndex([
+            '2014-01-01', '2014-01-15', '2014-02-03', '2014-02-03 12:00',
+            '2014-01-20', '2014-03-01',
+        ])
+        end = pd.Timestamp('2014-03-15')
+        locs, dates, found = index.lookup('splits', requested, starts, end)
+        expected_locs, expected = [], []
+        for i, (sid, start) in enumerate(zip(requested, starts)):
+            for d, j in sorted(
+                (d, j) for j, d in enumerate(days)
+                if sids[j] == sid and start.value < d * 10 ** 9 <= end.value
+            ):
+                expected_locs.append(i)
+                expected.append(ratios[j])
+        assert_equal(locs.tolist(), expected_locs)
+        assert_equal(found.tolist(), expected)
+
+        locs, dates, found = index.lookup(
+            'mergers', requested, pd.Timestamp('2014'), pd.Timestamp('2015'),
+        )
+        assert_equal(len(locs), 0)
+        assert_equal(len(found), 0)
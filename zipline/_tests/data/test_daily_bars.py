@@ -13,9 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from itertools import cycle, islice
+from multiprocessing.pool import ThreadPool
+import os
 from sys import maxsize
 import re
 
+from bcolz import carray, ctable
 from parameterized import parameterized
 import numpy as np
 import pandas as pd
@@ -36,9 +39,18 @@ from zipline.utils.calendar_utils import get_calendar
 
 from zipline.data.bar_reader import (
     NoDataAfterDate,
-    NoDataBeforeDate
+    NoDataBeforeDate,
+    NoDataForSid,
+)
+from zipline.data.bcolz_daily_bars import (
+    BcolzDailyBarReader,
+    BcolzDailyBarWriter,
+    ChunkCache,
+)
+from zipline.data.parquet_daily_bars import (
+    ParquetDailyBarReader,
+    ParquetDailyBarWriter,
 )
-from zipline.data.bcolz_daily_bars import BcolzDailyBarWriter
 from zipline.pipeline.loaders.synthetic import (
     OHLCV,
     asset_start,
@@ -638,6 +650,76 @@ class BcolzDailyBarTestCase(WithBcolzEquityDailyBarReader, _DailyBarsTestCase):
             sessions
         )
 
+    def test_spot_cache(self):
+        values = {
+            column: self.bcolz_daily_bar_ctable[column][:]
+            for column in OHLCV
+        }
+        # Use small chunks so that the values span several of them.
+        table = ctable(
+            columns=[carray(values[column], chunklen=8) for column in OHLCV],
+            names=list(OHLCV),
+        )
+        chunk_nbytes = 8 * values['close'].itemsize
+        cache = ChunkCache(table, max_bytes=3 * chunk_nbytes)
+
+        rows = np.random.RandomState(0).permutation(len(values['close']))
+        for column in OHLCV:
+            for ix in rows:
+                self.assertEqual(cache.get(column, ix), values[column][ix])
+                self.assertLessEqual(cache.nbytes, 3 * chunk_nbytes)
+        self.assertEqual(cache.hits + cache.misses, len(OHLCV) * len(rows))
+        self.assertGreater(cache.misses, len(OHLCV) * len(rows) // 8)
+
+        # Rows in the same chunk are read from the cache.
+        hits, misses = cache.hits, cache.misses
+        cache.get('close', 16)
+        cache.get('close', 17)
+        self.assertEqual((cache.hits, cache.misses), (hits + 1, misses + 1))
+
+        cache.clear()
+        self.assertEqual((cache.hits, cache.misses, cache.nbytes), (0, 0, 0))
+
+    def test_spot_cache_counts_reads(self):
+        reader = self.daily_bar_reader
+        reader.spot_cache.clear()
+        asset = self.assets[0]
+        date = self.dates_for_asset(asset)[0]
+        reader.get_value(asset, date, 'close')
+        reader.get_value(asset, date, 'open')
+        reader.get_value(asset, date, 'close')
+        self.assertEqual(reader.spot_cache.misses, 2)
+        self.assertEqual(reader.spot_cache.hits, 1)
+
+    def test_load_raw_arrays_read_pool(self):
+        columns = list(OHLCV)
+        # Use small chunks so that the per-asset slices span several chunks.
+        table = ctable(
+            columns=[
+                carray(self.bcolz_daily_bar_ctable[column][:], chunklen=8)
+                for column in self.bcolz_daily_bar_ctable.names
+            ],
+            names=self.bcolz_daily_bar_ctable.names,
+        )
+        table.attrs.attrs.update(self.bcolz_daily_bar_ctable.attrs.attrs)
+
+        pool = ThreadPool(4)
+        self.add_instance_callback(pool.terminate)
+        reader = BcolzDailyBarReader(
+            table,
+            self.daily_bar_reader._read_all_threshold,
+            read_pool=pool,
+        )
+
+        expected = self.daily_bar_reader.load_raw_arrays(
+            columns, TEST_QUERY_START, TEST_QUERY_STOP, self.assets,
+        )
+        actual = reader.load_raw_arrays(
+            columns, TEST_QUERY_START, TEST_QUERY_STOP, self.assets,
+        )
+        for e, a in zip(expected, actual):
+            assert_equal(a, e)
+
 
 class BcolzDailyBarAlwaysReadAllTestCase(BcolzDailyBarTestCase):
     """
@@ -657,6 +739,125 @@ class BcolzDailyBarNeverReadAllTestCase(BcolzDailyBarTestCase):
     BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD = maxsize
 
 
+class ParquetDailyBarTestCase(WithTmpDir, _DailyBarsTestCase):
+    EQUITY_DAILY_BAR_COUNTRY_CODES = ['US']
+    PARQUET_FILE_FORMAT = 'parquet'
+    PARQUET_PRICE_FORMAT = 'uint32'
+    __test__ = True
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(ParquetDailyBarTestCase, cls).init_class_fixtures()
+
+        cls.parquet_daily_bar_path = path = cls.tmpdir.makedir(
+            'daily_equity_pricing.' + cls.PARQUET_FILE_FORMAT,
+        )
+        days = cls.equity_daily_bar_days
+        ParquetDailyBarWriter(
+            path,
+            cls.exchange_calendar,
+            days[0],
+            days[-1],
+            file_format=cls.PARQUET_FILE_FORMAT,
+            price_format=cls.PARQUET_PRICE_FORMAT,
+        ).write(
+            cls.make_equity_daily_bar_data(
+                country_code='US',
+                sids=cls.asset_finder.equities_sids_for_country_code('US'),
+            ),
+        )
+        cls.daily_bar_reader = ParquetDailyBarReader(path)
+
+    def test_partitions_across_years(self):
+        calendar = self.exchange_calendar
+        sessions = calendar.sessions_in_range('2014-12-22', '2015-01-09')
+        path = self.tmpdir.makedir('across_years.' + self.PARQUET_FILE_FORMAT)
+        writer = ParquetDailyBarWriter(
+            path,
+            calendar,
+            sessions[0],
+            sessions[-1],
+            file_format=self.PARQUET_FILE_FORMAT,
+            price_format=self.PARQUET_PRICE_FORMAT,
+        )
+        # Sid 2 starts on the second session and doesn't trade in 2015.
+        volume = np.where(sessions[1:].year == 2015, 0, 100)
+        frames = {
+            1: DataFrame({
+                'open': 10.0, 'high': 11.0, 'low': 9.0,
+                'close': np.arange(len(sessions)) + 10.5,
+                'volume': 200,
+            }, index=sessions),
+            2: DataFrame({
+                'open': 20.0, 'high': 21.0, 'low': 19.0,
+                'close': np.where(volume == 0, 0.0, 20.25),
+                'volume': volume,
+            }, index=sessions[1:]),
+        }
+        writer.write(iteritems(frames))
+        self.assertEqual(
+            sorted(os.listdir(path)),
+            ['_metadata.json', 'year=2014', 'year=2015'],
+        )
+
+        reader = ParquetDailyBarReader(path)
+        close, volume = reader.load_raw_arrays(
+            ['close', 'volume'], sessions[0], sessions[-1], [2, 3, 1],
+        )
+        assert_equal(close[:, 2], frames[1].close.values)
+        assert_equal(close[0, 0], nan)
+        assert_equal(close[1:, 0], frames[2].close.replace(0, nan).values)
+        assert_equal(close[:, 1], np.full(len(sessions), nan))
+        assert_equal(volume[1:, 0], frames[2].volume.values.astype('uint32'))
+        self.assertEqual(volume.dtype, np.dtype('uint32'))
+
+        self.assertEqual(reader.get_value(1, sessions[-1], 'close'), 22.5)
+        self.assertEqual(
+            reader.get_last_traded_dt(2, sessions[-1]),
+            Timestamp('2014-12-31'),
+        )
+        with self.assertRaises(NoDataForSid):
+            reader.get_value(3, sessions[-1], 'close')
+
+        # Rewriting the dataset replaces its partitions.
+        writer.write(iteritems({1: frames[1].iloc[:3]}))
+        self.assertEqual(
+            sorted(os.listdir(path)),
+            ['_metadata.json', 'year=2014'],
+        )
+
+    def test_write_missing_session(self):
+        sessions = self.sessions
+        bar_data = make_bar_data(
+            EQUITY_INFO.loc[[5]],
+            sessions[sessions != Timestamp('2015-06-15')],
+        )
+        writer = ParquetDailyBarWriter(
+            self.tmpdir.makedir('missing_session'),
+            self.exchange_calendar,
+            sessions[0],
+            sessions[-1],
+        )
+        with self.assertRaisesRegex(ValueError, 'expected 21 rows'):
+            writer.write(bar_data)
+
+
+class ArrowDailyBarTestCase(ParquetDailyBarTestCase):
+    """
+    Run the tests defined in ParquetDailyBarTestCase on memory-mapped Arrow
+    files.
+    """
+    PARQUET_FILE_FORMAT = 'arrow'
+
+
+class ParquetFloatDailyBarTestCase(ParquetDailyBarTestCase):
+    """
+    Run the tests defined in ParquetDailyBarTestCase with the prices stored
+    as floats.
+    """
+    PARQUET_PRICE_FORMAT = 'float64'
+
+
 class BcolzDailyBarWriterMissingDataTestCase(WithAssetFinder,
                                              WithTmpDir,
                                              WithExchangeCalendars,
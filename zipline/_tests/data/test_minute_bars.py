@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from datetime import timedelta
+from multiprocessing.pool import ThreadPool
 import os
 
 from numpy import (
@@ -21,8 +22,10 @@ from numpy import (
     int64,
     float64,
     full,
+    isnan,
     nan,
     transpose,
+    uint32,
     zeros,
 )
 from numpy.testing import assert_almost_equal, assert_array_equal
@@ -988,6 +991,144 @@ class BcolzMinuteBarTestCase(WithExchangeCalendars,
                 assert_almost_equal(expected,
                                     actual)
 
+    def _write_load_raw_arrays_fixture(self):
+        """
+        Write minute data around the 2015 Thanksgiving early close for a sid
+        with the default OHLC ratio and a sid with its own ratio whose data
+        stops before the end of the window.
+        """
+        early_close = Timestamp('2015-11-27')
+        day_before = Timestamp('2015-11-25')
+        day_after = Timestamp('2015-11-30')
+
+        writer = BcolzMinuteBarWriter(
+            self.dest,
+            self.exchange_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+            ohlc_ratios_per_sid={2: 25},
+        )
+
+        minutes_1 = self.exchange_calendar.minutes_in_range(
+            self.market_closes[day_before] - Timedelta('9 min'),
+            self.market_opens[day_after] + Timedelta('9 min'),
+        )
+        num_minutes_1 = len(minutes_1)
+        writer.write_sid(1, DataFrame(
+            data={
+                'open': arange(num_minutes_1) + 10.0,
+                'high': arange(num_minutes_1) + 20.0,
+                'low': arange(num_minutes_1) + 5.0,
+                'close': arange(num_minutes_1) + 15.0,
+                'volume': arange(num_minutes_1) + 100,
+            },
+            index=minutes_1,
+        ))
+
+        minutes_2 = self.exchange_calendar.minutes_in_range(
+            self.market_opens[early_close],
+            self.market_closes[early_close],
+        )
+        num_minutes_2 = len(minutes_2)
+        writer.write_sid(2, DataFrame(
+            data={
+                'open': arange(num_minutes_2) + 30.4,
+                'high': arange(num_minutes_2) + 40.4,
+                'low': arange(num_minutes_2) + 25.4,
+                'close': arange(num_minutes_2) + 35.4,
+                'volume': arange(num_minutes_2) + 200,
+            },
+            index=minutes_2,
+        ))
+
+        return minutes_1, minutes_2
+
+    def test_load_raw_arrays_read_pool(self):
+        minutes_1, minutes_2 = self._write_load_raw_arrays_fixture()
+
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        # sid 3 has no data.
+        sids = [1, 2, 3]
+
+        sequential = BcolzMinuteBarReader(self.dest).load_raw_arrays(
+            columns, minutes_1[0], minutes_1[-1], sids,
+        )
+
+        pool = ThreadPool(4)
+        self.add_instance_callback(pool.terminate)
+        threaded = BcolzMinuteBarReader(
+            self.dest,
+            read_pool=pool,
+        ).load_raw_arrays(columns, minutes_1[0], minutes_1[-1], sids)
+
+        for expected, actual in zip(sequential, threaded):
+            assert_array_equal(expected, actual)
+            self.assertEqual(expected.dtype, actual.dtype)
+
+        opens, highs, lows, closes, volumes = sequential
+        self.assertEqual(opens.shape, (len(minutes_1), len(sids)))
+        self.assertEqual(volumes.dtype, uint32)
+
+        # The early close minutes are excluded from the window, so every
+        # written minute lines up with a row of the output.
+        assert_almost_equal(opens[:, 0], arange(len(minutes_1)) + 10.0)
+        assert_array_equal(volumes[:, 0], arange(len(minutes_1)) + 100)
+
+        # sid 2 is scaled by its own ratio and its carray ends before the
+        # end of the window.
+        loc_2 = minutes_1.get_loc(minutes_2[0])
+        stop_2 = loc_2 + len(minutes_2)
+        assert_almost_equal(
+            closes[loc_2:stop_2, 1],
+            arange(len(minutes_2)) + 35.4,
+        )
+        assert_array_equal(
+            volumes[loc_2:stop_2, 1],
+            arange(len(minutes_2)) + 200,
+        )
+        self.assertTrue(isnan(closes[stop_2:, 1]).all())
+        self.assertTrue(isnan(closes[:loc_2, 1]).all())
+        self.assertFalse(volumes[stop_2:, 1].any())
+
+        # sid 3 has no data at all.
+        for field in opens, highs, lows, closes:
+            self.assertTrue(isnan(field[:, 2]).all())
+        self.assertFalse(volumes[:, 2].any())
+
+    def test_load_raw_arrays_start_after_early_close(self):
+        minutes_1, _ = self._write_load_raw_arrays_fixture()
+        early_close = self.market_closes[Timestamp('2015-11-27')]
+        reader = BcolzMinuteBarReader(self.dest)
+
+        # A start inside the early close exclusion is rolled back to the
+        # close, so the window matches one starting at the close.
+        expected = reader.load_raw_arrays(
+            ['close', 'volume'], early_close, minutes_1[-1], [1, 2],
+        )
+        actual = reader.load_raw_arrays(
+            ['close', 'volume'],
+            early_close + Timedelta('30 min'),
+            minutes_1[-1],
+            [1, 2],
+        )
+        for e, a in zip(expected, actual):
+            assert_array_equal(e, a)
+
+        # Positions which start inside an exclusion only drop the excluded
+        # positions that fall inside the window.
+        interval, = reader._minute_exclusion_tree.overlap(
+            reader._find_position_of_minute(early_close),
+            reader._find_position_of_minute(minutes_1[-1]),
+        )
+        excl_start, excl_stop = interval.data
+        start_idx = excl_start + 5
+        end_idx = excl_stop + 10
+        assert_array_equal(
+            reader._positions_to_keep(start_idx, end_idx),
+            arange(excl_stop - start_idx + 1, end_idx - start_idx + 1),
+        )
+
     def test_adjust_non_trading_minutes(self):
         start_day = Timestamp('2015-06-01')
         end_day = Timestamp('2015-06-02')
@@ -0,0 +1,297 @@
+# Copyright 2026 QuantRocket LLC - All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from unittest.mock import patch
+
+from numpy import arange, isnan
+from numpy.testing import assert_almost_equal, assert_array_equal
+from pandas import DataFrame, DatetimeIndex, NaT, Timedelta, Timestamp
+
+from zipline.data.bar_reader import NoDataForSid
+from zipline.data.minute_bars import (
+    BcolzMinuteBarReader,
+    BcolzMinuteBarWriter,
+    US_EQUITIES_MINUTES_PER_DAY,
+)
+from zipline.data.mmap_minute_bars import (
+    MmapMinuteBarReader,
+    MmapMinuteBarWriter,
+    MmapMinuteNonMarketMinute,
+    MmapMinuteOverlappingData,
+    MmapMinuteWriterColumnMismatch,
+    convert_bcolz_minute_bars,
+)
+from zipline._testing.fixtures import (
+    WithAssetFinder,
+    WithInstanceTmpDir,
+    WithExchangeCalendars,
+    ZiplineTestCase,
+)
+
+TEST_CALENDAR_START = Timestamp('2015-11-02')
+TEST_CALENDAR_STOP = Timestamp('2015-12-31')
+
+COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+class MmapMinuteBarTestCase(WithExchangeCalendars,
+                            WithAssetFinder,
+                            WithInstanceTmpDir,
+                            ZiplineTestCase):
+
+    ASSET_FINDER_EQUITY_SIDS = 1, 2
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(MmapMinuteBarTestCase, cls).init_class_fixtures()
+
+        cal = cls.exchange_calendar.schedule.loc[
+            TEST_CALENDAR_START:TEST_CALENDAR_STOP
+        ]
+        cls.market_opens = cls.exchange_calendar.first_minutes[
+            TEST_CALENDAR_START:TEST_CALENDAR_STOP
+        ]
+        cls.market_closes = cal.close
+
+    def init_instance_fixtures(self):
+        super(MmapMinuteBarTestCase, self).init_instance_fixtures()
+
+        self.dest = self.instance_tmpdir.getpath('mmap_minute_bars')
+        os.makedirs(self.dest)
+        self.writer = MmapMinuteBarWriter(
+            self.dest,
+            self.exchange_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+            ohlc_ratios_per_sid={2: 25},
+        )
+
+    def _minute_data(self, minutes, offset):
+        num_minutes = len(minutes)
+        return DataFrame(
+            data={
+                'open': arange(num_minutes) + offset + 10.0,
+                'high': arange(num_minutes) + offset + 20.0,
+                'low': arange(num_minutes) + offset + 5.0,
+                'close': arange(num_minutes) + offset + 15.0,
+                'volume': arange(num_minutes) + 100,
+            },
+            index=minutes,
+        )
+
+    def _write_fixture(self, writer):
+        """
+        Write minutes around the 2015 Thanksgiving early close for sid 1,
+        and the early close session only for sid 2.
+        """
+        minutes_1 = self.exchange_calendar.minutes_in_range(
+            self.market_closes[Timestamp('2015-11-25')] - Timedelta('9 min'),
+            self.market_opens[Timestamp('2015-11-30')] + Timedelta('9 min'),
+        )
+        minutes_2 = self.exchange_calendar.minutes_in_range(
+            self.market_opens[Timestamp('2015-11-27')],
+            self.market_closes[Timestamp('2015-11-27')],
+        )
+        writer.write_sid(1, self._minute_data(minutes_1, 0))
+        writer.write_sid(2, self._minute_data(minutes_2, 0.4))
+        writer.set_sid_attrs(1, start_day=1, end_day=2)
+        return minutes_1, minutes_2
+
+    def test_get_value(self):
+        minutes_1, minutes_2 = self._write_fixture(self.writer)
+        reader = MmapMinuteBarReader(self.dest)
+
+        self.assertEqual(reader.get_value(1, minutes_1[0], 'open'), 10.0)
+        self.assertEqual(reader.get_value(1, minutes_1[-1], 'volume'),
+                         len(minutes_1) + 99)
+        assert_almost_equal(reader.get_value(2, minutes_2[3], 'close'), 18.4)
+
+        # Minutes after the last written minute have no trades.
+        self.assertTrue(isnan(reader.get_value(2, minutes_1[-1], 'close')))
+        self.assertEqual(reader.get_value(2, minutes_1[-1], 'volume'), 0)
+
+        with self.assertRaises(NoDataForSid):
+            reader.get_value(3, minutes_1[0], 'close')
+
+    def test_last_traded_dt_and_attrs(self):
+        minutes_1, minutes_2 = self._write_fixture(self.writer)
+        reader = MmapMinuteBarReader(self.dest)
+        asset = self.asset_finder.retrieve_asset(2)
+
+        self.assertEqual(
+            reader.get_last_traded_dt(asset, minutes_1[-1]),
+            minutes_2[-1],
+        )
+        self.assertEqual(reader.get_sid_attr(1, 'start_day'), 1)
+        self.assertIsNone(reader.get_sid_attr(2, 'start_day'))
+        # Like the bcolz writer, only sessions with all of their positions
+        # written count as written.
+        self.assertEqual(
+            self.writer.last_date_in_output_for_sid(1),
+            Timestamp('2015-11-27'),
+        )
+        self.assertIs(self.writer.last_date_in_output_for_sid(3), NaT)
+
+    def test_load_raw_arrays_matches_bcolz(self):
+        bcolz_dest = self.instance_tmpdir.getpath('bcolz_minute_bars')
+        os.makedirs(bcolz_dest)
+        bcolz_writer = BcolzMinuteBarWriter(
+            bcolz_dest,
+            self.exchange_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+            ohlc_ratios_per_sid={2: 25},
+        )
+        minutes_1, _ = self._write_fixture(bcolz_writer)
+        self._write_fixture(self.writer)
+
+        # sid 3 has no data.
+        sids = [3, 2, 1]
+        expected = BcolzMinuteBarReader(bcolz_dest).load_raw_arrays(
+            COLUMNS, minutes_1[0], minutes_1[-1], sids,
+        )
+        actual = MmapMinuteBarReader(self.dest).load_raw_arrays(
+            COLUMNS, minutes_1[0], minutes_1[-1], sids,
+        )
+        for e, a in zip(expected, actual):
+            assert_array_equal(e, a)
+            self.assertEqual(e.dtype, a.dtype)
+
+    def test_convert_bcolz_minute_bars(self):
+        bcolz_dest = self.instance_tmpdir.getpath('bcolz_minute_bars')
+        os.makedirs(bcolz_dest)
+        bcolz_writer = BcolzMinuteBarWriter(
+            bcolz_dest,
+            self.exchange_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+            ohlc_ratios_per_sid={2: 25},
+        )
+        minutes_1, minutes_2 = self._write_fixture(bcolz_writer)
+
+        converted = self.instance_tmpdir.getpath('converted')
+        os.makedirs(converted)
+        convert_bcolz_minute_bars(bcolz_dest, converted)
+
+        reader = MmapMinuteBarReader(converted)
+        expected = BcolzMinuteBarReader(bcolz_dest).load_raw_arrays(
+            COLUMNS, minutes_1[0], minutes_1[-1], [1, 2],
+        )
+        actual = reader.load_raw_arrays(
+            COLUMNS, minutes_1[0], minutes_1[-1], [1, 2],
+        )
+        for e, a in zip(expected, actual):
+            assert_array_equal(e, a)
+
+        assert_almost_equal(
+            reader.get_value(2, minutes_2[0], 'close'),
+            15.4,
+        )
+        self.assertEqual(reader.get_sid_attr(1, 'end_day'), 2)
+
+    def test_no_overwrite(self):
+        minutes_1, _ = self._write_fixture(self.writer)
+
+        with self.assertRaises(MmapMinuteOverlappingData):
+            self.writer.write_sid(1, self._minute_data(minutes_1[-3:], 0))
+
+    def test_write_cols_mismatch_length(self):
+        dts = self.exchange_calendar.minutes_in_range(
+            self.market_opens[TEST_CALENDAR_START],
+            self.market_opens[TEST_CALENDAR_START] + Timedelta('1 min'),
+        ).values
+        cols = {
+            'open': [1.0],
+            'high': [1.0],
+            'low': [1.0],
+            'close': [1.0],
+            'volume': [1.0],
+        }
+        with self.assertRaises(MmapMinuteWriterColumnMismatch):
+            self.writer.write_cols(1, dts, cols)
+
+    def test_write_non_market_minutes(self):
+        minutes = self.exchange_calendar.sessions_minutes(
+            TEST_CALENDAR_START, TEST_CALENDAR_START,
+        )
+        after_close = minutes[-1] + Timedelta('1 min')
+        after_end = self.exchange_calendar.session_first_minute(
+            self.exchange_calendar.next_session(TEST_CALENDAR_STOP),
+        )
+        for dt in after_close, after_end:
+            with self.assertRaises(MmapMinuteNonMarketMinute):
+                self.writer.write_sid(
+                    1,
+                    self._minute_data(
+                        minutes[:2].append(DatetimeIndex([dt])), 0,
+                    ),
+                )
+
+        # Nothing was written.
+        self.assertIs(self.writer.last_date_in_output_for_sid(1), NaT)
+
+    def test_empty(self):
+        reader = MmapMinuteBarReader(self.dest)
+        minute = self.market_opens[TEST_CALENDAR_START]
+
+        with self.assertRaises(NoDataForSid):
+            reader.get_value(1, minute, 'close')
+
+        closes, volumes = reader.load_raw_arrays(
+            ['close', 'volume'], minute, minute + Timedelta('9 min'), [1],
+        )
+        self.assertTrue(isnan(closes).all())
+        self.assertFalse(volumes.any())
+
+    def test_write_many_sids(self):
+        minutes = self.exchange_calendar.minutes_in_range(
+            self.market_opens[TEST_CALENDAR_START],
+            self.market_opens[TEST_CALENDAR_START] + Timedelta('9 min'),
+        )
+        sids = list(range(1, 12))
+
+        with patch.object(
+                MmapMinuteBarWriter,
+                '_write_index',
+                autospec=True,
+                side_effect=MmapMinuteBarWriter._write_index) as write_index:
+            self.writer.write(
+                (sid, self._minute_data(minutes, sid)) for sid in sids
+            )
+        # The index is only written once, at the end of the write.
+        self.assertEqual(write_index.call_count, 1)
+
+        # A sid written afterwards is appended to the trimmed files.
+        later = self._minute_data(minutes[-1:] + Timedelta('1 day'), 0)
+        self.writer.write_sid(12, later)
+        sids.append(12)
+
+        for field in COLUMNS:
+            self.assertEqual(
+                os.path.getsize(os.path.join(self.dest, field + '.uint32')),
+                len(sids) * self.writer._num_minutes * 4,
+            )
+
+        reader = MmapMinuteBarReader(self.dest)
+        opens, = reader.load_raw_arrays(
+            ['open'], minutes[0], minutes[-1], sids,
+        )
+        assert_array_equal(opens[0, :-1], [sid + 10.0 for sid in sids[:-1]])
+        self.assertTrue(isnan(opens[:, -1]).all())
+        self.assertEqual(
+            reader.get_value(12, later.index[0], 'open'), 10.0,
+        )
@@ -13,6 +13,7 @@
 # limitations under the License.
 from collections import OrderedDict
 from numbers import Real
+from unittest import mock
 
 from parameterized import parameterized
 from numpy.testing import assert_almost_equal
@@ -524,6 +525,42 @@ class MinuteToDailyAggregationTestCase(WithBcolzEquityMinuteBarReader,
                         asset, field, minute))
 
 
+    @parameterized.expand(OHLCV)
+    def test_staggered_minutes_multiple(self, field):
+        # Request asset 2 only every other minute, so that the assets of a
+        # request were last aggregated at different minutes.
+        method_name = field + 's'
+        assets = self.asset_finder.retrieve_all([1, 2])
+        minutes = EQUITY_CASES[1].index
+
+        reads = []
+        reader = self.bcolz_equity_minute_bar_reader
+
+        def load_raw_arrays(fields, start_dt, end_dt, sids):
+            reads.append(list(sids))
+            return reader.load_raw_arrays(fields, start_dt, end_dt, sids)
+
+        aggregator = self.equity_daily_aggregator
+        aggregator._minute_reader = mock.Mock(
+            wraps=reader, load_raw_arrays=load_raw_arrays,
+        )
+
+        for i, minute in enumerate(minutes):
+            requested = [asset for asset in assets if i % asset.sid == 0]
+            del reads[:]
+            values = getattr(aggregator, method_name)(requested, minute)
+
+            # All of the assets are read at once.
+            self.assertLessEqual(len(reads), 1)
+            for asset, value in zip(requested, values):
+                self.assertIsInstance(value, Real)
+                assert_almost_equal(
+                    value,
+                    EXPECTED_AGGREGATION[asset][field][i],
+                    err_msg='sid={0} field={1} dt={2}'.format(
+                        asset, field, minute))
+
+
 class TestMinuteToSession(WithEquityMinuteBarData,
                           ZiplineTestCase):
 
@@ -32,7 +32,9 @@ from zipline.finance.order import Order
 from zipline.finance.slippage import (
     EquitySlippageModel,
     fill_price_worse_than_limit_price,
+    FixedSlippage,
     FutureSlippageModel,
+    NoSlippage,
     SlippageModel,
     VolatilityVolumeShare,
     VolumeShareSlippage,
@@ -984,6 +986,63 @@ class MarketImpactTestCase(WithCreateBarData, ZiplineTestCase):
         self.assertEqual(volatility, reference_vol)
 
 
+class MarketImpactBatchTestCase(WithCreateBarData, ZiplineTestCase):
+
+    ASSET_FINDER_EQUITY_SIDS = 1, 2, 3, 4
+
+    @classmethod
+    def make_equity_minute_bar_data(cls):
+        minutes = cls.exchange_calendars[Equity].sessions_minutes(
+            cls.equity_minute_bar_days[0],
+            cls.equity_minute_bar_days[-1],
+        )
+        rand = np.random.RandomState(1337)
+        for sid in cls.ASSET_FINDER_EQUITY_SIDS:
+            close = np.round(
+                50 * np.exp(np.cumsum(rand.normal(0, 0.001, len(minutes)))),
+                3,
+            )
+            yield sid, pd.DataFrame(
+                {
+                    'open': close,
+                    'high': close + 0.01,
+                    'low': close - 0.01,
+                    'close': close,
+                    'volume': rand.randint(100, 1000, len(minutes)),
+                },
+                index=minutes,
+            )
+
+    def test_load_window_data(self):
+        session = pd.Timestamp('2006-03-01')
+        minute = self.exchange_calendar.session_minutes(session)[1]
+        data = self.create_bardata(simulation_dt_func=lambda: minute)
+        assets = self.asset_finder.retrieve_all(self.ASSET_FINDER_EQUITY_SIDS)
+
+        model = VolatilityVolumeShare(0.0)
+        model._load_window_data(data, assets, window_length=20)
+        for asset in assets:
+            # the window data is cached for the session
+            model._window_data_cache.get(asset, data.current_session)
+
+            expected = VolatilityVolumeShare(0.0)._get_window_data(
+                data, asset, window_length=20,
+            )
+            self.assertEqual(
+                model._get_window_data(data, asset, window_length=20),
+                expected,
+            )
+            self.assertFalse(np.isnan(expected[1]))
+
+    def test_supports_batch(self):
+        class CustomImpact(VolatilityVolumeShare):
+            def process_order(self, data, order):
+                return 1.0, order.open_amount
+
+        self.assertTrue(VolatilityVolumeShare(0.1).supports_batch)
+        self.assertFalse(CustomImpact(0.1).supports_batch)
+
+
 class OrdersStopTestCase(WithSimParams,
                          WithAssetFinder,
                          WithExchangeCalendars,
@@ -1393,3 +1452,112 @@ class FixedBasisPointsSlippageTestCase(WithCreateBarData,
         ))
         txns = [txn for _, txn in orders_txns if txn is not None]
         self.assertEqual(0, len(txns))
+
+
+class SimulateBatchTestCase(WithCreateBarData, ZiplineTestCase):
+
+    START_DATE = pd.Timestamp('2006-01-05')
+    END_DATE = pd.Timestamp('2006-01-05')
+    SIM_PARAMS_DATA_FREQUENCY = 'minute'
+
+    ASSET_FINDER_EQUITY_SIDS = 1, 2, 3, 4, 5, 6
+
+    @classmethod
+    def make_equity_minute_bar_data(cls):
+        minutes = cls.exchange_calendars[Equity].sessions_minutes(
+            cls.START_DATE, cls.END_DATE,
+        )
+        for sid, frame in create_minute_bar_data(
+                minutes, cls.ASSET_FINDER_EQUITY_SIDS):
+            if sid == 5:
+                frame['volume'] = 10000
+            elif sid == 6:
+                frame['volume'] = 0
+            yield sid, frame
+
+    def make_orders(self, dt):
+        assets = self.asset_finder.retrieve_all(self.ASSET_FINDER_EQUITY_SIDS)
+
+        def order(asset, amount, filled=0, **kwargs):
+            return Order(
+                dt=dt,
+                asset=asset,
+                amount=amount,
+                filled=filled,
+                id='{}-{}-{}'.format(asset.sid, amount, filled),
+                **kwargs
+            )
+
+        a1, a2, a3, a4, a5, a6 = assets
+        return [
+            (a1, [order(a1, 5), order(a1, 3), order(a1, -4)]),
+            (a2, [order(a2, 10, limit=1.0), order(a2, 50), order(a2, 5, 5)]),
+            (a3, [order(a3, 10, stop=5.0), order(a3, -10, limit=5.0)]),
+            (a4, [order(a4, -20, -15)]),
+            (a5, [order(a5, 200), order(a5, 300), order(a5, -100)]),
+            (a6, [order(a6, 10)]),
+        ]
+
+    @staticmethod
+    def summarize(orders_by_asset, fills):
+        return {
+            asset.sid: [
+                (
+                    order.id,
+                    order.stop_reached,
+                    order.limit_reached,
+                    None if txn is None else (txn.amount, txn.price, txn.dt),
+                )
+                for order, txn in fills[asset]
+            ]
+            for asset, _ in orders_by_asset
+        }
+
+    @parameterized.expand([
+        ('volume_share', VolumeShareSlippage()),
+        ('volume_share_full_volume', VolumeShareSlippage(volume_limit=1.0)),
+        ('volume_share_impact', VolumeShareSlippage(price_impact=2.0)),
+        ('fixed_bps', FixedBasisPointsSlippage()),
+        ('fixed_bps_half_volume', FixedBasisPointsSlippage(volume_limit=0.5)),
+        ('fixed', FixedSlippage(spread=0.1)),
+    ])
+    def test_matches_simulate(self, name, model):
+        self.assertTrue(model.supports_batch)
+
+        minute = self.exchange_calendar.session_minutes(self.START_DATE)[1]
+        data = self.create_bardata(simulation_dt_func=lambda: minute)
+
+        orders_by_asset = self.make_orders(minute)
+        expected = self.summarize(orders_by_asset, {
+            asset: list(model.simulate(data, asset, orders, 'minute'))
+            for asset, orders in orders_by_asset
+        })
+
+        orders_by_asset = self.make_orders(minute)
+        actual = self.summarize(
+            orders_by_asset,
+            model.simulate_batch(data, orders_by_asset, 'minute'),
+        )
+
+        self.assertEqual(actual, expected)
+        # the orders of every asset with volume are simulated
+        self.assertTrue(all(actual[sid] for sid in (1, 2, 3, 4, 5)))
+        self.assertEqual(actual[6], [])
+
+    def test_falls_back_to_simulate(self):
+        class CustomVolumeShare(VolumeShareSlippage):
+            def process_order(self, data, order):
+                return 1.0, order.open_amount
+
+        self.assertFalse(CustomVolumeShare().supports_batch)
+        self.assertFalse(NoSlippage().supports_batch)
+
+        minute = self.exchange_calendar.session_minutes(self.START_DATE)[1]
+        data = self.create_bardata(simulation_dt_func=lambda: minute)
+        orders_by_asset = self.make_orders(minute)
+        fills = CustomVolumeShare().simulate_batch(
+            data, orders_by_asset, 'minute',
+        )
+        for order, txn in fills[orders_by_asset[0][0]]:
+            self.assertEqual(txn.price, 1.0)
+            self.assertEqual(txn.amount, order.open_amount)
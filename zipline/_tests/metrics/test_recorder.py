@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+
+from zipline.finance.metrics import DailyPerfRecorder
+from zipline._testing.fixtures import ZiplineTestCase
+from zipline._testing.predicates import assert_equal
+
+
+def expected_daily_stats(perfs):
+    """Build the daily stats from a list of perf packets the way
+    ``TradingAlgorithm`` did before the recorder.
+    """
+    daily_perfs = []
+    for perf in perfs:
+        if 'daily_perf' in perf:
+            daily_perf = dict(perf['daily_perf'])
+            daily_perf.update(daily_perf.pop('recorded_vars'))
+            daily_perf.update(perf['cumulative_risk_metrics'])
+            daily_perfs.append(daily_perf)
+    return pd.DataFrame(
+        daily_perfs,
+        index=pd.DatetimeIndex([p['period_close'] for p in daily_perfs]),
+    )
+
+
+def make_packet(i, close):
+    daily_perf = {
+        'period_close': close,
+        'period_open': close - pd.Timedelta(hours=6, minutes=30),
+        'returns': 0.01 * i,
+        'pnl': 10 * i,
+        'ending_cash': 1e6 + i,
+        'orders': [{'id': str(i), 'amount': i}] if i % 3 else [],
+        'transactions': [],
+        'positions': [{'sid': 1, 'amount': i}],
+        'capital_used': 0 if i % 2 else -1.5 * i,
+        'big': 2 ** 60 if i == 4 else 1,
+        'flag': bool(i % 2),
+        'maybe_flag': None if i < 2 else i == 3,
+        'label': 'session-{}'.format(i),
+        'recorded_vars': {
+            'signal': None if i == 0 else i / 3.0,
+            'count': i,
+            # overrides the daily perf field
+            'label': i,
+        },
+    }
+    if i > 5:
+        # a field that only appears part of the way through
+        daily_perf['late'] = i
+    risk = {
+        'sharpe': None if i < 2 else 0.5 * i,
+        'alpha': None,
+        'max_drawdown': 0.0,
+        'trading_days': i + 1,
+        'period_label': close.strftime('%Y-%m'),
+    }
+    return {
+        'period_start': close,
+        'daily_perf': daily_perf,
+        'cumulative_perf': {},
+        'cumulative_risk_metrics': risk,
+    }
+
+
+class DailyPerfRecorderTestCase(ZiplineTestCase):
+
+    def make_perfs(self, num_sessions):
+        closes = pd.date_range(
+            '2014-01-02 21:00', periods=num_sessions, freq='D', tz='UTC',
+        )
+        perfs = [make_packet(i, close) for i, close in enumerate(closes)]
+        perfs.append({'cumulative_risk_metrics': {'sharpe': 1.0}})
+        return perfs
+
+    def test_matches_dataframe_of_packets(self):
+        # with enough capacity, and when the columns have to grow
+        for num_sessions, capacity in (10, 10), (10, 3), (1, 0):
+            perfs = self.make_perfs(num_sessions)
+            recorder = DailyPerfRecorder(capacity)
+            for perf in perfs:
+                recorder.record(perf)
+
+            self.assertEqual(len(recorder), num_sessions)
+            self.assertIs(recorder.risk_report, perfs[-1])
+
+            actual = recorder.to_frame()
+            expected = expected_daily_stats(perfs)
+            assert_equal(actual, expected)
+            assert_equal(actual.dtypes, expected.dtypes)
+
+    def test_empty(self):
+        recorder = DailyPerfRecorder(5)
+        self.assertEqual(len(recorder), 0)
+        self.assertIsNone(recorder.risk_report)
+        self.assertTrue(recorder.to_frame().empty)
+
+    def test_column_dtypes(self):
+        perfs = self.make_perfs(8)
+        recorder = DailyPerfRecorder(len(perfs))
+        for perf in perfs:
+            recorder.record(perf)
+        dtypes = recorder.to_frame().dtypes
+
+        self.assertEqual(dtypes['pnl'], np.dtype('int64'))
+        self.assertEqual(dtypes['count'], np.dtype('int64'))
+        self.assertEqual(dtypes['returns'], np.dtype('float64'))
+        self.assertEqual(dtypes['signal'], np.dtype('float64'))
+        self.assertEqual(dtypes['late'], np.dtype('float64'))
+        self.assertEqual(dtypes['flag'], np.dtype('bool'))
+        self.assertEqual(dtypes['alpha'], np.dtype('object'))
+        self.assertEqual(dtypes['orders'], np.dtype('object'))
@@ -0,0 +1,194 @@
+from collections import defaultdict
+
+import empyrical as ep
+import numpy as np
+import pandas as pd
+from parameterized import parameterized
+
+from zipline import api
+from zipline.finance.metrics import (
+    StreamingAlphaBeta,
+    StreamingReturnsStatistic,
+    load as load_metrics_set,
+)
+from zipline._testing.fixtures import WithMakeAlgo, ZiplineTestCase
+from zipline._testing.predicates import assert_equal
+
+
+class FakeLedger(object):
+    def __init__(self, num_sessions):
+        self.daily_returns_array = np.full(num_sessions, np.nan)
+
+
+class FakeBenchmarkSource(object):
+    def __init__(self, returns):
+        self._returns = returns
+
+    def daily_returns(self, start, end):
+        return pd.Series(self._returns)
+
+
+def nan_to_none(value):
+    return None if not np.isfinite(value) else value
+
+
+def make_returns(kind, num_sessions):
+    rand = np.random.RandomState(1337)
+    if kind == 'random':
+        return rand.normal(0.0005, 0.01, num_sessions)
+    elif kind == 'zeros':
+        return np.zeros(num_sessions)
+    elif kind == 'leading_zeros':
+        returns = rand.normal(0, 0.02, num_sessions)
+        returns[:num_sessions // 2] = 0
+        return returns
+    raise ValueError(kind)
+
+
+def simulate(metric, ledger, returns, bars_per_session):
+    """Run ``metric`` over ``returns`` like the metrics tracker, setting the
+    partial returns of the session at each bar, and yield each session index
+    with the returns so far and the packet.
+    """
+    rand = np.random.RandomState(42)
+    for session_ix, value in enumerate(returns):
+        # the partial returns of the session before the close
+        for _ in range(bars_per_session - 1):
+            partial = value * rand.uniform(-1, 2)
+            ledger.daily_returns_array[session_ix] = partial
+            packet = defaultdict(dict)
+            metric.end_of_bar(packet, ledger, None, session_ix, None)
+            yield session_ix, np.append(returns[:session_ix], partial), packet
+
+        ledger.daily_returns_array[session_ix] = value
+        packet = defaultdict(dict)
+        metric.end_of_session(packet, ledger, None, session_ix, None)
+        yield session_ix, returns[:session_ix + 1], packet
+
+
+class StreamingReturnsStatisticTestCase(ZiplineTestCase):
+
+    @parameterized.expand([
+        (function, kind, bars_per_session)
+        for function in (
+            ep.annual_volatility,
+            ep.sharpe_ratio,
+            ep.sortino_ratio,
+            ep.max_drawdown,
+        )
+        for kind in ('random', 'zeros', 'leading_zeros')
+        for bars_per_session in (1, 3)
+    ])
+    def test_matches_empyrical(self, function, kind, bars_per_session):
+        returns = make_returns(kind, 300)
+        ledger = FakeLedger(len(returns))
+        metric = StreamingReturnsStatistic(function, 'stat')
+        metric.start_of_simulation(ledger, 'daily', None, None, None)
+
+        for session_ix, returns_so_far, packet in simulate(
+                metric, ledger, returns, bars_per_session):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                expected = nan_to_none(function(returns_so_far))
+            actual = packet['cumulative_risk_metrics']['stat']
+            if expected is None:
+                self.assertIsNone(actual, msg=session_ix)
+            else:
+                np.testing.assert_allclose(
+                    actual, expected, rtol=1e-9, err_msg=str(session_ix),
+                )
+
+    def test_field_name(self):
+        self.assertEqual(
+            StreamingReturnsStatistic(ep.max_drawdown)._field_name,
+            'max_drawdown',
+        )
+
+    def test_unsupported_function(self):
+        with self.assertRaises(ValueError):
+            StreamingReturnsStatistic(ep.calmar_ratio)
+
+
+class StreamingAlphaBetaTestCase(ZiplineTestCase):
+
+    @parameterized.expand([
+        (kind, benchmark_nans, bars_per_session)
+        for kind in ('random', 'zeros', 'leading_zeros')
+        for benchmark_nans in (False, True)
+        for bars_per_session in (1, 3)
+    ])
+    def test_matches_empyrical(self, kind, benchmark_nans, bars_per_session):
+        returns = make_returns(kind, 300)
+        benchmark_returns = np.random.RandomState(0).normal(
+            0.0003, 0.01, len(returns),
+        )
+        if benchmark_nans:
+            benchmark_returns[[0, 5, 6, 100]] = np.nan
+
+        ledger = FakeLedger(len(returns))
+        metric = StreamingAlphaBeta()
+        metric.start_of_simulation(
+            ledger,
+            'daily',
+            None,
+            [None, None],
+            FakeBenchmarkSource(benchmark_returns),
+        )
+
+        for session_ix, returns_so_far, packet in simulate(
+                metric, ledger, returns, bars_per_session):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                expected = ep.alpha_beta_aligned(
+                    returns_so_far,
+                    benchmark_returns[:session_ix + 1],
+                )
+            risk = packet['cumulative_risk_metrics']
+            for field, value in zip(('alpha', 'beta'), expected):
+                value = nan_to_none(value)
+                if value is None:
+                    self.assertIsNone(risk[field], msg=session_ix)
+                else:
+                    np.testing.assert_allclose(
+                        risk[field],
+                        value,
+                        rtol=1e-7,
+                        err_msg=str(session_ix),
+                    )
+
+
+class StreamingMetricsSetTestCase(WithMakeAlgo, ZiplineTestCase):
+    START_DATE = pd.Timestamp('2006-01-03')
+    END_DATE = pd.Timestamp('2006-06-30')
+    ASSET_FINDER_EQUITY_SIDS = 1, 2
+    SIM_PARAMS_DATA_FREQUENCY = 'daily'
+    DATA_PORTAL_USE_MINUTE_DATA = False
+
+    def test_matches_default_metrics(self):
+        def initialize(context):
+            context.bar_count = 0
+
+        def handle_data(context, data):
+            asset = api.sid(1 + context.bar_count // 5 % 2)
+            target = 1.0 if context.bar_count % 3 else 0.5
+            api.order_target_percent(asset, target)
+            context.bar_count += 1
+
+        fields = [
+            'algo_volatility',
+            'alpha',
+            'beta',
+            'max_drawdown',
+            'sharpe',
+            'sortino',
+        ]
+        expected = self.run_algorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+        )[fields]
+        actual = self.run_algorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            metrics_set=load_metrics_set('streaming'),
+        )[fields]
+
+        self.assertTrue(expected.notnull().values[2:].all())
+        assert_equal(actual, expected, check_exact=False)
@@ -5,7 +5,11 @@ from __future__ import division
 import re
 from collections import OrderedDict, ChainMap
 from itertools import product
+from multiprocessing.pool import ThreadPool
 from operator import add, sub
+import threading
+import time
+from interface import implements
 from mock import patch
 
 from parameterized import parameterized
@@ -54,7 +58,11 @@ from zipline.pipeline.domain import (
     JP_EQUITIES,
     US_EQUITIES,
 )
-from zipline.pipeline.engine import SimplePipelineEngine, DataFrameWithMetadata
+from zipline.pipeline.engine import (
+    DataFrameWithMetadata,
+    run_chunked_pipeline_in_processes,
+    SimplePipelineEngine,
+)
 from zipline.pipeline.factors import (
     AverageDollarVolume,
     EWMA,
@@ -64,6 +72,9 @@ from zipline.pipeline.factors import (
     MaxDrawdown,
     SimpleMovingAverage,
 )
+from zipline.pipeline.graph import maybe_specialize
+from zipline.pipeline.hooks import PipelineHooks
+from zipline.pipeline.hooks.testing import TestingHooks
 from zipline.pipeline.filters import (
     CustomFilter,
     SingleAsset,
@@ -78,7 +89,8 @@ from zipline.pipeline.loaders.synthetic import (
     make_bar_data,
     expected_bar_values_2d,
 )
-from zipline.pipeline.term import InputDates
+from zipline.pipeline.term import AssetExists, InputDates
+from zipline.pipeline.term_cache import TermResultCache
 from zipline._testing import (
     AssetID,
     AssetIDPlusDay,
@@ -93,8 +105,10 @@ import zipline._testing.fixtures as zf
 from zipline.utils.exploding_object import NamedExplodingObject
 from zipline._testing.core import create_simple_domain
 from zipline._testing.predicates import assert_equal
+from zipline.utils.compat import contextmanager
 from zipline.utils.memoize import lazyval
 from zipline.utils.numpy_utils import bool_dtype, datetime64ns_dtype
+from zipline.utils.pandas_utils import categorical_df_concat
 
 
 class RollingSumDifference(CustomFactor):
@@ -1790,6 +1804,476 @@ class ChunkedPipelineTestCase(zf.WithSeededRandomPipelineEngine,
         )
 
 
+    def test_iter_pipeline(self):
+        pipe = Pipeline(
+            columns={
+                'float': TestingDataSet.float_col.latest,
+                'categorical': TestingDataSet.categorical_col.latest
+            },
+            domain=US_EQUITIES,
+        )
+        expected = self.run_pipeline(
+            pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+        )
+
+        chunks = list(self.seeded_random_engine.iter_pipeline(
+            pipe,
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+            chunksize=22,
+        ))
+        self.assertEqual(len(chunks), 12)
+        for chunk in chunks:
+            self.assertLessEqual(
+                len(chunk.index.get_level_values(0).unique()), 22,
+            )
+        assert_frame_equal(categorical_df_concat(chunks), expected)
+
+        # A chunksize of 1 yields one frame per day.
+        end_date = self.PIPELINE_START_DATE + pd.Timedelta(days=6)
+        daily = list(self.seeded_random_engine.iter_pipeline(
+            pipe,
+            self.PIPELINE_START_DATE,
+            end_date,
+            chunksize=1,
+        ))
+        dates = expected.index.get_level_values(0).unique()
+        self.assertEqual(
+            [chunk.index.get_level_values(0).unique().tolist() for chunk in daily],
+            [[date] for date in dates[dates <= end_date]],
+        )
+
+    def test_iter_pipeline_is_lazy(self):
+        hooks = TestingHooks()
+        pipe = Pipeline(
+            columns={'float': TestingDataSet.float_col.latest},
+            domain=US_EQUITIES,
+        )
+        results = self.seeded_random_engine.iter_pipeline(
+            pipe,
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+            chunksize=22,
+            hooks=[hooks],
+        )
+        self.assertEqual(hooks.trace, [])
+
+        next(results)
+        chunks = [
+            call for call in hooks.trace
+            if call.method_name == 'computing_chunk' and call.state == 'enter'
+        ]
+        self.assertEqual(len(chunks), 1)
+        results.close()
+
+
+class ProcessChunkedPipelineTestCase(zf.WithSeededRandomPipelineEngine,
+                                     zf.ZiplineTestCase):
+
+    PIPELINE_START_DATE = Timestamp('2006-01-05')
+    END_DATE = Timestamp('2006-12-29')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def make_engine(self):
+        return SimplePipelineEngine(
+            get_loader=lambda column: self.seeded_random_loader,
+            asset_finder=self.asset_finder,
+        )
+
+    def test_matches_serial_chunks(self):
+        pipe = Pipeline(
+            columns={
+                'float': TestingDataSet.float_col.latest,
+                'custom_factor': SimpleMovingAverage(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=10,
+                ),
+                # Each chunk has different categories.
+                'categorical': TestingDataSet.categorical_col.latest
+            },
+            screen=TestingDataSet.bool_col.latest,
+            domain=US_EQUITIES,
+        )
+        serial_hooks = TestingHooks()
+        process_hooks = TestingHooks()
+
+        expected = self.run_chunked_pipeline(
+            pipeline=pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=66,
+            hooks=[serial_hooks],
+        )
+        # The engine passed in is used in this process, and the factory is
+        # only called in the workers.
+        worker_engine_calls = []
+
+        def make_worker_engine():
+            worker_engine_calls.append(None)
+            return self.make_engine()
+
+        result = run_chunked_pipeline_in_processes(
+            self.make_engine(),
+            make_worker_engine,
+            pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=66,
+            workers=2,
+            hooks=[process_hooks],
+        )
+        assert_frame_equal(result, expected)
+        self.assertEqual(worker_engine_calls, [])
+
+        # The hook events of the workers are replayed in chunk order.
+        self.assertEqual(process_hooks.trace, serial_hooks.trace)
+        self.assertEqual(
+            len([c for c in process_hooks.trace
+                 if c.method_name == 'computing_chunk']),
+            2 * 4,
+        )
+
+    def test_worker_error_propagates(self):
+
+        class Explodes(CustomFactor):
+            inputs = [TestingDataSet.float_col]
+            window_length = 1
+
+            def compute(self, today, assets, out, values):
+                raise ValueError('boom')
+
+        pipe = Pipeline({'explodes': Explodes()}, domain=US_EQUITIES)
+
+        with self.assertRaises(ValueError) as e:
+            run_chunked_pipeline_in_processes(
+                self.make_engine(),
+                self.make_engine,
+                pipe,
+                start_date=self.PIPELINE_START_DATE,
+                end_date=self.END_DATE,
+                chunksize=66,
+                workers=2,
+            )
+        self.assertEqual(str(e.exception), 'boom')
+
+
+class ConcurrencyRecordingLoader(object):
+    """
+    Loader that records the maximum number of concurrent calls to
+    load_adjusted_array on the wrapped loader.
+    """
+    currency_aware = False
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._active = 0
+        self.max_active = 0
+
+    def load_adjusted_array(self, domain, columns, dates, sids, mask):
+        with self._lock:
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        try:
+            time.sleep(0.01)
+            return self._loader.load_adjusted_array(
+                domain, columns, dates, sids, mask,
+            )
+        finally:
+            with self._lock:
+                self._active -= 1
+
+
+class ComputePoolTestCase(zf.WithSeededRandomPipelineEngine,
+                          zf.ZiplineTestCase):
+
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+    SEEDED_RANDOM_PIPELINE_DEFAULT_DOMAIN = US_EQUITIES
+
+    def init_instance_fixtures(self):
+        super(ComputePoolTestCase, self).init_instance_fixtures()
+        self.pool = ThreadPool(4)
+        self.add_instance_callback(self.pool.terminate)
+        self.loader = ConcurrencyRecordingLoader(self.seeded_random_loader)
+        self.engine = SimplePipelineEngine(
+            get_loader=lambda column: self.loader,
+            asset_finder=self.asset_finder,
+            default_domain=US_EQUITIES,
+            compute_pool=self.pool,
+        )
+
+    def make_pipeline(self):
+        float_col = TestingDataSet.float_col
+        sma = SimpleMovingAverage(inputs=[float_col], window_length=10)
+        return Pipeline(
+            columns={
+                'float': float_col.latest,
+                'sma': sma,
+                'sma_rank': sma.rank(),
+                'zscore': (float_col.latest - sma).zscore(),
+                'int': TestingDataSet.int_col.latest,
+                'categorical': TestingDataSet.categorical_col.latest,
+            },
+            screen=TestingDataSet.bool_col.latest,
+        )
+
+    def test_matches_sequential(self):
+        pipe = self.make_pipeline()
+        start_date, end_date = self.trading_days[[-30, -1]]
+
+        expected = self.run_pipeline(pipe, start_date, end_date)
+        result = self.engine.run_pipeline(pipe, start_date, end_date)
+        assert_frame_equal(result, expected)
+
+        chunked_result = self.engine.run_chunked_pipeline(
+            pipe, start_date, end_date, chunksize=10,
+        )
+        assert_frame_equal(chunked_result, expected)
+
+        # Terms from the same loader were never loaded concurrently.
+        self.assertEqual(self.loader.max_active, 1)
+
+    def test_hooks_follow_dependencies(self):
+        pipe = self.make_pipeline()
+        start_date, end_date = self.trading_days[[-30, -1]]
+        hooks = TestingHooks()
+
+        self.engine.run_pipeline(pipe, start_date, end_date, hooks=[hooks])
+
+        trace = [
+            c for c in hooks.trace if c.method_name != 'on_workspace_update'
+        ]
+        self.assertEqual(
+            [c.method_name for c in (trace[0], trace[1], trace[-2], trace[-1])],
+            ['running_pipeline', 'computing_chunk',
+             'computing_chunk', 'running_pipeline'],
+        )
+        entered = {}
+        exited = {}
+        for i, call in enumerate(trace[2:-2]):
+            if call.method_name == 'loading_terms':
+                terms = call.args[0]
+            else:
+                terms = [call.args[0]]
+            seen = entered if call.state == 'enter' else exited
+            for term in terms:
+                self.assertNotIn(term, seen)
+                seen[term] = i
+
+        # Every term was entered and exited once, after the terms it depends
+        # on were exited.
+        self.assertEqual(set(entered), set(exited))
+        plan = pipe.to_execution_plan(
+            US_EQUITIES, AssetExists(), start_date, end_date,
+        )
+        for term, i in entered.items():
+            self.assertGreater(exited[term], i)
+            for dep in term.dependencies:
+                dep = maybe_specialize(dep, US_EQUITIES)
+                if dep in exited:
+                    self.assertLess(exited[dep], i)
+            self.assertIn(term, plan)
+
+    def test_error_propagates(self):
+
+        class Explodes(CustomFactor):
+            inputs = [TestingDataSet.float_col]
+            window_length = 1
+
+            def compute(self, today, assets, out, values):
+                raise ValueError('boom')
+
+        pipe = Pipeline(
+            columns={
+                'float': TestingDataSet.float_col.latest.rank(),
+                'explodes': Explodes(),
+            },
+        )
+        hooks = TestingHooks()
+        start_date, end_date = self.trading_days[[-10, -1]]
+
+        with self.assertRaises(ValueError) as e:
+            self.engine.run_pipeline(
+                pipe, start_date, end_date, hooks=[hooks],
+            )
+        self.assertEqual(str(e.exception), 'boom')
+
+        # The error was raised through the contexts of the failed term, the
+        # chunk and the pipeline. Every other context was exited normally.
+        trace = [
+            c for c in hooks.trace if c.method_name != 'on_workspace_update'
+        ]
+        exited = [c.call for c in trace if c.state == 'exit']
+        not_exited = [
+            c.call for c in trace
+            if c.state == 'enter' and c.call not in exited
+        ]
+        self.assertEqual(
+            [c.method_name for c in not_exited],
+            ['running_pipeline', 'computing_chunk', 'computing_term'],
+        )
+        self.assertIsInstance(not_exited[-1].args[0], Explodes)
+
+
+class CountingLoader(object):
+    """
+    Loader that counts the columns loaded from the wrapped loader.
+    """
+    currency_aware = False
+
+    def __init__(self, loader):
+        self._loader = loader
+        self.loaded = []
+
+    def load_adjusted_array(self, domain, columns, dates, sids, mask):
+        self.loaded.extend(c.unspecialize() for c in columns)
+        return self._loader.load_adjusted_array(
+            domain, columns, dates, sids, mask,
+        )
+
+
+class TermResultCacheTestCase(zf.WithSeededRandomPipelineEngine,
+                              zf.ZiplineTestCase):
+
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+    SEEDED_RANDOM_PIPELINE_DEFAULT_DOMAIN = US_EQUITIES
+
+    def init_instance_fixtures(self):
+        super(TermResultCacheTestCase, self).init_instance_fixtures()
+        self.cache = TermResultCache()
+        self.loader = CountingLoader(self.seeded_random_loader)
+        self.engine = SimplePipelineEngine(
+            get_loader=lambda column: self.loader,
+            asset_finder=self.asset_finder,
+            default_domain=US_EQUITIES,
+            term_cache=self.cache,
+        )
+
+    def test_cached_terms_skip_dependencies(self):
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col], window_length=10,
+        )
+        pipe = Pipeline(
+            columns={
+                'sma': sma,
+                'categorical': TestingDataSet.categorical_col.latest,
+            },
+            screen=TestingDataSet.bool_col.latest,
+        )
+        start_date, end_date = self.trading_days[[-20, -1]]
+        hooks = TestingHooks()
+
+        expected = self.run_pipeline(pipe, start_date, end_date)
+        result = self.engine.run_pipeline(
+            pipe, start_date, end_date, hooks=[hooks],
+        )
+        assert_frame_equal(result, expected)
+        self.assertEqual(len(self.cache), 3)
+
+        # The second run takes every output from the cache.
+        self.loader.loaded = []
+        hooks.clear()
+        result = self.engine.run_pipeline(
+            pipe, start_date, end_date, hooks=[hooks],
+        )
+        assert_frame_equal(result, expected)
+        self.assertEqual(self.loader.loaded, [])
+
+        lookups = [c for c in hooks.trace
+                   if c.method_name == 'on_term_cache_lookup']
+        self.assertEqual(len(lookups), 1)
+        hits, misses, nbytes = lookups[0].args
+        self.assertEqual(
+            set(hits),
+            {sma, TestingDataSet.categorical_col.latest,
+             TestingDataSet.bool_col.latest},
+        )
+        self.assertEqual(misses, [])
+        self.assertEqual(nbytes, self.cache.nbytes)
+        self.assertGreater(nbytes, 0)
+
+        # Adding a column only computes the new column.
+        pipe.add(TestingDataSet.int_col.latest, 'int')
+        result = self.engine.run_pipeline(pipe, start_date, end_date)
+        assert_frame_equal(
+            result, self.run_pipeline(pipe, start_date, end_date),
+        )
+        self.assertEqual(self.loader.loaded, [TestingDataSet.int_col])
+
+    def test_hooks_without_cache_lookup(self):
+        # Hooks written before on_term_cache_lookup and on_workspace_update
+        # were added still implement PipelineHooks.
+        class OldHooks(implements(PipelineHooks)):
+            def __init__(self):
+                self.computed = []
+
+            @contextmanager
+            def running_pipeline(self, pipeline, start_date, end_date):
+                yield
+
+            @contextmanager
+            def computing_chunk(self, terms, start_date, end_date):
+                yield
+
+            @contextmanager
+            def loading_terms(self, terms):
+                yield
+
+            @contextmanager
+            def computing_term(self, term):
+                self.computed.append(term)
+                yield
+
+        pipe = Pipeline({'float': TestingDataSet.float_col.latest})
+        start_date, end_date = self.trading_days[[-20, -1]]
+        old_hooks = OldHooks()
+        hooks = TestingHooks()
+
+        for _ in range(2):
+            self.engine.run_pipeline(
+                pipe, start_date, end_date, hooks=[old_hooks, hooks],
+            )
+
+        self.assertEqual(old_hooks.computed, [TestingDataSet.float_col.latest])
+        lookups = [c for c in hooks.trace
+                   if c.method_name == 'on_term_cache_lookup']
+        self.assertEqual(len(lookups), 2)
+
+    def test_different_dates_or_assets_miss(self):
+        pipe = Pipeline({'float': TestingDataSet.float_col.latest})
+        start_date, end_date = self.trading_days[[-20, -1]]
+
+        self.engine.run_pipeline(pipe, start_date, end_date)
+        self.engine.run_pipeline(pipe, self.trading_days[-19], end_date)
+        self.assertEqual(len(self.loader.loaded), 2)
+
+        pipe.set_screen(StaticSids(self.asset_finder.sids[:2]))
+        self.engine.run_pipeline(pipe, start_date, end_date)
+        self.assertEqual(len(self.loader.loaded), 3)
+
+    def test_lru_eviction(self):
+        cache = TermResultCache(max_size=3 * 80)
+        value = np.zeros(10)
+
+        for key in 'abc':
+            cache.set(key, value)
+        # Use a so that b is the least recently used.
+        cache.get('a')
+        cache.set('d', value)
+
+        self.assertEqual(cache.nbytes, 3 * 80)
+        self.assertNotIn('b', cache)
+        for key in 'acd':
+            self.assertIn(key, cache)
+
+        # Values are copied in and out of the cache.
+        cached = cache.get('a')
+        cached[:] = 1
+        self.assertFalse(cache.get('a').any())
+
+
 class MaximumRegressionTest(zf.WithSeededRandomPipelineEngine,
                             zf.ZiplineTestCase):
     ASSET_FINDER_EQUITY_SIDS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
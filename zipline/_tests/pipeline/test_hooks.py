@@ -11,6 +11,8 @@ from zipline.pipeline.domain import US_EQUITIES
 from zipline.pipeline.factors import CustomFactor
 from zipline.pipeline.data import Column, DataSet
 from zipline.pipeline.data.testing import TestingDataSet
+from zipline.pipeline.hooks import DelegatingHooks
+from zipline.pipeline.hooks.profiling import ProfilingHooks
 from zipline.pipeline.hooks.testing import TestingHooks
 from zipline.pipeline.hooks.progress import (
     ProgressHooks,
@@ -22,6 +24,7 @@ from zipline._testing import parameter_space
 from zipline._testing.fixtures import (
     ZiplineTestCase,
     WithSeededRandomPipelineEngine,
+    WithTmpDir,
 )
 from zipline._testing.predicates import instance_of
 
@@ -125,6 +128,8 @@ class HooksTestCase(WithSeededRandomPipelineEngine, ZiplineTestCase):
                      expected_chunks):
         """Verify a trace of a Pipeline execution.
         """
+        trace = [c for c in trace if c.method_name != 'on_workspace_update']
+
         # First/last calls should bracket the pipeline execution.
         self.expect_context_pair(trace[0], trace[-1], 'running_pipeline')
         self.assertEqual(
@@ -464,6 +469,125 @@ class ProgressHooksTestCase(WithSeededRandomPipelineEngine, ZiplineTestCase):
         return round((100.0 * days_complete) / total_days, 3)
 
 
+class ProfilingHooksTestCase(WithSeededRandomPipelineEngine,
+                             WithTmpDir,
+                             ZiplineTestCase):
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def test_profiling_hooks(self):
+        profiler = ProfilingHooks()
+        testing_hooks = TestingHooks()
+        pipeline = Pipeline(
+            {
+                'bool_': TestingDataSet.bool_col.latest,
+                'factor_rank': TrivialFactor().rank().zscore(),
+            },
+            domain=US_EQUITIES,
+        )
+        start_date, end_date = self.trading_days[[-10, -1]]
+
+        self.run_chunked_pipeline(
+            pipeline=pipeline,
+            start_date=start_date,
+            end_date=end_date,
+            chunksize=5,
+            # ProfilingHooks composes with other hooks.
+            hooks=[DelegatingHooks([profiler, testing_hooks])],
+        )
+
+        events = profiler.to_frame()
+        chunks = events[events.kind == 'chunk']
+        self.assertEqual(
+            list(zip(chunks.start_date, chunks.end_date)),
+            [
+                tuple(self.trading_days[[-10, -6]]),
+                tuple(self.trading_days[[-5, -1]]),
+            ],
+        )
+
+        # Each load and computation of each chunk has an event.
+        work = events[events.kind != 'chunk']
+        self.assertEqual(len(work), len([
+            c for c in testing_hooks.trace
+            if c.method_name in ('loading_terms', 'computing_term')
+            and c.state == 'exit'
+        ]))
+        computed = set(
+            term for terms in work[work.kind == 'compute'].terms
+            for term in terms
+        )
+        self.assertIn(TrivialFactor(), computed)
+        loaded = set(
+            term.unspecialize() for terms in work[work.kind == 'load'].terms
+            for term in terms
+        )
+        self.assertEqual(
+            loaded,
+            set(TrivialFactor.inputs) | {TestingDataSet.bool_col},
+        )
+
+        self.assertTrue((events.wall_time >= 0).all())
+        self.assertTrue((events.cpu_time >= 0).all())
+        self.assertTrue((events.workspace_nbytes > 0).all())
+        # A chunk's size is the peak of the sizes after its events.
+        for (start, end), chunk_events in work.groupby(
+                ['start_date', 'end_date']):
+            chunk = chunks[chunks.start_date == start].iloc[0]
+            self.assertEqual(
+                chunk.workspace_nbytes,
+                chunk_events.workspace_nbytes.max(),
+            )
+        self.assertEqual(
+            profiler.peak_workspace_nbytes,
+            chunks.workspace_nbytes.max(),
+        )
+
+        # The inputs of TrivialFactor are freed after it's computed, and its
+        # event has the size from before they were freed.
+        trace = testing_hooks.trace
+        sizes = [
+            (trace[i + 1].args[0], trace[i + 2].args[0])
+            for i, call in enumerate(trace)
+            if call.method_name == 'computing_term'
+            and call.state == 'exit'
+            and call.args == (TrivialFactor(),)
+        ]
+        self.assertEqual(len(sizes), 2)
+        for before, after in sizes:
+            self.assertGreater(before, after)
+        trivial = work[work.label == repr(TrivialFactor())]
+        self.assertEqual(
+            list(trivial.workspace_nbytes),
+            [before for before, _ in sizes],
+        )
+
+        report = profiler.report()
+        self.assertEqual(
+            report.index.names,
+            ['kind', 'label'],
+        )
+        self.assertEqual(report.calls.sum(), len(work))
+        self.assertTrue(report.wall_time.is_monotonic_decreasing)
+        self.assertEqual(
+            report.loc[('compute', repr(TrivialFactor()))].calls,
+            2,
+        )
+
+        path = self.tmpdir.getpath('pipeline.folded')
+        profiler.write_flamegraph(path)
+        with open(path) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), len(events))
+        for line in lines:
+            stack, microseconds = line.rsplit(' ', 1)
+            self.assertTrue(stack.startswith('pipeline;chunk '))
+            self.assertGreaterEqual(int(microseconds), 0)
+
+        profiler.clear()
+        self.assertEqual(len(profiler.to_frame()), 0)
+        self.assertEqual(profiler.peak_workspace_nbytes, 0)
+
+
 class TermReprTestCase(ZiplineTestCase):
 
     def test_htmlsafe_repr(self):
@@ -0,0 +1,215 @@
+"""
+Tests for zipline.pipeline.loaders.incremental.IncrementalLoader.
+"""
+from unittest import TestCase
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pandas as pd
+
+from zipline.lib.adjustment import MULTIPLY, OVERWRITE
+from zipline.pipeline import Pipeline
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.domain import US_EQUITIES
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import SimpleMovingAverage
+from zipline.pipeline.loaders.frame import DataFrameLoader
+from zipline.pipeline.loaders.incremental import IncrementalLoader
+from zipline.utils.calendar_utils import get_calendar
+import zipline._testing.fixtures as zf
+
+
+class RecordingLoader(DataFrameLoader):
+    """
+    DataFrameLoader that records the dates and sids of each load.
+    """
+    def __init__(self, *args, **kwargs):
+        super(RecordingLoader, self).__init__(*args, **kwargs)
+        self.loads = []
+
+    def load_adjusted_array(self, domain, columns, dates, sids, mask):
+        self.loads.append((dates, sids))
+        return super(RecordingLoader, self).load_adjusted_array(
+            domain, columns, dates, sids, mask,
+        )
+
+
+def windows(array, window_length):
+    return [w.copy() for w in array.traverse(window_length)]
+
+
+class IncrementalLoaderTestCase(TestCase):
+
+    def setUp(self):
+        trading_day = get_calendar("NYSE").day
+        self.dates = pd.date_range(
+            start='2014-01-02',
+            freq=trading_day,
+            periods=30,
+        )
+        self.sids = pd.Index(range(6), dtype="int64")
+        baseline = pd.DataFrame(
+            np.arange(180, dtype=float).reshape(30, 6) + 1,
+            index=self.dates,
+            columns=self.sids,
+        )
+        # Adjustments to all earlier rows, applied on the day after they end,
+        # like split and dividend adjustments.
+        adjustments = pd.DataFrame({
+            'sid': [0, 1, 3, 4, 2, 5],
+            'value': [0.5, 2.0, 0.25, 100.0, 0.1, 3.0],
+            'kind': [MULTIPLY, MULTIPLY, MULTIPLY, OVERWRITE, MULTIPLY,
+                     MULTIPLY],
+            'start_date': pd.NaT,
+            'end_date': self.dates[[9, 12, 13, 13, 17, 20]],
+            'apply_date': self.dates[[10, 13, 14, 14, 18, 21]],
+        })
+        self.underlying = RecordingLoader(
+            USEquityPricing.close, baseline, adjustments,
+        )
+        self.plain = DataFrameLoader(
+            USEquityPricing.close, baseline, adjustments,
+        )
+        self.loader = IncrementalLoader(self.underlying)
+
+    def load(self, loader, start, end, sids):
+        dates = self.dates[start:end]
+        mask = np.ones((len(dates), len(sids)), dtype=bool)
+        return loader.load_adjusted_array(
+            US_EQUITIES, [USEquityPricing.close], dates, sids, mask,
+        )[USEquityPricing.close]
+
+    def check_rolling(self, sids_by_day):
+        window = 8
+        for day, sids in enumerate(sids_by_day, start=window):
+            sids = pd.Index(sids, dtype="int64")
+            expected = self.load(self.plain, day - window, day, sids)
+            result = self.load(self.loader, day - window, day, sids)
+            for window_length in (1, 3, window):
+                for e, r in zip(windows(expected, window_length),
+                                windows(result, window_length)):
+                    assert_array_equal(r, e)
+
+    def test_rolling_window_loads_new_rows(self):
+        self.check_rolling([self.sids] * 20)
+
+        # After the first load, each day only loads the last kept row and
+        # the new row.
+        loads = self.underlying.loads
+        self.assertEqual(len(loads[0][0]), 8)
+        for dates, sids in loads[1:]:
+            self.assertEqual(len(dates), 2)
+            assert_array_equal(sids, self.sids)
+
+    def test_changing_assets(self):
+        sids_by_day = [
+            [0, 1, 2, 3],
+            [0, 1, 2, 3],
+            # A new asset
+            [0, 1, 2, 3, 4],
+            # A removed asset
+            [1, 2, 3, 4],
+            [1, 2, 3, 4, 5],
+            [0, 1, 2, 4, 5],
+            [0, 1, 2, 3, 4, 5],
+        ] + [list(self.sids)] * 10
+        self.check_rolling(sids_by_day)
+
+        # New assets are loaded over the whole window.
+        loads = self.underlying.loads
+        self.assertIn(
+            (8, [4]),
+            [(len(dates), list(sids)) for dates, sids in loads],
+        )
+
+    def test_repeated_and_unrelated_requests(self):
+        sids = self.sids
+        expected = self.load(self.plain, 5, 15, sids)
+
+        self.load(self.loader, 5, 15, sids)
+        # The same window is served from memory.
+        result = self.load(self.loader, 5, 15, sids)
+        self.assertEqual(len(self.underlying.loads), 1)
+        assert_array_equal(windows(result, 3), windows(expected, 3))
+
+        # A window that doesn't start within the kept window is loaded in
+        # full.
+        self.load(self.loader, 20, 25, sids)
+        self.assertEqual(len(self.underlying.loads[-1][0]), 5)
+
+        self.loader.clear()
+        self.load(self.loader, 21, 26, sids)
+        self.assertEqual(len(self.underlying.loads[-1][0]), 5)
+
+    def test_returned_arrays_are_not_kept(self):
+        sids = self.sids
+        first = self.load(self.loader, 5, 15, sids)
+        expected = windows(first, 10)
+
+        # Traversing without a copy mutates the returned array.
+        for _ in first.traverse(10, copy=False):
+            pass
+
+        result = self.load(self.loader, 6, 16, sids)
+        self.assertEqual(len(self.underlying.loads[-1][0]), 2)
+        assert_array_equal(
+            windows(result, 10)[0][:-1],
+            expected[0][1:],
+        )
+
+
+class IncrementalEngineTestCase(zf.WithAssetFinder, zf.ZiplineTestCase):
+    START_DATE = pd.Timestamp('2014-01-02')
+    END_DATE = pd.Timestamp('2014-03-31')
+    ASSET_FINDER_EQUITY_SIDS = list(range(1, 6))
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def test_incremental_engine_matches(self):
+        sessions = US_EQUITIES.sessions()
+        dates = sessions[
+            (sessions >= self.START_DATE) & (sessions <= self.END_DATE)
+        ]
+        sids = pd.Index(self.ASSET_FINDER_EQUITY_SIDS, dtype="int64")
+        baseline = pd.DataFrame(
+            np.arange(len(dates) * len(sids), dtype=float).reshape(
+                len(dates), len(sids),
+            ) + 1,
+            index=dates,
+            columns=sids,
+        )
+        adjustments = pd.DataFrame({
+            'sid': [1, 3],
+            'value': [0.5, 2.0],
+            'kind': [MULTIPLY, MULTIPLY],
+            'start_date': pd.NaT,
+            'end_date': dates[[30, 34]],
+            'apply_date': dates[[31, 35]],
+        })
+        underlying = RecordingLoader(
+            USEquityPricing.close, baseline, adjustments,
+        )
+
+        def make_engine(incremental):
+            return SimplePipelineEngine(
+                lambda column: underlying,
+                self.asset_finder,
+                default_domain=US_EQUITIES,
+                incremental=incremental,
+            )
+
+        pipe = Pipeline(
+            {'sma': SimpleMovingAverage(
+                inputs=[USEquityPricing.close], window_length=20,
+            )},
+            domain=US_EQUITIES,
+        )
+        engine = make_engine(False)
+        incremental_engine = make_engine(True)
+        for date in dates[25:40]:
+            expected = engine.run_pipeline(pipe, date, date)
+            del underlying.loads[:]
+            result = incremental_engine.run_pipeline(pipe, date, date)
+            pd.testing.assert_frame_equal(result, expected)
+
+        # Only the first run loaded the whole window.
+        self.assertEqual(len(underlying.loads[-1][0]), 2)
@@ -0,0 +1,288 @@
+# Copyright 2026 QuantRocket LLC - All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import shutil
+import unittest
+import warnings
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+from zipline.pipeline.data import ibkr
+from zipline.pipeline.loaders.cache import (
+    META_FILENAME,
+    PipelineDataCache,
+    get_reindexed_like)
+from zipline.pipeline.loaders.ibkr import IBKRAggregateShortableSharesPipelineLoader
+
+class NoData(Exception):
+    pass
+
+class StubReindexedLike:
+    """
+    Local stand-in for a quantrocket get_*_reindexed_like function which
+    records the dates of each call.
+    """
+    def __init__(self, no_data_after=None):
+        self.calls = []
+        self.no_data_after = no_data_after
+
+    def __call__(self, reindex_like, fields=None, shift=0):
+        self.calls.append(reindex_like.index)
+        dates = reindex_like.index
+        if self.no_data_after is not None and dates[0] > self.no_data_after:
+            raise NoData("no data")
+        return pd.concat(
+            {
+                field: pd.DataFrame(
+                    {
+                        sid: dates.day + i * 100 + shift + len(field)
+                        for i, sid in enumerate(reindex_like.columns)
+                    },
+                    index=dates,
+                ).astype(np.float64)
+                for field in fields
+            },
+            names=["Field", "Date"],
+        )
+
+def make_reindex_like(start, periods, sids=("FI1", "FI2")):
+    reindex_like = pd.DataFrame(
+        None, index=pd.date_range(start, periods=periods), columns=list(sids))
+    reindex_like.index.name = "Date"
+    return reindex_like
+
+class PipelineDataCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = PipelineDataCache(os.path.join(self.tmpdir, "cache"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_no_cache(self):
+        """
+        Tests that the function is called directly without a cache.
+        """
+        stub = StubReindexedLike()
+        reindex_like = make_reindex_like("2022-01-03", 5)
+
+        get_reindexed_like(stub, reindex_like, fields=["Close"])
+        get_reindexed_like(stub, reindex_like, fields=["Close"])
+
+        self.assertEqual(len(stub.calls), 2)
+        self.assertEqual(os.listdir(self.cache.rootdir), [])
+
+    def test_repeat_call_is_cached(self):
+        """
+        Tests that an identical call (in any field order) is read from the
+        cache.
+        """
+        stub = StubReindexedLike()
+        reindex_like = make_reindex_like("2022-01-03", 5)
+
+        expected = get_reindexed_like(
+            stub, reindex_like, fields=["Open", "Close"], cache=self.cache)
+        actual = get_reindexed_like(
+            stub, reindex_like, fields=["Close", "Open"], cache=self.cache)
+
+        self.assertEqual(len(stub.calls), 1)
+        pd.testing.assert_frame_equal(actual.sort_index(), expected.sort_index())
+
+    def test_different_key_is_not_cached(self):
+        """
+        Tests that different kwargs or sids are separate cache entries.
+        """
+        stub = StubReindexedLike()
+        reindex_like = make_reindex_like("2022-01-03", 5)
+
+        get_reindexed_like(stub, reindex_like, fields=["Close"], cache=self.cache)
+        result = get_reindexed_like(
+            stub, reindex_like, fields=["Close"], shift=1, cache=self.cache)
+        get_reindexed_like(
+            stub, make_reindex_like("2022-01-03", 5, sids=["FI1"]),
+            fields=["Close"], cache=self.cache)
+
+        self.assertEqual(len(stub.calls), 3)
+        self.assertEqual(len(os.listdir(self.cache.rootdir)), 3)
+        self.assertEqual(result.loc["Close"].iloc[0, 0], 3 + 1 + 5)
+
+    def test_overlapping_dates_fetch_missing_only(self):
+        """
+        Tests that an overlapping date range only fetches the missing dates.
+        """
+        stub = StubReindexedLike()
+
+        get_reindexed_like(
+            stub, make_reindex_like("2022-01-03", 5), fields=["Close"],
+            cache=self.cache)
+
+        reindex_like = make_reindex_like("2022-01-05", 6)
+        actual = get_reindexed_like(
+            stub, reindex_like, fields=["Close"], cache=self.cache)
+
+        self.assertEqual(len(stub.calls), 2)
+        self.assertListEqual(
+            list(stub.calls[1]),
+            list(pd.date_range("2022-01-08", periods=3)))
+        pd.testing.assert_frame_equal(
+            actual, StubReindexedLike()(reindex_like, fields=["Close"]))
+
+        # the whole range is now cached
+        get_reindexed_like(
+            stub, make_reindex_like("2022-01-03", 8), fields=["Close"],
+            cache=self.cache)
+        self.assertEqual(len(stub.calls), 2)
+
+    def test_no_data_for_missing_dates(self):
+        """
+        Tests that missing dates without data are filled from reindex_like
+        and are not cached.
+        """
+        stub = StubReindexedLike(no_data_after=pd.Timestamp("2022-01-07"))
+
+        get_reindexed_like(
+            stub, make_reindex_like("2022-01-03", 5), fields=["Close"],
+            cache=self.cache, no_data_errors=NoData)
+
+        actual = get_reindexed_like(
+            stub, make_reindex_like("2022-01-06", 4), fields=["Close"],
+            cache=self.cache, no_data_errors=NoData)
+
+        self.assertEqual(len(stub.calls), 2)
+        self.assertListEqual(
+            actual.loc["Close"]["FI1"].tolist()[:2], [6 + 5, 7 + 5])
+        self.assertTrue(actual.loc["Close"].iloc[2:].isnull().all().all())
+
+        # no data is not cached
+        get_reindexed_like(
+            stub, make_reindex_like("2022-01-08", 2), fields=["Close"],
+            cache=self.cache, no_data_errors=NoData)
+        self.assertEqual(len(stub.calls), 3)
+
+    def test_missing_field_for_missing_dates(self):
+        """
+        Tests that a field without data for the missing dates is left NaN,
+        without concatenating an empty frame.
+        """
+        stub = StubReindexedLike()
+
+        def get_close_only_after_first_call(reindex_like, fields=None):
+            if stub.calls:
+                fields = ["Close"]
+            return stub(reindex_like, fields=fields)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", FutureWarning)
+            get_reindexed_like(
+                get_close_only_after_first_call,
+                make_reindex_like("2022-01-03", 5), fields=["Open", "Close"],
+                cache=self.cache)
+            actual = get_reindexed_like(
+                get_close_only_after_first_call,
+                make_reindex_like("2022-01-06", 4), fields=["Open", "Close"],
+                cache=self.cache)
+
+        self.assertEqual(len(stub.calls), 2)
+        self.assertListEqual(
+            actual.loc["Close"]["FI1"].tolist(), [6 + 5, 7 + 5, 8 + 5, 9 + 5])
+        self.assertListEqual(
+            actual.loc["Open"]["FI1"].tolist()[:2], [6 + 4, 7 + 4])
+        self.assertTrue(actual.loc["Open"].iloc[2:].isnull().all().all())
+        self.assertEqual(actual.dtypes.tolist(), [np.float64, np.float64])
+
+    def test_single_field_result(self):
+        """
+        Tests caching a result without a Field level.
+        """
+        calls = []
+
+        def get_are_etb_reindexed_like(reindex_like):
+            calls.append(reindex_like.index)
+            return pd.DataFrame(
+                True, index=reindex_like.index, columns=reindex_like.columns)
+
+        reindex_like = make_reindex_like("2022-01-03", 3)
+        expected = get_are_etb_reindexed_like(reindex_like)
+        actual = get_reindexed_like(
+            get_are_etb_reindexed_like, reindex_like, cache=self.cache)
+        actual = get_reindexed_like(
+            get_are_etb_reindexed_like, reindex_like, cache=self.cache)
+
+        self.assertEqual(len(calls), 2)
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_size_based_eviction(self):
+        """
+        Tests that the least recently used entries are evicted when the cache
+        grows beyond max_size.
+        """
+        stub = StubReindexedLike()
+        reindex_like = make_reindex_like("2022-01-03", 50)
+
+        get_reindexed_like(stub, reindex_like, fields=["Open"], cache=self.cache)
+        entry_size = self.cache.size()
+        self.cache.max_size = entry_size * 2
+
+        get_reindexed_like(stub, reindex_like, fields=["High"], cache=self.cache)
+        # age both entries, then use Open so that High is the least recently
+        # used
+        for name in os.listdir(self.cache.rootdir):
+            os.utime(
+                os.path.join(self.cache.rootdir, name, META_FILENAME), (0, 0))
+        get_reindexed_like(stub, reindex_like, fields=["Open"], cache=self.cache)
+        self.assertEqual(len(stub.calls), 2)
+
+        get_reindexed_like(stub, reindex_like, fields=["Low"], cache=self.cache)
+        self.assertEqual(len(stub.calls), 3)
+        self.assertLessEqual(self.cache.size(), self.cache.max_size)
+        self.assertEqual(len(os.listdir(self.cache.rootdir)), 2)
+
+        # Open was kept, High was evicted
+        get_reindexed_like(stub, reindex_like, fields=["Open"], cache=self.cache)
+        self.assertEqual(len(stub.calls), 3)
+        get_reindexed_like(stub, reindex_like, fields=["High"], cache=self.cache)
+        self.assertEqual(len(stub.calls), 4)
+
+    @patch("zipline.pipeline.loaders.ibkr.get_ibkr_shortable_shares_reindexed_like")
+    def test_loader_with_cache(self, mock_get_ibkr_shortable_shares_reindexed_like):
+        """
+        Tests that a loader with a cache only calls the quantrocket function
+        once for repeated loads.
+        """
+        stub = StubReindexedLike()
+        mock_get_ibkr_shortable_shares_reindexed_like.side_effect = (
+            lambda reindex_like, aggregate=False, fields=None, shift=0: stub(
+                reindex_like, fields=fields, shift=shift))
+
+        last_qty = ibkr.ShortableShares.LastQuantity
+        loader = IBKRAggregateShortableSharesPipelineLoader(
+            {1: "FI1", 2: "FI2"}, cache=self.cache)
+        dates = pd.date_range(start="2022-07-25", periods=2)
+        sids = pd.Index([1, 2])
+        mask = np.array([[True, True], [True, True]])
+
+        first = loader.load_adjusted_array(
+            last_qty.domain, [last_qty], dates, sids, mask)
+        second = loader.load_adjusted_array(
+            last_qty.domain, [last_qty], dates, sids, mask)
+
+        self.assertEqual(len(mock_get_ibkr_shortable_shares_reindexed_like.mock_calls), 1)
+        np.testing.assert_array_equal(
+            first[last_qty].data, second[last_qty].data)
+        np.testing.assert_array_equal(
+            second[last_qty].data,
+            np.array([[25 + 1 + 12, 125 + 1 + 12], [26 + 1 + 12, 126 + 1 + 12]]))
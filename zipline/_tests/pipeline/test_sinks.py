@@ -0,0 +1,109 @@
+"""
+Tests for zipline.pipeline.sinks.
+"""
+from unittest import skipUnless
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from zipline.pipeline import CustomFilter, Pipeline
+from zipline.pipeline.data.testing import TestingDataSet
+from zipline.pipeline.domain import US_EQUITIES
+from zipline.pipeline.sinks import (
+    HAVE_PYARROW,
+    HAVE_TABLES,
+    HDF5Sink,
+    ParquetSink,
+    flatten_pipeline_output,
+)
+import zipline._testing.fixtures as zf
+
+
+class FalseOnOddMonths(CustomFilter):
+    inputs = ()
+    window_length = 1
+
+    def compute(self, today, assets, out):
+        out[:] = (today.month % 2 == 0)
+
+
+class PipelineSinkTestCase(zf.WithSeededRandomPipelineEngine,
+                           zf.WithTmpDir,
+                           zf.ZiplineTestCase):
+
+    PIPELINE_START_DATE = pd.Timestamp('2006-01-05')
+    END_DATE = pd.Timestamp('2006-06-30')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def make_pipeline(self, screen=None):
+        return Pipeline(
+            columns={
+                'float': TestingDataSet.float_col.latest,
+                'bool': TestingDataSet.bool_col.latest,
+                'categorical': TestingDataSet.categorical_col.latest,
+            },
+            screen=screen,
+            domain=US_EQUITIES,
+        )
+
+    def write_chunks(self, sink, pipe):
+        chunks = self.seeded_random_engine.iter_pipeline(
+            pipe,
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+            chunksize=10,
+        )
+        with sink:
+            for chunk in chunks:
+                sink.write(chunk)
+
+    def expected(self, pipe):
+        return flatten_pipeline_output(self.run_pipeline(
+            pipe,
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+        ))
+
+    def test_flatten_pipeline_output(self):
+        result = self.run_pipeline(
+            self.make_pipeline(),
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+        )
+        flat = flatten_pipeline_output(result)
+
+        self.assertEqual(
+            list(flat.columns),
+            ['date', 'asset'] + list(result.columns),
+        )
+        self.assertEqual(
+            flat['asset'].tolist(),
+            [asset.real_sid for asset in result.index.get_level_values(1)],
+        )
+        self.assertEqual(flat['categorical'].dtype, object)
+
+    @skipUnless(HAVE_PYARROW, 'pyarrow is not installed')
+    def test_parquet_sink(self):
+        path = self.tmpdir.getpath('pipeline.parquet')
+        for screen in None, FalseOnOddMonths():
+            pipe = self.make_pipeline(screen)
+            self.write_chunks(ParquetSink(path), pipe)
+            assert_frame_equal(
+                pd.read_parquet(path),
+                self.expected(pipe),
+                check_dtype=False,
+                check_frame_type=False,
+            )
+
+    @skipUnless(HAVE_TABLES, 'tables is not installed')
+    def test_hdf5_sink(self):
+        path = self.tmpdir.getpath('pipeline.h5')
+        for screen in None, FalseOnOddMonths():
+            pipe = self.make_pipeline(screen)
+            self.write_chunks(HDF5Sink(path, min_itemsize=10), pipe)
+            assert_frame_equal(
+                pd.read_hdf(path, 'pipeline').reset_index(drop=True),
+                self.expected(pipe),
+                check_dtype=False,
+                check_frame_type=False,
+            )
@@ -65,6 +65,8 @@ from zipline.finance.execution import (
 )
 from zipline.finance.order import ORDER_STATUS
 from zipline.finance.trading import SimulationParameters
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.loaders.incremental import IncrementalLoader
 from zipline.finance.asset_restrictions import (
     Restriction,
     HistoricalRestrictions,
@@ -389,6 +391,36 @@ def handle_data(context, data):
 
         self.run_algorithm(initialize=initialize, handle_data=handle_data)
 
+    def test_preloads_assets(self):
+        self.run_algorithm(initialize=lambda algo: None)
+        self.assertIsNotNone(self.asset_finder._snapshot)
+
+    def test_incremental_pipeline(self):
+        loader = object()
+        sim_params = SimulationParameters(
+            start_session=pd.Timestamp("2006-01-03"),
+            end_session=pd.Timestamp("2006-01-04"),
+            data_frequency="minute",
+            exchange_calendar=self.exchange_calendar,
+            arena="trade",
+        )
+
+        # Loaders are only wrapped when asked for, even in live trading.
+        algo = self.make_algo(
+            sim_params=sim_params,
+            get_pipeline_loader=lambda column: loader,
+        )
+        self.assertIs(algo.engine._get_loader(USEquityPricing.close), loader)
+
+        algo = self.make_algo(
+            sim_params=sim_params,
+            get_pipeline_loader=lambda column: loader,
+            incremental_pipeline=True,
+        )
+        incremental = algo.engine._get_loader(USEquityPricing.close)
+        self.assertIsInstance(incremental, IncrementalLoader)
+        self.assertIs(incremental.loader, loader)
+
     def test_get_open_orders(self):
         def initialize(algo):
             algo.minute = 0
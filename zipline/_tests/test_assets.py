@@ -569,6 +569,39 @@ class AssetFinderTestCase(WithExchangeCalendars, ZiplineTestCase):
                 result = result[permuted_sids]
                 assert_equal(result, expected_no_start)
 
+                for include_start_date, expected in (
+                        (True, expected_with_start),
+                        (False, expected_no_start)):
+                    expected = expected.sort_index(axis=1)
+                    expected_active = expected.columns[expected.any()]
+                    active = finder.active_sids(
+                        dates,
+                        include_start_date=include_start_date,
+                        country_codes=country_codes,
+                    )
+                    assert_equal(active, expected_active.values)
+
+                    result = finder.lifetimes(
+                        dates,
+                        include_start_date=include_start_date,
+                        country_codes=country_codes,
+                        sids=active,
+                    )
+                    assert_equal(result, expected[expected_active])
+
+                    packed, packed_sids = finder.packed_lifetimes(
+                        dates,
+                        include_start_date=include_start_date,
+                        country_codes=country_codes,
+                    )
+                    assert_equal(packed_sids, expected.columns.values)
+                    assert_equal(
+                        np.unpackbits(
+                            packed, axis=1, count=len(packed_sids),
+                        ).astype(bool),
+                        expected.values,
+                    )
+
     def test_bundle_end_date_equities(self):
         equities = make_simple_equity_info(
             [0, 1, 2],
@@ -766,6 +799,119 @@ class AssetFinderTestCase(WithExchangeCalendars, ZiplineTestCase):
                 "No {plural} found for sids: [1, 2].".format(plural=plural)
             )
 
+
+class PreloadedAssetFinderTestCase(AssetFinderTestCase):
+    asset_finder_type = partial(AssetFinder, preload=True)
+
+    def write_equities_and_futures(self):
+        equities = make_rotating_equity_info(
+            num_assets=6,
+            first_start=pd.Timestamp('2014-01-02'),
+            frequency=self.exchange_calendar.day,
+            periods_between_starts=3,
+            asset_lifetime=5,
+            exchange='TEST',
+        )
+        futures = make_commodity_future_info(
+            first_sid=6,
+            root_symbols=['CL', 'FV'],
+            years=[2014],
+        )
+        self.write_assets(equities=equities, futures=futures)
+        return list(equities.index) + list(futures.index)
+
+    def test_preloaded_assets_match_db(self):
+        sids = self.write_equities_and_futures()
+        expected = AssetFinder(self.asset_finder.engine).retrieve_all(sids)
+
+        # retrieve in two batches to build assets on both the slow path and
+        # the dense sid fast path
+        self.asset_finder.retrieve_all(sids[::2])
+        for _ in range(2):
+            actual = self.asset_finder.retrieve_all(sids)
+            assert_equal(
+                [asset.to_dict() for asset in actual],
+                [asset.to_dict() for asset in expected],
+            )
+            self.assertEqual(
+                list(map(type, actual)),
+                list(map(type, expected)),
+            )
+
+        self.assertIsNotNone(self.asset_finder._asset_array)
+        self.assertTrue(self.asset_finder._asset_array_filled[sids].all())
+        self.assertIs(
+            self.asset_finder.retrieve_asset(sids[0]),
+            self.asset_finder.retrieve_all(sids)[0],
+        )
+
+    def test_preloaded_missing_sids(self):
+        sids = self.write_equities_and_futures()
+        missing = max(sids) + 1
+
+        with self.assertRaises(SidsNotFound):
+            self.asset_finder.retrieve_all([sids[0], missing])
+        self.assertEqual(
+            self.asset_finder.retrieve_all([sids[0], missing, -1],
+                                           default_none=True)[1:],
+            [None, None],
+        )
+        self.assertEqual(
+            self.asset_finder.lookup_asset_types([sids[0], missing]),
+            {sids[0]: 'equity', missing: None},
+        )
+
+    def test_preloaded_empty_db(self):
+        self.write_assets()
+        self.assertEqual(
+            self.asset_finder.lookup_asset_types([1, 2]),
+            {1: None, 2: None},
+        )
+        self.assertEqual(
+            self.asset_finder.retrieve_all([1, 2], default_none=True),
+            [None, None],
+        )
+
+    def test_sparse_sids(self):
+        equities = make_simple_equity_info(
+            [1, 10 ** 6],
+            start_date=pd.Timestamp('2014-01-02'),
+            end_date=pd.Timestamp('2014-12-31'),
+        )
+        self.write_assets(equities=equities)
+
+        assets = self.asset_finder.retrieve_all([10 ** 6, 1])
+        self.assertEqual(assets, [10 ** 6, 1])
+        self.assertEqual(
+            list(asset.symbol for asset in assets),
+            list(equities.symbol.loc[[10 ** 6, 1]]),
+        )
+        self.assertIsNone(self.asset_finder._asset_array)
+
+    def test_from_snapshot(self):
+        sids = self.write_equities_and_futures()
+        expected = self.asset_finder.retrieve_all(sids)
+        snapshot = pickle.loads(pickle.dumps(self.asset_finder.snapshot()))
+
+        # assets db in memory, so the snapshot has no path
+        self.assertIsNone(snapshot.path)
+        with self.assertRaises(ValueError):
+            AssetFinder.from_snapshot(snapshot)
+
+        # the assets are built from the snapshot, not the db
+        engine = self.asset_finder.engine
+        engine.execute(self.asset_finder.equities.delete())
+        engine.execute(self.asset_finder.futures_contracts.delete())
+        engine.execute(self.asset_finder.asset_router.delete())
+
+        finder = AssetFinder.from_snapshot(snapshot, engine=engine)
+        actual = finder.retrieve_all(sids)
+        assert_equal(
+            [asset.to_dict() for asset in actual],
+            [asset.to_dict() for asset in expected],
+        )
+        self.assertEqual(finder.exchange_info, self.asset_finder.exchange_info)
+
 class TestAssetDBVersioning(ZiplineTestCase):
 
     def init_instance_fixtures(self):
@@ -1043,3 +1189,9 @@ class TestWrite(WithInstanceTmpDir, ZiplineTestCase):
             'TSE': ExchangeInfo('TSE', 'TSE', 'JP'),
         }
         assert_equal(exchange_info, expected_exchange_info)
+
+        # a finder built from a snapshot of the db file finds the same assets
+        snapshot = pickle.loads(pickle.dumps(reader.snapshot()))
+        self.assertEqual(snapshot.path, self.assets_db_path)
+        finder = AssetFinder.from_snapshot(snapshot)
+        assert_equal(finder.retrieve_all([0, 1]), expected_equities)
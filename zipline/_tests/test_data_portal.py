@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from collections import OrderedDict
+from unittest import mock
 
 from numpy import array, append, nan, full
 from numpy.testing import assert_almost_equal
@@ -400,6 +401,58 @@ class DataPortalTestBase(WithDataPortal,
         ]
         assert_almost_equal(expected.values.tolist(), result)
 
+    @parameter_space(
+        data_frequency=['daily', 'minute'],
+        field=['open', 'high', 'low', 'close', 'volume', 'price',
+               'last_traded'],
+    )
+    def test_get_spot_value_multiple_assets_matches_single(self,
+                                                           data_frequency,
+                                                           field):
+        exchange_calendar = self.exchange_calendars[Equity]
+        if data_frequency == 'daily':
+            assets = self.asset_finder.retrieve_all(
+                self.ASSET_FINDER_EQUITY_SIDS + (1,),
+            )
+            dts = self.trading_days
+        else:
+            assets = self.asset_finder.retrieve_all(
+                self.ASSET_FINDER_EQUITY_SIDS + (10000, 10001, 1),
+            )
+            dts = []
+            for session in self.trading_days[:4]:
+                minutes = exchange_calendar.session_minutes(session)
+                dts.extend(minutes[[0, 1, 2, 5, -1]])
+
+        for dt in dts:
+            expected = [
+                self.data_portal.get_spot_value(
+                    asset, field, dt, data_frequency,
+                )
+                for asset in assets
+            ]
+            result = self.data_portal.get_spot_value(
+                assets, field, dt, data_frequency,
+            )
+            assert_equal(result, expected, msg='dt={}'.format(dt))
+
+    def test_get_spot_value_multiple_assets_ffills_in_batch(self):
+        assets = self.asset_finder.retrieve_all(self.ASSET_FINDER_EQUITY_SIDS)
+        exchange_calendar = self.exchange_calendars[Equity]
+        # Equity 1 has no trades on the fourth day, so its price is the last
+        # close of the third day.
+        dt = exchange_calendar.session_minutes(self.trading_days[3])[1]
+
+        with mock.patch.object(
+            self.data_portal,
+            '_get_single_asset_value',
+            side_effect=AssertionError('looked up a single asset'),
+        ):
+            result = self.data_portal.get_spot_value(
+                assets, 'price', dt, 'minute',
+            )
+        assert_almost_equal(result, [101.3, 1.006, 1.006])
+
     @parameter_space(data_frequency=['daily', 'minute'],
                      field=['close', 'price'])
     def test_get_adjustments(self, data_frequency, field):
@@ -473,6 +526,29 @@ class DataPortalTestBase(WithDataPortal,
                          "Asset 10000 had a trade on fourth minute, so should "
                          "return that as the last trade on the fifth.")
 
+    @parameter_space(data_frequency=['daily', 'minute'])
+    def test_get_last_traded_dts(self, data_frequency):
+        assets = self.asset_finder.retrieve_all([1, 2, 3, 10000, 10001])
+        if data_frequency == 'daily':
+            assets = assets[:3]
+            dts = self.trading_days[:5]
+        else:
+            dts = [
+                minute
+                for day in self.trading_days[:4]
+                for minute in self.nyse_calendar.session_minutes(day)[:6]
+            ]
+
+        for dt in dts:
+            result = self.data_portal.get_last_traded_dts(
+                assets, dt, data_frequency,
+            )
+            expected = pd.DatetimeIndex([
+                self.data_portal.get_last_traded_dt(asset, dt, data_frequency)
+                for asset in assets
+            ])
+            assert_equal(result, expected)
+
     def test_get_empty_splits(self):
         splits = self.data_portal.get_splits([], self.trading_days[2])
         self.assertEqual([], splits)
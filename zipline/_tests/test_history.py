@@ -1195,6 +1195,36 @@ class MinuteEquityHistoryTestCase(WithHistory,
         # last 5 minutes should not be adjusted
         np.testing.assert_array_equal(np.array(range(782, 787)), window3[-5:])
 
+    @parameterized.expand([
+        ('minute', '1m', pd.Timestamp('2015-01-07 9:45', tz='US/Eastern')),
+        ('daily', '1d', pd.Timestamp('2015-01-08 9:45', tz='US/Eastern')),
+    ])
+    def test_history_window_multi(self, name, frequency, end_dt):
+        assets = [
+            self.ASSET1,
+            self.SPLIT_ASSET,
+            self.DIVIDEND_ASSET,
+            self.MERGER_ASSET,
+        ]
+        # The windows are cached by field, so read the single fields from a
+        # separate data portal.
+        result = self.make_data_portal().get_history_window_multi(
+            assets, end_dt, 10, frequency, ALL_FIELDS, 'minute',
+        )
+        self.assertEqual(
+            list(result.columns),
+            [(field, asset) for field in ALL_FIELDS for asset in assets],
+        )
+
+        data_portal = self.make_data_portal()
+        for field in ALL_FIELDS:
+            expected = data_portal.get_history_window(
+                assets, end_dt, 10, frequency, field, 'minute',
+            )
+            pd.testing.assert_frame_equal(
+                result[field], expected, check_names=False,
+            )
+
     def test_passing_iterable_to_history_regular_hours(self):
         # regular hours
         current_dt = pd.Timestamp("2015-01-06 9:45", tz='US/Eastern')
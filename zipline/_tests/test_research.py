@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from zipline.pipeline import Pipeline
 from zipline.research import (
     use_bundle,
@@ -26,6 +28,10 @@ from zipline.research import (
 )
 import zipline
 from zipline.research.exceptions import ValidationError
+from zipline.research._bundle_cache import BundleDataCache
+from zipline.research.pipeline import _make_pipeline_loader
+from zipline.pipeline.loaders.cache import PipelineDataCache
+from zipline.utils.calendar_utils import get_calendar
 import pandas as pd
 
 
@@ -195,3 +201,93 @@ class UseBundleTestCase(unittest.TestCase):
         """
         with self.assertRaises(ValidationError):
             use_bundle("no-such-bundle")
+
+
+class BundleDataCacheTestCase(unittest.TestCase):
+
+    @patch("zipline.research._bundle_cache.bundles")
+    def test_bundle_data_cache(self, mock_bundles):
+        """
+        Tests that bundle data is loaded once per ingestion and that the cache
+        is bounded.
+        """
+        ingestions = {
+            "bundle-1": [pd.Timestamp("2023-01-02")],
+            "bundle-2": [pd.Timestamp("2023-01-03")],
+            "bundle-3": [pd.Timestamp("2023-01-04")],
+        }
+        mock_bundles.ingestions_for_bundle.side_effect = (
+            lambda bundle, environ: ingestions[bundle])
+        mock_bundles.load.side_effect = (
+            lambda bundle, environ, timestamp: (bundle, ingestions[bundle][0]))
+
+        cache = BundleDataCache(maxsize=2)
+
+        bundle_data = cache.load("bundle-1")
+        self.assertEqual(bundle_data, ("bundle-1", pd.Timestamp("2023-01-02")))
+        self.assertIs(cache.load("bundle-1"), bundle_data)
+        self.assertEqual(mock_bundles.load.call_count, 1)
+
+        created = []
+        def create(bundle_data):
+            created.append(bundle_data)
+            return object()
+
+        obj = cache.get_or_create("bundle-1", "engine", create)
+        self.assertIs(cache.get_or_create("bundle-1", "engine", create), obj)
+        self.assertEqual(created, [bundle_data])
+
+        # a new ingestion replaces the bundle data and the objects built from it
+        ingestions["bundle-1"].insert(0, pd.Timestamp("2023-02-01"))
+        new_bundle_data = cache.load("bundle-1")
+        self.assertEqual(new_bundle_data, ("bundle-1", pd.Timestamp("2023-02-01")))
+        self.assertEqual(mock_bundles.load.call_count, 2)
+        self.assertIsNot(cache.get_or_create("bundle-1", "engine", create), obj)
+        self.assertEqual(created, [bundle_data, new_bundle_data])
+
+        # the least recently used bundle is dropped
+        cache.load("bundle-2")
+        cache.load("bundle-1")
+        cache.load("bundle-3")
+        self.assertEqual(mock_bundles.load.call_count, 4)
+        cache.load("bundle-1")
+        self.assertEqual(mock_bundles.load.call_count, 4)
+        cache.load("bundle-2")
+        self.assertEqual(mock_bundles.load.call_count, 5)
+
+        cache.clear()
+        cache.load("bundle-1")
+        self.assertEqual(mock_bundles.load.call_count, 6)
+
+
+class PipelineLoaderCacheTestCase(unittest.TestCase):
+
+    def test_pipeline_loader_cache(self):
+        """
+        Tests that the pipeline loader caches QuantRocket data only if
+        ZIPLINE_PIPELINE_CACHE_DIR is set.
+        """
+        bundle_data = MagicMock()
+        asset_finder = MagicMock()
+        calendar = get_calendar("XNYS")
+
+        loader = _make_pipeline_loader(
+            bundle_data, asset_finder, calendar, environ={})
+        self.assertIsNone(loader.database_loader.cache)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = os.path.join(tmpdir, "pipeline-cache")
+            loader = _make_pipeline_loader(
+                bundle_data,
+                asset_finder,
+                calendar,
+                environ={
+                    "ZIPLINE_PIPELINE_CACHE_DIR": cache_dir,
+                    "ZIPLINE_PIPELINE_CACHE_MAX_SIZE": "1000",
+                })
+
+        cache = loader.database_loader.cache
+        self.assertIsInstance(cache, PipelineDataCache)
+        self.assertEqual(cache.rootdir, cache_dir)
+        self.assertEqual(cache.max_size, 1000)
+        self.assertIs(loader.sharadar_fundamentals_loader.cache, cache)
@@ -12,16 +12,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from unittest import mock
 
 import pandas as pd
 
 from zipline.gens.sim_engine import BEFORE_TRADING_START_BAR
 
+from zipline import api
 from zipline.finance.asset_restrictions import NoRestrictions
+from zipline.finance.blotter import SimulationBlotter
+from zipline.finance.execution import LimitOrder
 from zipline.finance import metrics
 from zipline.finance.trading import SimulationParameters
 from zipline.gens.tradesimulation import AlgorithmSimulator
 from zipline._testing.core import parameter_space
+from zipline._testing.predicates import assert_equal
 import zipline._testing.fixtures as zf
 
 
@@ -132,3 +137,129 @@ def initialize(context):
         # since the clock only ever emitted a single before_trading_start
         # event, we can check that the simulation_dt was properly set
         self.assertEqual(dt, algo_simulator.simulation_dt)
+
+
+def without_order_ids(results):
+    """The daily stats of a run with the random order ids removed, and the
+    columns sorted.
+    """
+    results = results.sort_index(axis=1)
+    for column in 'orders', 'transactions':
+        results[column] = results[column].map(lambda values: [
+            {k: v for k, v in value.items() if k not in ('id', 'order_id')}
+            for value in values
+        ])
+    return results
+
+
+class TestFastForward(zf.WithMakeAlgo, zf.ZiplineTestCase):
+
+    ASSET_FINDER_EQUITY_SIDS = 1, 2
+    BENCHMARK_SID = 1
+    # These dates cross a DST transition, which moves the sessions' first
+    # minutes in UTC.
+    START_DATE = pd.Timestamp('2016-03-09')
+    END_DATE = pd.Timestamp('2016-03-18')
+    SIM_PARAMS_DATA_FREQUENCY = 'minute'
+    SIM_PARAMS_EMISSION_RATE = 'daily'
+
+    def run_with_and_without_fast_forward(self, **kwargs):
+        """Run an algorithm with and without skipping idle bars, and return
+        the results and the number of bars simulated of each run.
+        """
+        results = []
+        for fast_forward in True, False:
+            get_transactions = mock.patch.object(
+                SimulationBlotter,
+                'get_transactions',
+                autospec=True,
+                side_effect=SimulationBlotter.get_transactions,
+            )
+            can_fast_forward = mock.patch.object(
+                AlgorithmSimulator,
+                '_can_fast_forward',
+                autospec=True,
+                side_effect=(
+                    AlgorithmSimulator._can_fast_forward
+                    if fast_forward else
+                    lambda self: False
+                ),
+            )
+            with get_transactions as bars, can_fast_forward:
+                results.append((self.run_algorithm(**kwargs), bars.call_count))
+        return results
+
+    def test_scheduled_functions(self):
+        def initialize(context):
+            context.count = 0
+            api.schedule_function(
+                rebalance,
+                api.date_rules.every_day(),
+                api.time_rules.market_open(minutes=30),
+            )
+            api.schedule_function(
+                place_limit_order,
+                api.date_rules.week_start(),
+                api.time_rules.market_close(minutes=15),
+            )
+
+        def rebalance(context, data):
+            context.count += 1
+            api.order_target_percent(api.sid(1 + context.count % 2), 0.5)
+            api.order_target(api.sid(2 - context.count % 2), 0)
+            api.record(rebalanced=api.get_datetime())
+
+        def place_limit_order(context, data):
+            # stays open until it's canceled at the end of the session
+            api.order(api.sid(1), 10, style=LimitOrder(0.01))
+            api.record(limit_ordered=api.get_datetime())
+
+        def before_trading_start(context, data):
+            api.record(count=context.count)
+
+        (fast, fast_bars), (slow, slow_bars) = \
+            self.run_with_and_without_fast_forward(
+                initialize=initialize,
+                before_trading_start=before_trading_start,
+            )
+
+        assert_equal(without_order_ids(fast), without_order_ids(slow))
+        self.assertTrue(fast['transactions'].map(len).sum())
+        self.assertLess(fast_bars, slow_bars)
+
+    def test_idle_algorithm(self):
+        def initialize(context):
+            api.schedule_function(
+                record_time,
+                api.date_rules.every_day(),
+                api.time_rules.market_close(),
+            )
+
+        def record_time(context, data):
+            api.record(time=api.get_datetime())
+
+        (fast, fast_bars), (slow, slow_bars) = \
+            self.run_with_and_without_fast_forward(initialize=initialize)
+
+        assert_equal(without_order_ids(fast), without_order_ids(slow))
+        # the first bar of each session, where the scheduled function resets
+        # for the day, and the bar where it runs
+        self.assertEqual(fast_bars, 2 * len(fast))
+
+    def test_handle_data(self):
+        def initialize(context):
+            context.bars = 0
+
+        def handle_data(context, data):
+            context.bars += 1
+            api.record(bars=context.bars)
+
+        (fast, fast_bars), (slow, slow_bars) = \
+            self.run_with_and_without_fast_forward(
+                initialize=initialize,
+                handle_data=handle_data,
+            )
+
+        # every bar is simulated for an algorithm with handle_data
+        assert_equal(without_order_ids(fast), without_order_ids(slow))
+        self.assertEqual(fast_bars, slow_bars)
@@ -94,9 +94,19 @@ from zipline.finance.fees import (
     IBKRBorrowFees
 )
 from zipline.finance.order import Order
-from zipline.assets import Asset, Equity, Future, ContinuousFuture
+from zipline.assets import (
+    Asset,
+    AssetFinder,
+    Equity,
+    Future,
+    ContinuousFuture,
+)
 from zipline.gens.tradesimulation import AlgorithmSimulator
-from zipline.finance.metrics import MetricsTracker, load as load_metrics_set
+from zipline.finance.metrics import (
+    DailyPerfRecorder,
+    MetricsTracker,
+    load as load_metrics_set,
+)
 from zipline.pipeline import Pipeline
 import zipline.pipeline.domain as domain
 from zipline.pipeline.engine import (
@@ -196,6 +206,18 @@ class TradingAlgorithm(object):
         equities_metadata, but will be traded by this TradingAlgorithm.
     get_pipeline_loader : callable[BoundColumn -> PipelineLoader], optional
         The function that maps pipeline columns to their loaders.
+    incremental_pipeline : bool, optional
+        Whether pipelines should reuse the raw data loaded for the previous
+        session and only load the new session. This caches loaded data
+        only: factors, filters and classifiers are still computed over their
+        full lookback windows each session. It is meant for live trading,
+        where a runner that attaches pipelines should pass
+        ``incremental_pipeline=True`` along with ``arena='trade'`` in
+        ``sim_params``. It is only safe if the raw values of every pipeline
+        loader never change once loaded, as is the case for bundle pricing
+        data, since revised data for earlier sessions is not reloaded; see
+        :class:`~zipline.pipeline.loaders.incremental.IncrementalLoader`.
+        default: False
     create_event_context : callable[BarData -> context manager], optional
         A function used to create a context mananger that wraps the
         execution of all events that are scheduled for a bar.
@@ -240,6 +262,7 @@ class TradingAlgorithm(object):
                  platform='zipline',
                  capital_changes=None,
                  get_pipeline_loader=None,
+                 incremental_pipeline=False,
                  create_event_context=None,
                  show_progress_on_dates=None,
                  strategy=None,
@@ -310,6 +333,7 @@ class TradingAlgorithm(object):
             self._metrics_set = load_metrics_set('default')
 
         # Initialize Pipeline API data.
+        self._incremental_pipeline = incremental_pipeline
         self.init_engine(get_pipeline_loader)
         self._pipelines = {}
 
@@ -395,7 +419,7 @@ class TradingAlgorithm(object):
                         self.namespace[param] = value
 
             self._initialize = self.namespace.get('initialize', noop)
-            self._handle_data = self.namespace.get('handle_data', noop)
+            self._handle_data = self.namespace.get('handle_data')
             self._before_trading_start = self.namespace.get(
                 'before_trading_start',
             )
@@ -455,6 +479,7 @@ class TradingAlgorithm(object):
                 get_loader,
                 self.asset_finder,
                 self.default_pipeline_domain(self.exchange_calendar),
+                incremental=self._incremental_pipeline,
             )
         else:
             self.engine = ExplodingPipelineEngine()
@@ -506,6 +531,16 @@ class TradingAlgorithm(object):
         if self._handle_data:
             self._handle_data(self, data)
 
+    def _idle_event_callbacks(self):
+        """
+        The callbacks of the algorithm's events which do nothing, which is
+        handle_data if the algorithm doesn't define it.
+        """
+        if self._handle_data is None and \
+                type(self).handle_data is TradingAlgorithm.handle_data:
+            return (TradingAlgorithm.handle_data,)
+        return ()
+
     def analyze(self, perf):
         if self._analyze is None:
             return
@@ -644,6 +679,12 @@ class TradingAlgorithm(object):
             ledger=metrics_tracker.ledger
         )
 
+        # The simulation retrieves the assets of the positions at the end of
+        # every session, so build assets from the asset tables loaded into
+        # memory rather than querying the db for each one.
+        if isinstance(self.asset_finder, AssetFinder):
+            self.asset_finder.preload()
+
         # Set the dt initially to the period start by forcing it to change.
         self.on_dt_changed(self.sim_params.start_session)
 
@@ -702,13 +743,16 @@ class TradingAlgorithm(object):
         # Create zipline and loop through simulated_trading.
         # Each iteration returns a perf dictionary
         try:
-            perfs = []
+            # collect the daily perf into columns as it's generated, rather
+            # than keeping every perf dict
+            recorder = DailyPerfRecorder(len(self.sim_params.sessions))
             for perf in self.get_generator():
-                perfs.append(perf)
+                recorder.record(perf)
                 self._log_progress(perf)
 
-            # convert perf dict to pandas dataframe
-            daily_stats = self._create_daily_stats(perfs)
+            # convert the recorded perf to pandas dataframe
+            daily_stats = recorder.to_frame()
+            self.risk_report = recorder.risk_report
 
             self.analyze(daily_stats)
         finally:
@@ -761,26 +805,14 @@ class TradingAlgorithm(object):
 
     def _create_daily_stats(self, perfs):
         # create daily and cumulative stats dataframe
-        daily_perfs = []
-        # TODO: the loop here could overwrite expected properties
-        # of daily_perf. Could potentially raise or log a
+        # TODO: recorded variables and risk metrics could overwrite expected
+        # properties of daily_perf. Could potentially raise or log a
         # warning.
+        recorder = DailyPerfRecorder(len(perfs))
         for perf in perfs:
-            if 'daily_perf' in perf:
-
-                perf['daily_perf'].update(
-                    perf['daily_perf'].pop('recorded_vars')
-                )
-                perf['daily_perf'].update(perf['cumulative_risk_metrics'])
-                daily_perfs.append(perf['daily_perf'])
-            else:
-                self.risk_report = perf
-
-        daily_dts = pd.DatetimeIndex(
-            [p['period_close'] for p in daily_perfs]
-        )
-        daily_stats = pd.DataFrame(daily_perfs, index=daily_dts)
-        return daily_stats
+            recorder.record(perf)
+        self.risk_report = recorder.risk_report
+        return recorder.to_frame()
 
     def calculate_capital_changes(self, dt, emission_rate, is_interday,
                                   portfolio_value_adjustment=0.0):
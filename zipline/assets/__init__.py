@@ -21,6 +21,7 @@ from ._assets import (
 )
 from .assets import (
     AssetFinder,
+    AssetFinderSnapshot,
     AssetConvertible,
     ContinuousFuture,
     PricingDataAssociable,
@@ -37,6 +38,7 @@ __all__ = [
     'Equity',
     'Future',
     'AssetFinder',
+    'AssetFinderSnapshot',
     'AssetConvertible',
     'ExchangeInfo',
     'PricingDataAssociable',
@@ -235,7 +235,109 @@ def _encode_continuous_future_sid(root_symbol,
     return int(binascii.hexlify(a), 16)
 
 
-Lifetimes = namedtuple('Lifetimes', 'sid start end')
+# The sid, start and end of each asset, and the positions of the assets sorted
+# by start, with the sorted starts.
+Lifetimes = namedtuple('Lifetimes', 'sid start end start_order sorted_start')
+
+
+def _sid_array(sids):
+    """
+    Return ``sids`` as an int64 array, or None if they aren't all integers.
+    """
+    try:
+        return np.asarray(sids, dtype='int64')
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+class _AssetColumns(object):
+    """
+    The rows of a table of the assets db, held as one array per column and
+    sorted by sid.
+
+    Numeric columns without nulls are held in numeric arrays, and all other
+    columns in object arrays.
+    """
+    def __init__(self, names, rows):
+        rows = sorted(rows, key=itemgetter(names.index('sid')))
+        self.names = names
+        self.columns = []
+        for values in zip(*rows) if rows else [()] * len(names):
+            column = np.array(values)
+            if column.dtype.kind not in 'iuf':
+                column = np.array(values, dtype=object)
+            self.columns.append(column)
+        self.sids = (
+            self.columns[names.index('sid')].astype('int64')
+            if rows else
+            np.array([], dtype='int64')
+        )
+
+    def __len__(self):
+        return len(self.sids)
+
+    def positions(self, sids):
+        """
+        Return the positions of the rows of ``sids``, and a mask of the sids
+        that were found.
+        """
+        if not len(self):
+            return (
+                np.zeros(len(sids), dtype='int64'),
+                np.zeros(len(sids), dtype=bool),
+            )
+        positions = self.sids.searchsorted(sids).clip(0, len(self) - 1)
+        return positions, self.sids[positions] == sids
+
+    def row(self, position):
+        """
+        Return the row at ``position`` as a dict, with the values converted to
+        python scalars like the rows of a query.
+        """
+        return {
+            name: column[position].item()
+            if column.dtype.kind != 'O' else column[position]
+            for name, column in zip(self.names, self.columns)
+        }
+
+
+class AssetFinderSnapshot(object):
+    """
+    The equities, futures, and asset types of an assets db, loaded into column
+    arrays by ``AssetFinder.preload``.
+
+    A snapshot is pickleable, so it can be sent to worker processes which build
+    their AssetFinder with ``AssetFinder.from_snapshot`` rather than querying
+    the asset tables again.
+
+    Parameters
+    ----------
+    path : str or None
+        The path of the assets db, or None if it's not a file.
+    exchanges : dict[str -> ExchangeInfo]
+        The exchanges of the assets.
+    asset_types : _AssetColumns
+        The sid and asset_type of each asset.
+    equities : _AssetColumns
+        The rows of the equities table, with the most recent symbols of each
+        equity.
+    futures : _AssetColumns
+        The rows of the futures_contracts table.
+    """
+    def __init__(self, path, exchanges, asset_types, equities, futures):
+        self.path = path
+        self.exchanges = exchanges
+        self.asset_types = asset_types
+        self.equities = equities
+        self.futures = futures
+
+    def __repr__(self):
+        return '{}(path={!r}, equities={}, futures={})'.format(
+            type(self).__name__,
+            self.path,
+            len(self.equities),
+            len(self.futures),
+        )
 
 
 class AssetFinder(object):
@@ -255,12 +357,21 @@ class AssetFinder(object):
         A dict mapping future root symbol to a predicate function which accepts
         a contract as a parameter and returns whether or not the contract should be
         included in the chain.
+    preload : bool, optional
+        Load the equities, futures, and asset types of the db into memory on
+        the first retrieval of assets, and build the assets from there rather
+        than querying the db for each cache miss. Default False.
 
     See Also
     --------
     :class:`zipline.assets.AssetDBWriter`
     """
-    def __init__(self, engine, future_chain_predicates=None):
+    # The preloaded assets are held in an array indexed by sid, as well as in
+    # the asset cache, if the sids fill at least this fraction of the range
+    # from 0 to the max sid.
+    DENSE_SID_RATIO = 0.5
+
+    def __init__(self, engine, future_chain_predicates=None, preload=False):
         if isinstance(engine, str):
             engine = check_and_create_engine(engine, require_exists=True)
         self.engine = engine
@@ -284,6 +395,12 @@ class AssetFinder(object):
         self._asset_type_cache = {}
         self._caches = (self._asset_cache, self._asset_type_cache)
 
+        # Populated by `preload`, or on first retrieval if preload is True.
+        self._preload = preload
+        self._snapshot = None
+        self._asset_array = None
+        self._asset_array_filled = None
+
         self._future_chain_predicates = future_chain_predicates \
             if future_chain_predicates is not None else {}
         self._ordered_contracts = {}
@@ -297,8 +414,135 @@ class AssetFinder(object):
         self._sids_to_real_sids = {}
         self._real_sids_to_sids = {}
 
+    @classmethod
+    def from_snapshot(cls, snapshot, engine=None, future_chain_predicates=None):
+        """
+        Build an AssetFinder from the snapshot of another AssetFinder, such as
+        in a worker process, without querying the asset tables again.
+
+        Parameters
+        ----------
+        snapshot : AssetFinderSnapshot
+            The snapshot returned by ``AssetFinder.snapshot``.
+        engine : str or SQLAlchemy.engine, optional
+            The engine or path of the assets db, used for the lookups which
+            aren't answered from the snapshot, such as symbol lookups. Defaults
+            to the path of the snapshot.
+        future_chain_predicates : dict, optional
+            See the AssetFinder parameters.
+
+        Returns
+        -------
+        finder : AssetFinder
+        """
+        if engine is None:
+            if snapshot.path is None:
+                raise ValueError(
+                    "An engine is required for a snapshot of an assets db "
+                    "which isn't a file."
+                )
+            engine = snapshot.path
+        finder = cls(engine, future_chain_predicates, preload=True)
+        finder._install_snapshot(snapshot)
+        return finder
+
+    def preload(self):
+        """
+        Load the equities, futures, and asset types of the db into memory, if
+        they're not loaded already. Assets are then built from memory, as they
+        are first retrieved, rather than queried from the db.
+
+        Returns
+        -------
+        snapshot : AssetFinderSnapshot
+            The loaded assets.
+        """
+        if self._snapshot is None:
+            self._preload = True
+            self._install_snapshot(self._load_snapshot())
+        return self._snapshot
+
+    def snapshot(self):
+        """
+        Return a pickleable snapshot of the equities, futures, and asset types
+        of the db, loading them first if needed. Worker processes can build
+        their AssetFinder from it with ``AssetFinder.from_snapshot``.
+
+        Returns
+        -------
+        snapshot : AssetFinderSnapshot
+        """
+        return self.preload()
+
+    def _get_snapshot(self):
+        if self._snapshot is None and self._preload:
+            self.preload()
+        return self._snapshot
+
+    def _load_snapshot(self):
+        exchanges = self._load_exchange_info()
+
+        asset_types = _AssetColumns(
+            ['sid', 'asset_type'],
+            sa.select((
+                self.asset_router.c.sid,
+                self.asset_router.c.asset_type,
+            )).execute().fetchall(),
+        )
+
+        symbols = {
+            row.sid: {c: row[c] for c in symbol_columns}
+            for row in self.engine.execute(
+                self._select_most_recent_symbols_chunk(),
+            ).fetchall()
+        }
+        equity_names = [c.name for c in self.equities.c]
+        equity_names += [c for c in symbol_columns if c not in equity_names]
+        equities = _AssetColumns(
+            equity_names,
+            [
+                tuple(merge(dict(row), symbols.get(row['sid'], {})).get(name)
+                      for name in equity_names)
+                for row in sa.select([self.equities]).execute().fetchall()
+            ],
+        )
+
+        futures = _AssetColumns(
+            [c.name for c in self.futures_contracts.c],
+            [
+                tuple(row) for row in
+                sa.select([self.futures_contracts]).execute().fetchall()
+            ],
+        )
+
+        url = self.engine.url
+        path = (
+            url.database
+            if url.get_backend_name() == 'sqlite'
+            and url.database not in (None, '', ':memory:') else
+            None
+        )
+        return AssetFinderSnapshot(
+            path, exchanges, asset_types, equities, futures,
+        )
+
+    def _install_snapshot(self, snapshot):
+        self._snapshot = snapshot
+
+        sids = snapshot.asset_types.sids
+        if len(sids) and sids[0] >= 0 and (
+                len(sids) >= self.DENSE_SID_RATIO * (sids[-1] + 1)):
+            self._asset_array = np.empty(sids[-1] + 1, dtype=object)
+            self._asset_array_filled = np.zeros(sids[-1] + 1, dtype=bool)
+
     @lazyval
     def exchange_info(self):
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            return snapshot.exchanges
+        return self._load_exchange_info()
+
+    def _load_exchange_info(self):
         es = sa.select(self.exchanges.c).execute().fetchall()
         return {
             name: ExchangeInfo(name, canonical_name, country_code)
@@ -346,6 +590,26 @@ class AssetFinder(object):
         if not missing:
             return found
 
+        snapshot = self._get_snapshot()
+        missing = list(missing)
+        missing_array = _sid_array(missing)
+        if snapshot is not None and missing_array is not None:
+            asset_types = snapshot.asset_types
+            if not len(asset_types):
+                for sid in missing:
+                    found[sid] = self._asset_type_cache[sid] = None
+                return found
+
+            positions, is_found = asset_types.positions(missing_array)
+            types = asset_types.columns[1][positions]
+            for sid, type_, is_found in zip(missing, types, is_found):
+                found[sid] = self._asset_type_cache[sid] = (
+                    type_ if is_found else None
+                )
+            return found
+
+        missing = set(missing)
+
         router_cols = self.asset_router.c
 
         for assets in group_into_chunks(missing):
@@ -413,6 +677,18 @@ class AssetFinder(object):
             When a requested sid is not found and default_none=False.
         """
         sids = list(sids)
+
+        # Fast path for preloaded assets with dense sids, when all of the
+        # assets have been built already.
+        asset_array = self._asset_array
+        if asset_array is not None and sids:
+            sid_array = _sid_array(sids)
+            if (sid_array is not None
+                    and sid_array.min() >= 0
+                    and sid_array.max() < len(asset_array)
+                    and self._asset_array_filled[sid_array].all()):
+                return asset_array[sid_array].tolist()
+
         hits, missing, failures = {}, set(), []
         for sid in sids:
             try:
@@ -516,15 +792,15 @@ class AssetFinder(object):
     def _select_asset_by_symbol(asset_tbl, symbol):
         return sa.select([asset_tbl]).where(asset_tbl.c.symbol == symbol)
 
-    def _select_most_recent_symbols_chunk(self, sid_group):
+    def _select_most_recent_symbols_chunk(self, sid_group=None):
         """Retrieve the most recent symbol for a set of sids.
 
         Parameters
         ----------
-        sid_group : iterable[int]
+        sid_group : iterable[int], optional
             The sids to lookup. The length of this sequence must be less than
             or equal to SQLITE_MAX_VARIABLE_NUMBER because the sids will be
-            passed in as sql bind params.
+            passed in as sql bind params. If None, lookup all sids.
 
         Returns
         -------
@@ -557,13 +833,10 @@ class AssetFinder(object):
         # See https://www.sqlite.org/lang_select.html#resultset, for more info.
         to_select = data_cols + (sa.func.max(cols.end_date),)
 
-        return sa.select(
-            to_select,
-        ).where(
-            cols.sid.in_(map(int, sid_group))
-        ).group_by(
-            cols.sid,
-        )
+        sel = sa.select(to_select)
+        if sid_group is not None:
+            sel = sel.where(cols.sid.in_(map(int, sid_group)))
+        return sel.group_by(cols.sid)
 
     def _lookup_most_recent_symbols(self, sids):
         return {
@@ -583,6 +856,20 @@ class AssetFinder(object):
         if not sids:
             return
 
+        snapshot = self._get_snapshot()
+        sid_array = _sid_array(list(sids))
+        if snapshot is not None and sid_array is not None:
+            asset_columns = (
+                snapshot.equities if querying_equities else snapshot.futures
+            )
+            exchanges = self.exchange_info
+            positions, found = asset_columns.positions(sid_array)
+            for position in positions[found]:
+                d = asset_columns.row(position)
+                d['exchange_info'] = exchanges[d.pop('exchange')]
+                yield _convert_asset_timestamp_fields(d)
+            return
+
         if querying_equities:
             def mkdict(row,
                        exchanges=self.exchange_info,
@@ -646,6 +933,14 @@ class AssetFinder(object):
             asset = asset_type(**filter_kwargs(row))
             hits[sid] = cache[sid] = asset
 
+        asset_array = self._asset_array
+        if asset_array is not None:
+            filled = self._asset_array_filled
+            for sid, asset in hits.items():
+                if 0 <= sid < len(asset_array):
+                    asset_array[sid] = asset
+                    filled[sid] = True
+
         # If we get here, it means something in our code thought that a
         # particular sid was an equity/future and called this function with a
         # concrete type, but we couldn't actually resolve the asset.  This is
@@ -943,9 +1238,100 @@ class AssetFinder(object):
         end = np.array(ends, dtype='f8')
         start[np.isnan(start)] = 0  # convert missing starts to 0
         end[end==np.datetime64('NaT').view('i8')] = np.iinfo(int).max  # convert missing end to INTMAX
-        return Lifetimes(sid, start, end)
+        start_order = np.argsort(start, kind='stable')
+        return Lifetimes(sid, start, end, start_order, start[start_order])
+
+    def _get_asset_lifetimes(self, country_codes):
+        if isinstance(country_codes, string_types):
+            raise TypeError(
+                "Got string {!r} instead of an iterable of strings in "
+                "AssetFinder.lifetimes.".format(country_codes),
+            )
+
+        # normalize to a cache-key so that we can memoize results.
+        country_codes = frozenset(country_codes)
+
+        lifetimes = self._asset_lifetimes.get(country_codes)
+        if lifetimes is None:
+            self._asset_lifetimes[country_codes] = lifetimes = (
+                self._compute_asset_lifetimes(country_codes)
+            )
+        return lifetimes
+
+    @staticmethod
+    def _active_positions(lifetimes, dates, include_start_date):
+        """
+        Return the positions, in sid order, of the assets that existed on at
+        least one of ``dates``.
+        """
+        raw_dates = dates.asi8
+        if not len(raw_dates):
+            return np.array([], dtype='int64')
+
+        # Only the assets that started by the last date can have existed, and
+        # the starts are sorted, so those are a prefix of the start order.
+        num_started = lifetimes.sorted_start.searchsorted(
+            raw_dates[-1],
+            side='right' if include_start_date else 'left',
+        )
+        positions = lifetimes.start_order[:num_started]
+        positions = positions[lifetimes.end[positions] >= raw_dates[0]]
+
+        # The first date on which each of those assets existed, if any.
+        first_idx = raw_dates.searchsorted(
+            lifetimes.start[positions],
+            side='left' if include_start_date else 'right',
+        )
+        existed = first_idx < len(raw_dates)
+        existed[existed] = (
+            raw_dates[first_idx[existed]] <= lifetimes.end[positions[existed]]
+        )
+        return np.sort(positions[existed])
 
-    def lifetimes(self, dates, include_start_date, country_codes):
+    def active_sids(self, dates, include_start_date, country_codes):
+        """
+        Return the sids of the assets that existed on at least one of
+        ``dates``, without computing the full lifetimes matrix.
+
+        Parameters
+        ----------
+        dates : pd.DatetimeIndex
+            The dates, in ascending order.
+        include_start_date : bool
+            Whether or not to count the asset as alive on its start_date. See
+            ``AssetFinder.lifetimes``.
+        country_codes : iterable[str]
+            The country codes to get sids for.
+
+        Returns
+        -------
+        sids : np.ndarray[int64]
+            The sids, in the order of the columns of ``AssetFinder.lifetimes``.
+        """
+        lifetimes = self._get_asset_lifetimes(country_codes)
+        return lifetimes.sid[
+            self._active_positions(lifetimes, dates, include_start_date)
+        ]
+
+    def _lifetimes_mask(self, dates, include_start_date, country_codes, sids):
+        lifetimes = self._get_asset_lifetimes(country_codes)
+
+        if sids is None:
+            positions = slice(None)
+        else:
+            positions = np.flatnonzero(np.isin(lifetimes.sid, sids))
+
+        raw_dates = as_column(dates.asi8)
+        start = lifetimes.start[positions]
+        if include_start_date:
+            mask = start <= raw_dates
+        else:
+            mask = start < raw_dates
+        mask &= (raw_dates <= lifetimes.end[positions])
+
+        return mask, lifetimes.sid[positions]
+
+    def lifetimes(self, dates, include_start_date, country_codes, sids=None):
         """
         Compute a DataFrame representing asset lifetimes for the specified date
         range.
@@ -964,6 +1350,10 @@ class AssetFinder(object):
             day.
         country_codes : iterable[str]
             The country codes to get lifetimes for.
+        sids : iterable[int], optional
+            Only compute lifetimes for these sids, such as the sids returned
+            by ``AssetFinder.active_sids``. Sids of other countries are
+            ignored. Default is all sids of the countries.
 
         Returns
         -------
@@ -979,29 +1369,44 @@ class AssetFinder(object):
         numpy.putmask
         zipline.pipeline.engine.SimplePipelineEngine._compute_root_mask
         """
-        if isinstance(country_codes, string_types):
-            raise TypeError(
-                "Got string {!r} instead of an iterable of strings in "
-                "AssetFinder.lifetimes.".format(country_codes),
-            )
-
-        # normalize to a cache-key so that we can memoize results.
-        country_codes = frozenset(country_codes)
+        mask, sids = self._lifetimes_mask(
+            dates, include_start_date, country_codes, sids,
+        )
+        return pd.DataFrame(mask, index=dates, columns=sids)
 
-        lifetimes = self._asset_lifetimes.get(country_codes)
-        if lifetimes is None:
-            self._asset_lifetimes[country_codes] = lifetimes = (
-                self._compute_asset_lifetimes(country_codes)
-            )
+    def packed_lifetimes(self,
+                         dates,
+                         include_start_date,
+                         country_codes,
+                         sids=None):
+        """
+        Compute asset lifetimes like ``AssetFinder.lifetimes``, packed into
+        bits with ``np.packbits``, which takes an eighth of the memory.
 
-        raw_dates = as_column(dates.asi8)
-        if include_start_date:
-            mask = lifetimes.start <= raw_dates
-        else:
-            mask = lifetimes.start < raw_dates
-        mask &= (raw_dates <= lifetimes.end)
+        Parameters
+        ----------
+        dates : pd.DatetimeIndex
+            The dates for which to compute lifetimes.
+        include_start_date : bool
+            Whether or not to count the asset as alive on its start_date.
+        country_codes : iterable[str]
+            The country codes to get lifetimes for.
+        sids : iterable[int], optional
+            Only compute lifetimes for these sids.
 
-        return pd.DataFrame(mask, index=dates, columns=lifetimes.sid)
+        Returns
+        -------
+        packed : np.ndarray[uint8]
+            An array of shape ``(len(dates), ceil(len(sids) / 8))``. Row i
+            unpacks, with ``np.unpackbits(packed[i], count=len(sids))``, to the
+            lifetimes of ``dates[i]``.
+        sids : np.ndarray[int64]
+            The sids of the unpacked columns.
+        """
+        mask, sids = self._lifetimes_mask(
+            dates, include_start_date, country_codes, sids,
+        )
+        return np.packbits(mask, axis=1), sids
 
     def equities_sids_for_country_code(self, country_code):
         """Return all of the sids for a given country.
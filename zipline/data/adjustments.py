@@ -9,6 +9,7 @@ import six
 import sqlite3
 
 from zipline.utils.functional import keysorted
+from zipline.utils.memoize import lazyval
 
 from zipline.utils.numpy_utils import (
     datetime64ns_dtype,
@@ -195,6 +196,14 @@ class SQLiteAdjustmentReader(object):
                 for adjustment in
                 adjustments_for_sid]
 
+    @lazyval
+    def adjustment_index(self):
+        """
+        An :class:`AdjustmentIndex` of the splits, mergers and dividends
+        tables, read from the db the first time it is used.
+        """
+        return AdjustmentIndex.from_conn(self.conn)
+
     def get_dividends_with_ex_date(self, assets, date, asset_finder):
         seconds = date.value / int(1e9)
         c = self.conn.cursor()
@@ -313,6 +322,130 @@ class SQLiteAdjustmentReader(object):
         return out
 
 
+class AdjustmentIndex(object):
+    """
+    In-memory index of the ratio adjustment tables of an adjustments db, for
+    looking up the adjustments of many assets at once.
+
+    Each table is held as arrays of sids, effective dates and ratios sorted by
+    sid and then effective date, so that the adjustments of each requested
+    asset in a date range are found with a vectorized binary search.
+
+    Parameters
+    ----------
+    tables : dict[str -> (np.array[int64], np.array[int64], np.array[float64])]
+        Map from table name to the sids, effective dates (in seconds since the
+        epoch, as stored in the db) and ratios of its rows.
+    """
+    def __init__(self, tables):
+        self._tables = {}
+        for table_name, (sids, dates, ratios) in tables.items():
+            sids = np.asarray(sids, dtype=int64_dtype)
+            dates = np.asarray(dates, dtype=int64_dtype)
+            ratios = np.asarray(ratios, dtype=float64_dtype)
+            # lexsort is stable, so rows with the same sid and date stay in
+            # the order they were read.
+            order = np.lexsort((dates, sids))
+            sids, dates, ratios = sids[order], dates[order], ratios[order]
+
+            unique_sids, sid_ranks = np.unique(sids, return_inverse=True)
+            if len(dates):
+                min_date = dates.min()
+                span = dates.max() - min_date + 1
+            else:
+                min_date = span = 1
+            # Offsetting each date by the rank of its sid times the span of
+            # the dates gives a single sorted key for (sid, date).
+            keys = sid_ranks * span + (dates - min_date)
+
+            self._tables[table_name] = (
+                unique_sids, keys, min_date, span, dates, ratios,
+            )
+
+    @classmethod
+    def from_conn(cls, conn):
+        """
+        Read the splits, mergers and dividends tables of an adjustments db.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection
+            Connection to the adjustments db.
+
+        Returns
+        -------
+        index : AdjustmentIndex
+        """
+        tables = {}
+        for table_name in SQLITE_ADJUSTMENT_TABLENAMES:
+            rows = conn.execute(
+                "SELECT sid, effective_date, ratio FROM %s" % table_name
+            ).fetchall()
+            if rows:
+                tables[table_name] = tuple(zip(*rows))
+            else:
+                tables[table_name] = ((), (), ())
+        return cls(tables)
+
+    def lookup(self, table_name, sids, start, end):
+        """
+        Find the adjustments of ``sids`` effective after ``start`` and on or
+        before ``end``.
+
+        Parameters
+        ----------
+        table_name : {'splits', 'mergers', 'dividends'}
+            The table to search.
+        sids : iterable of int
+            The assets whose adjustments are needed.
+        start : pd.Timestamp or pd.DatetimeIndex
+            The exclusive lower bound of the effective dates, or one lower
+            bound for each of ``sids``.
+        end : pd.Timestamp
+            The inclusive upper bound of the effective dates.
+
+        Returns
+        -------
+        locs : np.array[intp]
+            The index into ``sids`` of the asset of each adjustment.
+        dates : np.array[int64]
+            The effective date of each adjustment, in nanoseconds since the
+            epoch.
+        ratios : np.array[float64]
+            The ratio of each adjustment.
+
+        The adjustments are ordered by asset, in the order of ``sids``, and
+        then by effective date.
+        """
+        unique_sids, keys, min_date, span, dates, ratios = \
+            self._tables[table_name]
+        sids = np.asarray(sids, dtype=int64_dtype)
+
+        ranks = unique_sids.searchsorted(sids)
+        found = ranks < len(unique_sids)
+        found[found] = unique_sids[ranks[found]] == sids[found]
+
+        # Clipping the bounds to just outside the range of the dates keeps
+        # each search within the rows of its sid.
+        if isinstance(start, pd.Timestamp):
+            start = start.value
+        else:
+            start = pd.DatetimeIndex(start).asi8
+        start = np.clip(start // 10 ** 9 - min_date, -1, span - 1)
+        end = np.clip(end.value // 10 ** 9 - min_date, -1, span - 1)
+        base = ranks * span
+        lo = np.where(found, keys.searchsorted(base + start, 'right'), 0)
+        hi = np.where(found, keys.searchsorted(base + end, 'right'), 0)
+
+        counts = np.maximum(hi - lo, 0)
+        locs = np.repeat(np.arange(len(sids)), counts)
+        rows = (
+            np.arange(counts.sum()) +
+            np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        )
+        return locs, dates[rows] * 10 ** 9, ratios[rows]
+
+
 class SQLiteAdjustmentWriter(object):
     """
     Writer for data to be read by SQLiteAdjustmentReader
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod, abstractproperty
+
+import pandas as pd
 from six import with_metaclass
 
 
@@ -146,3 +148,30 @@ class BarReader(with_metaclass(ABCMeta, object)):
             dt as a vantage point.
         """
         pass
+
+    def get_last_traded_dts(self, assets, dt):
+        """
+        Get the latest minute on or before ``dt`` in which each of ``assets``
+        traded.
+
+        Parameters
+        ----------
+        assets : list[zipline.asset.Asset]
+            The assets for which to get the last traded minute.
+        dt : pd.Timestamp
+            The minute at which to start searching for the last traded minute.
+
+        Returns
+        -------
+        last_traded : pd.DatetimeIndex
+            The dt of the last trade for each asset, using the input dt as a
+            vantage point, or ``pd.NaT`` for assets which have no trades on
+            or before ``dt`` or no data.
+        """
+        last_traded = []
+        for asset in assets:
+            try:
+                last_traded.append(self.get_last_traded_dt(asset, dt))
+            except NoDataForSid:
+                last_traded.append(pd.NaT)
+        return pd.DatetimeIndex(last_traded)
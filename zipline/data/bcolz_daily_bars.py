@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import OrderedDict
 from functools import partial
 from typing import Literal
 import warnings
@@ -42,6 +43,7 @@ from zipline.data.bar_reader import (
 from zipline.utils.functional import apply
 from zipline.utils.numpy_utils import iNaT, float64_dtype, uint32_dtype
 from zipline.utils.memoize import lazyval
+from zipline.utils.pool import SequentialPool
 from ._equities import _compute_row_slices, _read_bcolz_data
 
 OHLC = frozenset(['open', 'high', 'low', 'close'])
@@ -341,6 +343,72 @@ class BcolzDailyBarWriter(object):
         return ctable.fromdataframe(processed)
 
 
+class ChunkCache(object):
+    """
+    LRU cache of the decompressed chunks of the columns of a bcolz ctable,
+    for reading single values without decompressing whole columns.
+
+    Parameters
+    ----------
+    table : bcolz.ctable
+        The table whose columns are read.
+    max_bytes : int
+        The most memory the decompressed chunks may use. The least recently
+        used chunks are dropped to stay below it, but the most recently read
+        chunk is always kept.
+
+    Attributes
+    ----------
+    hits : int
+        The number of values read from a chunk that was already cached.
+    misses : int
+        The number of values whose chunk had to be decompressed.
+    nbytes : int
+        The memory used by the cached chunks.
+    """
+    def __init__(self, table, max_bytes):
+        self._table = table
+        self.max_bytes = max_bytes
+        self._cols = {}
+        self._chunks = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+
+    def get(self, colname, ix):
+        """
+        Read the value at row ``ix`` of the column ``colname``.
+        """
+        try:
+            col = self._cols[colname]
+        except KeyError:
+            col = self._cols[colname] = self._table[colname]
+
+        chunk_ix, offset = divmod(ix, col.chunklen)
+        key = (colname, chunk_ix)
+        try:
+            chunk = self._chunks[key]
+        except KeyError:
+            self.misses += 1
+            start = chunk_ix * col.chunklen
+            chunk = self._chunks[key] = col[start:start + col.chunklen]
+            self.nbytes += chunk.nbytes
+            while self.nbytes > self.max_bytes and len(self._chunks) > 1:
+                _, evicted = self._chunks.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+        else:
+            self.hits += 1
+            self._chunks.move_to_end(key)
+        return chunk[offset]
+
+    def clear(self):
+        """
+        Drop the cached chunks and reset the counters.
+        """
+        self._chunks.clear()
+        self.hits = self.misses = self.nbytes = 0
+
+
 class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
     """
     Reader for raw pricing data written by BcolzDailyOHLCVWriter.
@@ -356,6 +424,16 @@ class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
         all of the data for all assets into memory and then indexing into that
         array for each day and asset pair.  Used to tune performance of reads
         when using a small or large number of equities.
+    spot_cache_bytes : int, optional
+        The most memory used by the decompressed chunks kept for the single
+        value reads of ``get_value`` and ``get_last_traded_dt``. Default 64
+        MiB.
+    read_pool : multiprocessing.pool.ThreadPool, optional
+        The pool used to read the columns in ``load_raw_arrays``, one column
+        per task. blosc releases the GIL while decompressing, so a thread
+        pool reads several columns concurrently, at the cost of holding one
+        decompressed column per thread when the whole columns are read.
+        Defaults to a :class:`~zipline.utils.pool.SequentialPool`.
 
     Attributes
     ----------
@@ -412,13 +490,16 @@ class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
     --------
     zipline.data.bcolz_daily_bars.BcolzDailyBarWriter
     """
-    def __init__(self, table, read_all_threshold=3000):
+    def __init__(self,
+                 table,
+                 read_all_threshold=3000,
+                 spot_cache_bytes=64 * 2 ** 20,
+                 read_pool=None):
         self._maybe_table_rootdir = table
-        # Cache of fully read np.array for the carrays in the daily bar table.
-        # raw_array does not use the same cache, but it could.
-        # Need to test keeping the entire array in memory for the course of a
-        # process first.
-        self._spot_cols = {}
+        self._spot_cache_bytes = spot_cache_bytes
+        self._read_pool = (
+            read_pool if read_pool is not None else SequentialPool()
+        )
         self.PRICE_ADJUSTMENT_FACTOR = 0.001
         self._read_all_threshold = read_all_threshold
 
@@ -563,15 +644,25 @@ class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
             assets,
         )
         read_all = len(assets) > self._read_all_threshold
-        return _read_bcolz_data(
-            self._table,
-            (end_idx - start_idx + 1, len(assets)),
-            list(columns),
-            first_rows,
-            last_rows,
-            offsets,
-            read_all,
-        )
+        table = self._table
+        shape = (end_idx - start_idx + 1, len(assets))
+
+        def read_column(column):
+            # Slicing the carrays of the table decompresses either the whole
+            # column (when reading all of the data) or the rows of each asset
+            # without the GIL, so the columns are read concurrently. Only the
+            # column being read by a task is held decompressed.
+            return _read_bcolz_data(
+                table,
+                shape,
+                [column],
+                first_rows,
+                last_rows,
+                offsets,
+                read_all,
+            )[0]
+
+        return self._read_pool.map(read_column, list(columns))
 
     def _load_raw_arrays_date_to_index(self, date):
         try:
@@ -579,30 +670,16 @@ class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
         except KeyError:
             raise NoDataOnDate(date)
 
-    def _spot_col(self, colname):
+    @lazyval
+    def spot_cache(self):
         """
-        Get the colname from daily_bar_table and read all of it into memory,
-        caching the result.
-
-        Parameters
-        ----------
-        colname : string
-            A name of a OHLCV carray in the daily_bar_table
-
-        Returns
-        -------
-        array (uint32)
-            Full read array of the carray in the daily_bar_table with the
-            given colname.
+        The ChunkCache of the chunks read by ``get_value`` and
+        ``get_last_traded_dt``, with its hit and miss counters.
         """
-        try:
-            col = self._spot_cols[colname]
-        except KeyError:
-            col = self._spot_cols[colname] = self._table[colname]
-        return col
+        return ChunkCache(self._table, self._spot_cache_bytes)
 
     def get_last_traded_dt(self, asset, day):
-        volumes = self._spot_col('volume')
+        spot_cache = self.spot_cache
 
         search_day = day
 
@@ -620,7 +697,7 @@ class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
                 continue
             except NoDataOnDate:
                 return NaT
-            if volumes[ix] != 0:
+            if spot_cache.get('volume', ix) != 0:
                 return search_day
             prev_day_ix = self.sessions_unbounded.get_loc(search_day) - 1
             if prev_day_ix > -1:
@@ -682,7 +759,7 @@ class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
             0.
         """
         ix = self.sid_day_index(sid, dt)
-        price = self._spot_col(field)[ix]
+        price = self.spot_cache.get(field, ix)
         if field != 'volume':
             if price == 0:
                 return nan
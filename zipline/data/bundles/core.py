@@ -14,6 +14,8 @@ from ..minute_bars import (
     BcolzMinuteBarReader,
     BcolzMinuteBarWriter,
 )
+from ..mmap_minute_bars import MmapMinuteBarReader, MmapMinuteBarWriter
+from ..parquet_daily_bars import ParquetDailyBarReader, ParquetDailyBarWriter
 from zipline.assets import AssetDBWriter, AssetFinder, ASSET_DB_VERSION
 from zipline.utils.cache import (
     dataframe_cache,
@@ -29,16 +31,26 @@ def asset_db_path(bundle_name, timestr, environ=None, db_version=None):
     )
 
 
-def minute_equity_path(bundle_name, timestr, environ=None):
+MINUTE_BAR_FORMATS = ('bcolz', 'mmap')
+DAILY_BAR_FORMATS = ('bcolz', 'parquet', 'arrow')
+
+
+def minute_equity_path(bundle_name,
+                       timestr,
+                       environ=None,
+                       minute_bar_format='bcolz'):
     return pth.data_path(
-        minute_equity_relative(bundle_name, timestr),
+        minute_equity_relative(bundle_name, timestr, minute_bar_format),
         environ=environ,
     )
 
 
-def daily_equity_path(bundle_name, timestr, environ=None):
+def daily_equity_path(bundle_name,
+                      timestr,
+                      environ=None,
+                      daily_bar_format='bcolz'):
     return pth.data_path(
-        daily_equity_relative(bundle_name, timestr),
+        daily_equity_relative(bundle_name, timestr, daily_bar_format),
         environ=environ,
     )
 
@@ -65,12 +77,12 @@ def cache_relative(bundle_name):
     return bundle_name, '.cache'
 
 
-def daily_equity_relative(bundle_name, timestr):
-    return bundle_name, timestr, 'daily_equities.bcolz'
+def daily_equity_relative(bundle_name, timestr, daily_bar_format='bcolz'):
+    return bundle_name, timestr, 'daily_equities.%s' % daily_bar_format
 
 
-def minute_equity_relative(bundle_name, timestr):
-    return bundle_name, timestr, 'minute_equities.bcolz'
+def minute_equity_relative(bundle_name, timestr, minute_bar_format='bcolz'):
+    return bundle_name, timestr, 'minute_equities.%s' % minute_bar_format
 
 
 def asset_db_relative(bundle_name, timestr, db_version=None):
@@ -128,7 +140,9 @@ RegisteredBundle = namedtuple(
      'end_session',
      'minutes_per_day',
      'ingest',
-     'create_writers']
+     'create_writers',
+     'minute_bar_format',
+     'daily_bar_format']
 )
 
 BundleData = namedtuple(
@@ -184,7 +198,9 @@ def _make_bundle_core():
                  start_session=None,
                  end_session=None,
                  minutes_per_day=390,
-                 create_writers=True):
+                 create_writers=True,
+                 minute_bar_format='bcolz',
+                 daily_bar_format='bcolz'):
         """Register a data bundle ingest function.
 
         Parameters
@@ -198,9 +214,9 @@ def _make_bundle_core():
                   The environment this is being run with.
               asset_db_writer : AssetDBWriter
                   The asset db writer to write into.
-              minute_bar_writer : BcolzMinuteBarWriter
+              minute_bar_writer : BcolzMinuteBarWriter or MmapMinuteBarWriter
                   The minute bar writer to write into.
-              daily_bar_writer : BcolzDailyBarWriter
+              daily_bar_writer : BcolzDailyBarWriter or ParquetDailyBarWriter
                   The daily bar writer to write into.
               adjustment_writer : SQLiteAdjustmentWriter
                   The adjustment db writer to write into.
@@ -232,6 +248,19 @@ def _make_bundle_core():
             Should the ingest machinery create the writers for the ingest
             function. This can be disabled as an optimization for cases where
             they are not needed.
+        minute_bar_format : {'bcolz', 'mmap'}, optional
+            The format in which to store minute bars. 'bcolz' writes a
+            compressed ctable per sid. 'mmap' writes one memory-mapped
+            array per field, which avoids a file per sid and is faster to
+            read at the cost of disk space. Default is 'bcolz'.
+        daily_bar_format : {'bcolz', 'parquet', 'arrow'}, optional
+            The format in which to store daily bars. 'bcolz' writes a
+            compressed ctable. 'parquet' and 'arrow' write a dataset
+            partitioned by year with
+            :class:`~zipline.data.parquet_daily_bars.ParquetDailyBarWriter`,
+            as compressed Parquet files or as uncompressed Arrow files which
+            are memory-mapped when read. Both require pyarrow. Default is
+            'bcolz'.
 
         Notes
         -----
@@ -247,6 +276,21 @@ def _make_bundle_core():
         --------
         zipline.data.bundles.bundles
         """
+        if minute_bar_format not in MINUTE_BAR_FORMATS:
+            raise ValueError(
+                'minute_bar_format must be one of %r, got %r' % (
+                    MINUTE_BAR_FORMATS,
+                    minute_bar_format,
+                ),
+            )
+        if daily_bar_format not in DAILY_BAR_FORMATS:
+            raise ValueError(
+                'daily_bar_format must be one of %r, got %r' % (
+                    DAILY_BAR_FORMATS,
+                    daily_bar_format,
+                ),
+            )
+
         if name in bundles:
             warnings.warn(
                 'Overwriting bundle with name %r' % name,
@@ -270,6 +314,8 @@ def _make_bundle_core():
             minutes_per_day=minutes_per_day,
             ingest=f,
             create_writers=create_writers,
+            minute_bar_format=minute_bar_format,
+            daily_bar_format=daily_bar_format,
         )
         return f
 
@@ -343,22 +389,45 @@ def _make_bundle_core():
                     pth.data_path([], environ=environ))
                 )
                 daily_bars_path = wd.ensure_dir(
-                    *daily_equity_relative(name, timestr)
-                )
-                daily_bar_writer = BcolzDailyBarWriter(
-                    daily_bars_path,
-                    calendar,
-                    start_session,
-                    end_session,
+                    *daily_equity_relative(
+                        name,
+                        timestr,
+                        bundle.daily_bar_format,
+                    )
                 )
-                # Do an empty write to ensure that the daily ctables exist
+                if bundle.daily_bar_format == 'bcolz':
+                    daily_bar_writer = BcolzDailyBarWriter(
+                        daily_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                    )
+                    daily_bar_reader = BcolzDailyBarReader(daily_bars_path)
+                else:
+                    daily_bar_writer = ParquetDailyBarWriter(
+                        daily_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                        file_format=bundle.daily_bar_format,
+                    )
+                    daily_bar_reader = ParquetDailyBarReader(daily_bars_path)
+                # Do an empty write to ensure that the daily bars exist
                 # when we create the SQLiteAdjustmentWriter below. The
-                # SQLiteAdjustmentWriter needs to open the daily ctables so
+                # SQLiteAdjustmentWriter needs to open the daily bars so
                 # that it can compute the adjustment ratios for the dividends.
 
                 daily_bar_writer.write(())
-                minute_bar_writer = BcolzMinuteBarWriter(
-                    wd.ensure_dir(*minute_equity_relative(name, timestr)),
+                if bundle.minute_bar_format == 'mmap':
+                    minute_bar_writer_cls = MmapMinuteBarWriter
+                else:
+                    minute_bar_writer_cls = BcolzMinuteBarWriter
+                minute_bar_writer = minute_bar_writer_cls(
+                    wd.ensure_dir(*minute_equity_relative(
+                        name,
+                        timestr,
+                        bundle.minute_bar_format,
+                    )),
                     calendar,
                     start_session,
                     end_session,
@@ -370,7 +439,7 @@ def _make_bundle_core():
                 adjustment_db_writer = stack.enter_context(
                     SQLiteAdjustmentWriter(
                         wd.getpath(*adjustment_db_relative(name, timestr)),
-                        BcolzDailyBarReader(daily_bars_path),
+                        daily_bar_reader,
                         overwrite=True,
                     )
                 )
@@ -445,6 +514,13 @@ def _make_bundle_core():
         timestamp : datetime, optional
             The timestamp of the data to lookup.
             Defaults to the current time.
+        daily_bar_reader_kwargs : dict, optional
+            Extra keyword arguments for the BcolzDailyBarReader. These are
+            not used if the daily bars are stored in the 'parquet' or 'arrow'
+            format.
+        minute_bar_reader_kwargs : dict, optional
+            Extra keyword arguments for the BcolzMinuteBarReader. These are
+            not used if the minute bars are stored in the 'mmap' format.
 
         Returns
         -------
@@ -454,18 +530,49 @@ def _make_bundle_core():
         if timestamp is None:
             timestamp = pd.Timestamp.utcnow()
         timestr = most_recent_data(name, timestamp, environ=environ)
-        return BundleData(
-            asset_finder=AssetFinder(
-                asset_db_path(name, timestr, environ=environ),
-            ),
-            equity_minute_bar_reader=BcolzMinuteBarReader(
+
+        # Prefer minute bars in the 'mmap' format, which are either ingested
+        # in that format or converted from the bcolz minute bars with
+        # zipline.data.mmap_minute_bars.convert_bcolz_minute_bars.
+        mmap_minute_path = minute_equity_path(
+            name,
+            timestr,
+            environ=environ,
+            minute_bar_format='mmap',
+        )
+        if os.path.exists(mmap_minute_path):
+            equity_minute_bar_reader = MmapMinuteBarReader(mmap_minute_path)
+        else:
+            equity_minute_bar_reader = BcolzMinuteBarReader(
                 minute_equity_path(name, timestr, environ=environ),
                 **minute_bar_reader_kwargs
-            ),
-            equity_daily_bar_reader=BcolzDailyBarReader(
+            )
+
+        # Likewise, prefer daily bars in the 'parquet' or 'arrow' format,
+        # which are only written if the bundle was registered with that
+        # daily_bar_format.
+        for daily_bar_format in ('parquet', 'arrow'):
+            daily_path = daily_equity_path(
+                name,
+                timestr,
+                environ=environ,
+                daily_bar_format=daily_bar_format,
+            )
+            if os.path.exists(daily_path):
+                equity_daily_bar_reader = ParquetDailyBarReader(daily_path)
+                break
+        else:
+            equity_daily_bar_reader = BcolzDailyBarReader(
                 daily_equity_path(name, timestr, environ=environ),
                 **daily_bar_reader_kwargs
+            )
+
+        return BundleData(
+            asset_finder=AssetFinder(
+                asset_db_path(name, timestr, environ=environ),
             ),
+            equity_minute_bar_reader=equity_minute_bar_reader,
+            equity_daily_bar_reader=equity_daily_bar_reader,
             adjustment_reader=SQLiteAdjustmentReader(
                 adjustment_db_path(name, timestr, environ=environ),
             ),
@@ -12,13 +12,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from operator import mul
+from collections import OrderedDict
 
 import numpy as np
 from numpy import float64, int64, nan
 import pandas as pd
 from pandas import isnull
-from six.moves import reduce
 
 from zipline.assets import (
     Asset,
@@ -143,11 +142,6 @@ class DataPortal(object):
 
         self._adjustment_reader = adjustment_reader
 
-        # caches of sid -> adjustment list
-        self._splits_dict = {}
-        self._mergers_dict = {}
-        self._dividends_dict = {}
-
         self._first_available_session = first_trading_day
 
         if last_available_session:
@@ -311,6 +305,15 @@ class DataPortal(object):
         return self._get_pricing_reader(data_frequency).get_last_traded_dt(
             asset, dt)
 
+    def get_last_traded_dts(self, assets, dt, data_frequency):
+        """
+        Given a list of assets and dt, returns the last traded dt of each
+        asset from the viewpoint of the given dt, or NaT for assets which
+        have not traded.
+        """
+        return self._get_pricing_reader(data_frequency).get_last_traded_dts(
+            assets, dt)
+
     def _get_single_asset_value(self,
                                 session_label,
                                 asset,
@@ -426,7 +429,34 @@ class DataPortal(object):
                 data_frequency,
             )
         else:
-            get_single_asset_value = self._get_single_asset_value
+            return self._get_spot_values(
+                session_label,
+                list(assets),
+                field,
+                dt,
+                data_frequency,
+            )
+
+    def _get_spot_values(self,
+                         session_label,
+                         assets,
+                         field,
+                         dt,
+                         data_frequency):
+        """
+        Get the spot values of ``field`` for many assets.
+
+        The bar at ``dt`` is read for all of the live equities and futures with
+        a single read. Prices missing from that bar are forward-filled from
+        each asset's last traded bar, read once per distinct last traded dt.
+        Other assets and other fields fall back to
+        ``_get_single_asset_value``.
+        """
+        if field not in BASE_FIELDS:
+            raise KeyError("Invalid column: " + str(field))
+
+        get_single_asset_value = self._get_single_asset_value
+        if field not in OHLCVP_FIELDS:
             return [
                 get_single_asset_value(
                     session_label,
@@ -438,6 +468,113 @@ class DataPortal(object):
                 for asset in assets
             ]
 
+        # Assets outside of their lifetimes are handled one at a time, since
+        # whether their prices are forward-filled depends on the asset.
+        dt_value = dt.value
+        batch_locs = [
+            i for i, asset in enumerate(assets)
+            if type(asset) in (Equity, Future) and
+            asset.start_date.value <= dt_value and
+            session_label <= asset.end_date
+        ]
+
+        out = [None] * len(assets)
+        if batch_locs:
+            column = 'close' if field == 'price' else field
+            if data_frequency == 'daily':
+                read_dt = session_label
+            elif self.exchange_calendar.is_open_on_minute(dt):
+                read_dt = dt
+            else:
+                # There is no bar for a minute outside of the market hours,
+                # so look up each asset.
+                batch_locs = []
+        if batch_locs:
+            try:
+                values = self._get_pricing_reader(
+                    data_frequency
+                ).load_raw_arrays(
+                    [column],
+                    read_dt,
+                    read_dt,
+                    [assets[i] for i in batch_locs],
+                )[0][0]
+            except (NoDataOnDate, NoDataForSid):
+                # The bar doesn't exist for some of the assets, so look up
+                # each asset.
+                pass
+            else:
+                if field == 'volume':
+                    values = values.astype(int64)
+                for i, value in zip(batch_locs, values.tolist()):
+                    out[i] = value
+                if field == 'price':
+                    self._ffill_spot_prices(
+                        assets, out, read_dt, data_frequency,
+                    )
+
+        # Prices which couldn't be forward-filled above, and missing daily
+        # volumes (which are nan rather than 0), are looked up individually.
+        if field == 'price':
+            def is_missing(value):
+                return value is None or value != value
+        elif field == 'volume' and data_frequency == 'daily':
+            def is_missing(value):
+                return value is None or value == 0
+        else:
+            def is_missing(value):
+                return value is None
+
+        for i, asset in enumerate(assets):
+            if is_missing(out[i]):
+                out[i] = get_single_asset_value(
+                    session_label,
+                    asset,
+                    field,
+                    dt,
+                    data_frequency,
+                )
+        return out
+
+    def _ffill_spot_prices(self, assets, out, dt, data_frequency):
+        """
+        Forward-fill, in place, the prices in ``out`` which were read as nan
+        with the adjusted close of each asset's last traded bar on or before
+        ``dt``.
+
+        Prices which can't be forward-filled this way, e.g. because the asset
+        has no minute data, are set to None for ``_get_single_asset_value``.
+        """
+        missing_locs = [
+            i for i, value in enumerate(out)
+            if value is not None and value != value
+        ]
+        if not missing_locs:
+            return
+
+        for i in missing_locs:
+            out[i] = None
+        last_traded = self.get_last_traded_dts(
+            [assets[i] for i in missing_locs],
+            dt,
+            data_frequency,
+        )
+        traded = ~isnull(last_traded)
+        if not traded.any():
+            return
+
+        traded_locs = [i for i, t in zip(missing_locs, traded) if t]
+        values = self._get_adjusted_values(
+            [assets[i] for i in traded_locs],
+            'close',
+            last_traded[traded],
+            dt,
+            data_frequency,
+        )
+        for i, value in zip(traded_locs, values.tolist()):
+            if value == value:
+                out[i] = value
+
     def get_scalar_asset_spot_value(self, asset, field, dt, data_frequency):
         """
         Public API method that returns a scalar value representing the value
@@ -486,8 +623,9 @@ class DataPortal(object):
         field : {'open', 'high', 'low', 'close', 'volume', \
                  'price', 'last_traded'}
             The desired field of the asset.
-        dt : pd.Timestamp
-            The timestamp for the desired value.
+        dt : pd.Timestamp or pd.DatetimeIndex
+            The timestamp for the desired value, or the timestamp for each of
+            the assets.
         perspective_dt : pd.Timestamp
             The timestamp from which the data is being viewed back from.
 
@@ -499,45 +637,26 @@ class DataPortal(object):
         if isinstance(assets, Asset):
             assets = [assets]
 
-        adjustment_ratios_per_asset = []
+        ratios = np.ones(len(assets))
+        if self._adjustment_reader is None:
+            return ratios.tolist()
 
-        def split_adj_factor(x):
-            return x if field != 'volume' else 1.0 / x
+        if field != 'volume':
+            table_names = ('splits', 'mergers', 'dividends')
+        else:
+            table_names = ('splits',)
 
-        for asset in assets:
-            adjustments_for_asset = []
-            split_adjustments = self._get_adjustment_list(
-                asset, self._splits_dict, "SPLITS"
+        index = self._adjustment_reader.adjustment_index
+        sids = [int(asset) for asset in assets]
+        for table_name in table_names:
+            locs, _, table_ratios = index.lookup(
+                table_name, sids, dt, perspective_dt,
             )
-            for adj_dt, adj in split_adjustments:
-                if dt < adj_dt.tz_localize(dt.tzinfo) <= perspective_dt:
-                    adjustments_for_asset.append(split_adj_factor(adj))
-                elif adj_dt.tz_localize(dt.tzinfo) > perspective_dt:
-                    break
-
-            if field != 'volume':
-                merger_adjustments = self._get_adjustment_list(
-                    asset, self._mergers_dict, "MERGERS"
-                )
-                for adj_dt, adj in merger_adjustments:
-                    if dt < adj_dt.tz_localize(dt.tzinfo) <= perspective_dt:
-                        adjustments_for_asset.append(adj)
-                    elif adj_dt.tz_localize(dt.tzinfo) > perspective_dt:
-                        break
-
-                dividend_adjustments = self._get_adjustment_list(
-                    asset, self._dividends_dict, "DIVIDENDS",
-                )
-                for adj_dt, adj in dividend_adjustments:
-                    if dt < adj_dt.tz_localize(dt.tzinfo) <= perspective_dt:
-                        adjustments_for_asset.append(adj)
-                    elif adj_dt.tz_localize(dt.tzinfo) > perspective_dt:
-                        break
-
-            ratio = reduce(mul, adjustments_for_asset, 1.0)
-            adjustment_ratios_per_asset.append(ratio)
+            if table_name == 'splits' and field == 'volume':
+                table_ratios = 1.0 / table_ratios
+            np.multiply.at(ratios, locs, table_ratios)
 
-        return adjustment_ratios_per_asset
+        return ratios.tolist()
 
     def get_adjusted_value(self, asset, field, dt,
                            perspective_dt,
@@ -684,34 +803,38 @@ class DataPortal(object):
                                   assets,
                                   end_dt,
                                   bar_count,
-                                  field_to_use,
+                                  fields,
                                   data_frequency):
         """
-        Internal method that returns a dataframe containing history bars
-        of daily frequency for the given sids.
+        Internal method that returns a dataframe for each of ``fields``
+        containing history bars of daily frequency for the given sids.
         """
         session = self.exchange_calendar.minute_to_session(end_dt)
         days_for_window = self._get_days_for_window(session, bar_count)
 
         if len(assets) == 0:
-            return pd.DataFrame(None,
-                                index=days_for_window,
-                                columns=None)
+            return [
+                pd.DataFrame(None, index=days_for_window, columns=None)
+                for _ in fields
+            ]
 
         data = self._get_history_daily_window_data(
-            assets, days_for_window, end_dt, field_to_use, data_frequency
-        )
-        return pd.DataFrame(
-            data,
-            index=days_for_window,
-            columns=assets
+            assets, days_for_window, end_dt, fields, data_frequency
         )
+        return [
+            pd.DataFrame(
+                field_data,
+                index=days_for_window,
+                columns=assets
+            )
+            for field_data in data
+        ]
 
     def _get_history_daily_window_data(self,
                                        assets,
                                        days_for_window,
                                        end_dt,
-                                       field_to_use,
+                                       fields,
                                        data_frequency):
         if data_frequency == 'daily':
             # two cases where we use daily data for the whole range:
@@ -720,7 +843,7 @@ class DataPortal(object):
             # last trading day, use daily data for the whole range.
             return self._get_daily_window_data(
                 assets,
-                field_to_use,
+                fields,
                 days_for_window,
                 extra_slot=False
             )
@@ -728,50 +851,54 @@ class DataPortal(object):
             # minute mode, requesting '1d'
             daily_data = self._get_daily_window_data(
                 assets,
-                field_to_use,
+                fields,
                 days_for_window[0:-1]
             )
 
-            if field_to_use == 'open':
-                try:
-                    minute_value = self._daily_aggregator.opens(
-                        assets, end_dt)
-                except NoDataForSid:
-                    minute_value = np.nan
-            elif field_to_use == 'high':
-                try:
-                    minute_value = self._daily_aggregator.highs(
-                        assets, end_dt)
-                except NoDataForSid:
-                    minute_value = np.nan
-            elif field_to_use == 'low':
-                try:
-                    minute_value = self._daily_aggregator.lows(
-                        assets, end_dt)
-                except NoDataForSid:
-                    minute_value = np.nan
-            elif field_to_use == 'close':
-                try:
-                    minute_value = self._daily_aggregator.closes(
-                        assets, end_dt)
-                except NoDataForSid:
-                    minute_value = np.nan
-            elif field_to_use == 'volume':
-                try:
-                    minute_value = self._daily_aggregator.volumes(
-                        assets, end_dt)
-                except NoDataForSid:
-                    minute_value = 0
-            elif field_to_use == 'sid':
-                minute_value = [
-                    int(self._get_current_contract(asset, end_dt))
-                    for asset in assets]
-
             # append the partial day.
-            daily_data[-1] = minute_value
+            for field, field_data in zip(fields, daily_data):
+                field_data[-1] = self._get_partial_day_value(
+                    assets, field, end_dt,
+                )
 
             return daily_data
 
+    def _get_partial_day_value(self, assets, field_to_use, end_dt):
+        """
+        Internal method that returns the values of ``field_to_use`` for the
+        session of ``end_dt``, aggregated from the minute bars up to
+        ``end_dt``.
+        """
+        if field_to_use == 'open':
+            try:
+                return self._daily_aggregator.opens(assets, end_dt)
+            except NoDataForSid:
+                return np.nan
+        elif field_to_use == 'high':
+            try:
+                return self._daily_aggregator.highs(assets, end_dt)
+            except NoDataForSid:
+                return np.nan
+        elif field_to_use == 'low':
+            try:
+                return self._daily_aggregator.lows(assets, end_dt)
+            except NoDataForSid:
+                return np.nan
+        elif field_to_use == 'close':
+            try:
+                return self._daily_aggregator.closes(assets, end_dt)
+            except NoDataForSid:
+                return np.nan
+        elif field_to_use == 'volume':
+            try:
+                return self._daily_aggregator.volumes(assets, end_dt)
+            except NoDataForSid:
+                return 0
+        elif field_to_use == 'sid':
+            return [
+                int(self._get_current_contract(asset, end_dt))
+                for asset in assets]
+
     def _handle_minute_history_out_of_bounds(self, bar_count):
         cal = self.exchange_calendar
 
@@ -795,10 +922,10 @@ class DataPortal(object):
         )
 
     def _get_history_minute_window(self, assets, end_dt, bar_count,
-                                   field_to_use):
+                                   fields):
         """
-        Internal method that returns a dataframe containing history bars
-        of minute frequency for the given sids.
+        Internal method that returns a dataframe for each of ``fields``
+        containing history bars of minute frequency for the given sids.
         """
         # get all the minutes for this window
         try:
@@ -813,15 +940,18 @@ class DataPortal(object):
 
         asset_minute_data = self._get_minute_window_data(
             assets,
-            field_to_use,
+            fields,
             minutes_for_window,
         )
 
-        return pd.DataFrame(
-            asset_minute_data,
-            index=minutes_for_window,
-            columns=assets
-        )
+        return [
+            pd.DataFrame(
+                field_data,
+                index=minutes_for_window,
+                columns=assets
+            )
+            for field_data in asset_minute_data
+        ]
 
     def get_history_window(self,
                            assets,
@@ -861,99 +991,224 @@ class DataPortal(object):
         -------
         A dataframe containing the requested data.
         """
-        if field not in OHLCVP_FIELDS and field != 'sid':
-            raise ValueError("Invalid field: {0}".format(field))
+        return self._get_history_windows(
+            assets,
+            end_dt,
+            bar_count,
+            frequency,
+            [field],
+            data_frequency,
+            ffill,
+        )[0]
+
+    def get_history_window_multi(self,
+                                 assets,
+                                 end_dt,
+                                 bar_count,
+                                 frequency,
+                                 fields,
+                                 data_frequency,
+                                 ffill=True):
+        """
+        Public API method that returns a dataframe containing the requested
+        history window for several fields.  Data is fully adjusted.
+
+        All of the fields are read from each bar reader at once, and the
+        adjustments are looked up once for the price fields, so this is
+        faster than calling :meth:`get_history_window` for each field.
+
+        Parameters
+        ----------
+        assets : list of zipline.data.Asset objects
+            The assets whose data is desired.
+
+        bar_count: int
+            The number of bars desired.
+
+        frequency: string
+            "1d" or "1m"
+
+        fields: list of string
+            The desired fields of the assets.
+
+        data_frequency: string
+            The frequency of the data to query; i.e. whether the data is
+            'daily' or 'minute' bars.
+
+        ffill: boolean
+            Forward-fill missing values. Only has effect if fields
+            include 'price'.
+
+        Returns
+        -------
+        A dataframe containing the requested data, whose columns are a
+        MultiIndex of (field, asset).
+        """
+        fields = list(fields)
+        frames = self._get_history_windows(
+            assets,
+            end_dt,
+            bar_count,
+            frequency,
+            fields,
+            data_frequency,
+            ffill,
+        )
+        return pd.concat(OrderedDict(zip(fields, frames)), axis=1)
+
+    def _get_history_windows(self,
+                             assets,
+                             end_dt,
+                             bar_count,
+                             frequency,
+                             fields,
+                             data_frequency,
+                             ffill):
+        """
+        Internal method that returns a dataframe containing the requested
+        history window for each of ``fields``.
+        """
+        for field in fields:
+            if field not in OHLCVP_FIELDS and field != 'sid':
+                raise ValueError("Invalid field: {0}".format(field))
 
         if bar_count < 1:
             raise ValueError(
                 "bar_count must be >= 1, but got {}".format(bar_count)
             )
 
+        # price is read from close
+        fields_to_use = list(OrderedDict.fromkeys(
+            "close" if field == "price" else field for field in fields
+        ))
+
         if frequency == "1d":
-            if field == "price":
-                df = self._get_history_daily_window(assets, end_dt, bar_count,
-                                                    "close", data_frequency)
-            else:
-                df = self._get_history_daily_window(assets, end_dt, bar_count,
-                                                    field, data_frequency)
+            dfs = self._get_history_daily_window(assets, end_dt, bar_count,
+                                                 fields_to_use, data_frequency)
         elif frequency == "1m":
-            if field == "price":
-                df = self._get_history_minute_window(assets, end_dt, bar_count,
-                                                     "close")
-            else:
-                df = self._get_history_minute_window(assets, end_dt, bar_count,
-                                                     field)
+            dfs = self._get_history_minute_window(assets, end_dt, bar_count,
+                                                  fields_to_use)
         else:
             raise ValueError("Invalid frequency: {0}".format(frequency))
 
-        # forward-fill price
-        if field == "price":
-            if frequency == "1m":
-                ffill_data_frequency = 'minute'
-            elif frequency == "1d":
-                ffill_data_frequency = 'daily'
-            else:
-                raise Exception(
-                    "Only 1d and 1m are supported for forward-filling.")
-
-            assets_with_leading_nan = np.where(isnull(df.iloc[0]))[0]
+        dfs = dict(zip(fields_to_use, dfs))
+        out = []
+        for field in fields:
+            if field != "price":
+                out.append(dfs[field])
+                continue
+
+            df = dfs["close"]
+            if "close" in fields:
+                # don't forward-fill the close window too
+                df = df.copy()
+            self._ffill_price_window(df, frequency, data_frequency)
+            out.append(df)
+        return out
+
+    def _ffill_price_window(self, df, frequency, data_frequency):
+        """
+        Forward-fill a history window of prices in place, starting from the
+        last traded price before the window for assets that have no price at
+        the start of the window.
+        """
+        field = "price"
+        if frequency == "1m":
+            ffill_data_frequency = 'minute'
+        elif frequency == "1d":
+            ffill_data_frequency = 'daily'
+        else:
+            raise Exception(
+                "Only 1d and 1m are supported for forward-filling.")
+
+        assets_with_leading_nan = np.flatnonzero(isnull(df.iloc[0]))
+
+        history_start, history_end = df.index[[0, -1]]
+        if ffill_data_frequency == 'daily' and data_frequency == 'minute':
+            # When we're looking for a daily value, but we haven't seen any
+            # volume in today's minute bars yet, we need to use the
+            # previous day's ffilled daily price. Using today's daily price
+            # could yield a value from later today.
+            history_start -= self.exchange_calendar.day
+
+        if len(assets_with_leading_nan):
+            assets = list(df.columns[assets_with_leading_nan])
+            last_traded = self.get_last_traded_dts(
+                assets,
+                history_start,
+                ffill_data_frequency,
+            )
+            traded = ~isnull(last_traded)
 
-            history_start, history_end = df.index[[0, -1]]
-            if ffill_data_frequency == 'daily' and data_frequency == 'minute':
-                # When we're looking for a daily value, but we haven't seen any
-                # volume in today's minute bars yet, we need to use the
-                # previous day's ffilled daily price. Using today's daily price
-                # could yield a value from later today.
-                history_start -= self.exchange_calendar.day
+            initial_values = np.full(len(assets), nan)
+            if traded.any():
+                initial_values[traded] = self._get_adjusted_values(
+                    [asset for asset, t in zip(assets, traded) if t],
+                    field,
+                    last_traded[traded],
+                    history_end,
+                    ffill_data_frequency,
+                )
 
-            initial_values = []
-            for asset in df.columns[assets_with_leading_nan]:
-                try:
-                    last_traded = self.get_last_traded_dt(
-                        asset,
-                        history_start,
-                        ffill_data_frequency,
-                    )
-                except NoDataForSid:
-                    initial_values.append(nan)
-                    continue
+            # Set leading values for assets that were missing data.
+            df.iloc[0, assets_with_leading_nan] = initial_values
+        df.ffill(inplace=True)
+
+        # forward-filling will incorrectly produce values after the end of
+        # an asset's lifetime, so write NaNs back over the asset's
+        # auto_close_date.
+        auto_close_dates = pd.DatetimeIndex(
+            [asset.auto_close_date for asset in df.columns],
+        ).tz_localize(history_end.tzinfo)
+        after_auto_close = (
+            df.index.normalize().values[:, np.newaxis] >
+            auto_close_dates.values[np.newaxis, :]
+        )
+        if after_auto_close.any():
+            df.mask(after_auto_close, inplace=True)
+
+    def _get_adjusted_values(self,
+                             assets,
+                             field,
+                             dts,
+                             perspective_dt,
+                             data_frequency):
+        """
+        Internal method that returns the value of ``field`` for each asset at
+        the corresponding dt in ``dts``, with the adjustments known by
+        ``perspective_dt`` applied.
 
-                if isnull(last_traded):
-                    initial_values.append(nan)
-                else:
-                    initial_values.append(
-                        self.get_adjusted_value(
-                            asset,
-                            field,
-                            dt=last_traded,
-                            perspective_dt=history_end,
-                            data_frequency=ffill_data_frequency,
-                        )
-                    )
+        The values of the assets that share a dt are read at once.
+        """
+        values = np.full(len(assets), nan)
+        dts = pd.DatetimeIndex(dts)
+        unique_dts, dt_locs = np.unique(dts.asi8, return_inverse=True)
+        for i in range(len(unique_dts)):
+            locs = np.flatnonzero(dt_locs == i)
+            values[locs] = self.get_spot_value(
+                [assets[loc] for loc in locs],
+                field,
+                dts[locs[0]],
+                data_frequency,
+            )
 
-            # Set leading values for assets that were missing data, then ffill.
-            df.iloc[0, assets_with_leading_nan] = np.array(
-                initial_values,
-                dtype=np.float64
+        is_equity = np.array(
+            [isinstance(asset, Equity) for asset in assets], dtype=bool,
+        )
+        if is_equity.any():
+            values[is_equity] *= self.get_adjustments(
+                [asset for asset, e in zip(assets, is_equity) if e],
+                field,
+                dts[is_equity],
+                perspective_dt,
             )
-            df.ffill(inplace=True)
-
-            # forward-filling will incorrectly produce values after the end of
-            # an asset's lifetime, so write NaNs back over the asset's
-            # auto_close_date.
-            normed_index = df.index.normalize()
-            for asset in df.columns:
-                if asset.auto_close_date and history_end >= asset.auto_close_date.tz_localize(history_end.tzinfo):
-                    # if the window extends past the asset's auto_close_date, set
-                    # all post-auto_close_date values to NaN in that asset's series
-                    df.loc[normed_index > asset.auto_close_date.tz_localize(history_end.tzinfo), asset] = nan
-        return df
-
-    def _get_minute_window_data(self, assets, field, minutes_for_window):
+        return values
+
+    def _get_minute_window_data(self, assets, fields, minutes_for_window):
         """
         Internal method that gets a window of adjusted minute data for an asset
-        and specified date range.  Used to support the history API method for
-        minute bars.
+        and specified date range for each of ``fields``.  Used to support the
+        history API method for minute bars.
 
         Missing bars are filled with NaN.
 
@@ -962,8 +1217,8 @@ class DataPortal(object):
         assets : iterable[Asset]
             The assets whose data is desired.
 
-        field: string
-            The specific field to return.  "open", "high", "close_price", etc.
+        fields: list of string
+            The specific fields to return.  "open", "high", "close_price", etc.
 
         minutes_for_window: pd.DateTimeIndex
             The list of minutes representing the desired window.  Each minute
@@ -971,16 +1226,16 @@ class DataPortal(object):
 
         Returns
         -------
-        A numpy array with requested values.
+        A list with a numpy array of requested values for each field.
         """
-        return self._minute_history_loader.history(assets,
-                                                   minutes_for_window,
-                                                   field,
-                                                   False)
+        return self._minute_history_loader.history_multi(assets,
+                                                         minutes_for_window,
+                                                         fields,
+                                                         False)
 
     def _get_daily_window_data(self,
                                assets,
-                               field,
+                               fields,
                                days_in_window,
                                extra_slot=True):
         """
@@ -999,8 +1254,8 @@ class DataPortal(object):
         bar_count: int
             The number of days of data to return.
 
-        field: string
-            The specific field to return.  "open", "high", "close_price", etc.
+        fields: list of string
+            The specific fields to return.  "open", "high", "close_price", etc.
 
         extra_slot: boolean
             Whether to allocate an extra slot in the returned numpy array.
@@ -1010,68 +1265,41 @@ class DataPortal(object):
 
         Returns
         -------
-        A numpy array with requested values.  Any missing slots filled with
-        nan.
+        A list with a numpy array of requested values for each field.  Any
+        missing slots filled with nan.
 
         """
         bar_count = len(days_in_window)
-        # create an np.array of size bar_count
-        dtype = float64 if field != 'sid' else int64
-        if extra_slot:
-            return_array = np.zeros((bar_count + 1, len(assets)), dtype=dtype)
-        else:
-            return_array = np.zeros((bar_count, len(assets)), dtype=dtype)
-
-        if field not in ("volume", "sid"):
-            # volumes default to 0, so we don't need to put NaNs in the array;
-            # sid (which is a valid field for continuous future bar readers)
-            # won't be empty so it doesn't matter what the prefill is
-            return_array[:] = np.NAN
-
-        if bar_count != 0:
-            data = self._history_loader.history(assets,
-                                                days_in_window,
-                                                field,
-                                                extra_slot)
+        return_arrays = []
+        for field in fields:
+            # create an np.array of size bar_count
+            dtype = float64 if field != 'sid' else int64
             if extra_slot:
-                return_array[:len(return_array) - 1, :] = data
+                return_array = np.zeros(
+                    (bar_count + 1, len(assets)), dtype=dtype,
+                )
             else:
-                return_array[:len(data)] = data
-        return return_array
+                return_array = np.zeros((bar_count, len(assets)), dtype=dtype)
 
-    def _get_adjustment_list(self, asset, adjustments_dict, table_name):
-        """
-        Internal method that returns a list of adjustments for the given sid.
+            if field not in ("volume", "sid"):
+                # volumes default to 0, so we don't need to put NaNs in the
+                # array; sid (which is a valid field for continuous future bar
+                # readers) won't be empty so it doesn't matter what the
+                # prefill is
+                return_array[:] = np.NAN
+            return_arrays.append(return_array)
 
-        Parameters
-        ----------
-        asset : Asset
-            The asset for which to return adjustments.
-
-        adjustments_dict: dict
-            A dictionary of sid -> list that is used as a cache.
-
-        table_name: string
-            The table that contains this data in the adjustments db.
-
-        Returns
-        -------
-        adjustments: list
-            A list of [multiplier, pd.Timestamp], earliest first
-
-        """
-        if self._adjustment_reader is None:
-            return []
-
-        sid = int(asset)
-
-        try:
-            adjustments = adjustments_dict[sid]
-        except KeyError:
-            adjustments = adjustments_dict[sid] = self._adjustment_reader.\
-                get_adjustments_for_sid(table_name, sid)
-
-        return adjustments
+        if bar_count != 0:
+            data = self._history_loader.history_multi(assets,
+                                                      days_in_window,
+                                                      fields,
+                                                      extra_slot)
+            for return_array, field_data in zip(return_arrays, data):
+                if extra_slot:
+                    return_array[:len(return_array) - 1, :] = field_data
+                else:
+                    return_array[:len(field_data)] = field_data
+        return return_arrays
 
     def get_splits(self, assets, dt):
         """
@@ -1093,17 +1321,17 @@ class DataPortal(object):
         if self._adjustment_reader is None or not assets:
             return []
 
-        # convert dt to # of seconds since epoch, because that's what we use
-        # in the adjustments db
-        seconds = int(dt.value / 1e9)
-
-        splits = self._adjustment_reader.conn.execute(
-            "SELECT sid, ratio FROM SPLITS WHERE effective_date = ?",
-            (seconds,)).fetchall()
-
-        splits = [split for split in splits if split[0] in assets]
-        splits = [(self.asset_finder.retrieve_asset(split[0]), split[1])
-                  for split in splits]
+        assets = list(assets)
+        locs, _, ratios = self._adjustment_reader.adjustment_index.lookup(
+            'splits',
+            [int(asset) for asset in assets],
+            dt - pd.Timedelta(1, 's'),
+            dt,
+        )
+        splits = [
+            (self.asset_finder.retrieve_asset(int(assets[loc])), ratio)
+            for loc, ratio in zip(locs, ratios)
+        ]
 
         return splits
 
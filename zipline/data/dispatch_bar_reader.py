@@ -20,6 +20,7 @@ from numpy import (
     int64,
     zeros
 )
+from pandas import DatetimeIndex, NaT
 from six import iteritems, with_metaclass
 
 from zipline.utils.memoize import lazyval
@@ -102,6 +103,21 @@ class AssetDispatchBarReader(with_metaclass(ABCMeta)):
         r = self._readers[type(asset)]
         return r.get_last_traded_dt(asset, dt)
 
+    def get_last_traded_dts(self, assets, dt):
+        sid_groups = {}
+        out_pos = {}
+        for i, asset in enumerate(assets):
+            t = type(asset)
+            sid_groups.setdefault(t, []).append(asset)
+            out_pos.setdefault(t, []).append(i)
+
+        out = [NaT] * len(assets)
+        for t, group in iteritems(sid_groups):
+            last_traded = self._readers[t].get_last_traded_dts(group, dt)
+            for i, dt_ in zip(out_pos[t], last_traded):
+                out[i] = dt_
+        return DatetimeIndex(out)
+
     def load_raw_arrays(self, fields, start_dt, end_dt, sids):
         asset_types = self._asset_types
         sid_groups = {t: [] for t in asset_types}
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import OrderedDict
 from abc import (
     ABCMeta,
     abstractmethod,
@@ -56,15 +57,16 @@ class HistoryCompatibleUSEquityAdjustmentReader(object):
         out = [None] * len(columns)
         for i, column in enumerate(columns):
             adjs = {}
-            for asset in assets:
-                adjs.update(self._get_adjustments_in_range(
-                    asset, dts, column))
+            for asset_adjs in self.load_pricing_adjustments_by_asset(
+                    column, dts, assets):
+                adjs.update(asset_adjs)
             out[i] = adjs
         return out
 
-    def _get_adjustments_in_range(self, asset, dts, field):
+    def load_pricing_adjustments_by_asset(self, field, dts, assets):
         """
-        Get the Float64Multiply objects to pass to an AdjustedArrayWindow.
+        Get the Float64Multiply objects to pass to an AdjustedArrayWindow for
+        each asset.
 
         For the use of AdjustedArrayWindow in the loader, which looks back
         from current simulation time back to a window of data the dictionary is
@@ -77,78 +79,47 @@ class HistoryCompatibleUSEquityAdjustmentReader(object):
           location of the adjustment action, making all days before the event
           adjusted.
 
+        The adjustments of all of the assets are looked up at once in the
+        adjustment reader's in-memory index.
+
         Parameters
         ----------
-        asset : Asset
-            The assets for which to get adjustments.
-        dts : iterable of datetime64-like
-            The dts for which adjustment data is needed.
         field : str
             OHLCV field for which to get the adjustments.
+        dts : iterable of datetime64-like
+            The dts for which adjustment data is needed.
+        assets : iterable of Assets
+            The assets for which to get adjustments.
 
         Returns
         -------
-        out : dict[loc -> Float64Multiply]
-            The adjustments as a dict of loc -> Float64Multiply
+        out : list[dict[loc -> list[Float64Multiply]]]
+            The adjustments of each asset as a dict of loc -> Float64Multiply
         """
-        sid = int(asset)
+        index = self._adjustments_reader.adjustment_index
+        sids = [int(asset) for asset in assets]
         start = normalize_date(dts[0])
         end = normalize_date(dts[-1])
-        adjs = {}
+        dt_values = dts.asi8
+
         if field != 'volume':
-            mergers = self._adjustments_reader.get_adjustments_for_sid(
-                'mergers', sid)
-            for m in mergers:
-                dt = m[0].tz_localize(dts.tzinfo)
-                if start < dt <= end:
-                    end_loc = dts.searchsorted(dt)
-                    adj_loc = end_loc
-                    mult = Float64Multiply(0,
-                                           end_loc - 1,
-                                           0,
-                                           0,
-                                           m[1])
-                    try:
-                        adjs[adj_loc].append(mult)
-                    except KeyError:
-                        adjs[adj_loc] = [mult]
-            divs = self._adjustments_reader.get_adjustments_for_sid(
-                'dividends', sid)
-            for d in divs:
-                dt = d[0].tz_localize(dts.tzinfo)
-                if start < dt <= end:
-                    end_loc = dts.searchsorted(dt)
-                    adj_loc = end_loc
-                    mult = Float64Multiply(0,
-                                           end_loc - 1,
-                                           0,
-                                           0,
-                                           d[1])
-                    try:
-                        adjs[adj_loc].append(mult)
-                    except KeyError:
-                        adjs[adj_loc] = [mult]
-        splits = self._adjustments_reader.get_adjustments_for_sid(
-            'splits', sid)
-        for s in splits:
-            dt = s[0].tz_localize(dts.tzinfo)
-            if start < dt <= end:
-                if field == 'volume':
-                    ratio = 1.0 / s[1]
-                else:
-                    ratio = s[1]
-                end_loc = dts.searchsorted(dt)
-                adj_loc = end_loc
-                mult = Float64Multiply(0,
-                                       end_loc - 1,
-                                       0,
-                                       0,
-                                       ratio)
+            table_names = ('mergers', 'dividends', 'splits')
+        else:
+            table_names = ('splits',)
+
+        out = [{} for _ in sids]
+        for table_name in table_names:
+            locs, dates, ratios = index.lookup(table_name, sids, start, end)
+            if field == 'volume':
+                ratios = 1.0 / ratios
+            end_locs = dt_values.searchsorted(dates)
+            for loc, end_loc, ratio in zip(locs, end_locs, ratios):
+                mult = Float64Multiply(0, end_loc - 1, 0, 0, ratio)
                 try:
-                    adjs[adj_loc].append(mult)
+                    out[loc][end_loc].append(mult)
                 except KeyError:
-                    adjs[adj_loc] = [mult]
-        return adjs
+                    out[loc][end_loc] = [mult]
+        return out
 
 
 class ContinuousFutureAdjustmentReader(object):
@@ -186,6 +157,19 @@ class ContinuousFutureAdjustmentReader(object):
             out[i] = adjs
         return out
 
+    def load_pricing_adjustments_by_asset(self, field, dts, assets):
+        """
+        Returns
+        -------
+        adjustments : list[dict[int -> Adjustment]]
+            A list, where each element corresponds to the `assets`, of
+            mappings from index to adjustment objects to apply at that index.
+        """
+        return [
+            self._get_adjustments_in_range(asset, dts, field)
+            for asset in assets
+        ]
+
     def _make_adjustment(self,
                          adjustment_type,
                          front_close,
@@ -343,7 +327,7 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         pass
 
     @abstractmethod
-    def _array(self, start, end, assets, field):
+    def _arrays(self, dts, assets, fields):
         pass
 
     def _decimal_places_for_asset(self, asset, reference_date):
@@ -361,17 +345,21 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                     return number_of_decimal_places(contract.tick_size)
         return DEFAULT_ASSET_PRICE_DECIMALS
 
-    def _ensure_sliding_windows(self, assets, dts, field,
+    def _ensure_sliding_windows(self, assets, dts, fields,
                                 is_perspective_after):
         """
-        Ensure that there is a Float64Multiply window for each asset that can
-        provide data for the given parameters.
+        Ensure that there is a Float64Multiply window for each asset and field
+        that can provide data for the given parameters.
         If the corresponding window for the (assets, len(dts), field) does not
         exist, then create a new one.
         If a corresponding window does exist for (assets, len(dts), field), but
         can not provide data for the current dts range, then create a new
         one and replace the expired window.
 
+        The data for all of the new windows is read with a single
+        ``load_raw_arrays`` call, and the adjustments are looked up once for
+        the price fields and once for volume.
+
         Parameters
         ----------
         assets : iterable of Assets
@@ -380,40 +368,42 @@ class HistoryLoader(with_metaclass(ABCMeta)):
             The datetimes for which to fetch data.
             Makes an assumption that all dts are present and contiguous,
             in the calendar.
-        field : str
-            The OHLCV field for which to retrieve data.
+        fields : list[str]
+            The OHLCV fields for which to retrieve data.
         is_perspective_after : bool
             see: `PricingHistoryLoader.history`
 
         Returns
         -------
-        out : list of Float64Window with sufficient data so that each asset's
-        window can provide `get` for the index corresponding with the last
-        value in `dts`
+        out : list of (list of Float64Window), one per field, with sufficient
+        data so that each asset's window can provide `get` for the index
+        corresponding with the last value in `dts`
         """
         end = dts[-1]
         size = len(dts)
-        asset_windows = {}
-        needed_assets = []
+        asset_windows = {field: {} for field in fields}
+        needed_assets = OrderedDict()
         cal = self._calendar
 
         assets = self._asset_finder.retrieve_all(assets)
         end_ix = find_in_sorted_index(cal, end)
 
-        for asset in assets:
-            try:
-                window = self._window_blocks[field].get(
-                    (asset, size, is_perspective_after), end)
-            except KeyError:
-                needed_assets.append(asset)
-            else:
-                if end_ix < window.most_recent_ix:
-                    # Window needs reset. Requested end index occurs before the
-                    # end index from the previous history call for this window.
-                    # Grab new window instead of rewinding adjustments.
-                    needed_assets.append(asset)
+        for field in fields:
+            for asset in assets:
+                try:
+                    window = self._window_blocks[field].get(
+                        (asset, size, is_perspective_after), end)
+                except KeyError:
+                    needed_assets.setdefault(field, []).append(asset)
                 else:
-                    asset_windows[asset] = window
+                    if end_ix < window.most_recent_ix:
+                        # Window needs reset. Requested end index occurs before
+                        # the end index from the previous history call for this
+                        # window. Grab new window instead of rewinding
+                        # adjustments.
+                        needed_assets.setdefault(field, []).append(asset)
+                    else:
+                        asset_windows[field][asset] = window
 
         if needed_assets:
             offset = 0
@@ -428,45 +418,80 @@ class HistoryLoader(with_metaclass(ABCMeta)):
             else:
                 adj_dts = prefetch_dts
             prefetch_len = len(prefetch_dts)
-            array = self._array(prefetch_dts, needed_assets, field)
-
-            if field == 'sid':
-                window_type = Int64Window
-            else:
-                window_type = Float64Window
 
+            # Read every field for the assets needed by any of them at once.
+            load_assets = list(OrderedDict.fromkeys(
+                asset
+                for field_assets in needed_assets.values()
+                for asset in field_assets
+            ))
+            asset_locs = {asset: i for i, asset in enumerate(load_assets)}
+            arrays = self._arrays(prefetch_dts, load_assets, list(needed_assets))
+
+            # The adjustments only differ between volume and the other fields.
+            load_adjs = {}
             view_kwargs = {}
-            if field == 'volume':
-                array = array.astype(float64_dtype)
+            for field, array in zip(needed_assets, arrays):
+                if field == 'sid':
+                    window_type = Int64Window
+                else:
+                    window_type = Float64Window
 
-            for i, asset in enumerate(needed_assets):
-                adj_reader = None
+                if field == 'volume':
+                    array = array.astype(float64_dtype)
+
+                is_volume = field == 'volume'
                 try:
-                    adj_reader = self._adjustment_readers[type(asset)]
+                    asset_adjs = load_adjs[is_volume]
                 except KeyError:
-                    adj_reader = None
-                if adj_reader is not None:
-                    adjs = adj_reader.load_pricing_adjustments(
-                        [field], adj_dts, [asset])[0]
-                else:
-                    adjs = {}
-                window = window_type(
-                    array[:, i].reshape(prefetch_len, 1),
-                    view_kwargs,
-                    adjs,
-                    offset,
-                    size,
-                    int(is_perspective_after),
-                    self._decimal_places_for_asset(asset, dts[-1]),
-                )
-                sliding_window = SlidingWindow(window, size, start_ix, offset)
-                asset_windows[asset] = sliding_window
-                self._window_blocks[field].set(
-                    (asset, size, is_perspective_after),
-                    sliding_window,
-                    prefetch_end)
-
-        return [asset_windows[asset] for asset in assets]
+                    asset_adjs = load_adjs[is_volume] = self._load_adjustments(
+                        field, adj_dts, load_assets,
+                    )
+
+                for asset in needed_assets[field]:
+                    i = asset_locs[asset]
+                    window = window_type(
+                        array[:, i].reshape(prefetch_len, 1),
+                        view_kwargs,
+                        asset_adjs[i],
+                        offset,
+                        size,
+                        int(is_perspective_after),
+                        self._decimal_places_for_asset(asset, dts[-1]),
+                    )
+                    sliding_window = SlidingWindow(
+                        window, size, start_ix, offset,
+                    )
+                    asset_windows[field][asset] = sliding_window
+                    self._window_blocks[field].set(
+                        (asset, size, is_perspective_after),
+                        sliding_window,
+                        prefetch_end)
+
+        return [
+            [asset_windows[field][asset] for asset in assets]
+            for field in fields
+        ]
+
+    def _load_adjustments(self, field, dts, assets):
+        """
+        Look up the adjustments of ``field`` for each of ``assets``, for all
+        of the assets of each type at once.
+        """
+        asset_adjs = [{} for _ in assets]
+        for asset_type, adj_reader in self._adjustment_readers.items():
+            locs = [
+                i for i, asset in enumerate(assets)
+                if type(asset) is asset_type
+            ]
+            if not locs:
+                continue
+            adjs = adj_reader.load_pricing_adjustments_by_asset(
+                field, dts, [assets[i] for i in locs],
+            )
+            for i, asset_adj in zip(locs, adjs):
+                asset_adjs[i] = asset_adj
+        return asset_adjs
 
     def history(self, assets, dts, field, is_perspective_after):
         """
@@ -543,16 +568,47 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         -------
         out : np.ndarray with shape(len(days between start, end), len(assets))
         """
-        block = self._ensure_sliding_windows(assets,
-                                             dts,
-                                             field,
-                                             is_perspective_after)
+        return self.history_multi(
+            assets, dts, [field], is_perspective_after,
+        )[0]
+
+    def history_multi(self, assets, dts, fields, is_perspective_after):
+        """
+        Windows of pricing data for several fields, with adjustments applied
+        as in :meth:`history`.
+
+        The data for all of the fields is read in a single pass.
+
+        Parameters
+        ----------
+        assets : iterable of Assets
+            The assets in the window.
+        dts : iterable of datetime64-like
+            The datetimes for which to fetch data.
+        fields : list[str]
+            The OHLCV fields for which to retrieve data.
+        is_perspective_after : bool
+            See :meth:`history`.
+
+        Returns
+        -------
+        out : list[np.ndarray]
+            An array with shape(len(days between start, end), len(assets)) for
+            each field.
+        """
+        blocks = self._ensure_sliding_windows(assets,
+                                              dts,
+                                              fields,
+                                              is_perspective_after)
         end_ix = self._calendar.searchsorted(dts[-1])
 
-        return concatenate(
-            [window.get(end_ix) for window in block],
-            axis=1,
-        )
+        return [
+            concatenate(
+                [window.get(end_ix) for window in block],
+                axis=1,
+            )
+            for block in blocks
+        ]
 
 
 class DailyHistoryLoader(HistoryLoader):
@@ -565,13 +621,13 @@ class DailyHistoryLoader(HistoryLoader):
     def _calendar(self):
         return self._reader.sessions
 
-    def _array(self, dts, assets, field):
+    def _arrays(self, dts, assets, fields):
         return self._reader.load_raw_arrays(
-            [field],
+            fields,
             dts[0],
             dts[-1],
             assets,
-        )[0]
+        )
 
 
 class MinuteHistoryLoader(HistoryLoader):
@@ -592,10 +648,10 @@ class MinuteHistoryLoader(HistoryLoader):
             end = mm.searchsorted(self._reader.last_available_dt, side="right")
         return mm[start:end]
 
-    def _array(self, dts, assets, field):
+    def _arrays(self, dts, assets, fields):
         return self._reader.load_raw_arrays(
-            [field],
+            fields,
             dts[0],
             dts[-1],
             assets,
-        )[0]
+        )
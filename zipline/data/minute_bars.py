@@ -39,6 +39,7 @@ from zipline.data.bar_reader import BarReader, NoDataForSid, NoDataOnDate
 from zipline.data.bcolz_daily_bars import check_uint32_safe
 from zipline.utils.compat import mappingproxy
 from zipline.utils.memoize import lazyval
+from zipline.utils.pool import SequentialPool
 
 US_EQUITIES_MINUTES_PER_DAY = 390
 FUTURES_MINUTES_PER_DAY = 1440
@@ -855,6 +856,16 @@ class BcolzMinuteBarReader(MinuteBarReader):
     rootdir : string
         The root directory containing the metadata and asset bcolz
         directories.
+    sid_cache_sizes : dict, optional
+        A dict mapping each field to the number of open carrays to keep
+        cached for that field. Defaults to DEFAULT_MINUTELY_SID_CACHE_SIZES.
+    read_pool : multiprocessing.pool.ThreadPool, optional
+        The pool used to decompress each sid's window in
+        ``load_raw_arrays``. blosc releases the GIL while decompressing, so
+        a thread pool can read many sids concurrently. The carrays are
+        opened, and the cache of open carrays filled, in the calling thread
+        before the pool is used; the cache itself is not thread-safe.
+        Defaults to a :class:`~zipline.utils.pool.SequentialPool`.
 
     See Also
     --------
@@ -876,9 +887,15 @@ class BcolzMinuteBarReader(MinuteBarReader):
     # can do so by mutating DEFAULT_MINUTELY_SID_CACHE_SIZES.
     _default_proxy = mappingproxy(DEFAULT_MINUTELY_SID_CACHE_SIZES)
 
-    def __init__(self, rootdir, sid_cache_sizes=_default_proxy):
+    def __init__(self,
+                 rootdir,
+                 sid_cache_sizes=_default_proxy,
+                 read_pool=None):
 
         self._rootdir = rootdir
+        self._read_pool = (
+            read_pool if read_pool is not None else SequentialPool()
+        )
 
         metadata = self._get_metadata()
 
@@ -1153,6 +1170,23 @@ class BcolzMinuteBarReader(MinuteBarReader):
             return pd.NaT
         return self._pos_to_minute(minute_pos)
 
+    def get_last_traded_dts(self, assets, dt):
+        positions = np.full(len(assets), -1, dtype=np.int64)
+        for i, asset in enumerate(assets):
+            try:
+                positions[i] = self._find_last_traded_position(asset, dt)
+            except NoDataForSid:
+                pass
+
+        traded = positions != -1
+        positions = positions[traded]
+        minute_epochs = np.full(len(assets), pd.NaT.value, dtype=np.int64)
+        minute_epochs[traded] = NANOS_IN_MINUTE * (
+            self._market_open_values[positions // self._minutes_per_day] +
+            positions % self._minutes_per_day
+        )
+        return pd.DatetimeIndex(minute_epochs, tz='UTC')
+
     def _find_last_traded_position(self, asset, dt):
         volumes = self._open_minute_file('volume', asset)
         start_date_minute = asset.start_date.value / NANOS_IN_MINUTE
@@ -1249,50 +1283,104 @@ class BcolzMinuteBarReader(MinuteBarReader):
         start_idx = self._find_position_of_minute(start_dt)
         end_idx = self._find_position_of_minute(end_dt)
 
-        num_minutes = (end_idx - start_idx + 1)
+        keep = self._positions_to_keep(start_idx, end_idx)
+        if keep is not None:
+            num_minutes = len(keep)
+        else:
+            num_minutes = end_idx - start_idx + 1
+        sids = [int(sid) for sid in sids]
 
         results = []
-
-        indices_to_exclude = self._exclusion_indices_for_range(
-            start_idx, end_idx)
-        if indices_to_exclude is not None:
-            for excl_start, excl_stop in indices_to_exclude:
-                length = excl_stop - excl_start + 1
-                num_minutes -= length
-
-        shape = num_minutes, len(sids)
-
         for field in fields:
-            if field != 'volume':
-                out = np.full(shape, np.nan)
-            else:
-                out = np.zeros(shape, dtype=np.uint32)
-
+            # Open the carrays serially so that only the slicing (and
+            # therefore the decompression) is handed to the read pool; the
+            # LRU of open carrays is not safe to fill from several threads.
+            carrays = []
             for i, sid in enumerate(sids):
                 try:
-                    carray = self._open_minute_file(field, sid)
+                    carrays.append((i, self._open_minute_file(field, sid)))
                 except NoDataForSid:
                     continue
 
+            raw = np.zeros((num_minutes, len(sids)), dtype=np.uint32)
+
+            def read_sid(item, raw=raw):
+                i, carray = item
+                # Slicing the carray decompresses only the chunks which
+                # overlap the window. The carray might be shorter than the
+                # window if we have not written data for all the minutes
+                # requested; the remainder is left as zero, i.e. no trade.
                 values = carray[start_idx:end_idx + 1]
-                if indices_to_exclude is not None:
-                    for excl_start, excl_stop in indices_to_exclude[::-1]:
-                        excl_slice = np.s_[
-                            excl_start - start_idx:excl_stop - start_idx + 1]
-                        values = np.delete(values, excl_slice)
-
-                where = values != 0
-                # first slice down to len(where) because we might not have
-                # written data for all the minutes requested
-                if field != 'volume':
-                    out[:len(where), i][where] = (
-                        values[where] * self._ohlc_ratio_inverse_for_sid(sid))
-                else:
-                    out[:len(where), i][where] = values[where]
-
-            results.append(out)
+                if keep is not None:
+                    values = values[keep[keep < len(values)]]
+                raw[:len(values), i] = values
+
+            self._read_pool.map(read_sid, carrays)
+
+            results.append(self._scale_raw_window(field, raw, sids))
         return results
 
+    def _scale_raw_window(self, field, raw, sids):
+        """
+        Convert a (minutes, sids) window of stored uint32 values into the
+        values returned by ``load_raw_arrays``: prices are scaled by each
+        sid's inverse OHLC ratio with zeros replaced by nan, volumes are
+        returned as is.
+        """
+        if field == 'volume':
+            return raw
+        out = np.multiply(
+            raw,
+            self._ohlc_ratio_inverses_for_sids(sids),
+            dtype=np.float64,
+        )
+        out[raw == 0] = np.nan
+        return out
+
+    def _positions_to_keep(self, start_idx, end_idx):
+        """
+        Compute the window-relative positions which survive early close and
+        market break exclusion.
+
+        An exclusion which begins before ``start_idx`` only removes the
+        positions which fall inside the window.
+
+        Returns
+        -------
+        np.ndarray[int64] or None
+            The positions to keep, or None if no positions in the window are
+            excluded.
+        """
+        indices_to_exclude = self._exclusion_indices_for_range(
+            start_idx, end_idx)
+        if indices_to_exclude is None:
+            return None
+
+        keep = np.ones(end_idx - start_idx + 1, dtype=bool)
+        for excl_start, excl_stop in indices_to_exclude:
+            keep[max(excl_start - start_idx, 0):excl_stop - start_idx + 1] = (
+                False
+            )
+        return np.flatnonzero(keep)
+
+    def _ohlc_ratio_inverses_for_sids(self, sids):
+        """
+        Look up the inverse OHLC ratio for each of the given sids.
+
+        Returns
+        -------
+        float or np.ndarray[float64]
+            The default inverse as a scalar if the data has no per-sid
+            ratios, otherwise an array with an entry per sid. Either form
+            broadcasts across the sid columns of a (minutes, sids) array.
+        """
+        if self._ohlc_inverses_per_sid is None:
+            return self._default_ohlc_inverse
+        return np.array(
+            [self._ohlc_ratio_inverse_for_sid(sid) for sid in sids],
+            dtype=np.float64,
+        )
+
 
 class MinuteBarUpdateReader(with_metaclass(ABCMeta, object)):
     """
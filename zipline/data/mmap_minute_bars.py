@@ -0,0 +1,589 @@
+# Copyright 2026 QuantRocket LLC - All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+from glob import glob
+from textwrap import dedent
+
+import bcolz
+import numpy as np
+import pandas as pd
+
+from zipline.data.bar_reader import NoDataForSid
+from zipline.data.minute_bars import (
+    BcolzMinuteBarMetadata,
+    BcolzMinuteBarReader,
+    OHLC_RATIO,
+    _calc_minute_index,
+    convert_cols,
+)
+
+
+class MmapMinuteOverlappingData(Exception):
+    pass
+
+
+class MmapMinuteWriterColumnMismatch(Exception):
+    pass
+
+
+class MmapMinuteNonMarketMinute(Exception):
+    pass
+
+
+INDEX_FILENAME = 'index.json'
+
+
+def _field_path(rootdir, field):
+    return os.path.join(rootdir, '{0}.uint32'.format(field))
+
+
+def _index_path(rootdir):
+    return os.path.join(rootdir, INDEX_FILENAME)
+
+
+def _read_index(rootdir):
+    with open(_index_path(rootdir)) as fp:
+        index = json.load(fp)
+    index['attrs'] = {int(k): v for k, v in index['attrs'].items()}
+    return index
+
+
+class MmapMinuteBarWriter(object):
+    """
+    Class capable of writing minute OHLCV data to disk as one memory-mapped
+    uint32 array per field.
+
+    Parameters
+    ----------
+    rootdir : string
+        Path to the root directory into which to write the metadata, the
+        sid index and the field arrays.
+    calendar : exchange_calendars.exchange_calendar.ExchangeCalendar
+        The trading calendar on which to base the minute bars.
+    start_session : datetime
+        The first trading session in the data set.
+    end_session : datetime
+        The last trading session in the data set.
+    minutes_per_day : int
+        The number of minutes per each period.
+    default_ohlc_ratio : int, optional
+        The default ratio by which to multiply the pricing data to
+        convert from floats to integers that fit within np.uint32. If
+        ohlc_ratios_per_sid is None or does not contain a mapping for a
+        given sid, this ratio is used. Default is OHLC_RATIO (1000).
+    ohlc_ratios_per_sid : dict, optional
+        A dict mapping each sid in the output to the ratio by which to
+        multiply the pricing data to convert the floats from floats to
+        an integer to fit within the np.uint32.
+
+    Notes
+    -----
+    Each field (open, high, low, close, volume) is stored in a single
+    ``<field>.uint32`` file holding a C-ordered (sid x minute) array. Every
+    row spans the same minute positions as a
+    :class:`~zipline.data.minute_bars.BcolzMinuteBarWriter` ctable, i.e.
+    ``minutes_per_day`` positions for each session starting from the market
+    open, and prices are scaled by the OHLC ratio in the same way.
+
+    A sid's row is appended the first time data is written for it. The
+    files are grown by doubling their number of rows, which leaves the
+    unwritten positions as zeros (no trade) and sparse on file systems which
+    support it, and are kept memory-mapped between writes. They are trimmed
+    to the written rows when the index is written.
+
+    The sidecar ``index.json`` records the sid of each row, the number of
+    positions written for each row, the number of positions in each row and
+    any attributes set with ``set_sid_attrs``. It is written once at the
+    end of ``write``, and after each call to ``write_sid``, ``write_cols``
+    and ``set_sid_attrs``, so ``write`` should be preferred for writing many
+    sids. The metadata is written in the same ``metadata.json`` format as
+    the bcolz minute bars.
+
+    See Also
+    --------
+    zipline.data.mmap_minute_bars.MmapMinuteBarReader
+    """
+    COL_NAMES = ('open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self,
+                 rootdir,
+                 calendar,
+                 start_session,
+                 end_session,
+                 minutes_per_day,
+                 default_ohlc_ratio=OHLC_RATIO,
+                 ohlc_ratios_per_sid=None):
+
+        self._rootdir = rootdir
+        self._start_session = start_session
+        self._end_session = end_session
+        self._calendar = calendar
+        slicer = (
+            calendar.schedule.index.slice_indexer(start_session, end_session))
+        self._session_labels = calendar.schedule[slicer].index
+        self._minutes_per_day = minutes_per_day
+        self._default_ohlc_ratio = default_ohlc_ratio
+        self._ohlc_ratios_per_sid = ohlc_ratios_per_sid
+
+        self._minute_index = _calc_minute_index(
+            calendar.first_minutes[slicer], self._minutes_per_day)
+        self._num_minutes = len(self._minute_index)
+
+        self._sids = []
+        self._lengths = []
+        self._attrs = {}
+        self._rows = {}
+        # the number of rows the field files have room for, and their memory
+        # maps, which are opened on demand
+        self._capacity = 0
+        self._arrays = None
+
+        BcolzMinuteBarMetadata(
+            self._default_ohlc_ratio,
+            self._ohlc_ratios_per_sid,
+            self._calendar,
+            self._start_session,
+            self._end_session,
+            self._minutes_per_day,
+        ).write(self._rootdir)
+
+        for field in self.COL_NAMES:
+            open(_field_path(self._rootdir, field), 'wb').close()
+        self._write_index()
+
+    @property
+    def first_trading_day(self):
+        return self._start_session
+
+    def ohlc_ratio_for_sid(self, sid):
+        if self._ohlc_ratios_per_sid is not None:
+            try:
+                return self._ohlc_ratios_per_sid[sid]
+            except KeyError:
+                pass
+
+        # If no ohlc_ratios_per_sid dict is passed, or if the specified
+        # sid is not in the dict, fallback to the general ohlc_ratio.
+        return self._default_ohlc_ratio
+
+    def _write_index(self):
+        """
+        Flush the field arrays, trim the field files to the written rows and
+        write the index.
+        """
+        self._close_arrays()
+        num_rows = len(self._sids)
+        if self._capacity > num_rows:
+            self._resize_files(num_rows)
+
+        index = {
+            'sids': self._sids,
+            'lengths': self._lengths,
+            'minutes': self._num_minutes,
+            'attrs': self._attrs,
+        }
+        with open(_index_path(self._rootdir), 'w+') as fp:
+            json.dump(index, fp)
+
+    def _row_for_sid(self, sid):
+        """Return the row of ``sid``, appending an empty row if needed."""
+        sid = int(sid)
+        try:
+            return self._rows[sid]
+        except KeyError:
+            pass
+
+        row = len(self._sids)
+        if row == self._capacity:
+            self._close_arrays()
+            self._resize_files(max(2 * self._capacity, 1))
+
+        self._rows[sid] = row
+        self._sids.append(sid)
+        self._lengths.append(0)
+        return row
+
+    def _resize_files(self, num_rows):
+        size = num_rows * self._num_minutes * np.dtype(np.uint32).itemsize
+        for field in self.COL_NAMES:
+            with open(_field_path(self._rootdir, field), 'r+b') as fp:
+                fp.truncate(size)
+        self._capacity = num_rows
+
+    def _field_arrays(self):
+        if self._arrays is None:
+            self._arrays = {
+                field: np.memmap(
+                    _field_path(self._rootdir, field),
+                    dtype=np.uint32,
+                    mode='r+',
+                    shape=(self._capacity, self._num_minutes),
+                )
+                for field in self.COL_NAMES
+            }
+        return self._arrays
+
+    def _close_arrays(self):
+        if self._arrays is not None:
+            for array in self._arrays.values():
+                array.flush()
+            self._arrays = None
+
+    def last_date_in_output_for_sid(self, sid):
+        """
+        Parameters
+        ----------
+        sid : int
+            Asset identifier.
+
+        Returns
+        -------
+        out : pd.Timestamp
+            The midnight of the last date written in to the output for the
+            given sid.
+        """
+        try:
+            length = self._lengths[self._rows[sid]]
+        except KeyError:
+            return pd.NaT
+        num_days = length // self._minutes_per_day
+        if num_days == 0:
+            return pd.NaT
+        return self._session_labels[num_days - 1]
+
+    def set_sid_attrs(self, sid, **kwargs):
+        """Write all the supplied kwargs as attributes of the sid.
+        """
+        self._set_sid_attrs(sid, kwargs)
+        self._write_index()
+
+    def _set_sid_attrs(self, sid, attrs):
+        self._row_for_sid(sid)
+        self._attrs.setdefault(int(sid), {}).update(attrs)
+
+    def write(self, data, invalid_data_behavior='warn'):
+        """Write a stream of minute data.
+
+        Parameters
+        ----------
+        data : iterable[(int, pd.DataFrame)]
+            The data to write. Each element should be a tuple of sid, data
+            where data has the following format:
+              columns : ('open', 'high', 'low', 'close', 'volume')
+                  open : float64
+                  high : float64
+                  low  : float64
+                  close : float64
+                  volume : float64|int64
+              index : DatetimeIndex of market minutes.
+            A given sid may appear more than once in ``data``; however,
+            the dates must be strictly increasing.
+        """
+        write_sid = self._write_sid
+        for e in data:
+            write_sid(*e, invalid_data_behavior=invalid_data_behavior)
+        self._write_index()
+
+    def write_sid(self, sid, df, invalid_data_behavior='warn'):
+        """
+        Write the OHLCV data for the given sid.
+
+        Parameters
+        ----------
+        sid : int
+            The asset identifer for the data being written.
+        df : pd.DataFrame
+            DataFrame of market data with the following characteristics.
+            columns : ('open', 'high', 'low', 'close', 'volume')
+                open : float64
+                high : float64
+                low  : float64
+                close : float64
+                volume : float64|int64
+            index : DatetimeIndex of market minutes.
+        """
+        self._write_sid(sid, df, invalid_data_behavior)
+        self._write_index()
+
+    def _write_sid(self, sid, df, invalid_data_behavior):
+        cols = {
+            'open': df.open.values,
+            'high': df.high.values,
+            'low': df.low.values,
+            'close': df.close.values,
+            'volume': df.volume.values,
+        }
+        dts = df.index.values
+        self._write_cols(sid, dts, cols, invalid_data_behavior)
+
+    def write_cols(self, sid, dts, cols, invalid_data_behavior='warn'):
+        """
+        Write the OHLCV data for the given sid.
+
+        Parameters
+        ----------
+        sid : int
+            The asset identifier for the data being written.
+        dts : datetime64 array
+            The dts corresponding to values in cols.
+        cols : dict of str -> np.array
+            dict of market data with the following characteristics.
+            keys are ('open', 'high', 'low', 'close', 'volume')
+            open : float64
+            high : float64
+            low  : float64
+            close : float64
+            volume : float64|int64
+        """
+        if not all(len(dts) == len(cols[name]) for name in self.COL_NAMES):
+            raise MmapMinuteWriterColumnMismatch(
+                "Length of dts={0} should match cols: {1}".format(
+                    len(dts),
+                    " ".join("{0}={1}".format(name, len(cols[name]))
+                             for name in self.COL_NAMES)))
+        self._write_cols(sid, dts, cols, invalid_data_behavior)
+        self._write_index()
+
+    def _write_cols(self, sid, dts, cols, invalid_data_behavior):
+        """
+        Internal method for `write_cols` and `write`. Doesn't write the
+        index.
+        """
+        if not len(dts):
+            return
+
+        minutes = self._minute_index.values
+        dts = dts.astype('datetime64[ns]')
+        positions = np.searchsorted(minutes, dts)
+
+        # Guard against writing a dt which isn't a market minute into the
+        # slot of the next market minute.
+        is_market_minute = positions < len(minutes)
+        is_market_minute[is_market_minute] = (
+            minutes[positions[is_market_minute]] == dts[is_market_minute]
+        )
+        if not is_market_minute.all():
+            raise MmapMinuteNonMarketMinute(
+                "Data for sid={0} includes dts which are not market minutes "
+                "between {1} and {2}: {3}".format(
+                    sid,
+                    pd.Timestamp(minutes[0]),
+                    pd.Timestamp(minutes[-1]),
+                    list(map(pd.Timestamp, dts[~is_market_minute][:5])),
+                )
+            )
+
+        row = self._row_for_sid(sid)
+        if positions[0] < self._lengths[row]:
+            raise MmapMinuteOverlappingData(dedent("""
+            Data with last_date={0} already includes input start={1} for
+            sid={2}""".strip()).format(
+                self.last_date_in_output_for_sid(sid),
+                pd.Timestamp(dts[0]),
+                sid,
+            ))
+
+        converted = convert_cols(
+            cols,
+            self.ohlc_ratio_for_sid(sid),
+            sid,
+            invalid_data_behavior,
+        )
+        arrays = self._field_arrays()
+        for field, values in zip(self.COL_NAMES, converted):
+            arrays[field][row, positions] = values
+
+        self._lengths[row] = int(positions[-1]) + 1
+
+    def _write_raw_sid(self, sid, raw_cols):
+        """
+        Write already scaled uint32 columns for ``sid`` starting at the
+        first position, as read from a bcolz ctable. Doesn't write the
+        index.
+        """
+        row = self._row_for_sid(sid)
+        length = len(raw_cols['close'])
+        arrays = self._field_arrays()
+        for field in self.COL_NAMES:
+            arrays[field][row, :length] = raw_cols[field]
+        self._lengths[row] = length
+
+
+class MmapMinuteBarReader(BcolzMinuteBarReader):
+    """
+    Reader for data written by MmapMinuteBarWriter.
+
+    Each field is opened once as a read-only memory map, so ``get_value``
+    and ``get_last_traded_dt`` index directly into the mapped row of the
+    sid and ``load_raw_arrays`` reads a window for all sids with a single
+    slice of the (sid x minute) array. The calendar, position and early
+    close handling are shared with
+    :class:`~zipline.data.minute_bars.BcolzMinuteBarReader`.
+
+    Parameters
+    ----------
+    rootdir : string
+        The root directory containing the metadata, the sid index and the
+        field arrays.
+
+    Notes
+    -----
+    The sid index is read when the reader is created, so sids written
+    afterwards are not visible to it.
+
+    See Also
+    --------
+    zipline.data.mmap_minute_bars.MmapMinuteBarWriter
+    """
+    def __init__(self, rootdir):
+        super(MmapMinuteBarReader, self).__init__(rootdir)
+
+        index = _read_index(rootdir)
+        self._sid_rows = {sid: row for row, sid in enumerate(index['sids'])}
+        self._lengths = index['lengths']
+        self._sid_attrs = index['attrs']
+
+        shape = (len(index['sids']), index['minutes'])
+        if shape[0]:
+            self._arrays = {
+                field: np.memmap(
+                    _field_path(rootdir, field),
+                    dtype=np.uint32,
+                    mode='r',
+                    shape=shape,
+                )
+                for field in self.FIELDS
+            }
+        else:
+            # An empty file cannot be memory-mapped.
+            self._arrays = {
+                field: np.zeros(shape, dtype=np.uint32)
+                for field in self.FIELDS
+            }
+
+    def _open_minute_file(self, field, sid):
+        try:
+            row = self._sid_rows[int(sid)]
+        except KeyError:
+            raise NoDataForSid('No minute data for sid {}.'.format(sid))
+
+        # A view of the written positions, so that reads past the end of
+        # the data behave like reads past the end of a carray.
+        return self._arrays[field][row, :self._lengths[row]]
+
+    def get_sid_attr(self, sid, name):
+        return self._sid_attrs.get(int(sid), {}).get(name)
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        """
+        Parameters
+        ----------
+        fields : list of str
+           'open', 'high', 'low', 'close', or 'volume'
+        start_dt: Timestamp
+           Beginning of the window range.
+        end_dt: Timestamp
+           End of the window range.
+        sids : list of int
+           The asset identifiers in the window.
+
+        Returns
+        -------
+        list of np.ndarray
+            A list with an entry per field of ndarrays with shape
+            (minutes in range, sids) with a dtype of float64, containing the
+            values for the respective field over start and end dt range.
+        """
+        start_idx = self._find_position_of_minute(start_dt)
+        end_idx = self._find_position_of_minute(end_dt)
+
+        keep = self._positions_to_keep(start_idx, end_idx)
+        if keep is not None:
+            num_minutes = len(keep)
+        else:
+            num_minutes = end_idx - start_idx + 1
+        sids = [int(sid) for sid in sids]
+
+        columns = []
+        rows = []
+        for i, sid in enumerate(sids):
+            try:
+                rows.append(self._sid_rows[sid])
+            except KeyError:
+                continue
+            columns.append(i)
+
+        results = []
+        for field in fields:
+            raw = np.zeros((num_minutes, len(sids)), dtype=np.uint32)
+            if rows:
+                values = self._arrays[field][rows, start_idx:end_idx + 1]
+                if keep is not None:
+                    values = values[:, keep[keep < values.shape[1]]]
+                raw[:values.shape[1], columns] = values.T
+
+            results.append(self._scale_raw_window(field, raw, sids))
+        return results
+
+
+def convert_bcolz_minute_bars(bcolz_rootdir, mmap_rootdir):
+    """
+    Convert minute bars written by a BcolzMinuteBarWriter into the format
+    written by MmapMinuteBarWriter.
+
+    The stored uint32 values are copied as is, so the converted data keeps
+    the OHLC ratios of the source data.
+
+    Parameters
+    ----------
+    bcolz_rootdir : str
+        The root directory of the bcolz minute bars to convert.
+    mmap_rootdir : str
+        The directory into which to write the converted minute bars.
+
+    Returns
+    -------
+    writer : MmapMinuteBarWriter
+        The writer used for the converted minute bars.
+    """
+    metadata = BcolzMinuteBarMetadata.read(bcolz_rootdir)
+    writer = MmapMinuteBarWriter(
+        mmap_rootdir,
+        metadata.calendar,
+        metadata.start_session,
+        metadata.end_session,
+        metadata.minutes_per_day,
+        metadata.default_ohlc_ratio,
+        metadata.ohlc_ratios_per_sid,
+    )
+
+    glob_path = os.path.join(bcolz_rootdir, "*", "*", "*.bcolz")
+    for sid_path in sorted(glob(glob_path)):
+        sid = int(os.path.basename(sid_path).split('.')[0])
+        try:
+            table = bcolz.open(rootdir=sid_path, mode='r')
+        except IOError:
+            continue
+
+        writer._write_raw_sid(
+            sid,
+            {field: table[field][:] for field in writer.COL_NAMES},
+        )
+        attrs = dict(table.attrs)
+        if attrs:
+            writer._set_sid_attrs(sid, attrs)
+
+    writer._write_index()
+    return writer
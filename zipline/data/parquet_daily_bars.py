@@ -0,0 +1,597 @@
+# Copyright 2026 QuantRocket LLC - All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from collections import OrderedDict
+from glob import glob
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from zipline.data.bar_reader import (
+    NoDataAfterDate,
+    NoDataBeforeDate,
+    NoDataForSid,
+    NoDataOnDate,
+)
+from zipline.data.bcolz_daily_bars import OHLC, winsorise_uint32
+from zipline.data.session_bars import CurrencyAwareSessionBarReader
+from zipline.utils.calendar_utils import get_calendar
+from zipline.utils.memoize import lazyval
+from zipline.utils.string_formatting import bulleted_list
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.fs
+    import pyarrow.parquet as pq
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+
+FILE_FORMATS = ('parquet', 'arrow')
+PRICE_FORMATS = ('uint32', 'float64')
+
+METADATA_FILENAME = '_metadata.json'
+FORMAT_VERSION = 1
+
+# The number of rows in each Parquet row group and Arrow record batch. The
+# rows of a partition are sorted by sid, so each row group only spans a few
+# sids and its statistics let the reader skip the groups of other sids.
+ROW_GROUP_SIZE = 64 * 1024
+
+PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+
+
+def _check_pyarrow(name):
+    if not HAVE_PYARROW:
+        raise ValueError(
+            "{} needs pyarrow:\nMissing:\n{}".format(
+                name, bulleted_list(['pyarrow'])
+            )
+        )
+
+
+def _file_schema(price_format):
+    price_type = pa.uint32() if price_format == 'uint32' else pa.float64()
+    return pa.schema(
+        [('sid', pa.int64()), ('day', pa.timestamp('ns'))] +
+        [(column, price_type) for column in PRICE_COLUMNS] +
+        [('volume', pa.uint32())]
+    )
+
+
+def _partition_path(rootdir, year, file_format):
+    return os.path.join(
+        rootdir,
+        'year={0}'.format(year),
+        'part-0.{0}'.format(file_format),
+    )
+
+
+class ParquetDailyBarWriter(object):
+    """
+    Class capable of writing daily OHLCV data to disk as a Parquet or Arrow
+    dataset partitioned by year, in a format that can be read by
+    ParquetDailyBarReader.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory into which to write the dataset.
+    calendar : exchange_calendars.ExchangeCalendar
+        Calendar to which the data is aligned.
+    start_session : pd.Timestamp
+        The first session of the data set.
+    end_session : pd.Timestamp
+        The last session of the data set.
+    file_format : {'parquet', 'arrow'}, optional
+        'parquet' writes compressed Parquet files. 'arrow' writes uncompressed
+        Arrow IPC files, which the reader memory-maps so that columns are
+        read without copying them. Default is 'parquet'.
+    price_format : {'uint32', 'float64'}, optional
+        'uint32' stores the prices multiplied by 1000 and rounded, as
+        BcolzDailyBarWriter does. 'float64' stores the prices as given.
+        Default is 'uint32'.
+
+    Notes
+    -----
+    The rows of each year are written to ``year=<year>/part-0.<file_format>``
+    and sorted by sid and then by day. The columns are sid, day, open, high,
+    low, close and volume. Volume is always stored as a uint32. As in the
+    bcolz format, each sid has a row for every session from its first to its
+    last, and a price or volume of 0 means that the sid didn't trade.
+
+    The sidecar ``_metadata.json`` records the calendar, the sessions, the
+    formats and the first and last session of each sid.
+
+    See Also
+    --------
+    zipline.data.parquet_daily_bars.ParquetDailyBarReader
+    """
+    def __init__(self,
+                 rootdir,
+                 calendar,
+                 start_session,
+                 end_session,
+                 file_format='parquet',
+                 price_format='uint32'):
+        _check_pyarrow(type(self).__name__)
+        if file_format not in FILE_FORMATS:
+            raise ValueError(
+                'file_format must be one of %r, got %r' % (
+                    FILE_FORMATS, file_format,
+                ),
+            )
+        if price_format not in PRICE_FORMATS:
+            raise ValueError(
+                'price_format must be one of %r, got %r' % (
+                    PRICE_FORMATS, price_format,
+                ),
+            )
+
+        if start_session != end_session:
+            if not calendar.is_session(start_session):
+                raise ValueError(
+                    "Start session %s is invalid!" % start_session
+                )
+            if not calendar.is_session(end_session):
+                raise ValueError(
+                    "End session %s is invalid!" % end_session
+                )
+
+        self._rootdir = rootdir
+        self._calendar = calendar
+        self._start_session = start_session
+        self._end_session = end_session
+        self._file_format = file_format
+        self._price_format = price_format
+
+    @property
+    def progress_bar_message(self):
+        return "Merging daily equity files:"
+
+    def progress_bar_item_show_func(self, value):
+        return value if value is None else str(value[0])
+
+    def write(self,
+              data,
+              assets=None,
+              invalid_data_behavior='ignore'):
+        """
+        Write the data, replacing any data already in the dataset.
+
+        Parameters
+        ----------
+        data : iterable[tuple[int, pandas.DataFrame]]
+            The data chunks to write. Each chunk should be a tuple of sid
+            and a DataFrame of open, high, low, close and volume, indexed by
+            session.
+        assets : set[int], optional
+            The assets that should be in ``data``. If this is provided
+            we will check ``data`` against the assets.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}, optional
+            What to do when data is encountered that is outside the range of
+            a uint32.
+        """
+        sessions = self._calendar.sessions_in_range(
+            self._start_session, self._end_session,
+        )
+        if assets is not None:
+            assets = set(assets)
+
+        chunks = {name: [] for name in _file_schema(self._price_format).names}
+        lifetimes = {}
+        for sid, df in data:
+            if assets is not None and sid not in assets:
+                raise ValueError('unknown asset id %r' % sid)
+            if not len(df):
+                continue
+
+            asset_sessions = sessions[
+                sessions.slice_indexer(df.index[0], df.index[-1])
+            ]
+            if not df.index.equals(asset_sessions):
+                raise ValueError(
+                    "Got {0} rows for daily bars of sid {1} with first "
+                    "day={2}, last day={3}, expected {4} rows, one for each "
+                    "session.".format(
+                        len(df),
+                        sid,
+                        df.index[0].date(),
+                        df.index[-1].date(),
+                        len(asset_sessions),
+                    )
+                )
+
+            for name, values in self._to_columns(
+                    df, invalid_data_behavior).items():
+                chunks[name].append(values)
+            chunks['sid'].append(np.full(len(df), sid, dtype=np.int64))
+            chunks['day'].append(df.index.values.astype('datetime64[ns]'))
+            lifetimes[str(sid)] = [df.index[0].value, df.index[-1].value]
+
+        os.makedirs(self._rootdir, exist_ok=True)
+        for path in glob(os.path.join(self._rootdir, 'year=*')):
+            shutil.rmtree(path)
+
+        if lifetimes:
+            columns = {
+                name: np.concatenate(values)
+                for name, values in chunks.items()
+            }
+            years = pd.DatetimeIndex(columns['day']).year.values
+            order = np.lexsort((columns['day'], columns['sid'], years))
+            years = years[order]
+            columns = {name: values[order] for name, values in columns.items()}
+
+            bounds = np.flatnonzero(np.diff(years)) + 1
+            starts = np.r_[0, bounds]
+            stops = np.r_[bounds, len(years)]
+            for start, stop in zip(starts, stops):
+                self._write_partition(
+                    years[start],
+                    {
+                        name: values[start:stop]
+                        for name, values in columns.items()
+                    },
+                )
+
+        first_days = [first for first, _ in lifetimes.values()]
+        metadata = {
+            'version': FORMAT_VERSION,
+            'calendar_name': self._calendar.name,
+            'start_session_ns': self._start_session.value,
+            'end_session_ns': self._end_session.value,
+            'first_trading_day_ns': min(first_days) if first_days else None,
+            'file_format': self._file_format,
+            'price_format': self._price_format,
+            'lifetimes': lifetimes,
+        }
+        with open(os.path.join(self._rootdir, METADATA_FILENAME), 'w') as fp:
+            json.dump(metadata, fp)
+
+    def _to_columns(self, df, invalid_data_behavior):
+        if self._price_format == 'uint32':
+            winsorise_uint32(df, invalid_data_behavior, 'volume', *OHLC)
+            columns = {
+                column: (df[column].values * 1000).round().astype(np.uint32)
+                for column in PRICE_COLUMNS
+            }
+        else:
+            winsorise_uint32(df, invalid_data_behavior, 'volume')
+            columns = {
+                column: df[column].values.astype(np.float64)
+                for column in PRICE_COLUMNS
+            }
+        columns['volume'] = df['volume'].values.astype(np.uint32)
+        return columns
+
+    def _write_partition(self, year, columns):
+        path = _partition_path(self._rootdir, year, self._file_format)
+        os.makedirs(os.path.dirname(path))
+        table = pa.table(columns, schema=_file_schema(self._price_format))
+        if self._file_format == 'parquet':
+            pq.write_table(table, path, row_group_size=ROW_GROUP_SIZE)
+        else:
+            # Leave the file uncompressed so that it can be memory-mapped.
+            with pa.ipc.new_file(path, table.schema) as writer:
+                writer.write_table(table, max_chunksize=ROW_GROUP_SIZE)
+
+
+class _YearPartition(object):
+    """
+    The rows of one year of a daily bar dataset, for looking up single
+    values. The sid and day columns are read up front; the other columns are
+    read the first time they are needed.
+    """
+    def __init__(self, path, file_format):
+        self._path = path
+        if file_format == 'arrow':
+            self._table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        else:
+            self._table = None
+        self._columns = {}
+
+        sids = self.column('sid')
+        self.sids, self.starts, counts = np.unique(
+            sids, return_index=True, return_counts=True,
+        )
+        self.stops = self.starts + counts
+        self.days = self.column('day').view(np.int64)
+
+    def column(self, name):
+        try:
+            return self._columns[name]
+        except KeyError:
+            pass
+        if self._table is not None:
+            values = self._table.column(name).to_numpy()
+        else:
+            values = pq.read_table(
+                self._path, columns=[name], memory_map=True,
+            ).column(name).to_numpy()
+        self._columns[name] = values
+        return values
+
+    def rows(self, sid):
+        """
+        Return the first and one past the last row of ``sid``.
+        """
+        ix = self.sids.searchsorted(sid)
+        if ix == len(self.sids) or self.sids[ix] != sid:
+            return 0, 0
+        return self.starts[ix], self.stops[ix]
+
+
+class ParquetDailyBarReader(CurrencyAwareSessionBarReader):
+    """
+    Reader for daily OHLCV data written by ParquetDailyBarWriter.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory of the dataset.
+    spot_cache_years : int, optional
+        The number of years of data kept in memory for the single value
+        reads of ``get_value`` and ``get_last_traded_dt``. Default 2.
+
+    Notes
+    -----
+    ``load_raw_arrays`` only reads the requested columns, and filters the
+    rows on their year partition, sid and day while scanning the dataset, so
+    Parquet row groups whose sid or day statistics fall outside the request
+    are skipped. Arrow files are memory-mapped, so reading their columns
+    doesn't copy them.
+
+    ``get_value`` and ``get_last_traded_dt`` read the sid and day columns of
+    a year, and each field they are asked for, once, and find rows with a
+    binary search.
+
+    See Also
+    --------
+    zipline.data.parquet_daily_bars.ParquetDailyBarWriter
+    """
+    def __init__(self, rootdir, spot_cache_years=2):
+        _check_pyarrow(type(self).__name__)
+        self._rootdir = os.path.abspath(rootdir)
+        self._spot_cache_years = spot_cache_years
+        self._partitions = OrderedDict()
+
+    @lazyval
+    def _metadata(self):
+        with open(os.path.join(self._rootdir, METADATA_FILENAME)) as fp:
+            return json.load(fp)
+
+    @lazyval
+    def _lifetimes(self):
+        """
+        Map from sid to the first and last session with data for the sid,
+        in epoch ns.
+        """
+        return {
+            int(sid): tuple(lifetime)
+            for sid, lifetime in self._metadata['lifetimes'].items()
+        }
+
+    @lazyval
+    def _dataset(self):
+        file_format = self._metadata['file_format']
+        return ds.dataset(
+            self._rootdir,
+            schema=_file_schema(self._metadata['price_format']).append(
+                pa.field('year', pa.int32()),
+            ),
+            format='parquet' if file_format == 'parquet' else 'ipc',
+            partitioning=ds.partitioning(
+                pa.schema([('year', pa.int32())]),
+                flavor='hive',
+            ),
+            filesystem=pyarrow.fs.LocalFileSystem(use_mmap=True),
+        )
+
+    @lazyval
+    def calendar(self):
+        return get_calendar(self._metadata['calendar_name'])
+
+    @property
+    def exchange_calendar(self):
+        return self.calendar
+
+    @lazyval
+    def sessions(self):
+        return self.calendar.sessions_in_range(
+            pd.Timestamp(self._metadata['start_session_ns']),
+            pd.Timestamp(self._metadata['end_session_ns']),
+        )
+
+    @lazyval
+    def sessions_unbounded(self):
+        """
+        Returns sessions from the start date of the bundle data to the end
+        date of the calendar (which is later than the bundle end date).
+        """
+        return self.calendar.sessions_in_range(
+            pd.Timestamp(self._metadata['start_session_ns']),
+            self.calendar.last_session,
+        )
+
+    @lazyval
+    def first_trading_day(self):
+        first_trading_day_ns = self._metadata['first_trading_day_ns']
+        if first_trading_day_ns is None:
+            return pd.NaT
+        return pd.Timestamp(first_trading_day_ns)
+
+    @property
+    def last_available_dt(self):
+        return self.sessions[-1]
+
+    def _session_loc(self, date):
+        try:
+            return self.sessions.get_loc(date)
+        except KeyError:
+            raise NoDataOnDate(date)
+
+    def load_raw_arrays(self, columns, start_date, end_date, assets):
+        start_idx = self._session_loc(start_date)
+        end_idx = self._session_loc(end_date)
+        dates = self.sessions[start_idx:end_idx + 1]
+        sids, sid_locs = np.unique(
+            np.asarray(assets, dtype=np.int64), return_inverse=True,
+        )
+        columns = list(columns)
+
+        day_type = pa.timestamp('ns')
+        table = self._dataset.to_table(
+            columns=['sid', 'day'] + list(OrderedDict.fromkeys(columns)),
+            filter=(
+                ds.field('year').isin(
+                    list(range(dates[0].year, dates[-1].year + 1))
+                ) &
+                ds.field('sid').isin(pa.array(sids)) &
+                (ds.field('day') >= pa.scalar(dates[0].value, day_type)) &
+                (ds.field('day') <= pa.scalar(dates[-1].value, day_type))
+            ),
+        )
+        row_ix = dates.values.searchsorted(table.column('day').to_numpy())
+        col_ix = sids.searchsorted(table.column('sid').to_numpy())
+
+        shape = (len(dates), len(sids))
+        results = []
+        for column in columns:
+            values = table.column(column).to_numpy()
+            if column == 'volume':
+                out = np.zeros(shape, dtype=np.uint32)
+            else:
+                out = np.full(shape, np.nan)
+                values = self._to_prices(values)
+            out[row_ix, col_ix] = values
+            results.append(out[:, sid_locs])
+        return results
+
+    def _to_prices(self, values):
+        """
+        Convert stored prices to floats, with nan where there was no trade.
+        """
+        if self._metadata['price_format'] == 'uint32':
+            prices = values * 0.001
+        else:
+            prices = values.astype(np.float64)
+        prices[values == 0] = np.nan
+        return prices
+
+    def _partition(self, year):
+        try:
+            partition = self._partitions[year]
+        except KeyError:
+            partition = self._partitions[year] = _YearPartition(
+                _partition_path(
+                    self._rootdir, year, self._metadata['file_format'],
+                ),
+                self._metadata['file_format'],
+            )
+            while len(self._partitions) > self._spot_cache_years:
+                self._partitions.popitem(last=False)
+        else:
+            self._partitions.move_to_end(year)
+        return partition
+
+    def get_value(self, sid, dt, field):
+        """
+        Parameters
+        ----------
+        sid : int
+            The asset identifier.
+        dt : datetime64-like
+            Midnight of the day for which data is requested.
+        field : string
+            The price field. e.g. ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        float
+            The spot price for field of the given sid on the given day, or
+            nan if the sid didn't trade that day. Volume is returned as an
+            integer.
+
+        Raises
+        ------
+        NoDataForSid
+            If the dataset has no data for the sid.
+        NoDataOnDate
+            If the day is not a session, or is before (NoDataBeforeDate) or
+            after (NoDataAfterDate) the date range of the sid.
+        """
+        sid = int(sid)
+        try:
+            first, last = self._lifetimes[sid]
+        except KeyError:
+            raise NoDataForSid("No daily data for sid={0}".format(sid))
+        if dt not in self.sessions_unbounded:
+            raise NoDataOnDate("day={0} is outside of calendar={1}".format(
+                dt, self.sessions))
+        if dt.value < first:
+            raise NoDataBeforeDate(
+                "No data on or before day={0} for sid={1}".format(dt, sid))
+        if dt.value > last:
+            raise NoDataAfterDate(
+                "No data on or after day={0} for sid={1}".format(dt, sid))
+
+        partition = self._partition(dt.year)
+        start, stop = partition.rows(sid)
+        ix = start + partition.days[start:stop].searchsorted(dt.value)
+        value = partition.column(field)[ix]
+        if field == 'volume':
+            return value
+        if value == 0 or np.isnan(value):
+            return np.nan
+        if self._metadata['price_format'] == 'uint32':
+            return value * 0.001
+        return value
+
+    def get_last_traded_dt(self, asset, day):
+        sid = int(asset)
+        try:
+            first, last = self._lifetimes[sid]
+        except KeyError:
+            return pd.NaT
+        if day not in self.sessions_unbounded:
+            return pd.NaT
+
+        end = min(day.value, last)
+        if end < first:
+            return pd.NaT
+        for year in range(pd.Timestamp(end).year,
+                          pd.Timestamp(first).year - 1,
+                          -1):
+            partition = self._partition(year)
+            start, stop = partition.rows(sid)
+            stop = start + partition.days[start:stop].searchsorted(
+                end, side='right',
+            )
+            traded = np.flatnonzero(partition.column('volume')[start:stop])
+            if len(traded):
+                return pd.Timestamp(partition.days[start + traded[-1]])
+        return pd.NaT
+
+    def currency_codes(self, sids):
+        # Like BcolzDailyBarReader, this reader only knows about USD prices.
+        lifetimes = self._lifetimes
+        return np.array(
+            ['USD' if int(sid) in lifetimes else None for sid in sids],
+            dtype=object,
+        )
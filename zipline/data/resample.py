@@ -100,6 +100,101 @@ def minute_to_session(column, close_locs, data, out):
     return out
 
 
+class _SessionAggregation(object):
+    """
+    The running aggregation of a field over a session, for every asset
+    visited so far in the session.
+
+    The state of each asset is kept in arrays aligned with ``assets``:
+    whether the asset is alive for the session, the last dt aggregated (as an
+    int) and the aggregated value up to and including that dt.
+    """
+
+    def __init__(self, field, session, market_open, one_min):
+        self.field = field
+        self.session = session
+        self.market_open = market_open
+        self.assets = pd.Index([], dtype=object)
+        self.alive = np.array([], dtype=bool)
+        self.last_dt = np.array([], dtype=np.int64)
+        if field == 'volume':
+            self.values = np.array([], dtype=np.int64)
+        else:
+            self.values = np.array([], dtype=np.float64)
+        self._one_min = one_min
+
+    @property
+    def missing_value(self):
+        return 0 if self.field == 'volume' else np.nan
+
+    def locs(self, assets):
+        """
+        The positions of ``assets`` in the state arrays, adding assets which
+        have not been visited in the session yet.
+        """
+        locs = self.assets.get_indexer(assets)
+        is_new = locs == -1
+        if is_new.any():
+            new_assets = list(OrderedDict.fromkeys(
+                asset for asset, new in zip(assets, is_new) if new
+            ))
+            self.assets = self.assets.append(
+                pd.Index(new_assets, dtype=object)
+            )
+            self.alive = np.append(self.alive, [
+                asset.is_alive_for_session(self.session)
+                for asset in new_assets
+            ])
+            # Nothing has been aggregated yet, so the first read starts at the
+            # market open.
+            self.last_dt = np.append(
+                self.last_dt,
+                np.full(
+                    len(new_assets),
+                    self.market_open.value - self._one_min,
+                    dtype=np.int64,
+                ),
+            )
+            self.values = np.append(
+                self.values,
+                np.full(len(new_assets), self.missing_value,
+                        dtype=self.values.dtype),
+            )
+            locs = self.assets.get_indexer(assets)
+        return locs
+
+    def update(self, locs, window, dt_value):
+        """
+        Fold the minutes in ``window`` into the values at ``locs``.
+
+        ``window`` has a row per minute up to dt and a column per loc, with
+        the minutes that were already aggregated for an asset set to nan.
+        """
+        field = self.field
+        values = self.values[locs]
+        if field == 'volume':
+            values += np.nansum(window, axis=0).astype(np.int64)
+        elif field == 'high':
+            values = np.fmax(values, np.fmax.reduce(window, axis=0))
+        elif field == 'low':
+            values = np.fmin(values, np.fmin.reduce(window, axis=0))
+        else:
+            has_data = ~np.isnan(window)
+            has_any = has_data.any(axis=0)
+            if field == 'open':
+                rows = has_data.argmax(axis=0)
+                has_any &= np.isnan(values)
+            else:
+                rows = len(window) - 1 - has_data[::-1].argmax(axis=0)
+            values = np.where(
+                has_any,
+                window[rows, np.arange(len(locs))],
+                values,
+            )
+        self.values[locs] = values
+        self.last_dt[locs] = dt_value
+
+
 class DailyHistoryAggregator(object):
     """
     Converts minute pricing data into a daily summary, to be used for the
@@ -119,23 +214,17 @@ class DailyHistoryAggregator(object):
         self._minute_reader = minute_reader
         self._exchange_calendar = exchange_calendar
 
-        # The caches are structured as (date, market_open, entries), where
-        # entries is a dict of asset -> (last_visited_dt, value)
+        # The caches hold a _SessionAggregation per field, with the running
+        # value of every asset visited during the session of the last
+        # requested dt.
         #
-        # Whenever an aggregation method determines the current value,
-        # the entry for the respective asset should be overwritten with a new
-        # entry for the current dt.value (int) and aggregation value.
+        # Each request reads the minutes after the last dt aggregated for the
+        # requested assets, up to the requested dt, with a single minute bar
+        # read for all of the assets, and folds them into the running values.
         #
-        # When the requested dt's date is different from date the cache is
-        # flushed, so that the cache entries do not grow unbounded.
-        #
-        # Example cache:
-        # cache = (date(2016, 3, 17),
-        #          pd.Timestamp('2016-03-17 13:31', tz='UTC'),
-        #          {
-        #              1: (1458221460000000000, np.nan),
-        #              2: (1458221460000000000, 42.0),
-        #         })
+        # When the requested dt's session is different from the cached
+        # session the cache is flushed, so that the cache entries do not grow
+        # unbounded.
         self._caches = {
             'open': None,
             'high': None,
@@ -148,20 +237,60 @@ class DailyHistoryAggregator(object):
         # creating new Timestamps.
         self._one_min = pd.Timedelta('1 min').value
 
-    def _prelude(self, dt, field):
+    def _aggregate(self, field, assets, dt):
         session = self._exchange_calendar.minute_to_session(dt)
+        state = self._caches[field]
+        if state is None or state.session != session:
+            state = self._caches[field] = _SessionAggregation(
+                field,
+                session,
+                self._market_opens.loc[session],
+                self._one_min,
+            )
+
         dt_value = dt.value
-        cache = self._caches[field]
-        if cache is None or cache[0] != session:
-            market_open = self._market_opens.loc[session]
-            cache = self._caches[field] = (session, market_open, {})
-
-        _, market_open, entries = cache
-        if dt != market_open:
-            prev_dt = dt_value - self._one_min
-        else:
-            prev_dt = None
-        return market_open, prev_dt, dt_value, entries
+        locs = state.locs(assets)
+        stale = np.unique(
+            locs[state.alive[locs] & (state.last_dt[locs] < dt_value)]
+        )
+        if field == 'open' and len(stale):
+            # Once an asset has a non-nan open, it is fixed for the session.
+            has_open = ~np.isnan(state.values[stale])
+            state.last_dt[stale[has_open]] = dt_value
+            stale = stale[~has_open]
+
+        if len(stale):
+            state.update(stale, self._load_window(state, stale, dt), dt_value)
+
+        out = state.values[locs]
+        out[~state.alive[locs]] = state.missing_value
+        return out
+
+    def _load_window(self, state, locs, dt):
+        """
+        Read the minutes after the last aggregated dt of the assets at
+        ``locs`` up to ``dt``, in one read for all of the assets.
+        """
+        starts = state.last_dt[locs] + self._one_min
+        start = starts.min()
+        window = self._minute_reader.load_raw_arrays(
+            [state.field],
+            pd.Timestamp(start, tz='UTC'),
+            dt,
+            list(state.assets[locs]),
+        )[0].astype(np.float64)
+
+        if (starts != start).any():
+            # Blank out the minutes which were already aggregated for the
+            # assets that were visited more recently.
+            minutes = self._exchange_calendar.minutes_in_range(
+                pd.Timestamp(start, tz='UTC'), dt,
+            ).asi8
+            first_rows = (
+                len(window) - len(minutes) + minutes.searchsorted(starts)
+            )
+            window[np.arange(len(window))[:, None] < first_rows] = np.nan
+        return window
 
     def opens(self, assets, dt):
         """
@@ -176,64 +305,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'open')
-
-        opens = []
-        session_label = self._exchange_calendar.minute_to_session(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                opens.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'open')
-                entries[asset] = (dt_value, val)
-                opens.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, first_open = entries[asset]
-                    if last_visited_dt == dt_value:
-                        opens.append(first_open)
-                        continue
-                    elif not pd.isnull(first_open):
-                        opens.append(first_open)
-                        entries[asset] = (dt_value, first_open)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['open'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0]
-                        nonnan = window[~pd.isnull(window)]
-                        if len(nonnan):
-                            val = nonnan[0]
-                        else:
-                            val = np.nan
-                        entries[asset] = (dt_value, val)
-                        opens.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['open'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0]
-                    nonnan = window[~pd.isnull(window)]
-                    if len(nonnan):
-                        val = nonnan[0]
-                    else:
-                        val = np.nan
-                    entries[asset] = (dt_value, val)
-                    opens.append(val)
-                    continue
-        return np.array(opens)
+        return self._aggregate('open', assets, dt)
 
     def highs(self, assets, dt):
         """
@@ -245,70 +317,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'high')
-
-        highs = []
-        session_label = self._exchange_calendar.minute_to_session(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                highs.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'high')
-                entries[asset] = (dt_value, val)
-                highs.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_max = entries[asset]
-                    if last_visited_dt == dt_value:
-                        highs.append(last_max)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        curr_val = self._minute_reader.get_value(
-                            asset, dt, 'high')
-                        if pd.isnull(curr_val):
-                            val = last_max
-                        elif pd.isnull(last_max):
-                            val = curr_val
-                        else:
-                            val = max(last_max, curr_val)
-                        entries[asset] = (dt_value, val)
-                        highs.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['high'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0].T
-                        if np.isnan(window).all():
-                            val = np.nan
-                        else:
-                            val = np.nanmax(np.append(window, last_max))
-                        entries[asset] = (dt_value, val)
-                        highs.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['high'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0].T
-                    if np.isnan(window).all():
-                        val = np.nan
-                    else:
-                        val = np.nanmax(window)
-                    entries[asset] = (dt_value, val)
-                    highs.append(val)
-                    continue
-        return np.array(highs)
+        return self._aggregate('high', assets, dt)
 
     def lows(self, assets, dt):
         """
@@ -320,68 +329,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'low')
-
-        lows = []
-        session_label = self._exchange_calendar.minute_to_session(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                lows.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'low')
-                entries[asset] = (dt_value, val)
-                lows.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_min = entries[asset]
-                    if last_visited_dt == dt_value:
-                        lows.append(last_min)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        curr_val = self._minute_reader.get_value(
-                            asset, dt, 'low')
-                        if pd.isnull(last_min) and pd.isnull(curr_val):
-                            val = np.nan
-                        else:
-                            val = np.nanmin([last_min, curr_val])
-                        entries[asset] = (dt_value, val)
-                        lows.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['low'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0].T
-                        if np.isnan(window).all():
-                            val = np.nan
-                        else:
-                            val = np.nanmin(np.append(window, last_min))
-                        entries[asset] = (dt_value, val)
-                        lows.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['low'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0].T
-                    if np.isnan(window).all():
-                        val = np.nan
-                    else:
-                        val = np.nanmin(window)
-                    entries[asset] = (dt_value, val)
-                    lows.append(val)
-                    continue
-        return np.array(lows)
+        return self._aggregate('low', assets, dt)
 
     def closes(self, assets, dt):
         """
@@ -395,69 +343,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'close')
-
-        closes = []
-        session_label = self._exchange_calendar.minute_to_session(dt)
-
-        def _get_filled_close(asset):
-            """
-            Returns the most recent non-nan close for the asset in this
-            session. If there has been no data in this session on or before the
-            `dt`, returns `nan`
-            """
-            window = self._minute_reader.load_raw_arrays(
-                ['close'],
-                market_open,
-                dt,
-                [asset],
-            )[0]
-            try:
-                return window[~np.isnan(window)][-1]
-            except IndexError:
-                return np.NaN
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                closes.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'close')
-                entries[asset] = (dt_value, val)
-                closes.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_close = entries[asset]
-                    if last_visited_dt == dt_value:
-                        closes.append(last_close)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'close')
-                        if pd.isnull(val):
-                            val = last_close
-                        entries[asset] = (dt_value, val)
-                        closes.append(val)
-                        continue
-                    else:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'close')
-                        if pd.isnull(val):
-                            val = _get_filled_close(asset)
-                        entries[asset] = (dt_value, val)
-                        closes.append(val)
-                        continue
-                except KeyError:
-                    val = self._minute_reader.get_value(
-                        asset, dt, 'close')
-                    if pd.isnull(val):
-                        val = _get_filled_close(asset)
-                    entries[asset] = (dt_value, val)
-                    closes.append(val)
-                    continue
-        return np.array(closes)
+        return self._aggregate('close', assets, dt)
 
     def volumes(self, assets, dt):
         """
@@ -469,59 +355,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=int64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'volume')
-
-        volumes = []
-        session_label = self._exchange_calendar.minute_to_session(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                volumes.append(0)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'volume')
-                entries[asset] = (dt_value, val)
-                volumes.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_total = entries[asset]
-                    if last_visited_dt == dt_value:
-                        volumes.append(last_total)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'volume')
-                        val += last_total
-                        entries[asset] = (dt_value, val)
-                        volumes.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['volume'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0]
-                        val = np.nansum(window) + last_total
-                        entries[asset] = (dt_value, val)
-                        volumes.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['volume'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0]
-                    val = np.nansum(window)
-                    entries[asset] = (dt_value, val)
-                    volumes.append(val)
-                    continue
-        return np.array(volumes)
+        return self._aggregate('volume', assets, dt)
 
 
 class MinuteResampleSessionBarReader(SessionBarReader):
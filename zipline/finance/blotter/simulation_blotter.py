@@ -356,11 +356,21 @@ class SimulationBlotter(Blotter):
         commissions = []
 
         if self.open_orders:
+            batch_fills = self._simulate_batches(bar_data)
+
             for asset, asset_orders in iteritems(self.open_orders):
-                slippage = self.slippage_models[type(asset)]
+                try:
+                    fills = batch_fills[asset]
+                except KeyError:
+                    slippage = self.slippage_models[type(asset)]
+                    fills = slippage.simulate(
+                        bar_data,
+                        asset,
+                        asset_orders,
+                        self.sim_params.data_frequency,
+                    )
 
-                for order, txn in \
-                        slippage.simulate(bar_data, asset, asset_orders, self.sim_params.data_frequency):
+                for order, txn in fills:
 
                     if txn is not None:
 
@@ -386,6 +396,38 @@ class SimulationBlotter(Blotter):
 
         return transactions, commissions, closed_orders
 
+    def _simulate_batches(self, bar_data):
+        """
+        Simulate the open orders of all of the assets whose slippage model
+        supports batches, with one batch per slippage model.
+
+        Returns
+        -------
+        fills : dict[Asset, list[(Order, Transaction)]]
+            The orders and transactions for each of those assets. The orders
+            of other assets are simulated one asset at a time.
+        """
+        orders_by_model = {}
+        for asset, asset_orders in iteritems(self.open_orders):
+            slippage = self.slippage_models[type(asset)]
+            if not slippage.supports_batch:
+                continue
+            try:
+                orders_by_model[id(slippage)][1].append((asset, asset_orders))
+            except KeyError:
+                orders_by_model[id(slippage)] = (
+                    slippage, [(asset, asset_orders)],
+                )
+
+        fills = {}
+        for slippage, orders_by_asset in orders_by_model.values():
+            fills.update(slippage.simulate_batch(
+                bar_data,
+                orders_by_asset,
+                self.sim_params.data_frequency,
+            ))
+        return fills
+
     def prune_orders(self, closed_orders):
         """
         Removes all given orders from the blotter's open_orders list.
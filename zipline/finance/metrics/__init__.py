@@ -36,24 +36,32 @@ from .metric import (
     ReturnsStatistic,
     SimpleLedgerField,
     StartOfPeriodLedgerField,
+    StreamingAlphaBeta,
+    StreamingReturnsStatistic,
     Transactions,
     _ConstantCumulativeRiskMetric,
     _ClassicRiskMetrics,
 )
+from .recorder import DailyPerfRecorder
 from .tracker import MetricsTracker
 
 
-__all__ = ['MetricsTracker', 'unregister', 'metrics_sets', 'load']
+__all__ = [
+    'DailyPerfRecorder',
+    'MetricsTracker',
+    'unregister',
+    'metrics_sets',
+    'load',
+]
 
 
 register('none', set)
 
 
-@register('default')
-def default_metrics():
+def _make_default_metrics(returns_statistic, alpha_beta):
     return {
         Returns(),
-        ReturnsStatistic(empyrical.annual_volatility, 'algo_volatility'),
+        returns_statistic(empyrical.annual_volatility, 'algo_volatility'),
         BenchmarkReturnsAndVolatility(),
         PNL(),
         CashFlow(),
@@ -94,11 +102,11 @@ def default_metrics():
         DailyLedgerField('today_commissions', 'commissions'),
         DailyLedgerField('today_fees', 'fees'),
 
-        AlphaBeta(),
-        ReturnsStatistic(empyrical.sharpe_ratio, 'sharpe'),
-        ReturnsStatistic(empyrical.sortino_ratio, 'sortino'),
+        alpha_beta(),
+        returns_statistic(empyrical.sharpe_ratio, 'sharpe'),
+        returns_statistic(empyrical.sortino_ratio, 'sortino'),
 
-        ReturnsStatistic(empyrical.max_drawdown),
+        returns_statistic(empyrical.max_drawdown),
         MaxLeverage(),
 
         # Please kill these!
@@ -109,6 +117,20 @@ def default_metrics():
     }
 
 
+@register('default')
+def default_metrics():
+    return _make_default_metrics(ReturnsStatistic, AlphaBeta)
+
+
+@register('streaming')
+def streaming_metrics():
+    """The default metrics, with the cumulative risk metrics updated with
+    each session's returns rather than recomputed from all of the returns so
+    far.
+    """
+    return _make_default_metrics(StreamingReturnsStatistic, StreamingAlphaBeta)
+
+
 @register('classic')
 @deprecated(
     'The original risk packet has been deprecated and will be removed in a '
@@ -13,7 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import warnings
+from copy import copy
 import datetime
+import math
 from functools import partial
 import operator as op
 
@@ -472,6 +474,254 @@ class AlphaBeta(object):
     end_of_session = end_of_bar
 
 
+# The number of sessions in a year, used to annualize the streaming risk
+# metrics like empyrical's default daily period does.
+ANNUALIZATION_FACTOR = 252
+
+
+class _ReturnsAccumulator(object):
+    """The running statistics of the daily returns needed by the streaming
+    risk metrics, updated one session at a time.
+
+    Notes
+    -----
+    The mean and variance are updated with Welford's algorithm, and the
+    cumulative returns are a running product like ``np.cumprod``, so that the
+    statistics match empyrical's up to floating point rounding. Like
+    empyrical, nan returns count as sessions but are otherwise ignored.
+    """
+    def __init__(self):
+        # the number of sessions, and of sessions with returns that aren't nan
+        self.sessions = 0
+        self.count = 0
+        self.mean = 0.0
+        # the sum of squared differences from the mean
+        self.m2 = 0.0
+        # the sum of squared negative returns
+        self.downside_m2 = 0.0
+        # cumulative returns and their running peak, starting at 100 like
+        # ``ep.max_drawdown``
+        self.cumulative = 100.0
+        self.peak = 100.0
+        self.max_drawdown = 0.0
+
+    def update(self, value):
+        self.sessions += 1
+        if math.isnan(value):
+            return self
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < 0:
+            self.downside_m2 += value * value
+
+        self.cumulative *= 1 + value
+        self.peak = max(self.peak, self.cumulative)
+        self.max_drawdown = min(
+            self.max_drawdown,
+            (self.cumulative - self.peak) / self.peak,
+        )
+        return self
+
+
+# The statistics return nan rather than inf when dividing by zero, which is
+# the same to the metrics since neither is reported.
+def _annual_volatility(acc):
+    if acc.sessions < 2 or acc.count < 2:
+        return math.nan
+    return math.sqrt(acc.m2 / (acc.count - 1) * ANNUALIZATION_FACTOR)
+
+
+def _sharpe_ratio(acc):
+    if acc.sessions < 2 or acc.count < 2:
+        return math.nan
+    try:
+        return (
+            acc.mean /
+            math.sqrt(acc.m2 / (acc.count - 1)) *
+            math.sqrt(ANNUALIZATION_FACTOR)
+        )
+    except ZeroDivisionError:
+        return math.nan
+
+
+def _sortino_ratio(acc):
+    if acc.sessions < 2 or acc.count < 1:
+        return math.nan
+    try:
+        return (
+            acc.mean * ANNUALIZATION_FACTOR /
+            math.sqrt(acc.downside_m2 / acc.count * ANNUALIZATION_FACTOR)
+        )
+    except ZeroDivisionError:
+        return math.nan
+
+
+def _max_drawdown(acc):
+    if acc.sessions < 1:
+        return math.nan
+    return acc.max_drawdown
+
+
+class StreamingReturnsStatistic(object):
+    """Like :class:`~zipline.finance.metrics.metric.ReturnsStatistic`, but
+    updates the statistic with each session's returns rather than recomputing
+    it from all of the returns so far, which makes each bar O(1) rather than
+    O(sessions).
+
+    Parameters
+    ----------
+    function : callable
+        The empyrical function to compute, one of ``ep.annual_volatility``,
+        ``ep.sharpe_ratio``, ``ep.sortino_ratio`` or ``ep.max_drawdown``.
+    field_name : str, optional
+        The name of the field. If not provided, it will be
+        ``function.__name__``.
+    """
+    _statistics = {
+        ep.annual_volatility: _annual_volatility,
+        ep.sharpe_ratio: _sharpe_ratio,
+        ep.sortino_ratio: _sortino_ratio,
+        ep.max_drawdown: _max_drawdown,
+    }
+
+    def __init__(self, function, field_name=None):
+        try:
+            self._statistic = self._statistics[function]
+        except KeyError:
+            raise ValueError(
+                'no streaming statistic for %r, options are: %r' % (
+                    function,
+                    sorted(f.__name__ for f in self._statistics),
+                ),
+            )
+
+        if field_name is None:
+            field_name = function.__name__
+
+        self._field_name = field_name
+
+    def start_of_simulation(self, *args):
+        self._returns = _ReturnsAccumulator()
+
+    def end_of_bar(self,
+                   packet,
+                   ledger,
+                   dt,
+                   session_ix,
+                   data_portal):
+        returns = self._returns
+        daily_returns = ledger.daily_returns_array
+
+        # add the returns of the sessions that have closed since the last bar,
+        # then the (partial) returns of the current session
+        while returns.sessions < session_ix:
+            returns.update(float(daily_returns[returns.sessions]))
+        res = self._statistic(
+            copy(returns).update(float(daily_returns[session_ix])),
+        )
+
+        if not math.isfinite(res):
+            res = None
+        packet['cumulative_risk_metrics'][self._field_name] = res
+
+    end_of_session = end_of_bar
+
+
+class _AlphaBetaAccumulator(object):
+    """The running means, variance and covariance of the daily returns of the
+    algorithm and the benchmark, skipping the sessions where either returns
+    are nan like ``ep.alpha_beta_aligned``.
+    """
+    def __init__(self):
+        # the number of sessions, including those with nan returns
+        self.sessions = 0
+        self.count = 0
+        self.mean = 0.0
+        self.benchmark_mean = 0.0
+        # the sums of squared benchmark differences from the mean, and of the
+        # products of the differences from the means
+        self.benchmark_m2 = 0.0
+        self.comoment = 0.0
+
+    def update(self, value, benchmark_value):
+        self.sessions += 1
+        if math.isnan(value) or math.isnan(benchmark_value):
+            return self
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        benchmark_delta = benchmark_value - self.benchmark_mean
+        self.benchmark_mean += benchmark_delta / self.count
+        self.benchmark_m2 += benchmark_delta * (
+            benchmark_value - self.benchmark_mean
+        )
+        self.comoment += delta * (benchmark_value - self.benchmark_mean)
+        return self
+
+    def alpha_beta(self):
+        if self.sessions < 2 or self.count == 0:
+            return math.nan, math.nan
+
+        benchmark_variance = self.benchmark_m2 / self.count
+        if benchmark_variance < 1.0e-30:
+            return math.nan, math.nan
+
+        beta = self.comoment / self.count / benchmark_variance
+        try:
+            alpha = (
+                (self.mean - beta * self.benchmark_mean + 1) **
+                ANNUALIZATION_FACTOR - 1
+            )
+        except OverflowError:
+            alpha = math.inf
+        return alpha, beta
+
+
+class StreamingAlphaBeta(AlphaBeta):
+    """Like :class:`~zipline.finance.metrics.metric.AlphaBeta`, but updates
+    alpha and beta with each session's returns rather than recomputing them
+    from all of the returns so far.
+    """
+    def start_of_simulation(self, *args):
+        super(StreamingAlphaBeta, self).start_of_simulation(*args)
+        self._returns = _AlphaBetaAccumulator()
+
+    def end_of_bar(self,
+                   packet,
+                   ledger,
+                   dt,
+                   session_ix,
+                   data_portal):
+        risk = packet['cumulative_risk_metrics']
+        returns = self._returns
+        daily_returns = ledger.daily_returns_array
+        benchmark_returns = self._daily_returns_array
+
+        while returns.sessions < session_ix:
+            returns.update(
+                float(daily_returns[returns.sessions]),
+                float(benchmark_returns[returns.sessions]),
+            )
+        alpha, beta = copy(returns).update(
+            float(daily_returns[session_ix]),
+            float(benchmark_returns[session_ix]),
+        ).alpha_beta()
+
+        if math.isnan(alpha):
+            alpha = None
+        if math.isnan(beta):
+            beta = None
+
+        risk['alpha'] = alpha
+        risk['beta'] = beta
+
+    end_of_session = end_of_bar
+
+
 class MaxLeverage(object):
     """Tracks the maximum account leverage.
     """
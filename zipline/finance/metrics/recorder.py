@@ -0,0 +1,179 @@
+# Copyright 2026 QuantRocket LLC - All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+
+# The types of the values that are held in a float64 array rather than an
+# object array. Anything else, including bools, is held as an object.
+_NUMBER_TYPES = frozenset({float, int, np.float64, np.int64})
+
+# Ints above this lose precision as float64s.
+_MAX_EXACT_INT = 2 ** 53
+
+
+class _RecordedColumn(object):
+    """One column of the daily perf packets.
+
+    The values are held in a float64 array while they are all numbers or
+    None, and in an object array once any other value is recorded.
+
+    Parameters
+    ----------
+    capacity : int
+        The number of rows to allocate.
+    """
+    def __init__(self, capacity):
+        self.values = np.full(capacity, np.nan)
+        self.is_object = False
+        self.all_ints = True
+        self.has_numbers = False
+        # the rows whose value is None, which is nan in the float64 array
+        self.none_rows = []
+
+    def grow(self, capacity):
+        values = np.full(
+            capacity,
+            np.nan,
+            dtype=object if self.is_object else 'float64',
+        )
+        values[:len(self.values)] = self.values
+        self.values = values
+
+    def set(self, row, value):
+        if self.is_object:
+            self.values[row] = value
+        elif value is None:
+            self.none_rows.append(row)
+            self.values[row] = np.nan
+        elif type(value) in _NUMBER_TYPES and not (
+                isinstance(value, (int, np.int64)) and
+                abs(value) > _MAX_EXACT_INT):
+            self.values[row] = value
+            self.has_numbers = True
+            if not isinstance(value, (int, np.int64)):
+                self.all_ints = False
+        else:
+            self._to_object()
+            self.values[row] = value
+
+    def _to_object(self):
+        values = self.values.astype(object)
+        if self.all_ints:
+            filled = ~np.isnan(self.values)
+            values[filled] = self.values[filled].astype('int64').astype(object)
+        values[self.none_rows] = None
+        self.values = values
+        self.is_object = True
+
+    def finish(self, num_rows):
+        """Return the values of the first ``num_rows`` rows, with the dtype
+        that a DataFrame built from the packets would have.
+        """
+        if not self.is_object and not self.has_numbers:
+            # a column of only None and missing values is an object column
+            self._to_object()
+
+        values = self.values[:num_rows]
+        if self.is_object:
+            return pd.Series(values, dtype=object).infer_objects().array
+        if self.all_ints and not np.isnan(values).any():
+            return values.astype('int64')
+        return values
+
+
+class DailyPerfRecorder(object):
+    """Collects the daily perf packets of a simulation into columns, and
+    builds the daily stats DataFrame returned by ``TradingAlgorithm.run``
+    from them.
+
+    Each field of the packets is a column, held in a preallocated float64
+    array while its values are numbers, or in an object array for fields such
+    as orders, transactions and positions. The minute packets of minute
+    emission aren't kept.
+
+    Parameters
+    ----------
+    num_sessions : int, optional
+        The number of sessions in the simulation, used to allocate the
+        columns. The columns grow if more sessions are recorded.
+    """
+    def __init__(self, num_sessions=0):
+        self._capacity = max(num_sessions, 1)
+        self._num_rows = 0
+        self._columns = {}
+        self._index = []
+
+        # the last packet which isn't a daily packet, which is the risk
+        # report at the end of the simulation
+        self.risk_report = None
+
+    def __len__(self):
+        return self._num_rows
+
+    def record(self, perf):
+        """Record a perf packet.
+
+        Parameters
+        ----------
+        perf : dict
+            A packet yielded by ``TradingAlgorithm.get_generator``.
+        """
+        if 'daily_perf' not in perf:
+            self.risk_report = perf
+            return
+
+        row = self._num_rows
+        if row == self._capacity:
+            self._capacity *= 2
+            for column in self._columns.values():
+                column.grow(self._capacity)
+
+        daily_perf = perf['daily_perf']
+        # The recorded variables and the cumulative risk metrics are columns
+        # like the fields of the daily perf, taking precedence over them.
+        for fields in (
+                daily_perf,
+                daily_perf.get('recorded_vars', {}),
+                perf['cumulative_risk_metrics']):
+            for name, value in fields.items():
+                if fields is daily_perf and name == 'recorded_vars':
+                    continue
+                try:
+                    column = self._columns[name]
+                except KeyError:
+                    column = self._columns[name] = _RecordedColumn(
+                        self._capacity,
+                    )
+                column.set(row, value)
+
+        self._index.append(daily_perf['period_close'])
+        self._num_rows += 1
+
+    def to_frame(self):
+        """Build the daily stats DataFrame.
+
+        Returns
+        -------
+        daily_stats : pd.DataFrame
+            The fields of the daily packets, and the recorded variables and
+            cumulative risk metrics, indexed by the period close.
+        """
+        num_rows = self._num_rows
+        return pd.DataFrame(
+            {
+                name: column.finish(num_rows)
+                for name, column in self._columns.items()
+            },
+            index=pd.DatetimeIndex(self._index),
+        )
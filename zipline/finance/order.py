@@ -139,15 +139,18 @@ class Order(object):
         obj = zp.Order(initial_values=pydict)
         return obj
 
-    def check_triggers(self, data, data_frequency):
+    def check_triggers(self, data, data_frequency, price=None):
         """
         Update internal state based on price triggers and the
         trade event's price.
+
+        ``price`` is the current open price for on-open orders, or the
+        current close price otherwise. It's looked up if not given.
         """
-        if self.tif == "OPG":
-            price = data.current(self.asset, "open")
-        else:
-            price = data.current(self.asset, "close")
+        if price is None:
+            price = data.current(
+                self.asset, "open" if self.tif == "OPG" else "close",
+            )
         dt = data.current_dt
 
         stop_reached, limit_reached, sl_stop_reached = \
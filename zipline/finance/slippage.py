@@ -119,6 +119,31 @@ def fill_price_worse_than_limit_price(fill_price, order):
     return False
 
 
+def fill_prices_worse_than_limit_prices(fill_prices, directions, limits):
+    """
+    Vectorized version of :func:`fill_price_worse_than_limit_price`.
+
+    Parameters
+    ----------
+    fill_prices : np.ndarray[float64]
+        The prices to check.
+    directions : np.ndarray[float64]
+        The directions of the orders, 1 for a buy and -1 for a sell.
+    limits : np.ndarray[float64]
+        The limit prices of the orders, or nan for orders without one.
+
+    Returns
+    -------
+    worse : np.ndarray[bool]
+    """
+    # a limit price of 0 is ignored like None
+    has_limit = (limits != 0) & ~np.isnan(limits)
+    return has_limit & (
+        ((directions > 0) & (fill_prices > limits)) |
+        ((directions < 0) & (fill_prices < limits))
+    )
+
+
 class SlippageModel(with_metaclass(FinancialModelMeta)):
     """
     Abstract base class for slippage models.
@@ -171,6 +196,11 @@ class SlippageModel(with_metaclass(FinancialModelMeta)):
     # Asset types that are compatible with the given model.
     allowed_asset_types = (Equity, Future)
 
+    # The process_order that _process_orders computes for arrays of orders, if
+    # any. Models that override process_order or simulate are simulated one
+    # asset at a time.
+    _batch_process_order = None
+
     def __init__(self):
         self._volume_for_bar = 0
 
@@ -278,6 +308,191 @@ class SlippageModel(with_metaclass(FinancialModelMeta)):
 
             yield order, txn
 
+    @property
+    def supports_batch(self):
+        """
+        bool: Whether :meth:`simulate_batch` computes the fills for the orders
+        of all of the assets at once, rather than calling :meth:`simulate` for
+        each asset.
+        """
+        cls = type(self)
+        return (
+            cls._batch_process_order is not None and
+            cls.process_order is cls._batch_process_order and
+            cls.simulate is SlippageModel.simulate
+        )
+
+    def simulate_batch(self, data, orders_by_asset, data_frequency):
+        """
+        Simulate the open orders of several assets in the current bar.
+
+        The results are the same as calling :meth:`simulate` for each asset.
+        If the model :attr:`supports_batch`, the current volume and prices of
+        all of the assets are looked up at once, and the fills are computed
+        as arrays, one order per asset at a time.
+
+        Parameters
+        ----------
+        data : zipline.api.BarData
+            The data for the given bar.
+        orders_by_asset : list[(zipline.assets.Asset, list[Order])]
+            The assets and their open orders.
+        data_frequency : str
+            The data frequency of the simulation.
+
+        Returns
+        -------
+        fills : dict[zipline.assets.Asset, list[(Order, Transaction)]]
+            The orders simulated for each asset, and their transaction or None,
+            as yielded by :meth:`simulate`.
+        """
+        if not self.supports_batch:
+            return {
+                asset: list(self.simulate(data, asset, orders, data_frequency))
+                for asset, orders in orders_by_asset
+            }
+
+        assets = [asset for asset, _ in orders_by_asset]
+        fields = ['volume', 'close']
+        use_open = any(
+            order.tif == 'OPG'
+            for _, orders in orders_by_asset
+            for order in orders
+        )
+        if use_open:
+            fields.append('open')
+        current = data.current(assets, fields)
+        volumes = current['volume'].values.astype('float64')
+        closes = current['close'].values.astype('float64')
+        opens = current['open'].values.astype('float64') if use_open else None
+
+        fills = {}
+        # the index of each asset which has orders left to simulate, with an
+        # iterator of its orders
+        pending = []
+        for i, (asset, orders) in enumerate(orders_by_asset):
+            if np.isnan(volumes[i]) and not np.isnan(closes[i]):
+                # leave bad data to the per-asset path
+                fills[asset] = list(
+                    self.simulate(data, asset, orders, data_frequency)
+                )
+                continue
+
+            fills[asset] = []
+            # same as simulate, there's nothing to fill without volume, and
+            # the close price is only checked to guard against bad data
+            if volumes[i] == 0 or np.isnan(closes[i]):
+                continue
+            pending.append((i, iter(orders)))
+
+        dt = data.current_dt
+        volume_for_bar = np.zeros(len(assets))
+        while pending:
+            # the next triggered order of each asset with orders left
+            batch = []
+            for i, orders in pending:
+                asset = assets[i]
+                for order in orders:
+                    if order.open_amount == 0:
+                        fills[asset].append((order, None))
+                        continue
+
+                    if order.tif == 'OPG':
+                        price = opens[i]
+                    else:
+                        price = closes[i]
+                    order.check_triggers(data, data_frequency, price=price)
+                    if not order.triggered:
+                        fills[asset].append((order, None))
+                        continue
+
+                    batch.append((i, orders, order, price))
+                    break
+
+            if not batch:
+                break
+
+            locs = np.array([i for i, _, _, _ in batch])
+            batch_orders = [order for _, _, order, _ in batch]
+            limits = np.array([
+                np.nan if order.limit is None else order.limit
+                for order in batch_orders
+            ], dtype='float64')
+            prices, amounts, liquidity_exceeded = self._process_orders(
+                prices=np.array([price for _, _, _, price in batch]),
+                volumes=volumes[locs],
+                volume_for_bar=volume_for_bar[locs],
+                amounts=np.array(
+                    [order.amount for order in batch_orders],
+                    dtype='float64',
+                ),
+                open_amounts=np.array(
+                    [order.open_amount for order in batch_orders],
+                    dtype='float64',
+                ),
+                directions=np.array(
+                    [order.direction for order in batch_orders],
+                ),
+                limits=limits,
+            )
+
+            pending = []
+            for j, (i, orders, order, _) in enumerate(batch):
+                if liquidity_exceeded[j]:
+                    # no more orders are filled for the asset in this bar
+                    continue
+
+                txn = None
+                if amounts[j]:
+                    txn = create_transaction(
+                        order, dt, float(prices[j]), amounts[j],
+                    )
+                    volume_for_bar[i] += abs(txn.amount)
+
+                fills[assets[i]].append((order, txn))
+                pending.append((i, orders))
+
+        return fills
+
+    def _process_orders(self,
+                        prices,
+                        volumes,
+                        volume_for_bar,
+                        amounts,
+                        open_amounts,
+                        directions,
+                        limits):
+        """
+        Compute the fills for one order of each of several assets, like
+        :meth:`process_order`.
+
+        Parameters
+        ----------
+        prices : np.ndarray[float64]
+            The current open price of on-open orders, and close price of other
+            orders.
+        volumes : np.ndarray[float64]
+            The current volume of the asset of each order.
+        volume_for_bar : np.ndarray[float64]
+            The volume already filled for the asset of each order in the
+            current bar.
+        amounts, open_amounts, directions : np.ndarray[float64]
+            The amount, open amount and direction of each order.
+        limits : np.ndarray[float64]
+            The limit price of each order, or nan.
+
+        Returns
+        -------
+        fill_prices : np.ndarray[float64]
+            The price of the fill for each order.
+        fill_amounts : np.ndarray[float64]
+            The signed amount of the fill for each order, or 0 for no fill.
+        liquidity_exceeded : np.ndarray[bool]
+            Whether no more orders should be processed for the asset of each
+            order in the current bar, as if LiquidityExceeded was raised.
+        """
+        raise NotImplementedError('_process_orders')
+
     def asdict(self):
         return self.__dict__
 
@@ -422,6 +637,46 @@ class VolumeShareSlippage(SlippageModel):
             math.copysign(cur_volume, order.direction)
         )
 
+    _batch_process_order = process_order
+
+    def _process_orders(self,
+                        prices,
+                        volumes,
+                        volume_for_bar,
+                        amounts,
+                        open_amounts,
+                        directions,
+                        limits):
+        max_volume = self.volume_limit * volumes
+
+        remaining_volume = max_volume - volume_for_bar
+        liquidity_exceeded = remaining_volume < 1
+
+        cur_volume = np.trunc(
+            np.minimum(remaining_volume, np.abs(open_amounts))
+        )
+        cur_volume[cur_volume < 1] = 0
+
+        total_volume = volume_for_bar + cur_volume
+        volume_share = np.minimum(total_volume / volumes, self.volume_limit)
+
+        simulated_impact = volume_share ** 2 \
+            * np.copysign(self.price_impact, directions) \
+            * prices
+        impacted_prices = prices + simulated_impact
+
+        cur_volume[
+            fill_prices_worse_than_limit_prices(
+                impacted_prices, directions, limits,
+            )
+        ] = 0
+
+        return (
+            impacted_prices,
+            np.copysign(cur_volume, directions),
+            liquidity_exceeded,
+        )
+
 
 class FixedSlippage(SlippageModel):
     """
@@ -470,6 +725,22 @@ class FixedSlippage(SlippageModel):
             order.amount
         )
 
+    _batch_process_order = process_order
+
+    def _process_orders(self,
+                        prices,
+                        volumes,
+                        volume_for_bar,
+                        amounts,
+                        open_amounts,
+                        directions,
+                        limits):
+        return (
+            prices + (self.spread / 2.0 * directions),
+            amounts,
+            np.zeros(len(prices), dtype=bool),
+        )
+
 
 class MarketImpactBase(SlippageModel):
     """
@@ -479,10 +750,36 @@ class MarketImpactBase(SlippageModel):
 
     NO_DATA_VOLATILITY_SLIPPAGE_IMPACT = 10.0 / 10000
 
+    # The number of days of history used to calculate the mean volume and
+    # close price volatility.
+    WINDOW_LENGTH = 20
+
     def __init__(self):
         super(MarketImpactBase, self).__init__()
         self._window_data_cache = ExpiringCache()
 
+    @property
+    def supports_batch(self):
+        # The window data of all of the assets is loaded at once, and the
+        # orders are simulated one asset at a time.
+        cls = type(self)
+        return (
+            cls.process_order is MarketImpactBase.process_order and
+            cls.simulate is SlippageModel.simulate
+        )
+
+    def simulate_batch(self, data, orders_by_asset, data_frequency):
+        if self.supports_batch:
+            self._load_window_data(
+                data,
+                [asset for asset, _ in orders_by_asset],
+                self.WINDOW_LENGTH,
+            )
+        return {
+            asset: list(self.simulate(data, asset, orders, data_frequency))
+            for asset, orders in orders_by_asset
+        }
+
     @abstractmethod
     def get_txn_volume(self, data, order):
         """
@@ -530,7 +827,9 @@ class MarketImpactBase(SlippageModel):
             return None, None
 
         minute_data = data.current(order.asset, ['volume', 'high', 'low'])
-        mean_volume, volatility = self._get_window_data(data, order.asset, 20)
+        mean_volume, volatility = self._get_window_data(
+            data, order.asset, self.WINDOW_LENGTH,
+        )
 
         # Price to use is the average of the minute bar's open and close.
         price = np.mean([minute_data['high'], minute_data['low']])
@@ -604,28 +903,89 @@ class MarketImpactBase(SlippageModel):
                 # values as if there was no data.
                 return 0, np.NaN
 
-            # Exclude the first value of the percent change array because it is
-            # always just NaN.
-            with warnings.catch_warnings():
-                # Suppress pandas >=2.1 FutureWarning:
-                #    The default fill_method='pad' in DataFrame.pct_change is deprecated
-                #    and will be removed in a future version. Call ffill before calling
-                #    pct_change to retain current behavior and silence this warning.
-                # The suggested fix doesn't help because prices has leading NaNs, which
-                # aren't filled by ffill(). Can likely remove in pandas 3.x.
-                warnings.simplefilter("ignore", category=FutureWarning)
-                close_volatility = close_history[:-1].ffill().pct_change()[1:].std(
-                    skipna=False,
-                )
-
+            mean_volume, volatility = self._window_stats(
+                volume_history, close_history,
+            )
             values = {
-                'volume': volume_history[:-1].mean(),
-                'close': close_volatility * SQRT_252,
+                'volume': mean_volume,
+                'close': volatility,
             }
             self._window_data_cache.set(asset, values, data.current_session)
 
         return values['volume'], values['close']
 
+    def _load_window_data(self, data, assets, window_length):
+        """
+        Internal utility method to compute the trailing mean volume and
+        volatility of close prices for all of the given assets which aren't
+        cached for the current session, with one history call, and cache them
+        for :meth:`_get_window_data`.
+
+        Parameters
+        ----------
+        data : The BarData from which to fetch the daily windows.
+        assets : The Assets whose data we are fetching.
+        window_length : Number of days of history used to calculate the mean
+            volume and close price volatility.
+        """
+        session = data.current_session
+        missing = []
+        for asset in assets:
+            try:
+                self._window_data_cache.get(asset, session)
+            except KeyError:
+                missing.append(asset)
+
+        if not missing:
+            return
+
+        try:
+            # Add a day because we want 'window_length' complete days,
+            # excluding the current day.
+            history = data.history(
+                missing, ['volume', 'close'], window_length + 1, '1d',
+            )
+        except HistoryWindowStartsBeforeData:
+            # Leave the assets to _get_window_data, which returns values as if
+            # there was no data.
+            return
+
+        mean_volumes, volatilities = self._window_stats(
+            history['volume'], history['close'],
+        )
+        for asset in missing:
+            values = {
+                'volume': mean_volumes[asset],
+                'close': volatilities[asset],
+            }
+            self._window_data_cache.set(asset, values, session)
+
+    @staticmethod
+    def _window_stats(volume_history, close_history):
+        """
+        Compute the mean volume and annualized volatility of close prices
+        from daily windows which end with the current day, excluding the
+        current day.
+
+        The windows are Series for one asset, or DataFrames with a column per
+        asset, in which case the stats are Series indexed by asset.
+        """
+        # Exclude the first value of the percent change array because it is
+        # always just NaN.
+        with warnings.catch_warnings():
+            # Suppress pandas >=2.1 FutureWarning:
+            #    The default fill_method='pad' in DataFrame.pct_change is deprecated
+            #    and will be removed in a future version. Call ffill before calling
+            #    pct_change to retain current behavior and silence this warning.
+            # The suggested fix doesn't help because prices has leading NaNs, which
+            # aren't filled by ffill(). Can likely remove in pandas 3.x.
+            warnings.simplefilter("ignore", category=FutureWarning)
+            close_volatility = close_history[:-1].ffill().pct_change()[1:].std(
+                skipna=False,
+            )
+
+        return volume_history[:-1].mean(), close_volatility * SQRT_252
+
 
 class VolatilityVolumeShare(MarketImpactBase):
     """
@@ -780,3 +1140,25 @@ class FixedBasisPointsSlippage(SlippageModel):
             price + price * (self.percentage * order.direction),
             shares_to_fill * order.direction
         )
+
+    _batch_process_order = process_order
+
+    def _process_orders(self,
+                        prices,
+                        volumes,
+                        volume_for_bar,
+                        amounts,
+                        open_amounts,
+                        directions,
+                        limits):
+        max_volume = np.trunc(self.volume_limit * volumes)
+
+        shares_to_fill = np.minimum(
+            np.abs(open_amounts), max_volume - volume_for_bar,
+        )
+
+        return (
+            prices + prices * (self.percentage * directions),
+            shares_to_fill * directions,
+            shares_to_fill == 0,
+        )
@@ -1,3 +1,4 @@
+import pandas as pd
 
 NANOS_IN_MINUTE = ...
 
@@ -7,4 +8,5 @@ SESSION_END = ...
 MINUTE_END = ...
 BEFORE_TRADING_START_BAR = ...
 
-class MinuteSimulationClock: ...
\ No newline at end of file
+class MinuteSimulationClock:
+    def session_minutes(self, session: pd.Timestamp) -> pd.DatetimeIndex: ...
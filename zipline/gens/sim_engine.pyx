@@ -128,6 +128,12 @@ cdef class MinuteSimulationClock:
 
             yield regular_minutes[-1], SESSION_END
 
+    def session_minutes(self, session):
+        """The minutes of the BAR events of ``session``, a label as emitted
+        with SESSION_START.
+        """
+        return self.minutes_by_session[session.value]
+
     def _get_minutes_for_list(self, minutes, minute_emission):
         for minute in minutes:
             yield minute, BAR
@@ -14,6 +14,7 @@
 # limitations under the License.
 from contextlib2 import ExitStack
 from copy import copy
+from zipline.finance.blotter import SimulationBlotter
 from zipline.finance.order import ORDER_STATUS
 from zipline.protocol import BarData
 from zipline.utils.api_support import ZiplineAPI
@@ -24,7 +25,8 @@ from zipline.gens.sim_engine import (
     SESSION_START,
     SESSION_END,
     MINUTE_END,
-    BEFORE_TRADING_START_BAR
+    BEFORE_TRADING_START_BAR,
+    MinuteSimulationClock,
 )
 
 class AlgorithmSimulator(object):
@@ -191,14 +193,62 @@ class AlgorithmSimulator(object):
                 def calculate_minute_capital_changes(dt):
                     return []
 
+            # Whether to skip the bars on which nothing can happen, which are
+            # the bars with no open or new orders on which no events are
+            # triggered. The minutes on which events might be triggered are
+            # computed at the start of each session.
+            fast_forward = self._can_fast_forward()
+            event_manager = algo.event_manager
+            idle_callbacks = algo._idle_event_callbacks()
+            session_minutes = bar_triggers = None
+            bar_idx = num_events = 0
+            skipped_bar = False
+
             for dt, action in self.clock:
                 if action == BAR:
+                    if bar_triggers is not None:
+                        if len(event_manager) != num_events:
+                            # events were added, so recompute the triggers of
+                            # the rest of the session
+                            num_events = len(event_manager)
+                            bar_triggers = event_manager.session_triggers(
+                                session_minutes[bar_idx:], idle_callbacks,
+                            )
+                            session_minutes = session_minutes[bar_idx:]
+                            bar_idx = 0
+
+                    if bar_triggers is not None:
+                        blotter = algo.blotter
+                        triggered = bar_triggers[bar_idx]
+                        bar_idx += 1
+                        if not (triggered or
+                                blotter.open_orders or
+                                blotter.new_orders):
+                            skipped_bar = True
+                            continue
+
+                    skipped_bar = False
                     for capital_change_packet in every_bar(dt):
                         yield capital_change_packet
                 elif action == SESSION_START:
                     for capital_change_packet in once_a_day(dt):
                         yield capital_change_packet
+
+                    if fast_forward:
+                        session_minutes = self.clock.session_minutes(dt)
+                        num_events = len(event_manager)
+                        bar_triggers = event_manager.session_triggers(
+                            session_minutes, idle_callbacks,
+                        )
+                        bar_idx = 0
                 elif action == SESSION_END:
+                    if skipped_bar:
+                        # The last bar was skipped, so move to the close like
+                        # it would have.
+                        self.simulation_dt = dt
+                        algo.on_dt_changed(dt)
+                        skipped_bar = False
+
                     # End of the session.
                     positions = metrics_tracker.positions
                     position_assets = algo.asset_finder.retrieve_all(positions)
@@ -226,6 +276,22 @@ class AlgorithmSimulator(object):
             )
             yield risk_message
 
+    def _can_fast_forward(self):
+        """
+        Whether bars may be skipped, which is only in minute simulations with
+        daily emission and no capital changes, so that no perf is emitted
+        for the skipped bars, with the simulation blotter.
+        """
+        algo = self.algo
+        return (
+            algo.data_frequency == 'minute' and
+            algo.metrics_tracker.emission_rate == 'daily' and
+            not algo.capital_changes and
+            isinstance(self.clock, MinuteSimulationClock) and
+            type(algo.blotter).get_transactions is
+            SimulationBlotter.get_transactions
+        )
+
     def _cleanup_expired_assets(self, dt, position_assets):
         """
         Clear out any assets that have expired before starting a new sim day.
@@ -51,12 +51,21 @@ implements the following algorithm for executing pipelines:
 
    This logic lives in SimplePipelineEngine.compute_chunk.
 
+   If the engine was given a ``compute_pool``, the terms are instead
+   dispatched to the pool as soon as all of their inputs are in the
+   workspace, so that independent terms and loader groups run
+   concurrently. Steps (a) and (c) still happen in the calling thread.
+
 7. Extract the pipeline's outputs from the workspace and convert them
    into "narrow" format, with output labels dictated by the Pipeline's
    screen. This logic lives in SimplePipelineEngine._to_narrow.
 """
 from abc import ABCMeta, abstractmethod
+from collections import defaultdict
 from functools import partial
+from heapq import heappop, heappush
+import multiprocessing
+from queue import Queue
 
 from six import iteritems, with_metaclass, viewkeys
 from numpy import array, arange
@@ -65,7 +74,11 @@ from pandas import DataFrame, MultiIndex
 from toolz import groupby
 
 from zipline.data.bar_reader import NoDataOnDate
-from zipline.lib.adjusted_array import ensure_adjusted_array, ensure_ndarray
+from zipline.lib.adjusted_array import (
+    AdjustedArray,
+    ensure_adjusted_array,
+    ensure_ndarray,
+)
 from zipline.errors import NoFurtherDataError
 from zipline.utils.numpy_utils import (
     as_column,
@@ -78,6 +91,8 @@ from zipline.utils.string_formatting import bulleted_list
 from .domain import Domain, GENERIC
 from .graph import maybe_specialize
 from .hooks import DelegatingHooks
+from .hooks.recording import RecordingHooks, replay_events
+from .loaders.incremental import incremental_get_loader
 from .term import AssetExists, InputDates, LoadableTerm
 
 from zipline.utils.date_utils import compute_date_range_chunks
@@ -173,6 +188,48 @@ class PipelineEngine(with_metaclass(ABCMeta)):
         """
         raise NotImplementedError("run_chunked_pipeline")
 
+    @abstractmethod
+    def iter_pipeline(self,
+                      pipeline,
+                      start_date,
+                      end_date,
+                      chunksize,
+                      hooks=None):
+        """
+        Compute values for ``pipeline`` from ``start_date`` to ``end_date``, in
+        date chunks of size ``chunksize``, yielding the result of each chunk
+        as soon as it is computed.
+
+        Unlike :meth:`run_chunked_pipeline`, the results of the chunks are
+        never concatenated, so only one chunk needs to be held in memory at a
+        time.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            The start date to run the pipeline for.
+        end_date : pd.Timestamp
+            The end date to run the pipeline for.
+        chunksize : int
+            The number of days to execute at a time. Pass 1 to yield one
+            frame per day.
+        hooks : list[implements(PipelineHooks)], optional
+            Hooks for instrumenting Pipeline execution.
+
+        Yields
+        ------
+        result : pd.DataFrame
+            A frame of computed results for the dates of one chunk, in the
+            format returned by :meth:`run_pipeline`.
+
+        See Also
+        --------
+        :meth:`zipline.pipeline.engine.PipelineEngine.run_chunked_pipeline`
+        """
+        raise NotImplementedError("iter_pipeline")
+
 
 class NoEngineRegistered(Exception):
     """
@@ -202,6 +259,17 @@ class ExplodingPipelineEngine(PipelineEngine):
             "resources were registered."
         )
 
+    def iter_pipeline(self,
+                      pipeline,
+                      start_date,
+                      end_date,
+                      chunksize,
+                      hooks=None):
+        raise NoEngineRegistered(
+            "Attempted to iterate over a pipeline but no pipeline "
+            "resources were registered."
+        )
+
 
 def default_populate_initial_workspace(initial_workspace,
                                        root_mask_term,
@@ -256,6 +324,29 @@ class SimplePipelineEngine(PipelineEngine):
     default_hooks : list, optional
         List of hooks that should be used to instrument all pipelines executed
         by this engine.
+    compute_pool : multiprocessing.pool.ThreadPool, optional
+        A pool to compute terms on. If given, each term (or group of terms
+        from the same loader) is dispatched to the pool as soon as the terms
+        it depends on have been computed, so independent terms run
+        concurrently. NumPy releases the GIL for most of the work in
+        ``compute``, so a thread pool is usually what you want. Loaders need
+        not be thread-safe: terms from the same loader are never loaded
+        concurrently. By default, terms are computed one at a time in the
+        calling thread.
+    term_cache : zipline.pipeline.term_cache.TermResultCache, optional
+        A cache of pipeline outputs to reuse across runs. The columns and
+        screen computed by each run (or chunk) are stored in the cache, and
+        later runs over the same dates, domain and assets take any term
+        found in the cache from it instead of computing the term and its
+        dependencies. By default, nothing is cached.
+    incremental : bool, optional
+        Whether to wrap each loader in an
+        :class:`~zipline.pipeline.loaders.incremental.IncrementalLoader`,
+        which keeps the windows it loads and, when a later run requests the
+        same windows rolled forward, only loads the new rows. Useful for
+        running a pipeline once per session, as in live trading. Only loaded
+        data is reused; computed terms are still computed over their full
+        windows on each run. Default False.
 
     See Also
     --------
@@ -267,6 +358,8 @@ class SimplePipelineEngine(PipelineEngine):
         '_root_mask_term',
         '_root_mask_dates_term',
         '_populate_initial_workspace',
+        '_compute_pool',
+        '_term_cache',
     )
 
     def __init__(self,
@@ -274,8 +367,13 @@ class SimplePipelineEngine(PipelineEngine):
                  asset_finder,
                  default_domain=GENERIC,
                  populate_initial_workspace=None,
-                 default_hooks=None):
+                 default_hooks=None,
+                 compute_pool=None,
+                 term_cache=None,
+                 incremental=False):
 
+        if incremental:
+            get_loader = incremental_get_loader(get_loader)
         self._get_loader = get_loader
         self._finder = asset_finder
 
@@ -292,6 +390,9 @@ class SimplePipelineEngine(PipelineEngine):
         else:
             self._default_hooks = list(default_hooks)
 
+        self._compute_pool = compute_pool
+        self._term_cache = term_cache
+
     def run_chunked_pipeline(self,
                              pipeline,
                              start_date,
@@ -336,6 +437,53 @@ class SimplePipelineEngine(PipelineEngine):
         --------
         :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`
         """
+        return _concat_chunks(list(self.iter_pipeline(
+            pipeline,
+            start_date,
+            end_date,
+            chunksize,
+            hooks,
+        )))
+
+    def iter_pipeline(self,
+                      pipeline,
+                      start_date,
+                      end_date,
+                      chunksize,
+                      hooks=None):
+        """
+        Compute values for ``pipeline`` from ``start_date`` to ``end_date``, in
+        date chunks of size ``chunksize``, yielding the result of each chunk
+        as soon as it is computed.
+
+        Unlike :meth:`run_chunked_pipeline`, the results of the chunks are
+        never concatenated, so only one chunk needs to be held in memory at a
+        time.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            The start date to run the pipeline for.
+        end_date : pd.Timestamp
+            The end date to run the pipeline for.
+        chunksize : int
+            The number of days to execute at a time. Pass 1 to yield one
+            frame per day.
+        hooks : list[implements(PipelineHooks)], optional
+            Hooks for instrumenting Pipeline execution.
+
+        Yields
+        ------
+        result : pd.DataFrame
+            A frame of computed results for the dates of one chunk, in the
+            format returned by :meth:`run_pipeline`.
+
+        See Also
+        --------
+        :meth:`zipline.pipeline.engine.PipelineEngine.run_chunked_pipeline`
+        """
         domain = self.resolve_domain(pipeline)
         ranges = compute_date_range_chunks(
             domain.sessions(),
@@ -347,19 +495,8 @@ class SimplePipelineEngine(PipelineEngine):
 
         run_pipeline = partial(self._run_pipeline_impl, pipeline, hooks=hooks)
         with hooks.running_pipeline(pipeline, start_date, end_date):
-            chunks = [run_pipeline(s, e) for s, e in ranges]
-
-        if len(chunks) == 1:
-            # OPTIMIZATION: Don't make an extra copy in `categorical_df_concat`
-            # if we don't have to.
-            return chunks[0]
-
-        # Filter out empty chunks. Empty dataframes lose dtype information,
-        # which makes concatenation fail.
-        nonempty_chunks = [c for c in chunks if len(c)]
-        if not nonempty_chunks:
-            return DataFrameWithMetadata(columns=chunks[0].columns)
-        return categorical_df_concat(nonempty_chunks, inplace=True)
+            for s, e in ranges:
+                yield run_pipeline(s, e)
 
     def run_pipeline(self, pipeline, start_date, end_date, hooks=None):
         """
@@ -432,9 +569,21 @@ class SimplePipelineEngine(PipelineEngine):
             sids,
         )
 
+        if self._term_cache is not None:
+            cached_terms = self._populate_from_term_cache(
+                plan, workspace, dates, sids,
+            )
+
         refcounts = plan.initial_refcounts(workspace)
         execution_order = plan.execution_order(workspace, refcounts)
 
+        if self._term_cache is not None:
+            hooks.on_term_cache_lookup(
+                cached_terms,
+                [t for t in execution_order if not isinstance(t, LoadableTerm)],
+                self._term_cache.nbytes,
+            )
+
         with hooks.computing_chunk(execution_order,
                                    start_date,
                                    end_date):
@@ -449,6 +598,11 @@ class SimplePipelineEngine(PipelineEngine):
                 hooks=hooks,
             )
 
+        if self._term_cache is not None:
+            self._store_in_term_cache(
+                plan, workspace, results, dates[extra_rows:], sids,
+            )
+
         return self._to_narrow(
             plan.outputs,
             results,
@@ -457,6 +611,60 @@ class SimplePipelineEngine(PipelineEngine):
             sids,
         )
 
+    def _term_cache_key(self, plan, term, workspace, dates, sids):
+        """
+        Build the term cache key of ``term``, which covers the last
+        ``len(dates)`` rows of the root mask.
+        """
+        root_mask = workspace[self._root_mask_term]
+        return self._term_cache.key(
+            term,
+            plan.domain,
+            dates,
+            sids,
+            root_mask[len(root_mask) - len(dates):],
+        )
+
+    def _populate_from_term_cache(self, plan, workspace, dates, sids):
+        """
+        Add the terms of ``plan`` which are in the term cache to
+        ``workspace``.
+
+        Returns
+        -------
+        cached_terms : list[Term]
+            The terms taken from the cache.
+        """
+        cached_terms = []
+        root_extra_rows = plan.extra_rows[self._root_mask_term]
+        for term in plan.graph:
+            if (term in workspace
+                    or isinstance(term, LoadableTerm)
+                    or self._is_special_root_term(term)):
+                continue
+            term_dates = dates[root_extra_rows - plan.extra_rows[term]:]
+            value = self._term_cache.get(
+                self._term_cache_key(plan, term, workspace, term_dates, sids),
+            )
+            if value is not None:
+                workspace[term] = value
+                cached_terms.append(term)
+        return cached_terms
+
+    def _store_in_term_cache(self, plan, workspace, results, dates, sids):
+        """
+        Store the computed outputs of ``plan`` in the term cache.
+        """
+        for name, term in iteritems(plan.outputs):
+            # Skip terms that were supplied in the initial workspace,
+            # including those taken from the cache.
+            if term in workspace:
+                continue
+            self._term_cache.set(
+                self._term_cache_key(plan, term, workspace, dates, sids),
+                results[name],
+            )
+
     def _compute_root_mask(self, pipeline, domain, start_date, end_date, extra_rows):
         """
         Compute a lifetimes matrix from our AssetFinder, then drop columns that
@@ -512,27 +720,21 @@ class SimplePipelineEngine(PipelineEngine):
         # NOTE: This logic should probably be delegated to the domain once we
         #       start adding more complex domains.
         #
-        # Build lifetimes matrix reaching back to `extra_rows` days before
-        # `start_date.`
+        # Find the assets that existed from the farthest look back window,
+        # `extra_rows` days before `start_date`, through the end of the
+        # requested dates, so that the lifetimes matrix is only built for
+        # those assets (and only for those that pass the prescreen) rather
+        # than for every asset in the db.
         finder = self._finder
-        lifetimes = finder.lifetimes(
-            sessions[start_idx - extra_rows:end_idx],
+        dates = sessions[start_idx - extra_rows:end_idx]
+        country_codes = (domain.country_code,)
+        sids = finder.active_sids(
+            dates,
             include_start_date=False,
-            country_codes=(domain.country_code,),
+            country_codes=country_codes,
         )
 
-        if not lifetimes.columns.unique:
-            columns = lifetimes.columns
-            duplicated = columns[columns.duplicated()].unique()
-            raise AssertionError("Duplicated sids: %d" % duplicated)
-
-        # Filter out columns that didn't exist from the farthest look back
-        # window through the end of the requested dates.
-        existed = lifetimes.any()
-        ret = lifetimes.loc[:, existed]
-        num_assets = ret.shape[1]
-
-        if num_assets == 0:
+        if len(sids) == 0:
             raise ValueError(
                 "Failed to find any assets with country_code {!r} that traded "
                 "between {} and {}.\n"
@@ -543,10 +745,21 @@ class SimplePipelineEngine(PipelineEngine):
             )
 
         if pipeline._prescreen:
-            columns = self._prescreen(pipeline._prescreen, ret.columns)
-            ret = ret.loc[:, columns]
+            sids = self._prescreen(pipeline._prescreen, sids.tolist())
 
-        return ret
+        lifetimes = finder.lifetimes(
+            dates,
+            include_start_date=False,
+            country_codes=country_codes,
+            sids=sids,
+        )
+
+        if not lifetimes.columns.unique:
+            columns = lifetimes.columns
+            duplicated = columns[columns.duplicated()].unique()
+            raise AssertionError("Duplicated sids: %d" % duplicated)
+
+        return lifetimes
 
     def _prescreen(self, prescreen, sids):
         """
@@ -703,7 +916,6 @@ class SimplePipelineEngine(PipelineEngine):
 
         # Copy the supplied initial workspace so we don't mutate it in place.
         workspace = workspace.copy()
-        domain = graph.domain
 
         # Many loaders can fetch data more efficiently if we ask them to
         # retrieve all their inputs at once. For example, a loader backed by a
@@ -735,80 +947,83 @@ class SimplePipelineEngine(PipelineEngine):
             (t for t in execution_order if t in will_be_loaded),
         )
 
-        for term in execution_order:
-            # `term` may have been supplied in `initial_workspace`, or we may
-            # have loaded `term` as part of a batch with another term coming
-            # from the same loader (see note on loader_group_key above). In
-            # either case, we already have the term computed, so don't
-            # recompute.
-            if term in workspace:
-                continue
-
-            # Asset labels are always the same, but date labels vary by how
-            # many extra rows are needed.
-            mask, mask_dates = graph.mask_and_dates_for_term(
-                term,
-                self._root_mask_term,
-                workspace,
+        if self._compute_pool is not None:
+            self._compute_concurrently(
+                graph,
                 dates,
+                sids,
+                workspace,
+                refcounts,
+                execution_order,
+                hooks,
+                loader_group_key,
             )
-
-            if isinstance(term, LoadableTerm):
-                loader = get_loader(term)
-                to_load = sorted(
-                    loader_groups[loader_group_key(term)],
-                    key=lambda t: t.dataset
+        else:
+            # Keep a running total of the size of the workspace, rather than
+            # summing the whole workspace after every term.
+            workspace_nbytes = _workspace_nbytes(workspace)
+            for term in execution_order:
+                # `term` may have been supplied in `initial_workspace`, or we
+                # may have loaded `term` as part of a batch with another term
+                # coming from the same loader (see note on loader_group_key
+                # above). In either case, we already have the term computed,
+                # so don't recompute.
+                if term in workspace:
+                    continue
+
+                # Asset labels are always the same, but date labels vary by
+                # how many extra rows are needed.
+                mask, mask_dates = graph.mask_and_dates_for_term(
+                    term,
+                    self._root_mask_term,
+                    workspace,
+                    dates,
                 )
-                self._ensure_can_load(loader, to_load)
-                with hooks.loading_terms(to_load):
-                    try:
-                        loaded = loader.load_adjusted_array(
-                            domain, to_load, mask_dates, sids, mask,
-                        )
-                    except NoDataOnDate as e:
-                        extra_rows = graph.extra_rows[term]
-                        msg = (
-                            f"the pipeline definition requires {term} data on {str(e)} but no bundle data is "
-                            "available on that date; the cause of this issue is that another pipeline term needs "
-                            f"{term} and has a window_length of {extra_rows + 1}, which necessitates loading "
-                            f"{extra_rows} extra rows of {term}; try setting a later start date so that the maximum "
-                            "window_length of any term doesn't extend further back than the bundle start date. "
-                            f"Review the pipeline dependencies below to help determine which terms are causing "
-                            f"the problem:\n\n{repr(graph)}"
-                        )
-                        raise NoDataOnDate(msg)
-                assert set(loaded) == set(to_load), (
-                    'loader did not return an AdjustedArray for each column\n'
-                    'expected: %r\n'
-                    'got:      %r' % (
-                        sorted(to_load, key=repr),
-                        sorted(loaded, key=repr),
+
+                if isinstance(term, LoadableTerm):
+                    loader = get_loader(term)
+                    to_load = sorted(
+                        loader_groups[loader_group_key(term)],
+                        key=lambda t: t.dataset
                     )
-                )
-                workspace.update(loaded)
-            else:
-                with hooks.computing_term(term):
-                    workspace[term] = term._compute(
-                        self._inputs_for_term(
+                    self._ensure_can_load(loader, to_load)
+                    with hooks.loading_terms(to_load):
+                        loaded = self._load_terms(
+                            graph,
+                            loader,
                             term,
-                            workspace,
+                            to_load,
+                            mask_dates,
+                            sids,
+                            mask,
+                        )
+                    workspace_nbytes += _loaded_nbytes(workspace, loaded)
+                    workspace.update(loaded)
+                    hooks.on_workspace_update(workspace_nbytes)
+                else:
+                    with hooks.computing_term(term):
+                        workspace[term] = self._compute_term(
                             graph,
-                            domain,
+                            term,
+                            workspace,
                             refcounts,
-                        ),
-                        mask_dates,
-                        sids,
-                        mask,
-                    )
-                if term.ndim == 2:
-                    assert workspace[term].shape == mask.shape
-                else:
-                    assert workspace[term].shape == (mask.shape[0], 1)
-
-                # Decref dependencies of ``term``, and clear any terms
-                # whose refcounts hit 0.
-                for garbage in graph.decref_dependencies(term, refcounts):
-                    del workspace[garbage]
+                            mask_dates,
+                            sids,
+                            mask,
+                        )
+                    _check_output_shape(term, workspace[term], mask)
+                    # Report the size before freeing the dependencies, which
+                    # is when the workspace is largest.
+                    workspace_nbytes += _nbytes(workspace[term])
+                    hooks.on_workspace_update(workspace_nbytes)
+
+                    # Decref dependencies of ``term``, and clear any terms
+                    # whose refcounts hit 0.
+                    garbage = graph.decref_dependencies(term, refcounts)
+                    for dead in garbage:
+                        workspace_nbytes -= _nbytes(workspace.pop(dead))
+                    if garbage:
+                        hooks.on_workspace_update(workspace_nbytes)
 
         # At this point, all the output terms are in the workspace.
         out = {}
@@ -818,6 +1033,237 @@ class SimplePipelineEngine(PipelineEngine):
             out[name] = workspace[term][graph_extra_rows[term]:]
         return out
 
+    def _load_terms(self, graph, loader, term, to_load, mask_dates, sids, mask):
+        """
+        Load ``to_load``, the loader group of ``term``, with ``loader``.
+        """
+        try:
+            loaded = loader.load_adjusted_array(
+                graph.domain, to_load, mask_dates, sids, mask,
+            )
+        except NoDataOnDate as e:
+            extra_rows = graph.extra_rows[term]
+            msg = (
+                f"the pipeline definition requires {term} data on {str(e)} but no bundle data is "
+                "available on that date; the cause of this issue is that another pipeline term needs "
+                f"{term} and has a window_length of {extra_rows + 1}, which necessitates loading "
+                f"{extra_rows} extra rows of {term}; try setting a later start date so that the maximum "
+                "window_length of any term doesn't extend further back than the bundle start date. "
+                f"Review the pipeline dependencies below to help determine which terms are causing "
+                f"the problem:\n\n{repr(graph)}"
+            )
+            raise NoDataOnDate(msg)
+        assert set(loaded) == set(to_load), (
+            'loader did not return an AdjustedArray for each column\n'
+            'expected: %r\n'
+            'got:      %r' % (
+                sorted(to_load, key=repr),
+                sorted(loaded, key=repr),
+            )
+        )
+        return loaded
+
+    def _compute_term(self,
+                      graph,
+                      term,
+                      workspace,
+                      refcounts,
+                      mask_dates,
+                      sids,
+                      mask):
+        """
+        Compute ``term`` from its inputs in ``workspace``.
+        """
+        return term._compute(
+            self._inputs_for_term(
+                term,
+                workspace,
+                graph,
+                graph.domain,
+                refcounts,
+            ),
+            mask_dates,
+            sids,
+            mask,
+        )
+
+    def _compute_concurrently(self,
+                              graph,
+                              dates,
+                              sids,
+                              workspace,
+                              refcounts,
+                              execution_order,
+                              hooks,
+                              loader_group_key):
+        """
+        Compute the terms in ``execution_order`` on ``self._compute_pool``,
+        updating ``workspace`` and ``refcounts`` in place.
+
+        Each loader group and each ComputableTerm is a unit of work which is
+        dispatched to the pool once the terms it depends on are in the
+        workspace. Ready units are dispatched in ``execution_order``.
+
+        Only the pool's workers call ``load_adjusted_array`` and
+        ``_compute``. Everything else, including reading and updating the
+        workspace and refcounts and entering and exiting hooks, happens in
+        the calling thread, so hooks do not need to be thread-safe. Hook
+        contexts for concurrent units may overlap.
+        """
+        get_loader = self._get_loader
+        root_mask_term = self._root_mask_term
+        domain = graph.domain
+        # Compute lazy attributes of the graph up front rather than in the
+        # pool's workers.
+        graph.offset
+        graph.extra_rows
+
+        # Map each term to the unit of work that produces it. Like the
+        # sequential loop, a loader group is loaded as a unit using the mask
+        # of its first term in execution order, so only that term's
+        # dependencies need to be computed before loading the group.
+        unit_of_term = {}
+        unit_terms = {}
+        for term in execution_order:
+            if term in workspace:
+                continue
+            if isinstance(term, LoadableTerm):
+                unit = loader_group_key(term)
+            else:
+                unit = term
+            unit_of_term[term] = unit
+            unit_terms.setdefault(unit, []).append(term)
+
+        priority = {unit: i for i, unit in enumerate(unit_terms)}
+        num_waiting_on = {}
+        dependents = defaultdict(list)
+        for unit, terms in iteritems(unit_terms):
+            dependencies = {
+                unit_of_term[dep] for dep in graph.graph.predecessors(terms[0])
+                if dep in unit_of_term
+            }
+            dependencies.discard(unit)
+            num_waiting_on[unit] = len(dependencies)
+            for dep in dependencies:
+                dependents[dep].append(unit)
+
+        ready = []
+        for unit, count in iteritems(num_waiting_on):
+            if count == 0:
+                heappush(ready, (priority[unit], unit))
+
+        finished = Queue()
+
+        def run(unit, work):
+            try:
+                finished.put((unit, work(), None))
+            except Exception as e:
+                finished.put((unit, None, e))
+
+        # unit -> (hook context, loader or None, mask)
+        running = {}
+        busy_loaders = set()
+
+        def dispatch(unit):
+            term = unit_terms[unit][0]
+            mask, mask_dates = graph.mask_and_dates_for_term(
+                term,
+                root_mask_term,
+                workspace,
+                dates,
+            )
+            if isinstance(term, LoadableTerm):
+                loader = get_loader(term)
+                to_load = sorted(unit_terms[unit], key=lambda t: t.dataset)
+                self._ensure_can_load(loader, to_load)
+                ctx = hooks.loading_terms(to_load)
+                work = partial(
+                    self._load_terms,
+                    graph, loader, term, to_load, mask_dates, sids, mask,
+                )
+                busy_loaders.add(loader)
+            else:
+                loader = None
+                # Pass the worker a snapshot of the inputs and their
+                # refcounts. An input is only traversed without a copy if
+                # this term is its last remaining consumer.
+                inputs = [maybe_specialize(t, domain) for t in term.inputs]
+                ctx = hooks.computing_term(term)
+                work = partial(
+                    self._compute_term,
+                    graph,
+                    term,
+                    {t: workspace[t] for t in inputs},
+                    {t: refcounts[t] for t in inputs},
+                    mask_dates,
+                    sids,
+                    mask,
+                )
+            ctx.__enter__()
+            running[unit] = ctx, loader, mask
+            self._compute_pool.apply_async(run, (unit, work))
+
+        workspace_nbytes = _workspace_nbytes(workspace)
+        error = None
+        while running or (ready and error is None):
+            if error is None:
+                deferred = []
+                while ready:
+                    item = heappop(ready)
+                    unit = item[1]
+                    term = unit_terms[unit][0]
+                    if (isinstance(term, LoadableTerm)
+                            and get_loader(term) in busy_loaders):
+                        deferred.append(item)
+                        continue
+                    try:
+                        dispatch(unit)
+                    except Exception as e:
+                        error = e
+                        break
+                for item in deferred:
+                    heappush(ready, item)
+
+                if not running:
+                    break
+
+            unit, result, e = finished.get()
+            ctx, loader, mask = running.pop(unit)
+            if e is not None:
+                ctx.__exit__(type(e), e, e.__traceback__)
+                if error is None:
+                    error = e
+                continue
+            ctx.__exit__(None, None, None)
+            if error is not None:
+                # Let the remaining units finish, but don't start new ones.
+                continue
+
+            if loader is not None:
+                busy_loaders.discard(loader)
+                workspace_nbytes += _loaded_nbytes(workspace, result)
+                workspace.update(result)
+                hooks.on_workspace_update(workspace_nbytes)
+            else:
+                term = unit
+                workspace[term] = result
+                _check_output_shape(term, result, mask)
+                workspace_nbytes += _nbytes(result)
+                hooks.on_workspace_update(workspace_nbytes)
+                garbage = graph.decref_dependencies(term, refcounts)
+                for dead in garbage:
+                    workspace_nbytes -= _nbytes(workspace.pop(dead))
+                if garbage:
+                    hooks.on_workspace_update(workspace_nbytes)
+
+            for dependent in dependents[unit]:
+                num_waiting_on[dependent] -= 1
+                if num_waiting_on[dependent] == 0:
+                    heappush(ready, (priority[dependent], dependent))
+
+        if error is not None:
+            raise error
+
     def _to_narrow(self, terms, data, mask, dates, assets):
         """
         Convert raw computed pipeline results into a DataFrame for public APIs.
@@ -1004,6 +1450,170 @@ class SimplePipelineEngine(PipelineEngine):
                 )
 
 
+def run_chunked_pipeline_in_processes(engine,
+                                      make_worker_engine,
+                                      pipeline,
+                                      start_date,
+                                      end_date,
+                                      chunksize,
+                                      workers=None,
+                                      max_memory=None,
+                                      hooks=None):
+    """
+    Compute values for ``pipeline`` from ``start_date`` to ``end_date``, in
+    date chunks of size ``chunksize`` which are computed concurrently in a
+    pool of worker processes.
+
+    Parameters
+    ----------
+    engine : SimplePipelineEngine
+        The engine of this process, used to resolve the pipeline's domain
+        and hooks and to plan the pipeline. It doesn't compute any chunks.
+    make_worker_engine : callable
+        A function returning a SimplePipelineEngine equivalent to
+        ``engine``. It is called once in each worker process, so that each
+        worker opens its own bundle readers.
+    pipeline : Pipeline
+        The pipeline to run.
+    start_date : pd.Timestamp
+        The start date to run the pipeline for.
+    end_date : pd.Timestamp
+        The end date to run the pipeline for.
+    chunksize : int
+        The number of days to execute at a time.
+    workers : int, optional
+        The number of worker processes. Defaults to the number of CPUs.
+    max_memory : int, optional
+        The maximum address space, in bytes, of each worker process. A
+        worker which exceeds it raises a MemoryError instead of exhausting
+        the memory of the machine. By default, there is no limit.
+    hooks : list[implements(PipelineHooks)], optional
+        Hooks for instrumenting Pipeline execution. The hook events of each
+        chunk are recorded in the worker and replayed in this process, in
+        chunk order, once the chunk is complete.
+
+    Returns
+    -------
+    result : pd.DataFrame
+        A frame of computed results, the same as the result of
+        :meth:`SimplePipelineEngine.run_chunked_pipeline`.
+
+    Notes
+    -----
+    Pipelines can't be pickled, so the worker processes are forked from
+    this one, and inherit ``make_worker_engine`` and ``pipeline`` from it.
+    This is only supported on platforms that support the fork start method.
+    """
+    domain = engine.resolve_domain(pipeline)
+    ranges = list(compute_date_range_chunks(
+        domain.sessions(),
+        start_date,
+        end_date,
+        chunksize,
+    ))
+    hooks = engine._resolve_hooks(hooks)
+
+    # Build the plan for the whole date range to create all the
+    # (specialized) terms that the workers will use, so that the workers
+    # can refer to them by their position in the graph.
+    plan = pipeline.to_execution_plan(
+        domain, engine._root_mask_term, start_date, end_date,
+    )
+    terms = list(plan.graph)
+
+    context = multiprocessing.get_context('fork')
+    chunks = []
+    with hooks.running_pipeline(pipeline, start_date, end_date):
+        with context.Pool(
+            processes=min(workers or context.cpu_count(), len(ranges)),
+            initializer=_init_chunk_worker,
+            initargs=(make_worker_engine, pipeline, terms, max_memory),
+        ) as pool:
+            for chunk, events in pool.imap(_run_chunk_in_worker, ranges):
+                replay_events(events, hooks, terms)
+                chunks.append(chunk)
+
+    return _concat_chunks(chunks)
+
+
+# The state of a worker process of run_chunked_pipeline_in_processes: the
+# engine, the pipeline, and the terms which hook events refer to.
+_chunk_worker_state = None
+
+
+def _init_chunk_worker(make_worker_engine, pipeline, terms, max_memory):
+    global _chunk_worker_state
+
+    if max_memory is not None:
+        import resource
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+    _chunk_worker_state = make_worker_engine(), pipeline, terms
+
+
+def _run_chunk_in_worker(dates):
+    engine, pipeline, terms = _chunk_worker_state
+    start_date, end_date = dates
+    hooks = RecordingHooks(terms)
+    result = engine._run_pipeline_impl(pipeline, start_date, end_date, hooks)
+    return result, hooks.events
+
+
+def _concat_chunks(chunks):
+    """
+    Concatenate the results of a chunked pipeline, merging the categories of
+    categorical columns.
+    """
+    if len(chunks) == 1:
+        # OPTIMIZATION: Don't make an extra copy in `categorical_df_concat`
+        # if we don't have to.
+        return chunks[0]
+
+    # Filter out empty chunks. Empty dataframes lose dtype information,
+    # which makes concatenation fail.
+    nonempty_chunks = [c for c in chunks if len(c)]
+    if not nonempty_chunks:
+        return DataFrameWithMetadata(columns=chunks[0].columns)
+    return categorical_df_concat(nonempty_chunks, inplace=True)
+
+
+def _nbytes(value):
+    """
+    Return the size in bytes of a workspace value.
+    """
+    if isinstance(value, AdjustedArray):
+        value = value.data
+    return getattr(value, 'nbytes', 0)
+
+
+def _workspace_nbytes(workspace):
+    """
+    Return the total size in bytes of the arrays in a workspace.
+    """
+    return sum(_nbytes(value) for value in workspace.values())
+
+
+def _loaded_nbytes(workspace, loaded):
+    """
+    Return the change in size in bytes of a workspace when it is updated with
+    ``loaded``.
+    """
+    return sum(
+        _nbytes(value) - _nbytes(workspace.get(term))
+        for term, value in iteritems(loaded)
+    )
+
+
+def _check_output_shape(term, result, mask):
+    """
+    Check that the output of a ComputableTerm matches its mask.
+    """
+    if term.ndim == 2:
+        assert result.shape == mask.shape
+    else:
+        assert result.shape == (mask.shape[0], 1)
+
+
 def _pipeline_output_index(dates, assets, mask):
     """
     Create a MultiIndex for a pipeline output.
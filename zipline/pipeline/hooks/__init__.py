@@ -1,6 +1,7 @@
 from .iface import PipelineHooks
 from .no import NoHooks
 from .delegate import DelegatingHooks
+from .profiling import ProfilingHooks
 from .progress import ProgressHooks
 from .testing import TestingHooks
 
@@ -9,6 +10,7 @@ __all__ = [
     'PipelineHooks',
     'NoHooks',
     'DelegatingHooks',
+    'ProfilingHooks',
     'ProgressHooks',
     'TestingHooks',
 ]
@@ -3,7 +3,11 @@ from interface import implements
 
 from zipline.utils.compat import contextmanager, wraps
 
-from .iface import PipelineHooks, PIPELINE_HOOKS_CONTEXT_MANAGERS
+from .iface import (
+    PipelineHooks,
+    PIPELINE_HOOKS_CONTEXT_MANAGERS,
+    interface_method,
+)
 from .no import NoHooks
 
 
@@ -12,7 +16,7 @@ def delegating_hooks_method(method_name):
     """
     if method_name in PIPELINE_HOOKS_CONTEXT_MANAGERS:
         # Generate a contextmanager that enters the context of all child hooks.
-        @wraps(getattr(PipelineHooks, method_name))
+        @wraps(interface_method(method_name))
         @contextmanager
         def ctx(self, *args, **kwargs):
             with ExitStack() as stack:
@@ -23,7 +27,7 @@ def delegating_hooks_method(method_name):
         return ctx
     else:
         # Generate a method that calls methods of all child hooks.
-        @wraps(getattr(PipelineHooks, method_name))
+        @wraps(interface_method(method_name))
         def method(self, *args, **kwargs):
             for hook in self._hooks:
                 sub_method = getattr(hook, method_name)
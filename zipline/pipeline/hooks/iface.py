@@ -1,6 +1,6 @@
 from zipline.utils.compat import contextmanager as _contextmanager
 
-from interface import Interface
+from interface import Interface, default
 
 
 # Keep track of which methods of PipelineHooks are contextmanagers. Used by
@@ -33,6 +33,8 @@ class PipelineHooks(Interface):
     computing_chunk(self, terms, start_date, end_date)
     loading_terms(self, terms)
     computing_term(self, term):
+    on_term_cache_lookup(self, hits, misses, nbytes)
+    on_workspace_update(self, nbytes)
     """
 
     @contextmanager
@@ -87,3 +89,46 @@ class PipelineHooks(Interface):
         terms : zipline.pipeline.ComputableTerm
             Terms being computed.
         """
+
+    @default
+    def on_term_cache_lookup(self, hits, misses, nbytes):
+        """Called after looking up the terms of a chunk in the engine's term
+        cache, before computing the chunk. Only called if the engine has a
+        term cache.
+
+        Parameters
+        ----------
+        hits : list[zipline.pipeline.ComputableTerm]
+            Terms taken from the cache.
+        misses : list[zipline.pipeline.ComputableTerm]
+            Terms that weren't in the cache and will be computed.
+        nbytes : int
+            The total size of the cached values in bytes.
+        """
+        pass
+
+    @default
+    def on_workspace_update(self, nbytes):
+        """Called after the engine adds the results of a loaded or computed
+        term to the workspace of a chunk, and again after it discards the
+        terms that are no longer needed, if there are any.
+
+        Parameters
+        ----------
+        nbytes : int
+            The total size of the arrays in the workspace in bytes. Memory
+            shared by the arrays of several terms is counted for each term.
+        """
+        pass
+
+
+def interface_method(method_name):
+    """
+    Get the function declaring the PipelineHooks method ``method_name``,
+    unwrapping methods with a default implementation. Used by hooks that
+    generate their methods from the interface.
+    """
+    method = getattr(PipelineHooks, method_name)
+    if isinstance(method, default):
+        return method.implementation
+    return method
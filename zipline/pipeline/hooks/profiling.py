@@ -0,0 +1,218 @@
+"""Pipeline hooks for profiling the time and memory used by each term.
+"""
+import time
+
+from interface import implements
+import pandas as pd
+
+from zipline.utils.compat import contextmanager
+
+from .iface import PipelineHooks
+
+
+class ProfilingHooks(implements(PipelineHooks)):
+    """
+    Hooks implementation that records the wall and CPU time of each chunk,
+    each batch of loaded terms and each computed term, and the largest size
+    of the workspace after each of them.
+
+    The recorded events accumulate across pipeline executions until
+    :meth:`clear` is called.
+
+    Notes
+    -----
+    CPU time is measured for the whole process, so with an engine
+    ``compute_pool`` the CPU time of a term includes work done concurrently
+    for other terms. Times are measured in the process running the hooks, so
+    they are not meaningful for events replayed from worker processes.
+
+    Examples
+    --------
+    >>> profiler = ProfilingHooks()  # doctest: +SKIP
+    >>> engine.run_pipeline(pipe, start, end, hooks=[profiler])  # doctest: +SKIP
+    >>> profiler.report().head(10)  # doctest: +SKIP
+    """
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """
+        Discard the recorded events.
+        """
+        self._events = []
+        self._chunk = None
+        self._chunk_peak_nbytes = 0
+        self._last_event = None
+
+    @contextmanager
+    def running_pipeline(self, pipeline, start_date, end_date):
+        yield
+
+    @contextmanager
+    def computing_chunk(self, terms, start_date, end_date):
+        self._chunk = (start_date, end_date)
+        self._chunk_peak_nbytes = 0
+        with self._timing('chunk', 'chunk', ()) as event:
+            yield
+        event['workspace_nbytes'] = self._chunk_peak_nbytes
+        self._chunk = None
+
+    @contextmanager
+    def loading_terms(self, terms):
+        label = ', '.join(map(repr, terms))
+        with self._timing('load', label, tuple(terms)):
+            yield
+
+    @contextmanager
+    def computing_term(self, term):
+        with self._timing('compute', repr(term), (term,)):
+            yield
+
+    def on_workspace_update(self, nbytes):
+        self._chunk_peak_nbytes = max(self._chunk_peak_nbytes, nbytes)
+        if self._last_event is not None:
+            # The engine reports the size before and after freeing the
+            # terms that are no longer needed; keep the larger one.
+            self._last_event['workspace_nbytes'] = max(
+                self._last_event['workspace_nbytes'] or 0, nbytes,
+            )
+
+    @contextmanager
+    def _timing(self, kind, label, terms):
+        start_date, end_date = self._chunk
+        event = {
+            'kind': kind,
+            'label': label,
+            'terms': terms,
+            'start_date': start_date,
+            'end_date': end_date,
+            'wall_time': None,
+            'cpu_time': None,
+            'workspace_nbytes': None,
+        }
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield event
+        finally:
+            event['wall_time'] = time.perf_counter() - wall_start
+            event['cpu_time'] = time.process_time() - cpu_start
+            self._events.append(event)
+            self._last_event = event
+
+    @property
+    def peak_workspace_nbytes(self):
+        """
+        The largest size of a chunk's workspace in bytes.
+        """
+        return max(
+            (e['workspace_nbytes'] or 0 for e in self._events
+             if e['kind'] == 'chunk'),
+            default=0,
+        )
+
+    def to_frame(self):
+        """
+        Return the recorded events.
+
+        Returns
+        -------
+        events : pd.DataFrame
+            A frame with a row per event, in the order the events finished,
+            and columns:
+
+            kind : {'chunk', 'load', 'compute'}
+            label : str
+                The repr of the loaded or computed terms.
+            terms : tuple[zipline.pipeline.Term]
+                The loaded or computed terms.
+            start_date, end_date : pd.Timestamp
+                The bounds of the chunk.
+            wall_time, cpu_time : float
+                The elapsed seconds.
+            workspace_nbytes : float
+                The size of the workspace after the event, before the terms
+                that are no longer needed are freed, or for a chunk the
+                largest size of its workspace.
+        """
+        return pd.DataFrame(
+            self._events,
+            columns=[
+                'kind',
+                'label',
+                'terms',
+                'start_date',
+                'end_date',
+                'wall_time',
+                'cpu_time',
+                'workspace_nbytes',
+            ],
+        )
+
+    def report(self):
+        """
+        Summarize the loads and computations across chunks.
+
+        Returns
+        -------
+        report : pd.DataFrame
+            A frame indexed by (kind, label) with the number of ``calls``,
+            the total ``wall_time`` and ``cpu_time``, and the largest
+            ``workspace_nbytes`` after each load or computation, sorted by
+            descending wall time.
+        """
+        events = self.to_frame()
+        events = events[events['kind'] != 'chunk']
+        report = events.groupby(['kind', 'label'], sort=False).agg(
+            calls=('wall_time', 'size'),
+            wall_time=('wall_time', 'sum'),
+            cpu_time=('cpu_time', 'sum'),
+            workspace_nbytes=('workspace_nbytes', 'max'),
+        )
+        return report.sort_values('wall_time', ascending=False)
+
+    def write_flamegraph(self, path):
+        """
+        Write the wall times in the folded stack format read by flame graph
+        tools such as ``flamegraph.pl`` and speedscope.
+
+        Each line is a ``pipeline;chunk;term`` stack and its wall time in
+        microseconds. The time a chunk spent outside of loads and computations
+        is attributed to the chunk itself.
+
+        Parameters
+        ----------
+        path : str
+            The file to write.
+        """
+        def frame(name):
+            # Semicolons separate frames in the folded format.
+            return name.replace(';', ',')
+
+        lines = []
+        children = []
+        # A chunk finishes after its loads and computations.
+        for event in self._events:
+            if event['kind'] != 'chunk':
+                children.append(event)
+                continue
+
+            chunk_frame = 'pipeline;chunk {}:{}'.format(
+                event['start_date'].date(), event['end_date'].date(),
+            )
+            self_time = event['wall_time']
+            for child in children:
+                self_time -= child['wall_time']
+                lines.append('{};{} {} {}'.format(
+                    chunk_frame,
+                    child['kind'],
+                    frame(child['label']),
+                    int(child['wall_time'] * 1e6),
+                ))
+            lines.append('{} {}'.format(
+                chunk_frame, int(max(self_time, 0) * 1e6),
+            ))
+            children = []
+
+        with open(path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
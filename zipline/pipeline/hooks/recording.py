@@ -0,0 +1,120 @@
+"""Pipeline hooks for recording events in one process and replaying them in
+another.
+"""
+from interface import implements
+
+from zipline.utils.compat import contextmanager
+
+from .iface import PipelineHooks
+
+
+class RecordingHooks(implements(PipelineHooks)):
+    """
+    Hooks implementation that records the events of a pipeline execution so
+    that they can be replayed with :func:`replay_events`.
+
+    Terms can't be pickled, so each term is recorded as its index in
+    ``terms``. The process replaying the events must have the same terms in
+    the same order.
+
+    Parameters
+    ----------
+    terms : list[zipline.pipeline.Term]
+        The terms that may be passed to hooks.
+    """
+    def __init__(self, terms):
+        self._term_ids = {term: i for i, term in enumerate(terms)}
+        self.events = []
+
+    def _record(self, method_name, *args):
+        self.events.append(('enter', method_name, args))
+
+    @contextmanager
+    def running_pipeline(self, pipeline, start_date, end_date):
+        # The pipeline is recorded as None; the replaying process passes its
+        # own pipeline.
+        self._record('running_pipeline', None, start_date, end_date)
+        yield
+        self.events.append(('exit',))
+
+    @contextmanager
+    def computing_chunk(self, terms, start_date, end_date):
+        self._record(
+            'computing_chunk',
+            [self._term_ids[t] for t in terms],
+            start_date,
+            end_date,
+        )
+        yield
+        self.events.append(('exit',))
+
+    @contextmanager
+    def loading_terms(self, terms):
+        self._record('loading_terms', [self._term_ids[t] for t in terms])
+        yield
+        self.events.append(('exit',))
+
+    @contextmanager
+    def computing_term(self, term):
+        self._record('computing_term', self._term_ids[term])
+        yield
+        self.events.append(('exit',))
+
+    def on_term_cache_lookup(self, hits, misses, nbytes):
+        self.events.append((
+            'call',
+            'on_term_cache_lookup',
+            (
+                [self._term_ids[t] for t in hits],
+                [self._term_ids[t] for t in misses],
+                nbytes,
+            ),
+        ))
+
+    def on_workspace_update(self, nbytes):
+        self.events.append(('call', 'on_workspace_update', (nbytes,)))
+
+
+def replay_events(events, hooks, terms, pipeline=None):
+    """
+    Replay events recorded by :class:`RecordingHooks` on ``hooks``.
+
+    Parameters
+    ----------
+    events : list
+        The ``events`` of a RecordingHooks.
+    hooks : implements(PipelineHooks)
+        The hooks to replay the events on.
+    terms : list[zipline.pipeline.Term]
+        The terms the events were recorded with.
+    pipeline : zipline.pipeline.Pipeline, optional
+        The pipeline to pass to ``running_pipeline``.
+    """
+    def decode(arg):
+        if isinstance(arg, list):
+            return [terms[i] for i in arg]
+        return terms[arg]
+
+    stack = []
+    for event in events:
+        if event[0] == 'exit':
+            stack.pop().__exit__(None, None, None)
+            continue
+
+        kind, method_name, args = event
+        if kind == 'call':
+            if method_name == 'on_term_cache_lookup':
+                args = (decode(args[0]), decode(args[1]), args[2])
+            getattr(hooks, method_name)(*args)
+            continue
+
+        if method_name == 'running_pipeline':
+            args = (pipeline,) + args[1:]
+        elif method_name == 'computing_chunk':
+            args = (decode(args[0]),) + args[1:]
+        else:
+            args = (decode(args[0]),)
+
+        ctx = getattr(hooks, method_name)(*args)
+        ctx.__enter__()
+        stack.append(ctx)
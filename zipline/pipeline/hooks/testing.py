@@ -1,6 +1,10 @@
 from collections import namedtuple
 
-from .iface import PipelineHooks, PIPELINE_HOOKS_CONTEXT_MANAGERS
+from .iface import (
+    PipelineHooks,
+    PIPELINE_HOOKS_CONTEXT_MANAGERS,
+    interface_method,
+)
 
 from interface import implements
 
@@ -30,7 +34,7 @@ def testing_hooks_method(method_name):
     """
     if method_name in PIPELINE_HOOKS_CONTEXT_MANAGERS:
         # Generate a method that enters the context of all sub-hooks.
-        @wraps(getattr(PipelineHooks, method_name))
+        @wraps(interface_method(method_name))
         @contextmanager
         def ctx(self, *args, **kwargs):
             call = Call(method_name, args, kwargs)
@@ -41,7 +45,7 @@ def testing_hooks_method(method_name):
 
     else:
         # Generate a method that calls methods of all sub-hooks.
-        @wraps(getattr(PipelineHooks, method_name))
+        @wraps(interface_method(method_name))
         def method(self, *args, **kwargs):
             self.trace.append(Call(method_name, args, kwargs))
         return method
@@ -21,11 +21,13 @@ from quantrocket.fundamental import (
     get_alpaca_etb_reindexed_like,
     NoFundamentalData)
 from zipline.pipeline.loaders.missing import MISSING_VALUES_BY_DTYPE
+from zipline.pipeline.loaders.cache import get_reindexed_like
 
 class AlpacaETBPipelineLoader(implements(PipelineLoader)):
 
-    def __init__(self, zipline_sids_to_real_sids):
+    def __init__(self, zipline_sids_to_real_sids, cache=None):
         self.zipline_sids_to_real_sids = zipline_sids_to_real_sids
+        self.cache = cache
 
     def load_adjusted_array(self, domain, columns, dates, sids, mask):
 
@@ -34,7 +36,9 @@ class AlpacaETBPipelineLoader(implements(PipelineLoader)):
         reindex_like.index.name = "Date"
 
         try:
-            are_etb = get_alpaca_etb_reindexed_like(reindex_like)
+            are_etb = get_reindexed_like(
+                get_alpaca_etb_reindexed_like, reindex_like,
+                cache=self.cache, no_data_errors=NoFundamentalData)
         except NoFundamentalData:
             are_etb = reindex_like
 
@@ -26,11 +26,13 @@ from quantrocket.fundamental import (
 )
 from zipline.utils.numpy_utils import datetime64ns_dtype
 from zipline.pipeline.loaders.missing import MISSING_VALUES_BY_DTYPE
+from zipline.pipeline.loaders.cache import get_reindexed_like
 
 class BSIPipelineLoader(implements(PipelineLoader)):
 
-    def __init__(self, zipline_sids_to_real_sids):
+    def __init__(self, zipline_sids_to_real_sids, cache=None):
         self.zipline_sids_to_real_sids = zipline_sids_to_real_sids
+        self.cache = cache
 
     def load_adjusted_array(self, domain, columns, dates, sids, mask):
 
@@ -52,8 +54,10 @@ class BSIPipelineLoader(implements(PipelineLoader)):
             fields = list({c.name for c in columns})
 
             try:
-                metrics = get_brain_bsi_reindexed_like(
-                    reindex_like, N=N, fields=fields)
+                metrics = get_reindexed_like(
+                    get_brain_bsi_reindexed_like,
+                    reindex_like, N=N, fields=fields,
+                    cache=self.cache, no_data_errors=NoFundamentalData)
             except NoFundamentalData:
                 metrics = None
 
@@ -79,8 +83,9 @@ class BSIPipelineLoader(implements(PipelineLoader)):
 
 class BLMCFPipelineLoader(implements(PipelineLoader)):
 
-    def __init__(self, zipline_sids_to_real_sids):
+    def __init__(self, zipline_sids_to_real_sids, cache=None):
         self.zipline_sids_to_real_sids = zipline_sids_to_real_sids
+        self.cache = cache
 
     def load_adjusted_array(self, domain, columns, dates, sids, mask):
 
@@ -103,8 +108,10 @@ class BLMCFPipelineLoader(implements(PipelineLoader)):
             fields = list({c.name for c in columns})
 
             try:
-                metrics = get_brain_blmcf_reindexed_like(
-                    reindex_like, report_category=report_category, fields=fields)
+                metrics = get_reindexed_like(
+                    get_brain_blmcf_reindexed_like,
+                    reindex_like, report_category=report_category, fields=fields,
+                    cache=self.cache, no_data_errors=NoFundamentalData)
             except NoFundamentalData:
                 metrics = None
 
@@ -134,8 +141,9 @@ class BLMCFPipelineLoader(implements(PipelineLoader)):
 
 class BLMECTPipelineLoader(implements(PipelineLoader)):
 
-    def __init__(self, zipline_sids_to_real_sids):
+    def __init__(self, zipline_sids_to_real_sids, cache=None):
         self.zipline_sids_to_real_sids = zipline_sids_to_real_sids
+        self.cache = cache
 
     def load_adjusted_array(self, domain, columns, dates, sids, mask):
 
@@ -157,8 +165,10 @@ class BLMECTPipelineLoader(implements(PipelineLoader)):
             fields = list({c.name for c in columns})
 
             try:
-                metrics = get_brain_blmect_reindexed_like(
-                    reindex_like, fields=fields)
+                metrics = get_reindexed_like(
+                    get_brain_blmect_reindexed_like,
+                    reindex_like, fields=fields,
+                    cache=self.cache, no_data_errors=NoFundamentalData)
             except NoFundamentalData:
                 metrics = None
 
@@ -0,0 +1,328 @@
+#
+# Copyright 2026 QuantRocket LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_SIZE = 2 ** 30  # 1 GiB
+
+META_FILENAME = "meta.json"
+DATES_FILENAME = "dates.npy"
+
+def get_reindexed_like(func, reindex_like, cache=None, no_data_errors=(), **kwargs):
+    """
+    Call one of the quantrocket get_*_reindexed_like functions, through the
+    cache if one is given.
+
+    Parameters
+    ----------
+    func : callable
+        The get_*_reindexed_like function. It is called with
+        ``reindex_like`` and ``kwargs``.
+    reindex_like : pd.DataFrame
+        A DataFrame with a DatetimeIndex of dates and columns of sids.
+    cache : PipelineDataCache, optional
+        The cache to use. If None, ``func`` is called directly.
+    no_data_errors : tuple of Exception types, optional
+        The exceptions ``func`` raises when there is no data.
+    **kwargs
+        Keyword arguments for ``func``.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    if cache is None:
+        return func(reindex_like, **kwargs)
+
+    return cache.get_reindexed_like(
+        func, reindex_like, no_data_errors=no_data_errors, **kwargs)
+
+def _add_rows(frame, rows, all_dates):
+    """
+    Add ``rows`` to ``frame`` and reindex the result to ``all_dates``.
+
+    If there are no rows, or they are all NA, ``frame`` is only reindexed, as
+    pandas no longer lets empty or all-NA frames take part in determining the
+    dtype of a concatenation.
+    """
+    if rows is None or rows.isnull().values.all():
+        return frame.reindex(all_dates)
+    return pd.concat([frame, rows]).reindex(all_dates)
+
+class PipelineDataCache:
+    """
+    Content-addressed on-disk cache for the results of the quantrocket
+    get_*_reindexed_like functions used by the pipeline loaders.
+
+    Each entry is keyed by a hash of the function, its keyword arguments
+    (the dataset, fields and extra coords) and the sids, and covers a
+    set of dates. A request for dates which are partly cached only fetches
+    the missing dates and adds them to the entry.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory in which to store the cache entries.
+    max_size : int, optional
+        The maximum total size of the cache entries in bytes. The least
+        recently used entries are removed when the cache grows beyond this
+        size. Defaults to 1 GiB.
+
+    Notes
+    -----
+    Each entry is a directory containing the covered dates as ``dates.npy``,
+    a ``meta.json`` describing the result frame, and one ``.npy`` file of
+    (dates x sids) values per field. Numeric fields are opened as memory
+    maps; fields with object values are unpickled.
+
+    The values a get_*_reindexed_like function returns for a date are
+    assumed not to depend on which other dates were requested.
+    """
+
+    def __init__(self, rootdir, max_size=DEFAULT_MAX_SIZE):
+        self.rootdir = rootdir
+        self.max_size = max_size
+        os.makedirs(rootdir, exist_ok=True)
+
+    def _key(self, func, sids, kwargs):
+        kwargs = dict(kwargs)
+        # the order of the requested fields doesn't change the result
+        if isinstance(kwargs.get("fields"), (list, tuple)):
+            kwargs["fields"] = sorted(kwargs["fields"])
+
+        # use the type for callables without a name, such as partials
+        func_name = getattr(func, "__qualname__", type(func).__qualname__)
+        func_module = getattr(func, "__module__", type(func).__module__)
+
+        key = json.dumps(
+            {
+                "func": f"{func_module}.{func_name}",
+                "kwargs": sorted((k, repr(v)) for k, v in kwargs.items()),
+                "sids": [str(sid) for sid in sids],
+            },
+        )
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _read_entry(self, path, sids):
+        """
+        Read a cache entry into a dict mapping each field key to a
+        (dates x sids) DataFrame indexed by int64 dates.
+        """
+        try:
+            with open(os.path.join(path, META_FILENAME)) as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None, None
+
+        dates = np.load(os.path.join(path, DATES_FILENAME))
+        frames = {}
+        for i, (key, dtype) in enumerate(zip(meta["keys"], meta["dtypes"])):
+            filename = os.path.join(path, f"{i}.npy")
+            if dtype == "object":
+                values = np.load(filename, allow_pickle=True)
+            else:
+                values = np.load(filename, mmap_mode="r")
+            frames[tuple(key)] = pd.DataFrame(values, index=dates, columns=sids)
+
+        # mark the entry as recently used
+        os.utime(os.path.join(path, META_FILENAME))
+
+        return frames, meta["names"]
+
+    def _write_entry(self, path, frames, names):
+        os.makedirs(path, exist_ok=True)
+        dates = next(iter(frames.values())).index.values.astype(np.int64)
+        keys = []
+        dtypes = []
+        for i, (key, frame) in enumerate(frames.items()):
+            values = frame.values
+            keys.append(list(key))
+            dtypes.append(str(values.dtype))
+            self._save(os.path.join(path, f"{i}.npy"), values)
+
+        self._save(os.path.join(path, DATES_FILENAME), dates)
+        # the metadata is written last so that an entry is only read once
+        # complete
+        tmp_path = os.path.join(path, META_FILENAME + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"keys": keys, "dtypes": dtypes, "names": names}, f)
+        os.replace(tmp_path, os.path.join(path, META_FILENAME))
+
+    def _save(self, filename, values):
+        # write to a temporary file first, as the existing file may be
+        # memory-mapped by a frame which is still in use
+        tmp_filename = filename + ".tmp"
+        with open(tmp_filename, "wb") as f:
+            np.save(f, values, allow_pickle=values.dtype == object)
+        os.replace(tmp_filename, filename)
+
+    def _split(self, result):
+        """
+        Split a get_*_reindexed_like result into a dict mapping each field
+        key (the index values other than the date) to a (dates x sids)
+        DataFrame indexed by int64 dates.
+        """
+        names = list(result.index.names)
+        if result.index.nlevels == 1:
+            frame = result.copy()
+            frame.index = pd.DatetimeIndex(frame.index).asi8
+            return {(): frame}, names
+
+        field_levels = list(range(result.index.nlevels - 1))
+        frames = {}
+        for key, frame in result.groupby(
+                level=field_levels if len(field_levels) > 1 else 0, sort=False):
+            if not isinstance(key, tuple):
+                key = (key,)
+            frame = frame.droplevel(field_levels)
+            frame.index = pd.DatetimeIndex(frame.index).asi8
+            frames[key] = frame
+        return frames, names
+
+    def _combine(self, frames, names, reindex_like):
+        """
+        Reassemble the cached frames into the shape returned by the
+        get_*_reindexed_like function for the requested dates.
+        """
+        dates = reindex_like.index
+        reindexed = {}
+        for key, frame in frames.items():
+            frame = frame.reindex(dates.asi8)
+            frame.index = dates
+            frame.columns = reindex_like.columns
+            reindexed[key] = frame
+
+        if list(reindexed) == [()]:
+            return reindexed[()]
+
+        result = pd.concat(
+            {(key[0] if len(key) == 1 else key): frame
+             for key, frame in reindexed.items()})
+        result.index.names = names
+        return result
+
+    def get_reindexed_like(self, func, reindex_like, no_data_errors=(), **kwargs):
+        """
+        Return the result of ``func(reindex_like, **kwargs)``, fetching only
+        the dates which are not already cached.
+
+        Parameters
+        ----------
+        func : callable
+            The get_*_reindexed_like function.
+        reindex_like : pd.DataFrame
+            A DataFrame with a DatetimeIndex of dates and columns of sids.
+        no_data_errors : tuple of Exception types, optional
+            The exceptions ``func`` raises when there is no data. If only
+            some dates are cached and there is no data for the others, the
+            others are filled from ``reindex_like``. No data is never cached.
+        **kwargs
+            Keyword arguments for ``func``.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        sids = list(reindex_like.columns)
+        path = os.path.join(self.rootdir, self._key(func, sids, kwargs))
+
+        frames, names = self._read_entry(path, sids)
+
+        if frames is None:
+            result = func(reindex_like, **kwargs)
+            frames, names = self._split(result)
+            self._write_entry(path, frames, names)
+            self._evict(keep=path)
+            return result
+
+        dates = reindex_like.index
+        cached_dates = next(iter(frames.values())).index
+        missing = dates[~np.isin(dates.asi8, cached_dates)]
+
+        if len(missing) > 0:
+            all_dates = np.union1d(cached_dates, missing.asi8)
+            try:
+                fetched = func(reindex_like.loc[missing], **kwargs)
+            except no_data_errors:
+                fetched = None
+
+            if fetched is not None:
+                fetched_frames, _ = self._split(fetched)
+                frames = {
+                    key: _add_rows(frame, fetched_frames.get(key), all_dates)
+                    for key, frame in frames.items()
+                }
+                self._write_entry(path, frames, names)
+                self._evict(keep=path)
+            else:
+                # fill the dates without data like the loaders fill them
+                # when there is no data at all
+                filler = reindex_like.loc[missing].copy()
+                filler.index = missing.asi8
+                filler.columns = sids
+                frames = {
+                    key: _add_rows(frame, filler, all_dates)
+                    for key, frame in frames.items()
+                }
+
+        return self._combine(frames, names, reindex_like)
+
+    def _entry_size(self, path):
+        return sum(
+            os.path.getsize(os.path.join(path, filename))
+            for filename in os.listdir(path))
+
+    def size(self):
+        """
+        Return the total size of the cache entries in bytes.
+        """
+        return sum(
+            self._entry_size(os.path.join(self.rootdir, name))
+            for name in os.listdir(self.rootdir))
+
+    def _evict(self, keep=None):
+        """
+        Remove the least recently used entries, other than ``keep``, until
+        the cache is no larger than max_size.
+        """
+        entries = []
+        for name in os.listdir(self.rootdir):
+            path = os.path.join(self.rootdir, name)
+            try:
+                last_used = os.path.getmtime(os.path.join(path, META_FILENAME))
+            except FileNotFoundError:
+                last_used = 0
+            entries.append((last_used, path, self._entry_size(path)))
+
+        total_size = sum(size for _, _, size in entries)
+        for _, path, size in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
+
+    def clear(self):
+        """
+        Remove all cache entries.
+        """
+        for name in os.listdir(self.rootdir):
+            shutil.rmtree(os.path.join(self.rootdir, name), ignore_errors=True)
@@ -18,6 +18,7 @@ from collections import defaultdict
 from zipline.pipeline.loaders.base import PipelineLoader
 from zipline.lib.adjusted_array import AdjustedArray
 from zipline.pipeline.loaders.missing import MISSING_VALUES_BY_DTYPE
+from zipline.pipeline.loaders.cache import get_reindexed_like
 from zipline.utils.numpy_utils import (
     bool_dtype,
     float64_dtype,
@@ -31,9 +32,10 @@ class DatabasePipelineLoader(implements(PipelineLoader)):
     Loads data using quantrocket.get_prices_reindexed_like.
     """
 
-    def __init__(self, zipline_sids_to_real_sids, calendar):
+    def __init__(self, zipline_sids_to_real_sids, calendar, cache=None):
         self.zipline_sids_to_real_sids = zipline_sids_to_real_sids
         self.calendar = calendar
+        self.cache = cache
 
     def load_adjusted_array(self, domain, columns, dates, sids, mask):
 
@@ -53,9 +55,10 @@ class DatabasePipelineLoader(implements(PipelineLoader)):
             fields = list({c.name for c in columns})
 
             try:
-                prices = get_prices_reindexed_like(
+                prices = get_reindexed_like(
+                    get_prices_reindexed_like,
                     reindex_like,
-                    dataset.CODE,
+                    codes=dataset.CODE,
                     fields=fields,
                     shift=dataset.SHIFT,
                     ffill=dataset.FFILL,
@@ -64,7 +67,9 @@ class DatabasePipelineLoader(implements(PipelineLoader)):
                     times=dataset.TIMES,
                     agg=dataset.AGG,
                     cont_fut=dataset.CONT_FUT,
-                    data_frequency=dataset.DATA_FREQUENCY)
+                    data_frequency=dataset.DATA_FREQUENCY,
+                    cache=self.cache,
+                    no_data_errors=NoData)
             except NoData:
                 prices = None
 
@@ -22,11 +22,13 @@ from quantrocket.fundamental import (
     get_ibkr_borrow_fees_reindexed_like,
     NoFundamentalData)
 from zipline.pipeline.loaders.missing import MISSING_VALUES_BY_DTYPE
+from zipline.pipeline.loaders.cache import get_reindexed_like
 
 class IBKRAggregateShortableSharesPipelineLoader(implements(PipelineLoader)):
 
-    def __init__(self, zipline_sids_to_real_sids):
+    def __init__(self, zipline_sids_to_real_sids, cache=None):
         self.zipline_sids_to_real_sids = zipline_sids_to_real_sids
+        self.cache = cache
 
     def load_adjusted_array(self, domain, columns, dates, sids, mask):
 
@@ -36,8 +38,10 @@ class IBKRAggregateShortableSharesPipelineLoader(implements(PipelineLoader)):
         reindex_like.index.name = "Date"
 
         try:
-            shortables = get_ibkr_shortable_shares_reindexed_like(
-                reindex_like, aggregate=True, fields=fields, shift=1)
+            shortables = get_reindexed_like(
+                get_ibkr_shortable_shares_reindexed_like,
+                reindex_like, aggregate=True, fields=fields, shift=1,
+                cache=self.cache, no_data_errors=NoFundamentalData)
         except NoFundamentalData:
             shortables = pd.concat(
                 {column.name:reindex_like for column in columns})
@@ -56,8 +60,9 @@ class IBKRAggregateShortableSharesPipelineLoader(implements(PipelineLoader)):
 
 class IBKRBorrowFeesPipelineLoader(implements(PipelineLoader)):
 
-    def __init__(self, zipline_sids_to_real_sids):
+    def __init__(self, zipline_sids_to_real_sids, cache=None):
         self.zipline_sids_to_real_sids = zipline_sids_to_real_sids
+        self.cache = cache
 
     def load_adjusted_array(self, domain, columns, dates, sids, mask):
 
@@ -66,7 +71,9 @@ class IBKRBorrowFeesPipelineLoader(implements(PipelineLoader)):
         reindex_like.index.name = "Date"
 
         try:
-            fees = get_ibkr_borrow_fees_reindexed_like(reindex_like, shift=1)
+            fees = get_reindexed_like(
+                get_ibkr_borrow_fees_reindexed_like, reindex_like, shift=1,
+                cache=self.cache, no_data_errors=NoFundamentalData)
         except NoFundamentalData:
             fees = reindex_like
 
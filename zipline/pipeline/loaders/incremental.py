@@ -0,0 +1,295 @@
+"""
+PipelineLoader that reuses the rows it loaded for earlier, overlapping date
+ranges.
+"""
+from interface import implements
+import numpy as np
+
+from zipline.lib.adjusted_array import AdjustedArray
+from zipline.lib.adjustment import ArrayAdjustment
+
+from .base import PipelineLoader
+
+
+class IncrementalLoader(implements(PipelineLoader)):
+    """
+    A PipelineLoader that keeps the last window it loaded for each column and,
+    when the next request rolls that window forward, only asks the wrapped
+    loader for the new rows.
+
+    This is meant for live trading, where each session's pipeline requests
+    the same lookback window as the previous session's, shifted by one
+    session. Only the new session (plus one overlapping row) is loaded for
+    all assets, and the full window is only loaded for assets that weren't in
+    the previous window.
+
+    Parameters
+    ----------
+    loader : PipelineLoader
+        The loader to wrap.
+
+    Notes
+    -----
+    Only the loaded windows are kept. Terms computed from them, such as
+    factors, are still computed over their full lookback windows on every
+    run, since a term's output for a session depends on the adjustments
+    applied to its whole window. The time saved is therefore the time the
+    wrapped loader spends reading the rows of the earlier sessions.
+
+    The raw values the wrapped loader returns for a date must not change once
+    loaded, so data which is revised after the fact is not picked up. This
+    holds for the bars of a bundle, which are written once at ingestion, but
+    not necessarily for loaders of external data.
+
+    Adjustments are translated into the coordinates of the combined window.
+    An adjustment which starts at the first row of a load is assumed to apply
+    to all earlier rows too, as is the case for the split, merger and
+    dividend adjustments of EquityPricingLoader. Adjustments applied on a new
+    row must end no earlier than the row before it, or the load of the new
+    rows won't include them. Columns whose data isn't a plain ndarray, such
+    as string columns, or which have array adjustments are always loaded in
+    full.
+    """
+    def __init__(self, loader):
+        self.loader = loader
+        # column -> (dates, sids, AdjustedArray)
+        self._windows = {}
+
+    @property
+    def currency_aware(self):
+        return self.loader.currency_aware
+
+    def clear(self):
+        """
+        Discard the windows kept for all columns.
+        """
+        self._windows.clear()
+
+    def load_adjusted_array(self, domain, columns, dates, sids, mask):
+        plan = self._plan(columns, dates, sids)
+        if plan is None:
+            loaded = self.loader.load_adjusted_array(
+                domain, columns, dates, sids, mask,
+            )
+        else:
+            loaded = self._load_incremental(
+                domain, columns, dates, sids, mask, *plan
+            )
+            if loaded is None:
+                loaded = self.loader.load_adjusted_array(
+                    domain, columns, dates, sids, mask,
+                )
+
+        out = {}
+        for column, array in loaded.items():
+            if _is_incrementable(array):
+                self._windows[column] = (dates, sids, array.copy())
+            else:
+                self._windows.pop(column, None)
+            out[column] = array
+        return out
+
+    def _plan(self, columns, dates, sids):
+        """
+        Find the rows of ``dates`` that can be taken from the windows kept for
+        ``columns``.
+
+        Returns
+        -------
+        plan : (int, int) or None
+            The row of the kept window that matches ``dates[0]`` and the number
+            of rows of ``dates`` covered by the kept window, or None if the
+            columns must be loaded in full.
+        """
+        plan = kept_sids = None
+        for column in columns:
+            try:
+                kept_dates, column_sids, _ = self._windows[column]
+            except KeyError:
+                return None
+            # The columns are merged using the assets of the first column.
+            if kept_sids is None:
+                kept_sids = column_sids
+            elif not column_sids.equals(kept_sids):
+                return None
+
+            start = kept_dates.searchsorted(dates[0])
+            if start == len(kept_dates) or kept_dates[start] != dates[0]:
+                return None
+            nrows = len(kept_dates) - start
+            if nrows > len(dates) or not kept_dates[start:].equals(
+                    dates[:nrows]):
+                return None
+            if plan is None:
+                plan = (start, nrows)
+            elif plan != (start, nrows):
+                return None
+        return plan
+
+    def _load_incremental(self,
+                          domain,
+                          columns,
+                          dates,
+                          sids,
+                          mask,
+                          start,
+                          nrows):
+        # Load from the last kept row, so that adjustments effective on the
+        # first new row are included.
+        offset = nrows - 1
+        if offset + 1 < len(dates):
+            new_rows = self.loader.load_adjusted_array(
+                domain, columns, dates[offset:], sids, mask[offset:],
+            )
+        else:
+            new_rows = None
+
+        kept_sids = self._windows[columns[0]][1]
+        is_new_sid = ~sids.isin(kept_sids)
+        if is_new_sid.any():
+            new_sid_locs = np.flatnonzero(is_new_sid)
+            new_sids = self.loader.load_adjusted_array(
+                domain,
+                columns,
+                dates,
+                sids[new_sid_locs],
+                mask[:, new_sid_locs],
+            )
+        else:
+            new_sid_locs = new_sids = None
+
+        out = {}
+        for column in columns:
+            merged = _merge(
+                self._windows[column],
+                start,
+                nrows,
+                None if new_rows is None else new_rows[column],
+                new_sid_locs,
+                None if new_sids is None else new_sids[column],
+                dates,
+                sids,
+            )
+            if merged is None:
+                return None
+            out[column] = merged
+        return out
+
+
+def _is_incrementable(array):
+    if type(array.data) is not np.ndarray:
+        return False
+    return not any(
+        isinstance(adjustment, ArrayAdjustment)
+        for adjustments in array.adjustments.values()
+        for adjustment in adjustments
+    )
+
+
+def _move(adjustment, row_shift, col_locs, keep_first_row):
+    """
+    Copy ``adjustment`` shifted by ``row_shift`` rows and with each column
+    ``i`` moved to ``col_locs[i]`` (or dropped if ``col_locs[i]`` is -1).
+
+    Returns the copy, None if the adjustment no longer applies to any row or
+    column, or raises ValueError if its columns are no longer contiguous.
+    """
+    last_row = adjustment.last_row + row_shift
+    if last_row < 0:
+        return None
+    if keep_first_row and adjustment.first_row == 0:
+        first_row = 0
+    else:
+        first_row = max(adjustment.first_row + row_shift, 0)
+
+    locs = col_locs[adjustment.first_col:adjustment.last_col + 1]
+    if (locs == -1).all():
+        return None
+    if (locs == -1).any() or (np.diff(locs) != 1).any():
+        raise ValueError("columns of adjustment are no longer contiguous")
+
+    cls, args = adjustment.__reduce__()
+    return cls(first_row, last_row, locs[0], locs[-1], *args[4:])
+
+
+def _add_adjustments(out, adjustments, row_shift, col_locs, keep_first_row):
+    for row, row_adjustments in adjustments.items():
+        for adjustment in row_adjustments:
+            moved = _move(adjustment, row_shift, col_locs, keep_first_row)
+            if moved is None:
+                continue
+            existing = out.setdefault(max(row + row_shift, 0), [])
+            # The overlapping row is in both loads, so the same adjustment
+            # may be too.
+            if moved not in existing:
+                existing.append(moved)
+
+
+def _merge(kept, start, nrows, new_rows, new_sid_locs, new_sids, dates, sids):
+    """
+    Combine the kept window of a column with the newly loaded rows and assets
+    into the AdjustedArray for ``dates`` and ``sids``.
+    """
+    kept_dates, kept_sids, kept_array = kept
+    for array in (new_rows, new_sids):
+        if array is not None and not _is_incrementable(array):
+            return None
+
+    kept_data = kept_array.data
+    data = np.empty((len(dates), len(sids)), dtype=kept_data.dtype)
+
+    # Where each kept asset is in the new window, or -1.
+    kept_locs = sids.get_indexer(kept_sids)
+    is_kept = kept_locs != -1
+    data[:nrows, kept_locs[is_kept]] = kept_data[start:, is_kept]
+
+    offset = nrows - 1
+    if new_rows is not None:
+        data[offset:] = new_rows.data
+
+    all_locs = np.arange(len(sids))
+    if new_sid_locs is not None:
+        data[:, new_sid_locs] = new_sids.data
+        # Adjustments to new assets come from their full load.
+        new_rows_locs = all_locs.copy()
+        new_rows_locs[new_sid_locs] = -1
+    else:
+        new_rows_locs = all_locs
+
+    adjustments = {}
+    try:
+        _add_adjustments(
+            adjustments, kept_array.adjustments, -start, kept_locs, False,
+        )
+        if new_rows is not None:
+            _add_adjustments(
+                adjustments, new_rows.adjustments, offset, new_rows_locs, True,
+            )
+        if new_sid_locs is not None:
+            _add_adjustments(
+                adjustments, new_sids.adjustments, 0, new_sid_locs, False,
+            )
+    except ValueError:
+        return None
+
+    return AdjustedArray(data, adjustments, kept_array.missing_value)
+
+
+def incremental_get_loader(get_loader):
+    """
+    Wrap a ``get_loader`` function so that it returns an IncrementalLoader
+    for each loader, reusing the same IncrementalLoader every time.
+    """
+    incremental_loaders = {}
+
+    def get_incremental_loader(term):
+        loader = get_loader(term)
+        try:
+            return incremental_loaders[loader]
+        except KeyError:
+            incremental = incremental_loaders[loader] = IncrementalLoader(
+                loader,
+            )
+            return incremental
+
+    return get_incremental_loader
@@ -20,12 +20,14 @@ from zipline.pipeline.loaders.base import PipelineLoader
 from zipline.lib.adjusted_array import AdjustedArray
 from zipline.pipeline.loaders.missing import MISSING_VALUES_BY_DTYPE
 from zipline.utils.numpy_utils import datetime64ns_dtype
+from zipline.pipeline.loaders.cache import get_reindexed_like
 from quantrocket.master import get_securities_reindexed_like
 
 class SecuritiesMasterPipelineLoader(implements(PipelineLoader)):
 
-    def __init__(self, zipline_sids_to_real_sids):
+    def __init__(self, zipline_sids_to_real_sids, cache=None):
         self.zipline_sids_to_real_sids = zipline_sids_to_real_sids
+        self.cache = cache
 
     def load_adjusted_array(self, domain, columns, dates, sids, mask):
 
@@ -47,8 +49,9 @@ class SecuritiesMasterPipelineLoader(implements(PipelineLoader)):
         reindex_like = pd.DataFrame(None, index=dates, columns=real_sids)
         reindex_like.index.name = "Date"
 
-        securities = get_securities_reindexed_like(
-            reindex_like, fields=fields)
+        securities = get_reindexed_like(
+            get_securities_reindexed_like,
+            reindex_like, fields=fields, cache=self.cache)
 
         out = {}
 
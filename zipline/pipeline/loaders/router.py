@@ -47,8 +47,23 @@ from zipline.pipeline.loaders.db import DatabasePipelineLoader
 class QuantRocketPipelineLoaderRouter:
     """
     Routes to PipelineLoaders.
+
+    Parameters
+    ----------
+    sids_to_real_sids : dict
+        Mapping of zipline sids to real sids.
+    calendar : ExchangeCalendar
+        The exchange calendar.
+    default_loader : PipelineLoader
+        The loader for default_loader_columns.
+    default_loader_columns : list of BoundColumn
+        The columns to route to default_loader.
+    cache : PipelineDataCache, optional
+        A local cache for the data the QuantRocket-backed loaders fetch.
+        If None, data is fetched on every load.
     """
-    def __init__(self, sids_to_real_sids, calendar, default_loader, default_loader_columns):
+    def __init__(self, sids_to_real_sids, calendar, default_loader, default_loader_columns,
+                 cache=None):
 
         # Default
         self.default_loader = default_loader
@@ -64,38 +79,38 @@ class QuantRocketPipelineLoaderRouter:
 
         # Sharadar
         self.sharadar_fundamentals_loader = SharadarFundamentalsPipelineLoader(
-            sids_to_real_sids)
+            sids_to_real_sids, cache=cache)
         self.sharadar_sp500_loader = SharadarSP500PipelineLoader(
-            sids_to_real_sids)
+            sids_to_real_sids, cache=cache)
         self.sharadar_institutions_loader = SharadarInstitutionsPipelineLoader(
-            sids_to_real_sids
+            sids_to_real_sids, cache=cache
         )
 
         # Brain
         self.bsi_loader = BSIPipelineLoader(
-            sids_to_real_sids)
+            sids_to_real_sids, cache=cache)
         self.blmcf_loader = BLMCFPipelineLoader(
-            sids_to_real_sids)
+            sids_to_real_sids, cache=cache)
         self.blmect_loader = BLMECTPipelineLoader(
-            sids_to_real_sids)
+            sids_to_real_sids, cache=cache)
 
         # Alpaca
         self.alpaca_etb_loader = AlpacaETBPipelineLoader(
-            sids_to_real_sids)
+            sids_to_real_sids, cache=cache)
 
         # IBKR
         self.ibkr_shortable_shares_loader = IBKRAggregateShortableSharesPipelineLoader(
-            sids_to_real_sids)
+            sids_to_real_sids, cache=cache)
         self.ibkr_borrow_fees_loader = IBKRBorrowFeesPipelineLoader(
-            sids_to_real_sids)
+            sids_to_real_sids, cache=cache)
 
         # Master
         self.securities_master_loader = SecuritiesMasterPipelineLoader(
-            sids_to_real_sids)
+            sids_to_real_sids, cache=cache)
 
         # Database
         self.database_loader = DatabasePipelineLoader(
-            sids_to_real_sids, calendar)
+            sids_to_real_sids, calendar, cache=cache)
 
     def isin(self, column, dataset):
         """
@@ -26,11 +26,13 @@ from quantrocket.fundamental import (
 )
 from zipline.utils.numpy_utils import datetime64ns_dtype
 from zipline.pipeline.loaders.missing import MISSING_VALUES_BY_DTYPE
+from zipline.pipeline.loaders.cache import get_reindexed_like
 
 class SharadarFundamentalsPipelineLoader(implements(PipelineLoader)):
 
-    def __init__(self, zipline_sids_to_real_sids):
+    def __init__(self, zipline_sids_to_real_sids, cache=None):
         self.zipline_sids_to_real_sids = zipline_sids_to_real_sids
+        self.cache = cache
 
     def load_adjusted_array(self, domain, columns, dates, sids, mask):
 
@@ -55,9 +57,11 @@ class SharadarFundamentalsPipelineLoader(implements(PipelineLoader)):
             fields = list({c.name for c in columns})
 
             try:
-                fundamentals = get_sharadar_fundamentals_reindexed_like(
+                fundamentals = get_reindexed_like(
+                    get_sharadar_fundamentals_reindexed_like,
                     reindex_like, fields=fields, dimension=dimension,
-                    period_offset=period_offset)
+                    period_offset=period_offset,
+                    cache=self.cache, no_data_errors=NoFundamentalData)
             except NoFundamentalData:
                 fundamentals = None
 
@@ -87,8 +91,9 @@ class SharadarFundamentalsPipelineLoader(implements(PipelineLoader)):
 
 class SharadarInstitutionsPipelineLoader(implements(PipelineLoader)):
 
-    def __init__(self, zipline_sids_to_real_sids):
+    def __init__(self, zipline_sids_to_real_sids, cache=None):
         self.zipline_sids_to_real_sids = zipline_sids_to_real_sids
+        self.cache = cache
 
     def load_adjusted_array(self, domain, columns, dates, sids, mask):
 
@@ -98,8 +103,10 @@ class SharadarInstitutionsPipelineLoader(implements(PipelineLoader)):
         reindex_like.index.name = "Date"
 
         try:
-            institutions = get_sharadar_institutions_reindexed_like(
-                reindex_like, fields=fields)
+            institutions = get_reindexed_like(
+                get_sharadar_institutions_reindexed_like,
+                reindex_like, fields=fields,
+                cache=self.cache, no_data_errors=NoFundamentalData)
         except NoFundamentalData:
             institutions = pd.concat(
                 {column.name:reindex_like for column in columns})
@@ -118,8 +125,9 @@ class SharadarInstitutionsPipelineLoader(implements(PipelineLoader)):
 
 class SharadarSP500PipelineLoader(implements(PipelineLoader)):
 
-    def __init__(self, zipline_sids_to_real_sids):
+    def __init__(self, zipline_sids_to_real_sids, cache=None):
         self.zipline_sids_to_real_sids = zipline_sids_to_real_sids
+        self.cache = cache
 
     def load_adjusted_array(self, domain, columns, dates, sids, mask):
 
@@ -128,7 +136,9 @@ class SharadarSP500PipelineLoader(implements(PipelineLoader)):
         reindex_like.index.name = "Date"
 
         try:
-            in_sp500 = get_sharadar_sp500_reindexed_like(reindex_like)
+            in_sp500 = get_reindexed_like(
+                get_sharadar_sp500_reindexed_like, reindex_like,
+                cache=self.cache, no_data_errors=NoFundamentalData)
         except NoFundamentalData:
             in_sp500 = reindex_like
 
@@ -0,0 +1,173 @@
+"""
+Sinks for writing the output of a pipeline to disk one chunk at a time,
+without building the full output in memory.
+"""
+from pandas import HDFStore
+
+from zipline.utils.string_formatting import bulleted_list
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+try:
+    import tables  # noqa: F401 (needed by pd.HDFStore)
+    HAVE_TABLES = True
+except ImportError:
+    HAVE_TABLES = False
+
+
+def _check_dependency(name, available, sink_name):
+    if not available:
+        raise ValueError(
+            "{} needs {}:\nMissing:\n{}".format(
+                sink_name, name, bulleted_list([name])
+            )
+        )
+
+
+def flatten_pipeline_output(frame):
+    """
+    Convert a pipeline output frame to a flat frame suitable for writing to
+    disk.
+
+    The (date, asset) index is moved into ``date`` and ``asset`` columns, with
+    each asset stored as its ``real_sid``. Categorical columns are converted
+    to object columns, so that chunks with different categories share the
+    same schema.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        A frame returned by a pipeline engine.
+
+    Returns
+    -------
+    flat : pd.DataFrame
+    """
+    flat = frame.reset_index()
+    flat['asset'] = [asset.real_sid for asset in flat['asset']]
+    for column in frame.columns[frame.dtypes == 'category']:
+        flat[column] = flat[column].astype(object)
+    return flat
+
+
+class ParquetSink(object):
+    """
+    Write pipeline output chunks to a Parquet file.
+
+    The schema of the file is taken from the first non-empty chunk.
+
+    Parameters
+    ----------
+    path : str
+        The path of the Parquet file to write.
+
+    Examples
+    --------
+    >>> with ParquetSink('pipeline.parquet') as sink:  # doctest: +SKIP
+    ...     for chunk in engine.iter_pipeline(pipe, start, end, chunksize=252):
+    ...         sink.write(chunk)
+    """
+    def __init__(self, path):
+        _check_dependency('pyarrow', HAVE_PYARROW, type(self).__name__)
+        self.path = path
+        self._writer = None
+        self._empty = None
+
+    def write(self, frame):
+        """
+        Append a pipeline output chunk to the file.
+        """
+        if not len(frame):
+            # Empty frames lose dtype information, so they can't be used to
+            # determine the schema.
+            self._empty = frame
+            return
+
+        table = pyarrow.Table.from_pandas(
+            flatten_pipeline_output(frame),
+            schema=None if self._writer is None else self._writer.schema,
+            preserve_index=False,
+        )
+        if self._writer is None:
+            self._writer = pyarrow.parquet.ParquetWriter(
+                self.path,
+                table.schema,
+            )
+        self._writer.write_table(table)
+
+    def close(self):
+        """
+        Finish writing the file.
+        """
+        if self._writer is not None:
+            self._writer.close()
+        elif self._empty is not None:
+            # Every chunk was empty; still write a file with the columns.
+            pyarrow.parquet.write_table(
+                pyarrow.Table.from_pandas(
+                    flatten_pipeline_output(self._empty),
+                    preserve_index=False,
+                ),
+                self.path,
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class HDF5Sink(object):
+    """
+    Write pipeline output chunks to a table in an HDF5 file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the HDF5 file to write.
+    key : str, optional
+        The key of the table in the file. Defaults to 'pipeline'.
+    min_itemsize : int or dict, optional
+        The minimum size of string columns, passed to
+        :meth:`pandas.HDFStore.append`. The size of string columns is fixed
+        by the first chunk, so this must be given if later chunks may contain
+        longer strings.
+    """
+    def __init__(self, path, key='pipeline', min_itemsize=None):
+        _check_dependency('tables', HAVE_TABLES, type(self).__name__)
+        self.path = path
+        self.key = key
+        self.min_itemsize = min_itemsize
+        self._store = HDFStore(path, mode='w')
+
+    def write(self, frame):
+        """
+        Append a pipeline output chunk to the table.
+        """
+        if not len(frame):
+            return
+        self._store.append(
+            self.key,
+            flatten_pipeline_output(frame),
+            format='table',
+            index=False,
+            min_itemsize=self.min_itemsize,
+        )
+
+    def close(self):
+        """
+        Finish writing the file.
+        """
+        self._store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
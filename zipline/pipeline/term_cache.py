@@ -0,0 +1,123 @@
+"""
+Memoization of computed pipeline terms across pipeline runs.
+"""
+from collections import OrderedDict
+import hashlib
+
+import numpy as np
+
+DEFAULT_MAX_SIZE = 2 ** 30  # 1 GiB
+
+
+class TermResultCache(object):
+    """
+    In-memory LRU cache of the computed values of pipeline terms, for reuse
+    across runs of a :class:`~zipline.pipeline.engine.SimplePipelineEngine`.
+
+    Values are keyed by the term, the domain, the dates and sids they were
+    computed for, and the root mask over those dates (see
+    :meth:`TermResultCache.key`). Terms are memoized on their construction
+    arguments, so a structurally identical term in a later pipeline is the
+    same object and hits the cache.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        The maximum total size of the cached values in bytes. The least
+        recently used values are evicted when the cache grows beyond this
+        size. Defaults to 1 GiB.
+
+    Notes
+    -----
+    The cache assumes that the data available to the engine doesn't change
+    while the cache is in use. Call :meth:`clear` after the underlying data
+    is updated.
+    """
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self._values = OrderedDict()
+        self._nbytes = 0
+
+    @staticmethod
+    def key(term, domain, dates, sids, mask):
+        """
+        Build the cache key for the value of ``term``.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.Term
+            The term.
+        domain : zipline.pipeline.domain.Domain
+            The domain the term was computed in.
+        dates : pd.DatetimeIndex
+            The row labels of the term's value.
+        sids : pd.Index[int]
+            The column labels of the term's value.
+        mask : np.ndarray[bool]
+            The root mask for ``dates`` and ``sids``.
+
+        Returns
+        -------
+        key : tuple
+        """
+        digest = hashlib.sha1(np.asarray(sids, dtype=np.int64).tobytes())
+        digest.update(np.packbits(mask).tobytes())
+        return term, domain, dates[0], dates[-1], digest.hexdigest()
+
+    @property
+    def nbytes(self):
+        """
+        The total size of the cached values in bytes.
+        """
+        return self._nbytes
+
+    def get(self, key):
+        """
+        Return a copy of the value cached for ``key``, or None.
+        """
+        try:
+            value = self._values[key]
+        except KeyError:
+            return None
+        self._values.move_to_end(key)
+        # Terms may mutate their inputs in place, so never hand out the
+        # cached array itself.
+        return value.copy()
+
+    def set(self, key, value):
+        """
+        Cache a copy of ``value`` for ``key``, evicting the least recently
+        used values if the cache grows beyond max_size.
+        """
+        value = value.copy()
+        if value.nbytes > self.max_size:
+            return
+
+        self.pop(key)
+        self._values[key] = value
+        self._nbytes += value.nbytes
+
+        while self._nbytes > self.max_size:
+            _, evicted = self._values.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+
+    def pop(self, key):
+        """
+        Remove the value cached for ``key``, if any.
+        """
+        value = self._values.pop(key, None)
+        if value is not None:
+            self._nbytes -= value.nbytes
+
+    def clear(self):
+        """
+        Remove all cached values.
+        """
+        self._values.clear()
+        self._nbytes = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._values
@@ -13,6 +13,12 @@ use_bundle
 run_pipeline
     Execute a pipeline.
 
+iter_pipeline
+    Execute a pipeline, yielding the results one chunk of dates at a time.
+
+write_pipeline
+    Execute a pipeline, writing the results to a Parquet or HDF5 file.
+
 get_forward_returns
     Get forward returns for the dates and assets in an input factor (typically
     the output of `run_pipeline`).
@@ -35,7 +41,12 @@ Usage Guide:
 
 * Research API: https://qrok.it/dl/z/zipline-research
 """
-from zipline.research.pipeline import run_pipeline, get_forward_returns
+from zipline.research.pipeline import (
+    run_pipeline,
+    iter_pipeline,
+    write_pipeline,
+    get_forward_returns,
+)
 from zipline.research.bundle import use_bundle
 from zipline.research.bardata import get_data
 from zipline.research import sid as sid_module # for test suite
@@ -46,6 +57,8 @@ from zipline.research.continuous_future import continuous_future
 __all__ = [
     'use_bundle',
     'run_pipeline',
+    'iter_pipeline',
+    'write_pipeline',
     'get_forward_returns',
     'get_data',
     'sid',
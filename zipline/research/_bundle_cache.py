@@ -0,0 +1,127 @@
+#
+# Copyright 2020 QuantRocket LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+import os
+import pandas as pd
+from zipline.data import bundles
+
+
+class _CachedBundle(object):
+    """
+    The loaded data of one ingestion of a bundle, and the objects built from
+    it.
+    """
+    def __init__(self, ingestion, bundle_data):
+        self.ingestion = ingestion
+        self.bundle_data = bundle_data
+        self.objects = {}
+
+
+class BundleDataCache(object):
+    """
+    Process-wide cache of the BundleData of the most recent ingestion of each
+    bundle, and of the objects the research functions build from it, such as
+    pipeline loaders and data portals.
+
+    Loading a bundle opens its bcolz tables, adjustments db and assets db, so
+    reusing them makes repeated research calls much faster. Each bundle is
+    keyed on its most recent ingestion, so a new ingestion replaces the cached
+    data of the bundle on the next call.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The number of bundles to keep. The least recently used bundle is
+        dropped when more bundles are loaded. Default 4.
+    """
+    def __init__(self, maxsize=4):
+        self.maxsize = maxsize
+        self._bundles = OrderedDict()
+
+    def load(self, bundle, environ=os.environ):
+        """
+        Return the BundleData of the most recent ingestion of the bundle,
+        loading it if it's not cached.
+
+        Parameters
+        ----------
+        bundle : str
+            The bundle code.
+        environ : mapping, optional
+            The environment variables.
+
+        Returns
+        -------
+        bundle_data : zipline.data.bundles.BundleData
+        """
+        return self._get(bundle, environ).bundle_data
+
+    def get_or_create(self, bundle, key, create, environ=os.environ):
+        """
+        Return an object built from the most recent ingestion of the bundle,
+        building it with ``create`` if it's not cached.
+
+        Parameters
+        ----------
+        bundle : str
+            The bundle code.
+        key : hashable
+            Identifies the object among the objects cached for the bundle.
+        create : callable[BundleData -> object]
+            Builds the object from the bundle data.
+        environ : mapping, optional
+            The environment variables.
+        """
+        cached = self._get(bundle, environ)
+        try:
+            return cached.objects[key]
+        except KeyError:
+            obj = cached.objects[key] = create(cached.bundle_data)
+            return obj
+
+    def clear(self):
+        """
+        Drop all of the cached bundles.
+        """
+        self._bundles.clear()
+
+    def _get(self, bundle, environ):
+        try:
+            ingestion = bundles.ingestions_for_bundle(bundle, environ)[0]
+        except (OSError, IndexError):
+            # let bundles.load raise its error for a missing bundle
+            ingestion = None
+
+        cached = self._bundles.get(bundle)
+        if cached is not None and ingestion is not None and (
+                cached.ingestion == ingestion):
+            self._bundles.move_to_end(bundle)
+            return cached
+
+        cached = _CachedBundle(
+            ingestion,
+            bundles.load(bundle, environ, pd.Timestamp.utcnow()),
+        )
+        if ingestion is not None:
+            self._bundles[bundle] = cached
+            self._bundles.move_to_end(bundle)
+            while len(self._bundles) > self.maxsize:
+                self._bundles.popitem(last=False)
+        return cached
+
+
+# Bundle data shared by the research functions.
+bundle_data_cache = BundleDataCache()
@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
 import pandas as pd
 from typing import Literal
 from zipline.data import bundles
@@ -21,6 +20,7 @@ from zipline.data.data_portal import DataPortal
 from zipline.utils.extensions import load_extensions
 from zipline.research.exceptions import ValidationError
 from zipline.research._asset import asset_finder_cache
+from zipline.research._bundle_cache import bundle_data_cache
 from zipline.research.bundle import _get_bundle
 from zipline.finance.asset_restrictions import NoRestrictions
 from zipline.protocol import BarData
@@ -84,11 +84,7 @@ def get_data(
 
     load_extensions(code=bundle)
 
-    bundle_data = bundles.load(
-        bundle,
-        os.environ,
-        pd.Timestamp.utcnow(),
-    )
+    bundle_data = bundle_data_cache.load(bundle)
     if data_frequency and data_frequency not in ("daily", "minute"):
         raise ValidationError("data_frequency must be 'daily' or 'minute'")
 
@@ -14,13 +14,11 @@
 # limitations under the License.
 
 from typing import Literal
-import os
-import pandas as pd
-from zipline.data import bundles
 from zipline.assets import ContinuousFuture
 from zipline.utils.extensions import load_extensions
 from zipline.research.exceptions import ValidationError
 from zipline.research._asset import asset_finder_cache
+from zipline.research._bundle_cache import bundle_data_cache
 from zipline.research.bundle import _get_bundle
 from quantrocket.zipline import get_default_bundle
 
@@ -92,11 +90,7 @@ def continuous_future(
 
     load_extensions(code=bundle)
 
-    bundle_data = bundles.load(
-        bundle,
-        os.environ,
-        pd.Timestamp.utcnow(),
-    )
+    bundle_data = bundle_data_cache.load(bundle)
     asset_finder = asset_finder_cache.get(bundle, bundle_data.asset_finder)
     asset_finder_cache[bundle] = asset_finder
 
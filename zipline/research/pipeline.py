@@ -14,9 +14,10 @@
 # limitations under the License.
 
 import os
-from typing import Union, Any, Literal
+from typing import Union, Any, Literal, Iterator
 import pandas as pd
 from zipline.data import bundles
+from zipline.assets import AssetFinder
 import zipline.pipeline.domain as domain
 from zipline.pipeline import Pipeline
 from zipline.utils.extensions import load_extensions
@@ -25,9 +26,17 @@ from zipline.pipeline.data import EquityPricing
 from zipline.pipeline.filters import Filter
 from zipline.pipeline.factors import Returns, OvernightReturns, IntradayReturns
 from zipline.pipeline.loaders.router import QuantRocketPipelineLoaderRouter
-from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.loaders.cache import (
+    DEFAULT_MAX_SIZE as DEFAULT_CACHE_MAX_SIZE,
+    PipelineDataCache)
+from zipline.pipeline.engine import (
+    SimplePipelineEngine,
+    run_chunked_pipeline_in_processes,
+)
+from zipline.pipeline.sinks import ParquetSink, HDF5Sink
 from zipline.research.exceptions import ValidationError, RequestedEndDateAfterBundleEndDate
 from zipline.research._asset import asset_finder_cache
+from zipline.research._bundle_cache import bundle_data_cache
 from zipline.research.bundle import _get_bundle
 from quantrocket.zipline import get_default_bundle
 from zipline.utils.calendar_utils import get_calendar
@@ -38,7 +47,9 @@ def run_pipeline(
     pipeline: Pipeline,
     start_date: str,
     end_date: str = None,
-    bundle: str = None
+    bundle: str = None,
+    workers: int = None,
+    max_memory: int = None
     ) -> pd.DataFrame:
     """
     Compute values for pipeline from start_date to end_date, using the specified
@@ -71,6 +82,16 @@ def run_pipeline(
         `zipline.research.use_bundle`) will be used, or if that has not been set,
         the default bundle (as set with `quantrocket.zipline.set_default_bundle`).
 
+    workers : int, optional
+        compute the pipeline's 1-year chunks concurrently in this many worker
+        processes, each of which opens the bundle itself. This speeds up
+        pipelines spanning many years at the cost of more memory. By default,
+        the chunks are computed one after another in the current process.
+
+    max_memory : int, optional
+        the maximum memory, in bytes, of each worker process. A worker which
+        exceeds it raises a MemoryError. Only applies if workers is set.
+
     Returns
     -------
     result : pd.DataFrame
@@ -87,6 +108,12 @@ def run_pipeline(
 
     * Pipeline in Research: https://qrok.it/dl/z/pipeline-research
 
+    To avoid downloading the same data from QuantRocket databases on repeated
+    runs, set the ZIPLINE_PIPELINE_CACHE_DIR environment variable to a
+    directory in which to cache it, and optionally
+    ZIPLINE_PIPELINE_CACHE_MAX_SIZE to the maximum size of the cache in bytes
+    (default 1 GiB). The variables are read when the bundle is first used.
+
     Examples
     --------
     Get a pipeline of 1-year returns::
@@ -102,9 +129,168 @@ def run_pipeline(
         pipeline,
         start_date=start_date,
         end_date=end_date,
-        bundle=bundle)
+        bundle=bundle,
+        workers=workers,
+        max_memory=max_memory)
+
+def iter_pipeline(
+    pipeline: Pipeline,
+    start_date: str,
+    end_date: str = None,
+    bundle: str = None,
+    chunksize: int = 252
+    ) -> Iterator[pd.DataFrame]:
+    """
+    Compute values for pipeline from start_date to end_date, using the specified
+    bundle or the default bundle, and yield the results one chunk of dates at a
+    time as they are computed.
+
+    Unlike run_pipeline, the full result is never built in memory, so this
+    function can be used for pipelines whose output is too large to hold in
+    memory at once.
+
+    Parameters
+    ----------
+    pipeline : Pipeline, required
+        The pipeline to run.
+
+    start_date : str (YYYY-MM-DD), required
+        First date on which the pipeline should run. See run_pipeline.
+
+    end_date : str (YYYY-MM-DD), optional
+        Last date on which the pipeline should run. See run_pipeline.
+        Defaults to today.
+
+    bundle : str, optional
+        the bundle code. If omitted, the currently active bundle (as set with
+        `zipline.research.use_bundle`) will be used, or if that has not been set,
+        the default bundle (as set with `quantrocket.zipline.set_default_bundle`).
 
-def _run_pipeline(pipeline, start_date, end_date=None, bundle=None, mask=None):
+    chunksize : int, optional
+        the number of trading days in each yielded result. Pass 1 to yield one
+        result per day. Default 252 (about 1 year).
+
+    Yields
+    ------
+    result : pd.DataFrame
+        A frame of computed results for the dates of one chunk, in the format
+        returned by run_pipeline.
+
+    Examples
+    --------
+    Compute 1-year returns one month at a time::
+
+        from zipline.pipeline.factors import Returns
+        pipeline = Pipeline(
+            columns={
+                '1Y': Returns(window_length=252),
+            })
+        for factor in iter_pipeline(pipeline, '2010-01-01', '2020-01-01', chunksize=21):
+            ...
+    """
+    bundle, bundle_data, exchange_calendar, start_date, end_date = _load_bundle_and_dates(
+        start_date, end_date, bundle)
+
+    asset_finder = asset_finder_cache.get(bundle, bundle_data.asset_finder)
+    asset_finder_cache[bundle] = asset_finder
+
+    engine = _get_engine(bundle, asset_finder, exchange_calendar)
+
+    # validate the arguments now rather than on the first iteration
+    def iter_results():
+        for results in engine.iter_pipeline(pipeline, start_date, end_date, chunksize=chunksize):
+            # add bundle and source to DataFrame metadata
+            results._qr_bundle = bundle
+            results._qr_src = "pipeline"
+            yield results
+
+    return iter_results()
+
+def write_pipeline(
+    pipeline: Pipeline,
+    filepath: str,
+    start_date: str,
+    end_date: str = None,
+    bundle: str = None,
+    chunksize: int = 252
+    ) -> None:
+    """
+    Compute values for pipeline from start_date to end_date, using the specified
+    bundle or the default bundle, and write the results to a Parquet or HDF5 file
+    one chunk of dates at a time, without building the full result in memory.
+
+    The file contains a flat table with date and asset columns followed by the
+    pipeline columns. Assets are stored as their real sids.
+
+    Parameters
+    ----------
+    pipeline : Pipeline, required
+        The pipeline to run.
+
+    filepath : str, required
+        the file to write. The format is determined by the extension:
+        .parquet or .pq for Parquet (requires pyarrow), or .h5, .hdf5 or .hdf for
+        HDF5 (requires tables). HDF5 results are written under the key "pipeline".
+
+    start_date : str (YYYY-MM-DD), required
+        First date on which the pipeline should run. See run_pipeline.
+
+    end_date : str (YYYY-MM-DD), optional
+        Last date on which the pipeline should run. See run_pipeline.
+        Defaults to today.
+
+    bundle : str, optional
+        the bundle code. If omitted, the currently active bundle (as set with
+        `zipline.research.use_bundle`) will be used, or if that has not been set,
+        the default bundle (as set with `quantrocket.zipline.set_default_bundle`).
+
+    chunksize : int, optional
+        the number of trading days to compute and write at a time. Default 252
+        (about 1 year).
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    Write 1-year returns to a Parquet file::
+
+        from zipline.pipeline.factors import Returns
+        pipeline = Pipeline(
+            columns={
+                '1Y': Returns(window_length=252),
+            })
+        write_pipeline(pipeline, 'returns.parquet', '2010-01-01', '2020-01-01')
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext in (".parquet", ".pq"):
+        sink_cls = ParquetSink
+    elif ext in (".h5", ".hdf5", ".hdf"):
+        sink_cls = HDF5Sink
+    else:
+        raise ValidationError(
+            f"unsupported file extension for filepath: {filepath} (use .parquet or .h5)")
+
+    results = iter_pipeline(
+        pipeline,
+        start_date,
+        end_date=end_date,
+        bundle=bundle,
+        chunksize=chunksize)
+
+    with sink_cls(filepath) as sink:
+        for chunk in results:
+            sink.write(chunk)
+
+def _run_pipeline(
+    pipeline,
+    start_date,
+    end_date=None,
+    bundle=None,
+    mask=None,
+    workers=None,
+    max_memory=None):
     """
     Internal function for run_pipeline that adds a mask parameter used by
     get_forward_returns. See run_pipeline.
@@ -116,6 +302,80 @@ def _run_pipeline(pipeline, start_date, end_date=None, bundle=None, mask=None):
         and asset combinations to compute values for. Values will only be computed for
         dates and assets containing True values.
     """
+    bundle, bundle_data, exchange_calendar, start_date, end_date = _load_bundle_and_dates(
+        start_date, end_date, bundle)
+
+    asset_finder = asset_finder_cache.get(bundle, bundle_data.asset_finder)
+    asset_finder_cache[bundle] = asset_finder
+
+    if mask is not None:
+        mask.columns = [asset.sid for asset in mask.columns]
+
+    engine = _get_engine(bundle, asset_finder, exchange_calendar, mask=mask)
+
+    use_chunks = True
+    # if the pipeline uses a filter such as StaticAssets and we already know there are
+    # only a few sids, it's faster to run the pipeline without chunks
+    if pipeline._prescreen:
+        max_sids_without_chunks = 25
+        if "sids" in pipeline._prescreen and len(pipeline._prescreen["sids"]) <= max_sids_without_chunks:
+            use_chunks = False
+        elif "real_sids" in pipeline._prescreen and len(pipeline._prescreen["real_sids"]) <= max_sids_without_chunks:
+            use_chunks = False
+
+    if use_chunks:
+        # Run in 1-years chunks to reduce memory usage
+        chunksize = 252
+        if workers:
+            # each worker process loads the bundle itself rather than sharing
+            # the readers and asset finder of this process, but builds its
+            # asset finder from a snapshot of this process's assets
+            asset_snapshot = asset_finder.snapshot()
+
+            def make_worker_engine():
+                worker_bundle_data = bundles.load(
+                    bundle,
+                    os.environ,
+                    pd.Timestamp.utcnow(),
+                )
+                worker_asset_finder = AssetFinder.from_snapshot(asset_snapshot)
+                return _make_engine(
+                    _make_pipeline_loader(
+                        worker_bundle_data,
+                        worker_asset_finder,
+                        exchange_calendar),
+                    worker_asset_finder,
+                    exchange_calendar,
+                    mask=mask)
+
+            results = run_chunked_pipeline_in_processes(
+                engine,
+                make_worker_engine,
+                pipeline,
+                start_date,
+                end_date,
+                chunksize=chunksize,
+                workers=workers,
+                max_memory=max_memory)
+        else:
+            results = engine.run_chunked_pipeline(pipeline, start_date, end_date, chunksize=chunksize)
+    else:
+        results = engine.run_pipeline(pipeline, start_date, end_date)
+    # add bundle and source to DataFrame metadata
+    results._qr_bundle = bundle
+    results._qr_src = "pipeline"
+    return results
+
+def _load_bundle_and_dates(start_date, end_date=None, bundle=None):
+    """
+    Load the bundle (or the active or default bundle) and validate the
+    requested dates, rolling them forward to sessions.
+
+    Returns
+    -------
+    tuple
+        (bundle, bundle_data, exchange_calendar, start_date, end_date)
+    """
     if not bundle:
         bundle = _get_bundle()
         if not bundle:
@@ -126,11 +386,7 @@ def _run_pipeline(pipeline, start_date, end_date=None, bundle=None, mask=None):
 
     load_extensions(code=bundle)
 
-    bundle_data = bundles.load(
-        bundle,
-        os.environ,
-        pd.Timestamp.utcnow(),
-    )
+    bundle_data = bundle_data_cache.load(bundle)
 
     calendar_name = bundles.bundles[bundle].calendar_name
     exchange_calendar = get_calendar(calendar_name)
@@ -199,26 +455,69 @@ def _run_pipeline(pipeline, start_date, end_date=None, bundle=None, mask=None):
             # if the user didn't specify an end date, just silently use the max end date
             end_date = max_end_date
 
+    return bundle, bundle_data, exchange_calendar, start_date, end_date
+
+def _get_engine(bundle, asset_finder, exchange_calendar, mask=None):
+    """
+    Return a SimplePipelineEngine for the bundle, restricted to the
+    (date x sid) mask if given. The pipeline loader, and the engine if there
+    is no mask, are shared by all calls for the same ingestion of the bundle.
+    """
+    pipeline_loader = bundle_data_cache.get_or_create(
+        bundle,
+        "pipeline_loader",
+        lambda bundle_data: _make_pipeline_loader(
+            bundle_data, asset_finder, exchange_calendar))
+
+    if mask is not None:
+        return _make_engine(
+            pipeline_loader, asset_finder, exchange_calendar, mask=mask)
+
+    return bundle_data_cache.get_or_create(
+        bundle,
+        "pipeline_engine",
+        lambda bundle_data: _make_engine(
+            pipeline_loader, asset_finder, exchange_calendar))
+
+def _make_pipeline_loader(bundle_data, asset_finder, exchange_calendar, environ=os.environ):
+    """
+    Return the pipeline loader router for the bundle data.
+
+    If the ZIPLINE_PIPELINE_CACHE_DIR environment variable is set, the data
+    fetched by the QuantRocket-backed loaders is cached in that directory,
+    which is limited to ZIPLINE_PIPELINE_CACHE_MAX_SIZE bytes (default 1 GiB).
+    """
     default_pipeline_loader = EquityPricingLoader.without_fx(
         bundle_data.equity_daily_bar_reader,
         bundle_data.adjustment_reader,
     )
-    asset_finder = asset_finder_cache.get(bundle, bundle_data.asset_finder)
-    asset_finder_cache[bundle] = asset_finder
 
-    pipeline_loader = QuantRocketPipelineLoaderRouter(
+    cache = None
+    cache_dir = environ.get("ZIPLINE_PIPELINE_CACHE_DIR")
+    if cache_dir:
+        cache = PipelineDataCache(
+            cache_dir,
+            max_size=int(environ.get(
+                "ZIPLINE_PIPELINE_CACHE_MAX_SIZE", DEFAULT_CACHE_MAX_SIZE)))
+
+    return QuantRocketPipelineLoaderRouter(
         sids_to_real_sids=asset_finder.sids_to_real_sids,
         calendar=exchange_calendar,
         default_loader=default_pipeline_loader,
-        default_loader_columns=EquityPricing.columns
+        default_loader_columns=EquityPricing.columns,
+        cache=cache
     )
 
+def _make_engine(pipeline_loader, asset_finder, exchange_calendar, mask=None):
+    """
+    Return a SimplePipelineEngine using the pipeline loader, restricted to the
+    (date x sid) mask if given.
+    """
     calendar_domain = domain.get_domain_from_calendar(exchange_calendar)
 
     kwargs = {}
 
     if mask is not None:
-        mask.columns = [asset.sid for asset in mask.columns]
 
         def populate_initial_workspace(
             initial_workspace,
@@ -235,33 +534,12 @@ def _run_pipeline(pipeline, start_date, end_date=None, bundle=None, mask=None):
 
         kwargs["populate_initial_workspace"] = populate_initial_workspace
 
-    engine = SimplePipelineEngine(
+    return SimplePipelineEngine(
         pipeline_loader,
         asset_finder,
         calendar_domain,
         **kwargs)
 
-    use_chunks = True
-    # if the pipeline uses a filter such as StaticAssets and we already know there are
-    # only a few sids, it's faster to run the pipeline without chunks
-    if pipeline._prescreen:
-        max_sids_without_chunks = 25
-        if "sids" in pipeline._prescreen and len(pipeline._prescreen["sids"]) <= max_sids_without_chunks:
-            use_chunks = False
-        elif "real_sids" in pipeline._prescreen and len(pipeline._prescreen["real_sids"]) <= max_sids_without_chunks:
-            use_chunks = False
-
-    if use_chunks:
-        # Run in 1-years chunks to reduce memory usage
-        chunksize = 252
-        results = engine.run_chunked_pipeline(pipeline, start_date, end_date, chunksize=chunksize)
-    else:
-        results = engine.run_pipeline(pipeline, start_date, end_date)
-    # add bundle and source to DataFrame metadata
-    results._qr_bundle = bundle
-    results._qr_src = "pipeline"
-    return results
-
 def get_forward_returns(
     factor: Union['pd.Series[Any]', 'pd.DataFrame'],
     periods: Union[Union[int, Literal['oc', 'co']], list[Union[int, Literal['oc', 'co']]]] = None,
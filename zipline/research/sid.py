@@ -13,13 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
-import pandas as pd
-from zipline.data import bundles
 from zipline.assets import Asset
 from zipline.utils.extensions import load_extensions
 from zipline.research.exceptions import ValidationError
 from zipline.research._asset import asset_finder_cache
+from zipline.research._bundle_cache import bundle_data_cache
 from zipline.research.bundle import _get_bundle
 from quantrocket.zipline import get_default_bundle
 
@@ -65,11 +63,7 @@ def sid(sid: str, bundle: str = None) -> Asset:
 
     load_extensions(code=bundle)
 
-    bundle_data = bundles.load(
-        bundle,
-        os.environ,
-        pd.Timestamp.utcnow(),
-    )
+    bundle_data = bundle_data_cache.load(bundle)
 
     asset_finder = asset_finder_cache.get(bundle, bundle_data.asset_finder)
     asset_finder_cache[bundle] = asset_finder
@@ -153,11 +147,7 @@ def symbol(symbol: str, bundle: str = None) -> Asset:
 
     load_extensions(code=bundle)
 
-    bundle_data = bundles.load(
-        bundle,
-        os.environ,
-        pd.Timestamp.utcnow(),
-    )
+    bundle_data = bundle_data_cache.load(bundle)
 
     asset_finder = asset_finder_cache.get(bundle, bundle_data.asset_finder)
     asset_finder_cache[bundle] = asset_finder
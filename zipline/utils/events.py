@@ -169,12 +169,16 @@ class EventManager(object):
     """
     def __init__(self, create_context=None):
         self._events = []
+        self._has_context = create_context is not None
         self._create_context = (
             create_context
             if create_context is not None else
             lambda *_: nop_context
         )
 
+    def __len__(self):
+        return len(self._events)
+
     def add_event(self, event, prepend=False):
         """
         Adds an event to the manager.
@@ -193,6 +197,43 @@ class EventManager(object):
                     dt,
                 )
 
+    def session_triggers(self, minutes, idle_callbacks=()):
+        """
+        Compute ahead of time on which of the minutes of a session any of the
+        events might be triggered, so that handle_data can be skipped on the
+        others.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            The minutes of the session, none of which have been passed to
+            handle_data yet.
+        idle_callbacks : container[callable], optional
+            Callbacks which do nothing, whose events are ignored.
+
+        Returns
+        -------
+        triggers : np.ndarray[bool] or None
+            Whether any event might be triggered on each minute, or None if
+            handle_data must be called on every minute, because the events are
+            run in a context or the triggers of a rule can't be computed ahead
+            of time.
+        """
+        if self._has_context:
+            return None
+
+        triggers = np.zeros(len(minutes), dtype=bool)
+        for event in self._events:
+            if event.callback in idle_callbacks:
+                continue
+
+            event_triggers = event.rule.session_triggers(minutes)
+            if event_triggers is None:
+                return None
+            triggers |= event_triggers
+
+        return triggers
+
 
 class Event(namedtuple('Event', ['rule', 'callback'])):
     """
@@ -235,6 +276,25 @@ class EventRule(six.with_metaclass(ABCMeta)):
         """
         raise NotImplementedError('should_trigger')
 
+    def session_triggers(self, minutes):
+        """
+        Compute whether the rule triggers on each of the minutes of a session
+        ahead of time, given its current state.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            The minutes of the session, none of which have been passed to
+            should_trigger yet.
+
+        Returns
+        -------
+        triggers : np.ndarray[bool] or None
+            Whether the rule triggers on each minute, or None if that can't be
+            known ahead of time, which is the default for custom rules.
+        """
+        return None
+
 
 class StatelessRule(EventRule):
     """
@@ -243,6 +303,21 @@ class StatelessRule(EventRule):
     same datetime.
     Because these are pure, they can be composed to create new rules.
     """
+    def _minute_triggers(self, minutes):
+        return np.array(
+            [bool(self.should_trigger(dt)) for dt in minutes],
+            dtype=bool,
+        )
+
+    def _session_label_triggers(self, minutes):
+        # For rules which only depend on the session of the minute, which is
+        # the same for all of the minutes when the rule's calendar agrees.
+        if self.cal.minute_to_session(minutes[0]) != \
+                self.cal.minute_to_session(minutes[-1]):
+            return self._minute_triggers(minutes)
+
+        return np.full(len(minutes), bool(self.should_trigger(minutes[0])))
+
     def and_(self, rule):
         """
         Logical and of two rules, triggers only when both rules trigger.
@@ -284,6 +359,22 @@ class ComposedRule(StatelessRule):
             dt
         )
 
+    def session_triggers(self, minutes):
+        if self.composer is not ComposedRule.lazy_and:
+            return None
+
+        first = self.first.session_triggers(minutes)
+        if first is None:
+            return None
+        if not first.any():
+            # like lazy_and, don't check the second rule
+            return first
+
+        second = self.second.session_triggers(minutes)
+        if second is None:
+            return None
+        return first & second
+
     @staticmethod
     def lazy_and(first_should_trigger, second_should_trigger, dt):
         """
@@ -314,6 +405,9 @@ class Always(StatelessRule):
         return True
     should_trigger = always_trigger
 
+    def session_triggers(self, minutes):
+        return np.ones(len(minutes), dtype=bool)
+
 
 class Never(StatelessRule):
     """
@@ -327,6 +421,9 @@ class Never(StatelessRule):
         return False
     should_trigger = never_trigger
 
+    def session_triggers(self, minutes):
+        return np.zeros(len(minutes), dtype=bool)
+
 
 class AfterOpen(StatelessRule):
     """
@@ -383,6 +480,9 @@ class AfterOpen(StatelessRule):
 
         return dt == self._period_end
 
+    def session_triggers(self, minutes):
+        return self._minute_triggers(minutes)
+
 
 class BeforeClose(StatelessRule):
     """
@@ -434,6 +534,9 @@ class BeforeClose(StatelessRule):
 
         return self._period_start == dt
 
+    def session_triggers(self, minutes):
+        return self._minute_triggers(minutes)
+
 
 class NotHalfDay(StatelessRule):
     """
@@ -443,6 +546,9 @@ class NotHalfDay(StatelessRule):
         return self.cal.minute_to_session(dt) \
             not in self.cal.early_closes
 
+    def session_triggers(self, minutes):
+        return self._session_label_triggers(minutes)
+
 
 class TradingDayOfWeekRule(six.with_metaclass(ABCMeta, StatelessRule)):
     def __init__(self, n, invert):
@@ -457,6 +563,9 @@ class TradingDayOfWeekRule(six.with_metaclass(ABCMeta, StatelessRule)):
         val = self.cal.minute_to_session(dt, direction="none").value
         return val in self.execution_period_values
 
+    def session_triggers(self, minutes):
+        return self._session_label_triggers(minutes)
+
     @lazyval
     def execution_period_values(self):
         # calculate the list of periods that match the given criteria
@@ -507,6 +616,9 @@ class TradingDayOfMonthRule(six.with_metaclass(ABCMeta, StatelessRule)):
             return False
         return session.value in self.execution_period_values
 
+    def session_triggers(self, minutes):
+        return self._session_label_triggers(minutes)
+
     @lazyval
     def execution_period_values(self):
         # calculate the list of periods that match the given criteria
@@ -582,6 +694,23 @@ class OncePerDay(StatefulRule):
             self.triggered = True
             return True
 
+    def session_triggers(self, minutes):
+        triggers = self.rule.session_triggers(minutes)
+        if triggers is None:
+            return None
+
+        # The rule must also see the minute on which it resets for the new
+        # day, which is the first minute it sees on or after next_date.
+        if self.date is None:
+            reset_idx = 0
+        else:
+            reset_idx = minutes.searchsorted(self.next_date)
+        if reset_idx < len(minutes):
+            triggers = triggers.copy()
+            triggers[reset_idx] = True
+
+        return triggers
+
 
 # Factory API
 